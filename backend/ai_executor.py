@@ -0,0 +1,114 @@
+"""
+AI Decision Executor
+Where WebSocket games compute AI decisions: process_ai_turns_with_events awaits
+AIExecutor.decide() for every AI turn.
+
+Modes (AI_EXECUTOR):
+- "inline" (default): on the event loop. Decisions use the preflop and rank
+  tables (tens of microseconds), less than a hand-off to a pool costs.
+- "thread": a thread pool sharing this process's warm evaluator
+- "process": a process pool whose workers warm up the evaluator as they start,
+  for strategies heavy enough to stall other games' traffic
+
+Offloaded decisions are computed from a copy of the game's RNG and then applied
+on the event loop, so the game, its RNG and its journal end up exactly as with
+inline decisions (see PokerGame.use_computed_ai_decision).
+"""
+import asyncio
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Optional
+
+from game.ai_strategy import AIDecision, compute_ai_decision
+from game.hand_evaluator import warm_up
+from game.poker_engine import PokerGame
+
+AI_EXECUTOR_MODES = ("inline", "thread", "process")
+AI_EXECUTOR = os.getenv("AI_EXECUTOR", "inline")
+# Pool size for "thread" / "process" (0 = one per CPU)
+AI_EXECUTOR_WORKERS = int(os.getenv("AI_EXECUTOR_WORKERS", "0"))
+# Most recent decisions kept for the latency percentiles
+LATENCY_WINDOW = 4096
+
+
+def _percentile(values, q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class AIExecutor:
+    """
+    Computes AI decisions inline or in a worker pool and records per-decision
+    latency (request to decision applied, including any wait for a worker) and
+    compute time (the strategy itself).
+    """
+
+    def __init__(self, mode: str = AI_EXECUTOR, workers: int = AI_EXECUTOR_WORKERS):
+        if mode not in AI_EXECUTOR_MODES:
+            raise ValueError(f"mode must be one of {AI_EXECUTOR_MODES}, got {mode!r}")
+        if workers < 0:
+            raise ValueError(f"workers must be >= 0, got {workers}")
+        self.mode = mode
+        self.workers = workers or os.cpu_count() or 1
+        self._pool: Optional[Executor] = None
+        self.decisions = 0
+        self.recomputed = 0  # Offloaded decisions redone inline because the game changed meanwhile
+        self.latency_ms: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.compute_ms: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    def start(self):
+        """Create the pool (no-op inline or if already started)."""
+        if self.mode == "inline" or self._pool is not None:
+            return
+        if self.mode == "thread":
+            warm_up()  # Threads share this process's evaluator
+            self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="ai-decision")
+        else:
+            self._pool = ProcessPoolExecutor(self.workers, initializer=warm_up)
+            self._pool.submit(int).result()  # Start (and warm up) the workers now, not on the first decision
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def decide(self, game: PokerGame, player_index: int) -> AIDecision:
+        """game.decide_ai_action(player_index), computed according to the mode."""
+        start = time.perf_counter()
+        if self.mode == "inline":
+            decision = game.decide_ai_action(player_index)
+            compute_ms = (time.perf_counter() - start) * 1000
+        else:
+            self.start()
+            request = game.ai_decision_request(player_index)
+            result = await asyncio.get_running_loop().run_in_executor(self._pool, compute_ai_decision, request)
+            game.use_computed_ai_decision(result)
+            decision = game.decide_ai_action(player_index)
+            if decision is not result.decision:
+                self.recomputed += 1
+            compute_ms = result.compute_ms
+        self.decisions += 1
+        self.latency_ms.append((time.perf_counter() - start) * 1000)
+        self.compute_ms.append(compute_ms)
+        return decision
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "workers": 0 if self.mode == "inline" else self.workers,
+            "decisions": self.decisions,
+            "recomputed": self.recomputed,
+            "latency_p50_ms": _percentile(self.latency_ms, 0.50),
+            "latency_p99_ms": _percentile(self.latency_ms, 0.99),
+            "latency_max_ms": max(self.latency_ms, default=0.0),
+            "compute_p50_ms": _percentile(self.compute_ms, 0.50),
+            "compute_p99_ms": _percentile(self.compute_ms, 0.99),
+        }
+
+
+# Global executor instance
+ai_executor = AIExecutor()
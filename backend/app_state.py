@@ -4,7 +4,9 @@ Shared application state - accessed by routes and main.py.
 Contains in-memory game storage, analysis caching, and LLM configuration.
 """
 import asyncio
+import os
 import time
+import uuid
 import logging
 from typing import Dict, Tuple, List, Optional, Any, Set
 from dataclasses import dataclass
@@ -12,6 +14,7 @@ from datetime import datetime
 from pydantic import BaseModel
 
 from game.poker_engine import PokerGame
+from game.journal import resume_journal, discard_journal, remove_unlocked_journal, JournalLockedError
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +32,14 @@ game_tasks: Dict[str, asyncio.Task] = {}
 GAME_MAX_IDLE_SECONDS = 3600  # Remove games idle > 1 hour
 GAME_CLEANUP_INTERVAL_SECONDS = 300  # Clean up every 5 minutes
 
+# Crash recovery: one action journal per game (game/journal.py), replayed on
+# first access after a restart. Unset = no journaling.
+GAME_JOURNAL_DIR = os.getenv("GAME_JOURNAL_DIR")
+if GAME_JOURNAL_DIR:
+    os.makedirs(GAME_JOURNAL_DIR, exist_ok=True)
+# Journals no process holds are deleted once unmodified this long (default 7 days)
+GAME_JOURNAL_MAX_AGE_SECONDS = int(os.getenv("GAME_JOURNAL_MAX_AGE_SECONDS", str(7 * 24 * 3600)))
+
 # Phase 4: LLM Analysis - Caching and Metrics
 # Cache key format: "{game_id}_hand_{hand_number}_{depth}"
 analysis_cache: Dict[str, Dict] = {}
@@ -63,10 +74,90 @@ def cleanup_old_games(max_age_seconds: int = GAME_MAX_IDLE_SECONDS) -> int:
         if current_time - last_access > max_age_seconds
     ]
     for game_id in to_remove:
-        del games[game_id]
+        game, _ = games.pop(game_id)
+        if game.journal is not None:
+            game.journal.close()  # Journal file stays until cleanup_old_journals: the game can still be recovered
     return len(to_remove)
 
 
+def cleanup_old_journals(max_age_seconds: int = GAME_JOURNAL_MAX_AGE_SECONDS) -> int:
+    """
+    Delete journals unmodified for > max_age_seconds that no process is
+    appending to (a game idle that long was abandoned). Returns number removed.
+    """
+    if not GAME_JOURNAL_DIR:
+        return 0
+    cutoff = time.time() - max_age_seconds
+    removed = 0
+    for entry in os.scandir(GAME_JOURNAL_DIR):
+        if not entry.name.endswith(".jsonl") or entry.name[:-len(".jsonl")] in games:
+            continue
+        try:
+            if entry.stat().st_mtime < cutoff and remove_unlocked_journal(entry.path):
+                removed += 1
+        except FileNotFoundError:
+            pass  # Discarded meanwhile
+    return removed
+
+
+def journal_path(game_id: str) -> Optional[str]:
+    """Journal file for a game, or None when journaling is off or game_id isn't a UUID."""
+    if not GAME_JOURNAL_DIR:
+        return None
+    try:
+        uuid.UUID(game_id)
+    except ValueError:
+        return None
+    return os.path.join(GAME_JOURNAL_DIR, f"{game_id}.jsonl")
+
+
+def get_game(game_id: str) -> Optional[PokerGame]:
+    """
+    Look up an active game and update its last access time.
+
+    A game this process doesn't hold (restart, crash, idle cleanup) is rebuilt
+    from its journal if there is one. Returns None if the game is unknown.
+    Raises JournalLockedError if another worker holds the game.
+    """
+    entry = games.get(game_id)
+    if entry is not None:
+        game = entry[0]
+    else:
+        game = recover_game(game_id)
+        if game is None:
+            return None
+    games[game_id] = (game, time.time())
+    return game
+
+
+def recover_game(game_id: str) -> Optional[PokerGame]:
+    """
+    Replay a game's journal. Returns None if there is no usable journal.
+    Raises JournalLockedError if another worker holds the game (and appends to
+    the journal): a second live copy would append to it too.
+    """
+    path = journal_path(game_id)
+    if game_id in deleted_games or path is None or not os.path.exists(path):
+        return None
+    try:
+        game, meta = resume_journal(path)
+    except JournalLockedError:
+        logger.info(f"Game {game_id} is held by another worker")
+        raise
+    except Exception:
+        logger.exception(f"Failed to recover game {game_id} from {path}")
+        return None
+    if "user_id" in meta:
+        game.user_id = meta["user_id"]
+    logger.info(f"Recovered game {game_id} (hand #{game.hand_count}) from its journal")
+    return game
+
+
+def discard_game_journal(game_id: str, game: Optional[PokerGame] = None):
+    """Stop journaling a game and delete its journal (quit, account deleted, state edited)."""
+    discard_journal(game, journal_path(game_id))
+
+
 def track_analysis_metrics(game_id: str, model: str, cost: float, count: int, success: bool = True):
     """Track analysis metrics for cost monitoring."""
     metrics = AnalysisMetrics(
@@ -1,9 +1,57 @@
 import random
+import time
 import uuid
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
-from game.hand_evaluator import HandEvaluator
+import numpy as np
+
+from game.hand_evaluator import HandEvaluator, get_hand_evaluator
+
+# Personality / action codes used by make_decisions_batch (index = code)
+PERSONALITIES = ("Conservative", "Aggressive", "Mathematical", "Loose-Passive", "Tight-Aggressive", "Maniac")
+ACTIONS = ("fold", "call", "raise")
+FOLD, CALL, RAISE = 0, 1, 2
+
+# Per-personality strategy thresholds. make_decision_with_reasoning() and
+# make_decisions_batch() both read them, so the scalar and batched strategies
+# can't drift apart. *_strength: hand_strength cutoffs, *_spr: stack-to-pot
+# cutoffs, *_roll / *_chance: cutoffs for rng.random() rolls, *_stack_div: bet
+# limits as player_stack // div. "Default" is for unknown personalities.
+PERSONALITY_THRESHOLDS: Dict[str, Dict[str, float]] = {
+    "Conservative": {
+        "low_spr": 3, "commit_strength": 0.45, "raise_roll": 0.3,
+        "deep_spr": 10, "deep_strength": 0.65,
+        "premium_strength": 0.75, "solid_strength": 0.45,
+        "marginal_strength": 0.25, "marginal_stack_div": 20,
+    },
+    "Aggressive": {
+        "low_spr": 3, "push_strength": 0.25,
+        "bluff_spr": 7, "bluff_strength": 0.25,
+        "bluff_chance_small_bet": 0.4, "bluff_chance": 0.2, "small_bet_stack_div": 20,
+        "strong_strength": 0.55, "strong_raise_roll": 0.2,
+        "pair_strength": 0.25, "pair_play_roll": 0.4, "pair_raise_roll": 0.6,
+        "steal_roll": 0.7, "steal_stack_div": 40,
+    },
+    "Mathematical": {
+        "low_spr": 3, "commit_strength": 0.25,
+        "strong_strength": 0.65, "solid_strength": 0.45,
+        "marginal_strength": 0.25, "marginal_pot_odds": 0.33, "marginal_spr": 5,
+    },
+    "Loose-Passive": {
+        "pair_strength": 0.20, "low_spr": 3,
+        "expensive_stack_div": 3, "small_bet_stack_div": 40,
+    },
+    "Tight-Aggressive": {
+        "premium_strength": 0.75, "strong_strength": 0.55, "push_spr": 5, "marginal_strength": 0.35,
+    },
+    "Maniac": {
+        "strong_strength": 0.45, "bluff_roll": 0.70, "call_stack_div": 2,
+    },
+    "Default": {
+        "call_strength": 0.4,
+    },
+}
 
 
 @dataclass
@@ -19,24 +67,60 @@ class AIDecision:
     decision_id: str = ""  # FIX Issue #3: Unique ID for deduplication (generated on creation)
 
 
+@dataclass(frozen=True)
+class AIDecisionRequest:
+    """
+    Everything one AI decision depends on, picklable so it can be computed in a
+    worker thread or process. rng_state is the game's RNG state before the decision.
+    """
+    player_index: int
+    args: tuple  # make_decision_with_reasoning() positional arguments
+    rng_state: tuple
+
+
+@dataclass(frozen=True)
+class AIDecisionResult:
+    """A computed decision, the RNG state it leaves behind and the compute time."""
+    request: AIDecisionRequest
+    decision: AIDecision
+    rng_state: tuple
+    compute_ms: float
+
+
+def compute_ai_decision(request: AIDecisionRequest) -> AIDecisionResult:
+    """
+    Run make_decision_with_reasoning() for a request on a copy of the game's RNG.
+    Module-level (no game object) so thread and process pools can run it.
+    """
+    start = time.perf_counter()
+    rng = random.Random()
+    rng.setstate(request.rng_state)
+    decision = AIStrategy.make_decision_with_reasoning(*request.args, rng=rng)
+    return AIDecisionResult(request, decision, rng.getstate(), (time.perf_counter() - start) * 1000)
+
+
 class AIStrategy:
     """AI strategies with decision reasoning for learning."""
 
     @staticmethod
     def make_decision_with_reasoning(personality: str, hole_cards: List[str], community_cards: List[str],
                                    current_bet: int, pot_size: int, player_stack: int, player_bet: int = 0,
-                                   big_blind: int = 10, last_raise_amount: Optional[int] = None) -> AIDecision:
+                                   big_blind: int = 10, last_raise_amount: Optional[int] = None,
+                                   rng: Optional[random.Random] = None) -> AIDecision:
         """
         Make AI decision with full reasoning for transparency.
         Fixed: Uses last_raise_amount for correct minimum raise calculation per Texas Hold'em rules
+        rng: Random stream for bluff/mix rolls (PokerGame passes its per-game stream);
+             defaults to the global `random` module.
         """
+        if rng is None:
+            rng = random
 
         # Calculate minimum raise increment (Texas Hold'em rule)
         min_raise_increment = last_raise_amount if last_raise_amount is not None else big_blind
 
         # Hand strength calculation
-        evaluator = HandEvaluator()
-        hand_score, hand_rank = evaluator.evaluate_hand(hole_cards, community_cards)
+        hand_score, hand_rank = get_hand_evaluator().evaluate_hand(hole_cards, community_cards, rng=rng)
 
         # Use consolidated hand strength calculation
         hand_strength = HandEvaluator.score_to_strength(hand_score)
@@ -50,31 +134,32 @@ class AIStrategy:
         spr = player_stack / pot_size if pot_size > 0 else 999.0
 
         if personality == "Conservative":
+            t = PERSONALITY_THRESHOLDS["Conservative"]
             # SPR-aware Conservative: Tighter with deep stacks, more committed with shallow stacks
-            if spr < 3 and hand_strength >= 0.45:  # Low SPR - pot-committed with two pair+
-                action = "raise" if random.random() > 0.3 else "call"
+            if spr < t["low_spr"] and hand_strength >= t["commit_strength"]:  # Low SPR - pot-committed with two pair+
+                action = "raise" if rng.random() > t["raise_roll"] else "call"
                 # FIX: Don't use max with player_stack, just calculate min raise and cap it
                 amount = (current_bet + min_raise_increment) if action == "raise" else call_amount
                 amount = min(amount, player_stack)
                 reasoning = f"Low SPR ({spr:.1f}) - pot committed with {hand_rank} ({hand_strength:.1%})"
                 confidence = 0.85
-            elif spr > 10 and hand_strength < 0.65:  # High SPR - need premium hands
+            elif spr > t["deep_spr"] and hand_strength < t["deep_strength"]:  # High SPR - need premium hands
                 action = "fold"
                 amount = 0
                 reasoning = f"High SPR ({spr:.1f}) - need premium hand, folding {hand_rank} ({hand_strength:.1%})"
                 confidence = 0.8
-            elif hand_strength >= 0.75:  # Flush or better
-                action = "raise" if random.random() > 0.3 else "call"
+            elif hand_strength >= t["premium_strength"]:  # Flush or better
+                action = "raise" if rng.random() > t["raise_roll"] else "call"
                 amount = max(current_bet + min_raise_increment, current_bet * 2) if action == "raise" else call_amount
                 amount = min(amount, player_stack)
                 reasoning = f"Premium hand ({hand_rank}, {hand_strength:.1%}). Conservative value betting."
                 confidence = 0.9
-            elif hand_strength >= 0.45:  # Two pair or better
+            elif hand_strength >= t["solid_strength"]:  # Two pair or better
                 action = "call"
                 amount = call_amount
                 reasoning = f"Solid hand ({hand_rank}, {hand_strength:.1%}). Conservative call."
                 confidence = 0.7
-            elif hand_strength >= 0.25 and call_amount <= player_stack // 20:
+            elif hand_strength >= t["marginal_strength"] and call_amount <= player_stack // t["marginal_stack_div"]:
                 action = "call"
                 amount = call_amount
                 reasoning = f"Marginal hand ({hand_rank}, {hand_strength:.1%}). Small bet, worth a call."
@@ -86,15 +171,17 @@ class AIStrategy:
                 confidence = 0.9
 
         elif personality == "Aggressive":
+            t = PERSONALITY_THRESHOLDS["Aggressive"]
             # SPR-aware Aggressive: Push/fold with low SPR, bluff more with high SPR
-            if spr < 3 and hand_strength >= 0.25:  # Low SPR - any pair, push/fold
+            if spr < t["low_spr"] and hand_strength >= t["push_strength"]:  # Low SPR - any pair, push/fold
                 action = "raise"
                 amount = player_stack  # All-in or near all-in
                 reasoning = f"Low SPR ({spr:.1f}) - aggressive push with {hand_rank} ({hand_strength:.1%})"
                 confidence = 0.75
-            elif spr > 7 and hand_strength < 0.25:  # High SPR - more bluffs
-                bluff_chance = 0.4 if call_amount <= player_stack // 20 else 0.2
-                if random.random() < bluff_chance:
+            elif spr > t["bluff_spr"] and hand_strength < t["bluff_strength"]:  # High SPR - more bluffs
+                bluff_chance = (t["bluff_chance_small_bet"] if call_amount <= player_stack // t["small_bet_stack_div"]
+                                else t["bluff_chance"])
+                if rng.random() < bluff_chance:
                     action = "raise"
                     amount = max(current_bet + min_raise_increment, current_bet * 2)
                     amount = min(amount, player_stack)
@@ -105,15 +192,15 @@ class AIStrategy:
                     amount = 0
                     reasoning = f"High SPR ({spr:.1f}) - weak hand ({hand_rank}), conserving chips for better spots."
                     confidence = 0.7
-            elif hand_strength >= 0.55:  # Three of a kind or better
-                action = "raise" if random.random() > 0.2 else "call"
+            elif hand_strength >= t["strong_strength"]:  # Three of a kind or better
+                action = "raise" if rng.random() > t["strong_raise_roll"] else "call"
                 amount = max(current_bet + min_raise_increment, current_bet * 3) if action == "raise" else call_amount
                 amount = min(amount, player_stack)
                 reasoning = f"Strong hand ({hand_rank}, {hand_strength:.1%}). Aggressive value betting."
                 confidence = 0.8
-            elif hand_strength >= 0.25:  # Any pair
-                if random.random() > 0.4:
-                    action = "raise" if random.random() > 0.6 else "call"
+            elif hand_strength >= t["pair_strength"]:  # Any pair
+                if rng.random() > t["pair_play_roll"]:
+                    action = "raise" if rng.random() > t["pair_raise_roll"] else "call"
                     amount = max(current_bet + min_raise_increment, current_bet * 2) if action == "raise" else call_amount
                     amount = min(amount, player_stack)
                     reasoning = f"Playable hand ({hand_rank}, {hand_strength:.1%}). Aggressive play to build pot."
@@ -124,7 +211,7 @@ class AIStrategy:
                     reasoning = f"Marginal hand ({hand_rank}). Aggressive fold to control pot size."
                     confidence = 0.5
             else:  # High card
-                if random.random() > 0.7 and call_amount <= player_stack // 40:
+                if rng.random() > t["steal_roll"] and call_amount <= player_stack // t["steal_stack_div"]:
                     action = "raise"
                     amount = max(current_bet + min_raise_increment, current_bet * 2)
                     amount = min(amount, player_stack)
@@ -137,31 +224,32 @@ class AIStrategy:
                     confidence = 0.8
 
         elif personality == "Mathematical":
+            t = PERSONALITY_THRESHOLDS["Mathematical"]
             # SPR + pot odds combined for optimal EV decisions
             implied_odds_factor = min(spr * pot_odds, 1.0) if spr < 999.0 else pot_odds
 
-            if spr < 3 and hand_strength >= 0.25:  # Low SPR - committed with any pair
+            if spr < t["low_spr"] and hand_strength >= t["commit_strength"]:  # Low SPR - committed with any pair
                 action = "call" if call_amount < player_stack else "raise"
                 amount = call_amount if action == "call" else player_stack
                 reasoning = f"Low SPR ({spr:.1f}) - pot committed with {hand_rank}. Positive EV."
                 confidence = 0.85
-            elif hand_strength >= 0.65:  # Straight or better
+            elif hand_strength >= t["strong_strength"]:  # Straight or better
                 action = "raise"
                 amount = max(current_bet + min_raise_increment, current_bet * 2)
                 amount = min(amount, player_stack)
                 reasoning = f"Strong hand ({hand_rank}, {hand_strength:.1%}). Mathematical value betting."
                 confidence = 0.9
-            elif hand_strength >= 0.45:  # Two pair or better
+            elif hand_strength >= t["solid_strength"]:  # Two pair or better
                 action = "call"
                 amount = call_amount
                 reasoning = f"Solid hand ({hand_rank}, {hand_strength:.1%}). Positive expectation call."
                 confidence = 0.8
-            elif hand_strength >= 0.25 and (pot_odds <= 0.33 or spr < 5):
+            elif hand_strength >= t["marginal_strength"] and (pot_odds <= t["marginal_pot_odds"] or spr < t["marginal_spr"]):
                 action = "call"
                 amount = call_amount
                 reasoning = f"Marginal hand ({hand_rank}, {hand_strength:.1%}). Pot odds {pot_odds:.1%}, SPR {spr:.1f} - positive EV."
                 confidence = 0.6
-            elif hand_strength >= 0.25:
+            elif hand_strength >= t["marginal_strength"]:
                 action = "fold"
                 amount = 0
                 reasoning = f"Pair ({hand_rank}). Pot odds {pot_odds:.1%}, SPR {spr:.1f} - negative EV fold."
@@ -173,14 +261,15 @@ class AIStrategy:
                 confidence = 0.95
 
         elif personality == "Loose-Passive":
+            t = PERSONALITY_THRESHOLDS["Loose-Passive"]
             # Calling station - calls too much, rarely raises or bluffs
-            if hand_strength >= 0.20:  # Any pair or better
-                if spr < 3:  # Low SPR - call to see showdown
+            if hand_strength >= t["pair_strength"]:  # Any pair or better
+                if spr < t["low_spr"]:  # Low SPR - call to see showdown
                     action = "call"
                     amount = call_amount
                     reasoning = f"Low SPR ({spr:.1f}) - calling with {hand_rank}. Loose-passive play."
                     confidence = 0.6
-                elif current_bet > player_stack // 3:  # Too expensive
+                elif current_bet > player_stack // t["expensive_stack_div"]:  # Too expensive
                     action = "fold"
                     amount = 0
                     reasoning = f"Too expensive ({hand_rank}). Even calling stations fold sometimes."
@@ -191,7 +280,7 @@ class AIStrategy:
                     reasoning = f"Calling with {hand_rank} ({hand_strength:.1%}). Loose-passive style."
                     confidence = 0.5
             else:  # Even calling stations fold high card sometimes
-                if call_amount <= player_stack // 40:  # Very small bet
+                if call_amount <= player_stack // t["small_bet_stack_div"]:  # Very small bet
                     action = "call"
                     amount = call_amount
                     reasoning = f"Small bet, worth a call with {hand_rank}. Loose play."
@@ -203,15 +292,16 @@ class AIStrategy:
                     confidence = 0.8
 
         elif personality == "Tight-Aggressive":
+            t = PERSONALITY_THRESHOLDS["Tight-Aggressive"]
             # TAG - premium hands only, but aggressive when playing
-            if hand_strength >= 0.75:  # Flush or better - premium
+            if hand_strength >= t["premium_strength"]:  # Flush or better - premium
                 action = "raise"
                 amount = max(current_bet + min_raise_increment, pot_size)
                 amount = min(amount, player_stack)
                 reasoning = f"Premium hand ({hand_rank}, {hand_strength:.1%}). TAG value betting."
                 confidence = 0.95
-            elif hand_strength >= 0.55:  # Three of a kind - solid
-                if spr < 5:  # Low SPR - go all-in
+            elif hand_strength >= t["strong_strength"]:  # Three of a kind - solid
+                if spr < t["push_spr"]:  # Low SPR - go all-in
                     action = "raise"
                     amount = player_stack
                     reasoning = f"Low SPR ({spr:.1f}), strong hand ({hand_rank}). TAG push."
@@ -222,7 +312,7 @@ class AIStrategy:
                     amount = min(amount, player_stack)
                     reasoning = f"Strong hand ({hand_rank}). TAG value raise."
                     confidence = 0.85
-            elif hand_strength >= 0.35:  # Marginal hands - fold
+            elif hand_strength >= t["marginal_strength"]:  # Marginal hands - fold
                 action = "fold"
                 amount = 0
                 reasoning = f"Below TAG threshold ({hand_rank}, {hand_strength:.1%}). Fold."
@@ -234,21 +324,22 @@ class AIStrategy:
                 confidence = 0.95
 
         elif personality == "Maniac":
+            t = PERSONALITY_THRESHOLDS["Maniac"]
             # Hyper-aggressive - raises almost always
-            if hand_strength >= 0.45:  # Two pair or better
+            if hand_strength >= t["strong_strength"]:  # Two pair or better
                 action = "raise"
                 amount = max(current_bet + min_raise_increment, pot_size * 2)
                 amount = min(amount, player_stack)
                 reasoning = f"Strong hand ({hand_rank}). Maniac value aggression!"
                 confidence = 0.7
-            elif random.random() < 0.70:  # 70% bluff frequency
+            elif rng.random() < t["bluff_roll"]:  # 70% bluff frequency
                 action = "raise"
                 amount = max(current_bet + min_raise_increment, pot_size)
                 amount = min(amount, player_stack)
                 reasoning = f"Bluffing with {hand_rank}. Maniac pressure play!"
                 confidence = 0.3
             else:  # Occasionally calls to vary play
-                if call_amount < player_stack // 2:
+                if call_amount < player_stack // t["call_stack_div"]:
                     action = "call"
                     amount = call_amount
                     reasoning = f"Calling with {hand_rank} to vary play. Maniac style."
@@ -261,7 +352,7 @@ class AIStrategy:
 
         else:
             # Default Conservative
-            action = "call" if hand_strength > 0.4 else "fold"
+            action = "call" if hand_strength > PERSONALITY_THRESHOLDS["Default"]["call_strength"] else "fold"
             amount = call_amount if action == "call" else 0
             reasoning = f"Default strategy: {action} with {hand_strength:.1%} hand strength."
             confidence = 0.5
@@ -276,3 +367,102 @@ class AIStrategy:
             spr=spr,
             decision_id=str(uuid.uuid4())  # FIX Issue #3: Unique ID for reliable deduplication
         )
+
+    @staticmethod
+    def make_decisions_batch(personality: np.ndarray, hand_strength: np.ndarray, current_bet: np.ndarray,
+                             pot_size: np.ndarray, player_stack: np.ndarray, player_bet: np.ndarray,
+                             min_raise_increment: np.ndarray, rolls: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized make_decision_with_reasoning() for the batched engine: one row
+        per deciding player, same branches and amounts (no reasoning), thresholds
+        from the same PERSONALITY_THRESHOLDS.
+
+        personality: codes into PERSONALITIES (-1 = default strategy)
+        hand_strength: score_to_strength() of each player's hand
+        min_raise_increment: last raise size, or big blind if none this round
+        rolls: (n, 2) uniforms standing in for the 1st and 2nd rng.random() call
+
+        Returns (action codes into ACTIONS, amount). Amount is the raise total
+        for raises, the call amount for calls and 0 for folds.
+        """
+        hs = hand_strength
+        stack = player_stack
+        u1, u2 = rolls[:, 0], rolls[:, 1]
+
+        call_amount = current_bet - player_bet
+        pot_odds = np.divide(call_amount, pot_size + call_amount, out=np.zeros(len(hs)),
+                             where=(pot_size + call_amount) > 0)
+        spr = np.divide(stack, pot_size, out=np.full(len(hs), 999.0), where=pot_size > 0)
+
+        min_raise = current_bet + min_raise_increment
+        raise_min = np.minimum(min_raise, stack)
+        raise_2x = np.minimum(np.maximum(min_raise, current_bet * 2), stack)
+        raise_3x = np.minimum(np.maximum(min_raise, current_bet * 3), stack)
+        raise_pot = np.minimum(np.maximum(min_raise, pot_size), stack)
+        raise_2pot = np.minimum(np.maximum(min_raise, pot_size * 2), stack)
+
+        # Conservative
+        t = PERSONALITY_THRESHOLDS["Conservative"]
+        low_spr_commit = (spr < t["low_spr"]) & (hs >= t["commit_strength"])
+        raise_or_call = np.where(u1 > t["raise_roll"], RAISE, CALL)
+        conservative = np.select(
+            [low_spr_commit, (spr > t["deep_spr"]) & (hs < t["deep_strength"]), hs >= t["premium_strength"],
+             hs >= t["solid_strength"], (hs >= t["marginal_strength"]) & (call_amount <= stack // t["marginal_stack_div"])],
+            [raise_or_call, FOLD, raise_or_call, CALL, CALL],
+            FOLD)
+        conservative_amount = np.where(low_spr_commit, raise_min, raise_2x)
+
+        # Aggressive
+        t = PERSONALITY_THRESHOLDS["Aggressive"]
+        push = (spr < t["low_spr"]) & (hs >= t["push_strength"])
+        high_spr_bluff = (spr > t["bluff_spr"]) & (hs < t["bluff_strength"])
+        bluff_chance = np.where(call_amount <= stack // t["small_bet_stack_div"],
+                                t["bluff_chance_small_bet"], t["bluff_chance"])
+        strong = hs >= t["strong_strength"]
+        aggressive = np.select(
+            [push, high_spr_bluff, strong, hs >= t["pair_strength"]],
+            [RAISE, np.where(u1 < bluff_chance, RAISE, FOLD), np.where(u1 > t["strong_raise_roll"], RAISE, CALL),
+             np.where(u1 > t["pair_play_roll"], np.where(u2 > t["pair_raise_roll"], RAISE, CALL), FOLD)],
+            np.where((u1 > t["steal_roll"]) & (call_amount <= stack // t["steal_stack_div"]), RAISE, FOLD))
+        aggressive_amount = np.select([push, high_spr_bluff, strong], [stack, raise_2x, raise_3x], raise_2x)
+
+        # Mathematical
+        t = PERSONALITY_THRESHOLDS["Mathematical"]
+        committed = (spr < t["low_spr"]) & (hs >= t["commit_strength"])
+        mathematical = np.select(
+            [committed, hs >= t["strong_strength"], hs >= t["solid_strength"],
+             (hs >= t["marginal_strength"]) & ((pot_odds <= t["marginal_pot_odds"]) | (spr < t["marginal_spr"]))],
+            [np.where(call_amount < stack, CALL, RAISE), RAISE, CALL, CALL],
+            FOLD)
+        mathematical_amount = np.where(committed, stack, raise_2x)
+
+        # Loose-Passive
+        t = PERSONALITY_THRESHOLDS["Loose-Passive"]
+        loose_passive = np.where(
+            hs >= t["pair_strength"],
+            np.select([spr < t["low_spr"], current_bet > stack // t["expensive_stack_div"]], [CALL, FOLD], CALL),
+            np.where(call_amount <= stack // t["small_bet_stack_div"], CALL, FOLD))
+
+        # Tight-Aggressive
+        t = PERSONALITY_THRESHOLDS["Tight-Aggressive"]
+        tight_aggressive = np.where(hs >= t["strong_strength"], RAISE, FOLD)
+        tight_aggressive_amount = np.select([hs >= t["premium_strength"], spr < t["push_spr"]],
+                                            [raise_pot, stack], raise_2x)
+
+        # Maniac
+        t = PERSONALITY_THRESHOLDS["Maniac"]
+        maniac_strong = hs >= t["strong_strength"]
+        maniac = np.select([maniac_strong, u1 < t["bluff_roll"]], [RAISE, RAISE],
+                           np.where(call_amount < stack // t["call_stack_div"], CALL, FOLD))
+        maniac_amount = np.where(maniac_strong, raise_2pot, raise_pot)
+
+        is_personality = [personality == code for code in range(len(PERSONALITIES))]
+        action = np.select(is_personality,
+                           [conservative, aggressive, mathematical, loose_passive, tight_aggressive, maniac],
+                           np.where(hs > PERSONALITY_THRESHOLDS["Default"]["call_strength"], CALL, FOLD))
+        raise_amount = np.select(is_personality,
+                                 [conservative_amount, aggressive_amount, mathematical_amount,
+                                  raise_2x, tight_aggressive_amount, maniac_amount],
+                                 raise_2x)
+        amount = np.where(action == RAISE, raise_amount, np.where(action == CALL, call_amount, 0))
+        return action, amount
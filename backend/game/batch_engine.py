@@ -0,0 +1,599 @@
+"""
+Batched multi-table engine for research-scale AI-only simulation.
+
+Advances K independent AI-only tables in lockstep, with all table state in
+NumPy arrays: stacks, bets, invested chips, active/all-in/acted flags per
+seat and pot, current bet, blinds, dealer and street per table. Each step
+applies one action at every table that has a player to act, with all AI
+decisions made in one AIStrategy.make_decisions_batch() call.
+
+The rules are PokerGame's, transcribed array-wise and kept bit-compatible:
+- start_new_hand / _post_blinds: button skips busted seats, heads-up SB is
+  the dealer, short blinds go all-in, blinds double every 10 hands
+- apply_action: min-raise rule, short all-in raise becomes a call, a raise
+  reopens the betting, BB option pre-flop
+- _process_remaining_actions / _advance_state_core: same loop and the same
+  resolution order (no-one-can-act showdown on the current board, fold
+  wins, all-in fast-forward, street advance)
+- _award_pot_at_showdown: side pots, split pots and odd chips to the
+  earliest seat left of the button
+
+Hand scores come from the same tables HandEvaluator uses (preflop table
+mean score, treys 5/6-card scores, the 7-card rank table), computed for
+all seats still in the hand each time a street is reached. Seat flags are
+per-table bitmasks, so counts and "next seat to act" are table lookups.
+
+Randomness comes from one counter-based Philox stream per engine. Each AI
+decision draws two uniforms up front (the scalar strategy draws 0-2 lazily),
+so a batched table and a PokerGame do not take the same path from the same
+seed. With trace=True the engine records every deck and decision roll, which
+is enough to replay any table through PokerGame (tests/test_batch_engine.py
+does this as a differential test).
+
+    python -m game.batch_engine --tables 20000 --players 6 --hands 50
+"""
+import argparse
+import itertools
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from treys import Card
+from treys.lookup import LookupTable
+
+from game.ai_strategy import AIStrategy, PERSONALITIES, FOLD, CALL, RAISE
+from game.equity import get_equity_engine
+from game.hand_evaluator import HandEvaluator, get_treys_evaluator
+from game.preflop_table import get_preflop_table
+from game.rank_table import RANK_KEYS
+
+# Same defaults as PokerGame
+STARTING_STACK = 1000
+SMALL_BLIND = 5
+BIG_BLIND = 10
+HANDS_PER_BLIND_LEVEL = 10
+BLIND_MULTIPLIER = 2.0
+MAX_ROUND_ITERATIONS = 100  # _process_remaining_actions loop cap
+
+PRE_FLOP, FLOP, TURN, RIVER = 0, 1, 2, 3
+BOARD_SIZE = (0, 3, 4, 5)  # Community cards visible on each street
+
+# Table phases
+IDLE, BETTING, RESOLVING, FINISHED = 0, 1, 2, 3
+
+_unsuited_tables: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+
+def _unsuited_table(num_cards: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sorted rank-key sums and treys scores of every non-flush 5- or 6-card
+    rank multiset (the 7-card case is the rank table). Rank-key sums are
+    unique for up to 7 cards, so a sum identifies the multiset.
+    """
+    if num_cards not in _unsuited_tables:
+        lookup: LookupTable = get_treys_evaluator().table
+        keys, scores = [], []
+        for ranks in itertools.combinations_with_replacement(range(13), num_cards):
+            if any(ranks[i] == ranks[i + 4] for i in range(num_cards - 4)):
+                continue  # 5 of one rank
+            best = LookupTable.MAX_HIGH_CARD
+            for five in set(itertools.combinations(ranks, 5)):
+                prime = 1
+                for r in five:
+                    prime *= Card.PRIMES[r]
+                best = min(best, lookup.unsuited_lookup[prime])
+            keys.append(sum(RANK_KEYS[r] for r in ranks))
+            scores.append(best)
+        order = np.argsort(keys)
+        _unsuited_tables[num_cards] = (np.array(keys, dtype=np.int64)[order],
+                                       np.array(scores, dtype=np.float64)[order])
+    return _unsuited_tables[num_cards]
+
+
+class BatchScorer:
+    """Scores (R, n) card arrays exactly as HandEvaluator.evaluate_hand does."""
+
+    def __init__(self):
+        preflop = get_preflop_table()
+        if preflop is None:
+            raise RuntimeError("Batched engine needs the preflop table (python -m game.preflop_table)")
+        self.engine = get_equity_engine()
+        self.preflop = np.zeros((52, 52))
+        for a, b in itertools.permutations(range(52), 2):
+            self.preflop[a, b] = preflop.mean_score([a, b])
+        self.unsuited = {n: _unsuited_table(n) for n in (5, 6)}
+
+    def score(self, cards: np.ndarray) -> np.ndarray:
+        """Scores for 2 (preflop mean score), 5, 6 or 7 cards per row. Lower is better."""
+        num_cards = cards.shape[1]
+        if num_cards == 2:
+            return self.preflop[cards[:, 0], cards[:, 1]]
+        if num_cards == 7:
+            return self.engine.score7(cards).astype(np.float64)
+
+        engine = self.engine
+        keys, values = self.unsuited[num_cards]
+        scores = values[np.searchsorted(keys, engine.rank_keys[cards].sum(axis=1))]
+        flush_suit = engine.flush_suit[engine.suit_keys[cards].sum(axis=1)]
+        flush_rows = np.nonzero(flush_suit >= 0)[0]
+        if flush_rows.size:
+            # 5+ suited out of 5-6 cards: the flush beats any pairing
+            flush_cards = cards[flush_rows]
+            suited = engine.suits[flush_cards] == flush_suit[flush_rows, None]
+            masks = (engine.rank_bits[flush_cards] * suited).sum(axis=1)
+            scores[flush_rows] = engine.flush[masks]
+        return scores
+
+
+class BatchPokerEngine:
+    """K AI-only tables of num_players seats, advanced together."""
+
+    def __init__(self, num_tables: int, num_players: int = 4,
+                 personalities: Optional[Sequence[Sequence[str]]] = None,
+                 seed: Optional[int] = None, starting_stack: int = STARTING_STACK,
+                 trace: bool = False):
+        """
+        Args:
+            num_tables: Number of independent tables (K)
+            num_players: Seats per table (2-6, as PokerGame)
+            personalities: Per table, one AIStrategy personality per seat. Default:
+                           distinct random picks per table, as PokerGame does.
+            seed: Seed for the engine's Philox stream (decks, decision rolls)
+            starting_stack: Chips per seat
+            trace: Record decks and decision rolls per table (for replay)
+        """
+        if not 2 <= num_players <= 6:
+            raise ValueError("num_players must be between 2 and 6")
+
+        K, N = num_tables, num_players
+        self.num_tables = K
+        self.num_players = N
+        self.rng = np.random.Generator(np.random.Philox(seed))
+        self.scorer = BatchScorer()
+
+        if personalities is None:
+            picks = self.rng.random((K, len(PERSONALITIES))).argsort(axis=1)[:, :N]
+            self.personality = picks.astype(np.int64)
+        else:
+            self.personality = np.array([[PERSONALITIES.index(p) for p in table] for table in personalities],
+                                        dtype=np.int64).reshape(K, N)
+
+        # Per-seat flags are bitmasks per table (bit i = seat i), so counts and
+        # "next seat that can act" are single table lookups instead of row scans
+        self.seats = np.arange(N)
+        self.seat_bit = 1 << self.seats
+        self.popcount = np.array([bin(bits).count("1") for bits in range(1 << N)])
+        self.next_seat = np.array([
+            [next(((start + j) % N for j in range(N) if bits >> ((start + j) % N) & 1), -1)
+             for bits in range(1 << N)]
+            for start in range(N)
+        ])
+
+        # Seat state (K, N)
+        self.stack = np.full((K, N), starting_stack, dtype=np.int64)
+        self.bet = np.zeros((K, N), dtype=np.int64)  # Player.current_bet
+        self.invested = np.zeros((K, N), dtype=np.int64)  # Player.total_invested
+        self.hole = np.zeros((K, N, 2), dtype=np.int64)
+        self.scores = np.full((K, N, 4), np.inf)  # Per street, filled when the street is reached
+        self.strength = np.zeros((K, N, 4))  # score_to_strength() of scores
+
+        # Seat flags as bitmasks (K,)
+        self.active = np.zeros(K, dtype=np.int64)
+        self.all_in = np.zeros(K, dtype=np.int64)
+        self.acted = np.zeros(K, dtype=np.int64)  # Player.has_acted
+        self.acted_this_hand = np.zeros(K, dtype=np.int64)  # Any action event (BB option)
+
+        # Table state (K,)
+        self.board = np.zeros((K, 5), dtype=np.int64)  # Dealt up front, revealed per street
+        self.pot = np.zeros(K, dtype=np.int64)
+        self.current_bet = np.zeros(K, dtype=np.int64)
+        self.last_raise = np.zeros(K, dtype=np.int64)  # Min raise increment (BB when no raise yet)
+        self.last_raiser = np.full(K, -1, dtype=np.int64)
+        self.last_actor = np.full(K, -1, dtype=np.int64)
+        self.street = np.zeros(K, dtype=np.int64)
+        self.dealer = np.zeros(K, dtype=np.int64)
+        self.current = np.full(K, -1, dtype=np.int64)  # Seat to act, -1 = None
+        self.iterations = np.zeros(K, dtype=np.int64)
+        self.small_blind = np.full(K, SMALL_BLIND, dtype=np.int64)
+        self.big_blind = np.full(K, BIG_BLIND, dtype=np.int64)
+        self.hand_count = np.zeros(K, dtype=np.int64)
+        self.phase = np.full(K, IDLE, dtype=np.int64)
+        self.total_chips = self.stack.sum(axis=1)
+
+        # Flat views for (table, seat) gathers and scatters
+        self._stack_flat = self.stack.reshape(-1)
+        self._bet_flat = self.bet.reshape(-1)
+        self._invested_flat = self.invested.reshape(-1)
+
+        self.trace = trace
+        self.trace_decks: List[List[List[int]]] = [[] for _ in range(K)] if trace else []
+        self.trace_rolls: List[List[Tuple[float, float]]] = [[] for _ in range(K)] if trace else []
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def run(self, max_hands: int = 200) -> int:
+        """
+        Play every table until one player has all the chips or it has played
+        max_hands hands. Tables start their next hand as soon as the previous
+        one ends. Returns the number of hands played.
+        """
+        hands_before = int(self.hand_count.sum())
+        self.phase[self.phase == FINISHED] = IDLE
+        while True:
+            idle = np.nonzero(self.phase == IDLE)[0]
+            if idle.size:
+                funded = (self.stack[idle] > 0).sum(axis=1)
+                can_start = (funded >= 2) & (self.hand_count[idle] < max_hands)
+                self.phase[idle[~can_start]] = FINISHED
+                self._start_hands(idle[can_start])
+
+            betting = np.nonzero(self.phase == BETTING)[0]
+            if betting.size:
+                done = ((self.current[betting] < 0) | (self.iterations[betting] >= MAX_ROUND_ITERATIONS)
+                        | self._round_complete(betting))
+                self.phase[betting[done]] = RESOLVING
+                acting = betting[~done]
+            else:
+                acting = betting
+
+            resolving = np.nonzero(self.phase == RESOLVING)[0]
+            if resolving.size:
+                self._resolve(resolving)
+            if acting.size:
+                self._act(acting)
+
+            if not acting.size and not resolving.size and (self.phase == FINISHED).all():
+                break
+        return int(self.hand_count.sum()) - hands_before
+
+    def check_chips(self):
+        """Raise if any table created or lost chips (chip conservation)."""
+        totals = self.stack.sum(axis=1) + self.pot
+        bad = np.nonzero(totals != self.total_chips)[0]
+        if bad.size:
+            raise RuntimeError(f"🚨 CHIP CONSERVATION VIOLATED at tables {bad[:10].tolist()}")
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _seat_mask(self, bits: np.ndarray) -> np.ndarray:
+        """Bitmasks (m,) -> bool array (m, N)."""
+        return ((bits[:, None] >> self.seats) & 1).astype(bool)
+
+    def _bet(self, rows: np.ndarray, seats: np.ndarray, amount: np.ndarray):
+        """Player.bet() for one seat per row, adding to the pot."""
+        flat = rows * self.num_players + seats
+        stack = self._stack_flat[flat]
+        goes_all_in = amount >= stack
+        amount = np.where(goes_all_in, stack, amount)
+        stack = stack - amount
+        bet = self._bet_flat[flat] + amount
+        self._stack_flat[flat] = stack
+        self._bet_flat[flat] = bet
+        self._invested_flat[flat] += amount
+        self.all_in[rows] |= np.where(goes_all_in | ((stack == 0) & (bet > 0)), 1 << seats, 0)
+        self.pot[rows] += amount
+
+    def _round_complete(self, rows: np.ndarray) -> np.ndarray:
+        """PokerGame._betting_round_complete() for each row."""
+        active = self.active[rows]
+        can_act = active & ~self.all_in[rows]
+        acted = self.acted[rows]
+        num_can_act = self.popcount[can_act]
+
+        # One player left who can act: done unless others are all-in and they haven't acted
+        lone = np.where(self.popcount[active] > 1, (can_act & acted) != 0, True)
+
+        # Everyone who can act has acted and matched the current bet
+        many = (can_act & ~acted) == 0
+        check = np.nonzero(many & (num_can_act > 1))[0]
+        if check.size:
+            check_rows = rows[check]
+            unmatched = (self.bet[check_rows] != self.current_bet[check_rows, None]) @ self.seat_bit
+            many[check] = (unmatched & can_act[check]) == 0
+
+        # BB option: pre-flop, the BB (last raiser) still gets to act if it only posted
+        bb = self.last_raiser[rows]
+        bb_bit = 1 << np.maximum(bb, 0)
+        bb_pending = ((self.street[rows] == PRE_FLOP) & (bb >= 0) & ((can_act & bb_bit) != 0)
+                      & ((self.acted_this_hand[rows] & bb_bit) == 0))
+        many &= ~bb_pending
+
+        return np.where(num_can_act == 0, True, np.where(num_can_act == 1, lone, many))
+
+    def _score_street(self, rows: np.ndarray, street: int):
+        """Score the active seats' hands on `street` (board as dealt so far)."""
+        if not rows.size:
+            return
+        table_rows, seat_cols = np.nonzero(self._seat_mask(self.active[rows]))
+        tables = rows[table_rows]
+        cards = np.hstack([self.hole[tables, seat_cols], self.board[tables, :BOARD_SIZE[street]]])
+        scores = self.scorer.score(cards)
+        self.scores[tables, seat_cols, street] = scores
+        self.strength[tables, seat_cols, street] = HandEvaluator.scores_to_strength(scores)
+
+    # ------------------------------------------------------------------
+    # Hand flow
+    # ------------------------------------------------------------------
+
+    def _start_hands(self, rows: np.ndarray):
+        """PokerGame.start_new_hand() up to the first action, for each row."""
+        if not rows.size:
+            return
+        m, N = len(rows), self.num_players
+
+        # Defensive award of a pot left by an unfinished hand (first active seat, else seat 0)
+        carried = rows[self.pot[rows] > 0]
+        if carried.size:
+            active = self.active[carried]
+            winner = np.where(active != 0, self.next_seat[0, active], 0)
+            self.stack[carried, winner] += self.pot[carried]
+            self.pot[carried] = 0
+
+        self.hand_count[rows] += 1
+        hands = self.hand_count[rows]
+        level_up = rows[(hands > HANDS_PER_BLIND_LEVEL) & ((hands - 1) % HANDS_PER_BLIND_LEVEL == 0)]
+        self.small_blind[level_up] = (self.small_blind[level_up] * BLIND_MULTIPLIER).astype(np.int64)
+        self.big_blind[level_up] = (self.big_blind[level_up] * BLIND_MULTIPLIER).astype(np.int64)
+
+        # Player.reset_for_new_hand()
+        funded_mask = self.stack[rows] > 0
+        funded = funded_mask @ self.seat_bit
+        self.active[rows] = funded
+        self.all_in[rows] = 0
+        self.acted[rows] = 0
+        self.acted_this_hand[rows] = 0
+        self.bet[rows] = 0
+        self.invested[rows] = 0
+        self.street[rows] = PRE_FLOP
+        self.current_bet[rows] = 0
+        self.last_raiser[rows] = -1
+        self.last_actor[rows] = -1
+
+        # Shuffle and deal: 2 cards per active seat in seat order, then the board
+        decks = self.rng.random((m, 52)).argsort(axis=1)
+        if self.trace:
+            for row, deck in zip(rows, decks):
+                self.trace_decks[row].append(deck.tolist())
+        position = 2 * np.maximum(np.cumsum(funded_mask, axis=1) - 1, 0)
+        hole = np.stack([np.take_along_axis(decks, position, axis=1),
+                         np.take_along_axis(decks, position + 1, axis=1)], axis=2)
+        self.hole[rows] = hole
+        dealt = 2 * self.popcount[funded]
+        self.board[rows] = np.take_along_axis(decks, dealt[:, None] + np.arange(5), axis=1)
+
+        # Preflop scores are a table read; later streets are scored when reached
+        preflop = self.scorer.preflop[hole[:, :, 0], hole[:, :, 1]]
+        self.scores[rows, :, PRE_FLOP] = preflop
+        self.strength[rows, :, PRE_FLOP] = HandEvaluator.scores_to_strength(preflop)
+
+        # _post_blinds(): move the button to the next funded seat, then SB/BB
+        dealer = self.next_seat[(self.dealer[rows] + 1) % N, funded]
+        self.dealer[rows] = dealer
+        heads_up = self.popcount[funded] == 2
+        sb = np.where(heads_up, dealer, self.next_seat[(dealer + 1) % N, funded])
+        bb = self.next_seat[(sb + 1) % N, funded & ~(1 << sb)]
+
+        self._bet(rows, sb, self.small_blind[rows])
+        self._bet(rows, bb, self.big_blind[rows])
+        self.current_bet[rows] = self._bet_flat[rows * N + bb]  # Actual BB posted
+        self.last_raiser[rows] = bb
+        self.last_raise[rows] = self.big_blind[rows]
+
+        self.current[rows] = self.next_seat[(bb + 1) % N, funded & ~self.all_in[rows]]
+        self.iterations[rows] = 0
+        self.phase[rows] = BETTING
+
+    def _act(self, rows: np.ndarray):
+        """One AI action at each row's current seat (apply_action semantics)."""
+        m, N = len(rows), self.num_players
+        seat = self.current[rows]
+        bit = 1 << seat
+        flat = rows * N + seat
+        stack = self._stack_flat[flat]
+        bet = self._bet_flat[flat]
+        current_bet = self.current_bet[rows]
+
+        rolls = self.rng.random((m, 2))
+        if self.trace:
+            for row, roll in zip(rows, rolls):
+                self.trace_rolls[row].append((float(roll[0]), float(roll[1])))
+
+        action, amount = AIStrategy.make_decisions_batch(
+            self.personality.reshape(-1)[flat], self.strength[rows, seat, self.street[rows]], current_bet,
+            self.pot[rows], stack, bet, self.last_raise[rows], rolls)
+
+        # Raise below the minimum: all-in converts to a call, anything else is rejected
+        min_raise = current_bet + self.last_raise[rows]
+        short = (action == RAISE) & (amount < min_raise)
+        short_all_in = short & ((amount >= stack) | (amount >= stack + bet))
+        action = np.where(short_all_in, CALL, action)
+        valid = ~short | short_all_in
+
+        calls = np.nonzero(valid & (action == CALL))[0]
+        if calls.size:
+            call_rows = rows[calls]
+            self._bet(call_rows, seat[calls], current_bet[calls] - bet[calls])
+            self.acted[call_rows] |= bit[calls]
+
+        raises = np.nonzero(valid & (action == RAISE))[0]
+        if raises.size:
+            raise_rows, total = rows[raises], amount[raises]
+            self._bet(raise_rows, seat[raises], np.minimum(total - bet[raises], stack[raises]))
+            self.last_raise[raise_rows] = total - current_bet[raises]
+            self.current_bet[raise_rows] = total
+            self.last_raiser[raise_rows] = seat[raises]
+            # A raise reopens the betting for everyone else still able to act
+            reopen = self.active[raise_rows] & ~self.all_in[raise_rows]
+            self.acted[raise_rows] = (self.acted[raise_rows] & ~reopen) | bit[raises]
+
+        ended = np.zeros(m, dtype=bool)
+        folds = np.nonzero(valid & (action == FOLD))[0]
+        if folds.size:
+            fold_rows = rows[folds]
+            self.active[fold_rows] &= ~bit[folds]
+            self.acted[fold_rows] |= bit[folds]
+            remaining = self.popcount[self.active[fold_rows]]
+            # <= 1 player left: fold win (0 left leaves the pot for the next hand)
+            ended[folds] = remaining <= 1
+            self._award_sole(fold_rows[remaining == 1])
+
+        self.acted_this_hand[rows[valid]] |= bit[valid]
+        self.last_actor[rows[valid]] = seat[valid]
+
+        self.phase[rows[ended]] = IDLE
+        going = rows[~ended]
+        self.current[going] = self.next_seat[(seat[~ended] + 1) % N, self.active[going] & ~self.all_in[going]]
+        self.iterations[going] += 1
+
+    def _resolve(self, rows: np.ndarray):
+        """PokerGame._advance_state_core() once the betting loop stops."""
+        active = self.active[rows]
+        active_count = self.popcount[active]
+        can_act = self.popcount[active & ~self.all_in[rows]]
+        done = np.zeros(len(rows), dtype=bool)
+
+        # No one to act: sole survivor takes the pot, else showdown on the current board
+        stuck = self.current[rows] < 0
+        self._award_sole(rows[stuck & (active_count == 1)])
+        self._showdown(rows[stuck & (active_count > 1)])
+        done |= stuck
+
+        # Everyone folded: last actor takes the pot
+        nobody = ~done & (active_count == 0)
+        if nobody.any():
+            nobody_rows = rows[nobody]
+            award = nobody_rows[(self.last_actor[nobody_rows] >= 0) & (self.pot[nobody_rows] > 0)]
+            winner = self.last_actor[award]
+            self.stack[award, winner] += self.pot[award]
+            self.active[award] |= 1 << winner
+            self.pot[award] = 0
+        done |= nobody
+
+        # One player left
+        sole = ~done & (active_count == 1)
+        self._award_sole(rows[sole])
+        done |= sole
+
+        # All-in fast-forward: run out the board and show down
+        fast_forward = ~done & (can_act <= 1)
+        self._score_street(rows[fast_forward & (self.street[rows] < RIVER)], RIVER)
+        self.street[rows[fast_forward]] = RIVER
+        done |= fast_forward
+
+        # Loop hit its iteration cap mid-round: the pot carries to the next hand
+        done |= ~done & ~self._round_complete(rows)
+
+        river = ~done & (self.street[rows] == RIVER)
+        self._showdown(rows[river | fast_forward])
+        done |= river
+
+        self.phase[rows[done]] = IDLE
+
+        # Next street: reset the round, first to act is left of the button
+        advance = rows[~done]
+        if advance.size:
+            self.street[advance] += 1
+            for street in (FLOP, TURN, RIVER):
+                self._score_street(advance[self.street[advance] == street], street)
+            self.bet[advance] = 0
+            self.acted[advance] = 0
+            self.current_bet[advance] = 0
+            self.last_raiser[advance] = -1
+            self.last_raise[advance] = self.big_blind[advance]
+            self.current[advance] = self.next_seat[(self.dealer[advance] + 1) % self.num_players,
+                                                   self.active[advance] & ~self.all_in[advance]]
+            self.iterations[advance] = 0
+            self.phase[advance] = BETTING
+
+    # ------------------------------------------------------------------
+    # Pot awards
+    # ------------------------------------------------------------------
+
+    def _award_sole(self, rows: np.ndarray):
+        """Whole pot to the only active seat."""
+        if rows.size:
+            winner = self.next_seat[0, self.active[rows]]
+            self.stack[rows, winner] += self.pot[rows]
+            self.pot[rows] = 0
+
+    def _showdown(self, rows: np.ndarray):
+        """_award_pot_at_showdown() with determine_winners_with_side_pots() pots."""
+        rows = rows[self.pot[rows] > 0]
+        if not rows.size:
+            return
+        m, N = len(rows), self.num_players
+        index = np.arange(m)
+
+        scores = self.scores[rows][index, :, self.street[rows]]
+        eligible = self._seat_mask(self.active[rows])
+        invested = self.invested[rows]
+        pot = self.pot[rows]
+
+        # All eligible players invested the same: one pot of everything, no layering
+        big = np.iinfo(np.int64).max
+        simple = (np.where(eligible, invested, big).min(axis=1) == np.where(eligible, invested, -1).max(axis=1))
+
+        # Odd chips go to winners closest to the button's left
+        offset = (self.seats - self.dealer[rows, None] - 1) % N
+        earlier = offset[:, None, :] < offset[:, :, None]  # [k, i, j]: seat j before seat i
+
+        remaining = invested.copy()
+        awards = np.zeros((m, N), dtype=np.int64)
+        awarded_pots = np.zeros(m, dtype=np.int64)
+        first_winner = np.full(m, -1, dtype=np.int64)
+        for _ in range(N):
+            contributing = remaining > 0
+            if not contributing.any():
+                break
+            level = np.where(simple, big, np.where(contributing, remaining, big).min(axis=1))
+            contribution = np.minimum(remaining, level[:, None])
+            remaining -= contribution
+            amount = contribution.sum(axis=1)
+
+            contenders = eligible & ((contribution > 0) | simple[:, None])
+            has_winner = contenders.any(axis=1)
+            best = np.where(contenders, scores, np.inf).min(axis=1)
+            winners = contenders & (scores == best[:, None])
+            num_winners = np.maximum(winners.sum(axis=1), 1)
+            order = (earlier & winners[:, None, :]).sum(axis=2)
+            share = amount // num_winners
+            remainder = amount % num_winners
+            awards += np.where(winners, share[:, None] + (order < remainder[:, None]), 0)
+            awarded_pots += np.where(has_winner, amount, 0)
+
+            new_first = has_winner & (first_winner < 0)
+            first_winner[new_first] = (winners & (order == 0))[new_first].argmax(axis=1)
+
+        # Chips in no pot (e.g. folded players' top layer) go to the first winner
+        difference = pot - awarded_pots
+        extra = (difference > 0) & (first_winner >= 0)
+        awards[index[extra], first_winner[extra]] += difference[extra]
+
+        self.stack[rows] += awards
+        self.pot[rows] = 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the batched multi-table engine.")
+    parser.add_argument("--tables", type=int, default=10000, help="tables advanced together")
+    parser.add_argument("--players", type=int, default=6, help="seats per table (2-6)")
+    parser.add_argument("--hands", type=int, default=50, help="max hands per table")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    engine = BatchPokerEngine(args.tables, args.players, seed=args.seed)
+    start = time.perf_counter()
+    hands = engine.run(args.hands)
+    elapsed = time.perf_counter() - start
+    engine.check_chips()
+    print(f"{hands:,} hands on {args.tables:,} tables in {elapsed:.2f}s ({hands / elapsed:,.0f} hands/sec)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
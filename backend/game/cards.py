@@ -0,0 +1,47 @@
+"""
+Integer card representation.
+
+Inside the engine a card is a plain int 0-51: rank * 4 + suit, with ranks
+"23456789TJQKA" and suits "shdc" (so 0 = "2s", 51 = "Ac"). DeckManager,
+Player.hole_cards, PokerGame.community_cards and HandEvaluator all use
+ints; strings like "Ah" only appear at the API/serialization edge
+(cards_to_str) and when parsing external input (to_cards).
+"""
+from typing import Dict, Iterable, List, Union
+
+RANKS = "23456789TJQKA"
+SUITS = "shdc"
+
+# Card int -> string
+CARD_STRINGS: List[str] = [rank + suit for rank in RANKS for suit in SUITS]
+
+# String -> card int. Also accepts "10" as an alias for "T", and card ints
+# themselves (identity), so lookups work on either form without a type check.
+CARD_INDEX: Dict[Union[str, int], int] = {}
+for _index, _card in enumerate(CARD_STRINGS):
+    CARD_INDEX[_card] = _index
+    CARD_INDEX[_index] = _index
+    if _card[0] == "T":
+        CARD_INDEX["10" + _card[1]] = _index
+
+FULL_DECK: List[int] = list(range(52))
+
+
+def card_index(card: Union[str, int]) -> int:
+    """Convert a card ("Ah", "Ts", "10s" or an int) to its 0-51 int."""
+    return CARD_INDEX[card]
+
+
+def to_cards(cards: Iterable[Union[str, int]]) -> List[int]:
+    """Parse external cards (strings or ints) into card ints."""
+    return [CARD_INDEX[card] for card in cards]
+
+
+def card_str(card: Union[str, int]) -> str:
+    """Card int (or string) -> canonical string like "Ah"."""
+    return CARD_STRINGS[CARD_INDEX[card]]
+
+
+def cards_to_str(cards: Iterable[Union[str, int]]) -> List[str]:
+    """Card ints -> strings, for API responses and hand history records."""
+    return [CARD_STRINGS[CARD_INDEX[card]] for card in cards]
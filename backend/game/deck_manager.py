@@ -1,23 +1,55 @@
 import random
-from typing import List
+from typing import List, Optional, Tuple
+
+from game.cards import FULL_DECK
 
 
 class DeckManager:
-    """Simple deck management."""
+    """Simple deck management. Cards are ints (see game.cards)."""
 
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
+        """
+        Args:
+            rng: Random stream to shuffle with (PokerGame passes its own per-game
+                 stream). Defaults to the global `random` module.
+        """
+        self.rng = rng if rng is not None else random
         self.reset()
 
     def reset(self):
         """Create and shuffle a new deck."""
-        self.deck = [rank + suit for rank in "23456789TJQKA" for suit in "shdc"]
-        random.shuffle(self.deck)
+        self._cards = FULL_DECK.copy()
+        self.rng.shuffle(self._cards)
+        self._position = 0  # Next card to deal (no list copy per deal)
+
+    @property
+    def deck(self) -> List[int]:
+        """Undealt cards, top of the deck first (a copy, for inspection)."""
+        return self._cards[self._position:]
+
+    def snapshot(self) -> Tuple[List[int], int]:
+        """
+        Deck order and position. The card list is shared, not copied: reset()
+        replaces it and dealing never mutates it.
+        """
+        return self._cards, self._position
+
+    def restore(self, snapshot: Tuple[List[int], int]):
+        self._cards, self._position = snapshot
+
+    def fork(self, rng: random.Random) -> "DeckManager":
+        """Same deck at the same position, shuffling future decks with rng."""
+        deck = DeckManager.__new__(DeckManager)
+        deck.rng = rng
+        deck._cards, deck._position = self._cards, self._position
+        return deck
 
-    def deal_cards(self, num_cards: int) -> List[str]:
+    def deal_cards(self, num_cards: int) -> List[int]:
         """Deal specified number of cards."""
-        if num_cards > len(self.deck):
-            raise ValueError(f"Not enough cards: need {num_cards}, have {len(self.deck)}")
+        remaining = len(self._cards) - self._position
+        if num_cards > remaining:
+            raise ValueError(f"Not enough cards: need {num_cards}, have {remaining}")
 
-        cards = self.deck[:num_cards]
-        self.deck = self.deck[num_cards:]
-        return cards
+        start = self._position
+        self._position += num_cards
+        return self._cards[start:self._position]
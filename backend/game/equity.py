@@ -0,0 +1,185 @@
+"""
+Vectorized Monte Carlo equity engine.
+
+Samples thousands of runouts in one NumPy call and scores them all at once
+through the memory-mapped rank table (game.rank_table). Replaces the old
+per-sample loop of random.shuffle + Card.new + treys.evaluate.
+
+When the number of possible runouts (board completions x opponent hands)
+is at most the exact-enumeration threshold - e.g. heads-up on the turn or
+river - every runout is enumerated instead, giving a deterministic,
+zero-variance result.
+
+Cards are 0-51 indices (rank * 4 + suit), see game.rank_table.CARD_INDEX.
+"""
+import itertools
+import os
+import random
+from math import comb
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+from game.rank_table import (
+    CARD_RANK_BIT, CARD_RANK_KEY, CARD_SUIT_KEY, FLUSH_SUIT,
+    RankTable, get_rank_table,
+)
+
+DEFAULT_SAMPLES = 2000  # Runouts per estimate (old loop used 100)
+# Enumerate every runout when there are at most this many (turn vs 1 opponent = 45,540)
+EXACT_ENUMERATION_THRESHOLD = int(os.getenv("POKER_EXACT_EQUITY_THRESHOLD", "50000"))
+
+
+@dataclass
+class EquityResult:
+    """Equity estimate for one hand against random opponent holdings."""
+    mean_score: float  # Average treys score of hero's final hand (lower is better)
+    score_std_error: float  # Standard error of mean_score
+    equity: float  # Share of pots won vs num_opponents random hands (ties split)
+    std_error: float  # Standard error of equity
+    samples: int  # Runouts evaluated
+    num_opponents: int = 1
+    exact: bool = False  # True if every runout was enumerated (std errors are 0)
+
+
+class EquityEngine:
+    """Batched hand scoring and equity estimation over the shared rank table."""
+
+    def __init__(self, rank_table: Optional[RankTable] = None,
+                 exact_threshold: int = EXACT_ENUMERATION_THRESHOLD):
+        table = rank_table or get_rank_table()
+        self.exact_threshold = exact_threshold
+        self.flush = np.frombuffer(table.flush, dtype=np.uint16)
+        self.unsuited = np.frombuffer(table.unsuited, dtype=np.uint16)
+        self.rank_keys = np.array(CARD_RANK_KEY, dtype=np.int32)
+        self.suit_keys = np.array(CARD_SUIT_KEY, dtype=np.int32)
+        self.rank_bits = np.array(CARD_RANK_BIT, dtype=np.int32)
+        self.suits = np.arange(52, dtype=np.int32) & 3
+        self.flush_suit = np.array(FLUSH_SUIT, dtype=np.int8)
+
+    def score7(self, cards: np.ndarray) -> np.ndarray:
+        """Score an (N, 7) array of card indices. Returns N treys scores."""
+        scores = self.unsuited[self.rank_keys[cards].sum(axis=1)].astype(np.int32)
+
+        flush_suit = self.flush_suit[self.suit_keys[cards].sum(axis=1)]
+        flush_rows = np.nonzero(flush_suit >= 0)[0]
+        if flush_rows.size:
+            flush_cards = cards[flush_rows]
+            suited = self.suits[flush_cards] == flush_suit[flush_rows, None]
+            masks = (self.rank_bits[flush_cards] * suited).sum(axis=1)
+            scores[flush_rows] = self.flush[masks]
+        return scores
+
+    @staticmethod
+    def sample_cards(rng: np.random.Generator, deck: np.ndarray, samples: int, count: int) -> np.ndarray:
+        """
+        Draw `count` distinct cards from deck for each of `samples` rows.
+        Vectorized partial Fisher-Yates: one column of draws per step.
+        """
+        remaining = np.tile(deck, (samples, 1))
+        drawn = np.empty((samples, count), dtype=deck.dtype)
+        rows = np.arange(samples)
+        for j in range(count):
+            last = deck.size - 1 - j
+            picks = rng.integers(0, last + 1, size=samples)
+            drawn[:, j] = remaining[rows, picks]
+            remaining[rows, picks] = remaining[:, last]
+        return drawn
+
+    @staticmethod
+    def count_runouts(unseen: int, board_needed: int, num_opponents: int) -> int:
+        """Number of (board completion, opponent hands) runouts from `unseen` cards."""
+        total = comb(unseen, board_needed)
+        unseen -= board_needed
+        for _ in range(num_opponents):
+            total *= comb(unseen, 2)
+            unseen -= 2
+        return total
+
+    @staticmethod
+    def enumerate_cards(deck: np.ndarray, board_needed: int, num_opponents: int) -> np.ndarray:
+        """
+        Every runout as rows of [board completion, opponent 1 hand, ...].
+        Opponent hands are ordered, so each board appears equally often.
+        """
+        rows = np.array(list(itertools.combinations(deck, board_needed)), dtype=np.int32)
+        pairs = np.array(list(itertools.combinations(deck, 2)), dtype=np.int32)
+        for _ in range(num_opponents):
+            rows = np.hstack([np.repeat(rows, len(pairs), axis=0), np.tile(pairs, (len(rows), 1))])
+            # Drop rows where the new hand reuses a card already dealt in that row
+            overlap = (rows[:, :-2, None] == rows[:, None, -2:]).any(axis=(1, 2))
+            rows = rows[~overlap]
+        return rows
+
+    def estimate(self, hole_cards: Sequence[int], community_cards: Sequence[int],
+                 num_opponents: int = 1, samples: int = DEFAULT_SAMPLES,
+                 rng: Optional[np.random.Generator] = None,
+                 exact_threshold: Optional[int] = None) -> EquityResult:
+        """
+        Equity for 2 hole cards + 0-5 community cards.
+
+        Each runout completes the board and deals num_opponents random hands
+        from the unseen cards. Runouts are enumerated exhaustively when there
+        are at most exact_threshold of them (default: the engine's threshold),
+        otherwise `samples` are drawn. If rng is not given, one is seeded from
+        the global `random` module so random.seed() keeps runs reproducible.
+        """
+        if exact_threshold is None:
+            exact_threshold = self.exact_threshold
+
+        known = list(hole_cards) + list(community_cards)
+        deck = np.array([c for c in range(52) if c not in known], dtype=np.int32)
+        board_needed = 5 - len(community_cards)
+
+        exact = self.count_runouts(deck.size, board_needed, num_opponents) <= exact_threshold
+        if exact:
+            drawn = self.enumerate_cards(deck, board_needed, num_opponents)
+        else:
+            if rng is None:
+                rng = np.random.default_rng(random.getrandbits(64))
+            drawn = self.sample_cards(rng, deck, samples, board_needed + 2 * num_opponents)
+
+        runouts = drawn.shape[0]
+        board = np.empty((runouts, 5), dtype=np.int32)
+        board[:, :len(community_cards)] = list(community_cards)
+        board[:, len(community_cards):] = drawn[:, :board_needed]
+
+        hero = self.score7(np.hstack([np.broadcast_to(np.array(hole_cards, dtype=np.int32), (runouts, 2)), board]))
+        return self._summarize(hero, board, drawn[:, board_needed:], num_opponents, exact)
+
+    def _summarize(self, hero: np.ndarray, board: np.ndarray, opponent_cards: np.ndarray,
+                   num_opponents: int, exact: bool = False) -> EquityResult:
+        """Turn hero scores + opponent hole cards into an EquityResult."""
+        samples = hero.shape[0]
+        opponents = np.stack([
+            self.score7(np.hstack([opponent_cards[:, 2 * i:2 * i + 2], board]))
+            for i in range(num_opponents)
+        ], axis=1)
+        best_opponent = opponents.min(axis=1)
+        ties = (opponents == hero[:, None]).sum(axis=1)
+
+        # Win = 1, split n ways = 1/n, lose = 0
+        share = np.where(hero < best_opponent, 1.0,
+                         np.where(hero == best_opponent, 1.0 / (1 + ties), 0.0))
+
+        return EquityResult(
+            mean_score=float(hero.mean()),
+            score_std_error=0.0 if exact else float(hero.std() / np.sqrt(samples)),
+            equity=float(share.mean()),
+            std_error=0.0 if exact else float(share.std() / np.sqrt(samples)),
+            samples=samples,
+            num_opponents=num_opponents,
+            exact=exact,
+        )
+
+
+_engine: Optional[EquityEngine] = None
+
+
+def get_equity_engine() -> EquityEngine:
+    """Process-wide equity engine (shares the rank table mmap)."""
+    global _engine
+    if _engine is None:
+        _engine = EquityEngine()
+    return _engine
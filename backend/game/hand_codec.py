@@ -0,0 +1,685 @@
+"""
+Compact binary encoding of CompletedHand.
+
+asdict() JSON repeats player names and ids, spells out ISO timestamps and
+carries every reasoning sentence in full. This codec writes the same hand as:
+
+- seats from a TableTemplate: the player ids, names and session id every hand
+  of a game shares, stored once per game rather than per hand. Hands refer to
+  them (and to WORDS: actions, event types, rounds, hand ranks) by one-byte
+  ids, so an engine hand carries no strings
+- cards as one byte each (game.cards ints); a betting round's board is a
+  count into the hand's community cards
+- integers as varints (zigzag for signed); stacks and pots as deltas from the
+  previous record, which are almost always zero
+- other strings interned per hand: a repeat costs one varint
+- reasoning as a template id plus its slot values (TEMPLATES); numeric slots
+  ("40", "62.0", "25.0%") as fixed-point varints. Text that matches no template
+  is stored as a plain string
+- timestamps as one varint of microseconds since the previous one, UUIDs as
+  16 raw bytes
+- floats interned; values with up to 6 decimals as fixed-point varints
+
+decode_hand(encode_hand(hand, table), table) == hand for every hand the
+engine produces, whatever the template (players it doesn't know cost a string
+on first use). Card strings come back in canonical form ("Th", not "10h").
+
+The random decision and session UUIDs are most of what is left: 16 bytes per
+AI decision that no encoding can shrink.
+
+The format is versioned (VERSION). TEMPLATES and WORDS are append-only:
+reordering or removing an entry changes old ids and needs a new VERSION.
+"""
+import json
+import math
+import re
+import struct
+import uuid
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from game.ai_strategy import AIDecision
+from game.cards import CARD_STRINGS, card_index
+from game.poker_engine import ActionRecord, BettingRound, CompletedHand, HandEvent
+
+MAGIC = b"PH"
+VERSION = 2
+
+# Strings engine hands use, preloaded into every hand's intern table (id = index)
+WORDS = [
+    # Rounds (BettingRound.round_name)
+    "pre_flop", "flop", "turn", "river", "showdown",
+    # Event types and actions
+    "deal", "hole_cards", "action", "fold", "call", "raise", "all-in", "unknown",
+    "pot_award", "win", "win_by_fold", "defensive_award", "blind_increase", "increase", "system",
+    # Hand ranks (treys rank classes)
+    "Royal Flush", "Straight Flush", "Four of a Kind", "Full House", "Flush",
+    "Straight", "Three of a Kind", "Two Pair", "Pair", "High Card",
+]
+
+# Reasoning templates ("{}" = slot). Template id = index + 1; 0 = plain string.
+TEMPLATES = [
+    # Engine (game.poker_engine)
+    "{} folded",
+    "{} called ${}",
+    "{} called all-in ${}",
+    "{} raised to ${}",
+    "Human player {}",
+    "Dealt 2 hole cards",
+    "{} wins ${} (all others folded)",
+    "{} wins ${} (no other players can act)",
+    "All players folded - {} wins ${} by default",
+    "{} wins ${} at showdown",
+    "Defensive pot award: {} receives ${}",
+    "Blinds increased from ${}/${} to ${}/${}",
+    # AI personalities (game.ai_strategy)
+    "Low SPR ({}) - pot committed with {} ({})",
+    "High SPR ({}) - need premium hand, folding {} ({})",
+    "Premium hand ({}, {}). Conservative value betting.",
+    "Solid hand ({}, {}). Conservative call.",
+    "Marginal hand ({}, {}). Small bet, worth a call.",
+    "Weak hand ({}, {}). Conservative fold.",
+    "Low SPR ({}) - aggressive push with {} ({})",
+    "High SPR ({}) - applying pressure with weak {}. Bluff play.",
+    "High SPR ({}) - weak hand ({}), conserving chips for better spots.",
+    "Strong hand ({}, {}). Aggressive value betting.",
+    "Playable hand ({}, {}). Aggressive play to build pot.",
+    "Marginal hand ({}). Aggressive fold to control pot size.",
+    "Weak hand ({}) but bluffing for fold equity. Aggressive move.",
+    "Too weak to continue ({}, {}). Smart aggression.",
+    "Low SPR ({}) - pot committed with {}. Positive EV.",
+    "Strong hand ({}, {}). Mathematical value betting.",
+    "Solid hand ({}, {}). Positive expectation call.",
+    "Marginal hand ({}, {}). Pot odds {}, SPR {} - positive EV.",
+    "Pair ({}). Pot odds {}, SPR {} - negative EV fold.",
+    "Weak hand ({}, {}). Clear mathematical fold.",
+    "Low SPR ({}) - calling with {}. Loose-passive play.",
+    "Too expensive ({}). Even calling stations fold sometimes.",
+    "Calling with {} ({}). Loose-passive style.",
+    "Small bet, worth a call with {}. Loose play.",
+    "Weak hand ({}). Fold.",
+    "Premium hand ({}, {}). TAG value betting.",
+    "Low SPR ({}), strong hand ({}). TAG push.",
+    "Strong hand ({}). TAG value raise.",
+    "Below TAG threshold ({}, {}). Fold.",
+    "Weak hand ({}). TAG disciplined fold.",
+    "Strong hand ({}). Maniac value aggression!",
+    "Bluffing with {}. Maniac pressure play!",
+    "Calling with {} to vary play. Maniac style.",
+    "Too expensive. Even maniacs fold sometimes.",
+    "Default strategy: {} with {} hand strength.",
+]
+
+
+def _build_matcher():
+    """One anchored alternation over all templates; the outer group that matched names the template."""
+    parts, outer_groups = [], {}
+    group = 0
+    for template_id, template in enumerate(TEMPLATES, start=1):
+        pieces = template.split("{}")
+        group += 1
+        outer_groups[group] = template_id
+        group += len(pieces) - 1
+        parts.append("(" + "(.*?)".join(re.escape(piece) for piece in pieces) + ")")
+    return re.compile("(?s:" + "|".join(parts) + r")\Z"), outer_groups
+
+
+_TEMPLATE_RE, _TEMPLATE_GROUPS = _build_matcher()
+_TEMPLATE_SLOTS = [template.count("{}") for template in TEMPLATES]
+
+
+@dataclass(frozen=True)
+class TableTemplate:
+    """The seats (player id, name) and session id shared by every hand of a game."""
+    session_id: str = ""
+    seats: Tuple[Tuple[str, str], ...] = ()
+
+    @classmethod
+    def for_game(cls, game) -> "TableTemplate":
+        return cls(game.session_id, tuple((player.player_id, player.name) for player in game.players))
+
+
+_NO_TABLE = TableTemplate()
+
+
+@lru_cache(maxsize=256)
+def _preloaded(table: TableTemplate) -> Tuple[Tuple[str, ...], int]:
+    """Strings every hand against table starts with interned, and the table's 16-bit check."""
+    strings = dict.fromkeys(WORDS)
+    for seat in table.seats:
+        strings.update(dict.fromkeys(seat))
+    check = zlib.crc32(json.dumps([table.session_id, table.seats]).encode()) & 0xFFFF
+    return tuple(strings), check
+
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_MAX_DECIMALS = 6  # Floats and numeric slots with up to 6 decimals are stored as ints
+
+# Timestamp kinds (tag 0 = plain string)
+_TS_NAIVE, _TS_UTC_Z = 0, 1
+# Float tags: 0 = interned (ref * _FLOAT_TAGS), 1..7 = fixed point with 0..6 decimals, 8 = raw double
+_FLOAT_RAW = _MAX_DECIMALS + 2
+_FLOAT_TAGS = _FLOAT_RAW + 1
+# Reasoning slot tags: 0 = new string, 1..14 = new number (decimals * 2 + percent + 1), then interned
+_SLOT_REF = 2 * (_MAX_DECIMALS + 1) + 1
+# Action record header: action id (index + 1 in _RECORD_ACTIONS, 0 = string) << 2 | flags.
+# _NAMED: player_name is the seat's name; _CHIPS: stack and pot move by exactly the amount
+_RECORD_ACTIONS = ("fold", "call", "raise", "all-in")
+_NAMED, _CHIPS = 1, 2
+# Event header: kind << 1 | current_bet changed.
+# Event kinds: every field written, a "deal" event (_DEAL_EVENT), or the next betting-round action
+_EVENT_FIELDS, _EVENT_DEAL, _EVENT_ACTION = 0, 1, 2
+_DEAL_EVENT = ("deal", "hole_cards", 0, "Dealt 2 hole cards")  # event_type, action, amount, reasoning
+_DECIMAL_RE = re.compile(r"(-?)(\d+)(?:\.(\d+))?(%?)\Z")
+
+
+class _Writer:
+    def __init__(self, table: TableTemplate):
+        self.table = table
+        strings, check = _preloaded(table)
+        self.buf = bytearray(MAGIC)
+        self.buf.append(VERSION)
+        self.buf += check.to_bytes(2, "little")
+        self.strings: Dict[str, int] = {s: i for i, s in enumerate(strings)}
+        self.floats: Dict[Tuple[float, float], int] = {}
+        self.last_ts = 0
+
+    def uint(self, n: int):
+        buf = self.buf
+        while n > 0x7F:
+            buf.append((n & 0x7F) | 0x80)
+            n >>= 7
+        buf.append(n)
+
+    def int(self, n: int):
+        self.uint(n << 1 if n >= 0 else (-n << 1) - 1)
+
+    def string(self, s: str):
+        """Interned: 0 + length + UTF-8 the first time, id + 1 after that."""
+        ref = self.strings.get(s)
+        if ref is not None:
+            self.uint(ref + 1)
+            return
+        self.strings[s] = len(self.strings)
+        data = s.encode("utf-8")
+        self.uint(0)
+        self.uint(len(data))
+        self.buf += data
+
+    def slot(self, s: str):
+        """Reasoning slot: interned like string(), but a new number is stored as one."""
+        ref = self.strings.get(s)
+        if ref is not None:
+            self.uint(ref + _SLOT_REF)
+            return
+        self.strings[s] = len(self.strings)
+        match = _DECIMAL_RE.match(s)
+        if match:
+            sign, whole, fraction, percent = match.groups()
+            fraction = fraction or ""
+            mantissa = int(sign + whole + fraction)
+            if len(fraction) <= _MAX_DECIMALS and _format_decimal(mantissa, len(fraction), percent) == s:
+                self.uint(len(fraction) * 2 + bool(percent) + 1)
+                self.int(mantissa)
+                return
+        data = s.encode("utf-8")
+        self.uint(0)
+        self.uint(len(data))
+        self.buf += data
+
+    def text(self, s: str):
+        match = _TEMPLATE_RE.match(s)
+        if match:
+            template_id = _TEMPLATE_GROUPS[match.lastindex]
+            slots = match.groups()[match.lastindex:match.lastindex + _TEMPLATE_SLOTS[template_id - 1]]
+            self.uint(template_id)
+            for slot in slots:
+                self.slot(slot)
+        else:
+            self.uint(0)
+            self.string(s)
+
+    def cards(self, cards: List[str]):
+        self.uint(len(cards))
+        self.buf += bytes(card_index(card) for card in cards)
+
+    def board(self, cards: List[str], community_cards: List[str]):
+        """A round's board: 2 * count + 1 if it is the first count community cards, else the cards."""
+        if cards == community_cards[:len(cards)]:
+            self.uint(2 * len(cards) + 1)
+        else:
+            self.uint(2 * len(cards))
+            self.buf += bytes(card_index(card) for card in cards)
+
+    def float(self, x: float):
+        key = (x, math.copysign(1.0, x))  # Keeps -0.0 apart from 0.0
+        ref = self.floats.get(key)
+        if ref is not None:
+            self.uint(ref * _FLOAT_TAGS)
+            return
+        self.floats[key] = len(self.floats)
+        if math.isfinite(x) and (x or key[1] > 0):
+            for decimals in range(_MAX_DECIMALS + 1):
+                fixed = round(x * 10 ** decimals)
+                if abs(fixed) >= 1 << 53:
+                    break
+                if fixed / 10 ** decimals == x:
+                    self.uint(decimals + 1)
+                    self.int(fixed)
+                    return
+        self.uint(_FLOAT_RAW)
+        self.buf += struct.pack("<d", x)
+
+    def timestamp(self, s: str):
+        """Microseconds since the previous timestamp, if s is ISO format that round-trips."""
+        kind = _TS_UTC_Z if s.endswith("Z") else _TS_NAIVE
+        try:
+            dt = datetime.fromisoformat(s[:-1] if kind == _TS_UTC_Z else s)
+        except ValueError:
+            dt = None
+        if dt is None or dt.tzinfo is not None or _format_ts(dt, kind) != s:
+            self.uint(0)
+            self.string(s)
+            return
+        micros = (dt - _EPOCH) // _MICROSECOND
+        delta = micros - self.last_ts
+        self.uint(((delta << 1 if delta >= 0 else (-delta << 1) - 1) << 1 | kind) + 1)
+        self.last_ts = micros
+
+    def uuid(self, s: str):
+        """2 for the table's session id, 1 + 16 raw bytes for a canonical UUID, else a plain string."""
+        if s == self.table.session_id and s:
+            self.uint(2)
+            return
+        try:
+            value = uuid.UUID(s)
+        except ValueError:
+            value = None
+        if value is not None and str(value) == s:
+            self.uint(1)
+            self.buf += value.bytes
+        else:
+            self.uint(0)
+            self.string(s)
+
+
+class _Reader:
+    def __init__(self, data: bytes, table: TableTemplate):
+        if data[:2] != MAGIC:
+            raise ValueError("Not an encoded hand (bad magic)")
+        if len(data) < 3 or data[2] != VERSION:
+            raise ValueError(f"Unsupported hand encoding version: {data[2] if len(data) > 2 else None}")
+        strings, check = _preloaded(table)
+        if int.from_bytes(data[3:5], "little") != check:
+            raise ValueError("Hand was encoded against a different table template")
+        self.table = table
+        self.data = data
+        self.pos = 5
+        self.strings: List[str] = list(strings)
+        self.floats: List[float] = []
+        self.last_ts = 0
+
+    def uint(self) -> int:
+        data = self.data
+        byte = data[self.pos]
+        self.pos += 1
+        if byte < 0x80:  # Most values fit in one byte
+            return byte
+        n, shift = byte & 0x7F, 7
+        while True:
+            byte = data[self.pos]
+            self.pos += 1
+            n |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return n
+            shift += 7
+
+    def int(self) -> int:
+        n = self.uint()
+        return n >> 1 if not n & 1 else -((n + 1) >> 1)
+
+    def raw(self, size: int) -> bytes:
+        start = self.pos
+        self.pos += size
+        return self.data[start:self.pos]
+
+    def string(self) -> str:
+        ref = self.uint()
+        if ref:
+            return self.strings[ref - 1]
+        s = self.raw(self.uint()).decode("utf-8")
+        self.strings.append(s)
+        return s
+
+    def slot(self) -> str:
+        tag = self.uint()
+        if tag >= _SLOT_REF:
+            return self.strings[tag - _SLOT_REF]
+        if tag:
+            s = _format_decimal(self.int(), (tag - 1) >> 1, "%" if (tag - 1) & 1 else "")
+        else:
+            s = self.raw(self.uint()).decode("utf-8")
+        self.strings.append(s)
+        return s
+
+    def text(self) -> str:
+        template_id = self.uint()
+        if not template_id:
+            return self.string()
+        slots = [self.slot() for _ in range(_TEMPLATE_SLOTS[template_id - 1])]
+        return TEMPLATES[template_id - 1].format(*slots)
+
+    def cards(self) -> List[str]:
+        return [CARD_STRINGS[card] for card in self.raw(self.uint())]
+
+    def board(self, community_cards: List[str]) -> List[str]:
+        tag = self.uint()
+        if tag & 1:
+            return community_cards[:tag >> 1]
+        return [CARD_STRINGS[card] for card in self.raw(tag >> 1)]
+
+    def float(self) -> float:
+        tag = self.uint()
+        if tag % _FLOAT_TAGS == 0:
+            return self.floats[tag // _FLOAT_TAGS]
+        if tag == _FLOAT_RAW:
+            x = struct.unpack("<d", self.raw(8))[0]
+        else:
+            x = self.int() / 10 ** (tag - 1)
+        self.floats.append(x)
+        return x
+
+    def timestamp(self) -> str:
+        tag = self.uint()
+        if not tag:
+            return self.string()
+        tag -= 1
+        delta = tag >> 1
+        self.last_ts += delta >> 1 if not delta & 1 else -((delta + 1) >> 1)
+        return _format_ts(_EPOCH + self.last_ts * _MICROSECOND, tag & 1)
+
+    def uuid(self) -> str:
+        kind = self.uint()
+        if kind == 2:
+            return self.table.session_id
+        if kind:
+            return str(uuid.UUID(bytes=self.raw(16)))
+        return self.string()
+
+
+def _format_ts(dt: datetime, kind: int) -> str:
+    return dt.isoformat() + "Z" if kind == _TS_UTC_Z else dt.isoformat()
+
+
+def _format_decimal(mantissa: int, decimals: int, percent: str) -> str:
+    if not decimals:
+        return f"{mantissa}{percent}"
+    digits = str(abs(mantissa)).rjust(decimals + 1, "0")
+    sign = "-" if mantissa < 0 else ""
+    return f"{sign}{digits[:-decimals]}.{digits[-decimals:]}{percent}"
+
+
+def encode_hand(hand: CompletedHand, table: Optional[TableTemplate] = None) -> bytes:
+    """
+    Encode a CompletedHand (see module docstring for the layout). Pass the
+    game's TableTemplate to leave its seats and session id out of the bytes;
+    decode with the same template.
+    """
+    w = _Writer(table or _NO_TABLE)
+
+    w.uint(hand.hand_number)
+    w.cards(hand.community_cards)
+    w.int(hand.pot_size)
+    w.uint(len(hand.winner_ids))
+    for player_id in hand.winner_ids:
+        w.string(player_id)
+    w.uint(len(hand.winner_names))
+    for name in hand.winner_names:
+        w.string(name)
+    w.string(hand.human_action)
+    w.cards(hand.human_cards)
+    w.int(hand.human_final_stack)
+    w.float(hand.human_hand_strength)
+    w.float(hand.human_pot_odds)
+    w.uint(hand.analysis_available)
+    w.uuid(hand.session_id)
+
+    w.uint(len(hand.ai_decisions))
+    for player_id, decision in hand.ai_decisions.items():
+        w.string(player_id)
+        w.string(decision.action)
+        w.int(decision.amount)
+        w.text(decision.reasoning)
+        w.float(decision.hand_strength)
+        w.float(decision.pot_odds)
+        w.float(decision.confidence)
+        w.float(decision.spr)
+        w.uuid(decision.decision_id)
+
+    names = dict(w.table.seats)  # player_id -> seat name
+    stacks: Dict[str, int] = {}  # player_id -> stack_after of their last action
+    pot = 0
+    w.uint(len(hand.betting_rounds))
+    for betting_round in hand.betting_rounds:
+        w.string(betting_round.round_name)
+        w.board(betting_round.community_cards, hand.community_cards)
+        w.int(betting_round.pot_at_start - pot)
+        pot = betting_round.pot_at_start
+        w.uint(len(betting_round.actions))
+        for action in betting_round.actions:
+            named = action.player_name == names.get(action.player_id)
+            chips = (action.stack_after == action.stack_before - action.amount and action.pot_before == pot
+                     and action.pot_after == pot + action.amount)
+            code = _RECORD_ACTIONS.index(action.action) + 1 if action.action in _RECORD_ACTIONS else 0
+            w.uint(code << 2 | chips << 1 | named)
+            w.string(action.player_id)
+            if not named:
+                w.string(action.player_name)
+                names[action.player_id] = action.player_name
+            if not code:
+                w.string(action.action)
+            w.int(action.amount)
+            w.int(action.stack_before - stacks.get(action.player_id, 0))
+            if not chips:
+                w.int(action.stack_before - action.amount - action.stack_after)
+                w.int(action.pot_before - pot)
+                w.int(action.pot_after - action.pot_before - action.amount)
+            w.text(action.reasoning)
+            stacks[action.player_id] = action.stack_after
+            pot = action.pot_after
+        w.int(betting_round.pot_at_end - pot)
+        pot = betting_round.pot_at_end
+
+    records = [action for betting_round in hand.betting_rounds for action in betting_round.actions]
+    next_record = 0
+    pot = bet = 0
+    w.uint(len(hand.events))
+    for event in hand.events:
+        record = records[next_record] if next_record < len(records) else None
+        if (record is not None and event.event_type == "action" and event.player_id == record.player_id
+                and event.action == record.action and event.amount == record.amount
+                and event.reasoning == record.reasoning and event.pot_size == record.pot_after):
+            w.uint(_EVENT_ACTION << 1 | (event.current_bet != bet))
+            w.timestamp(event.timestamp)
+            w.float(event.hand_strength)
+            next_record += 1
+        elif ((event.event_type, event.action, event.amount, event.reasoning) == _DEAL_EVENT
+              and event.hand_strength == 0 and math.copysign(1.0, event.hand_strength) > 0
+              and (event.pot_size, event.current_bet) == (pot, bet)):
+            w.uint(_EVENT_DEAL << 1)
+            w.timestamp(event.timestamp)
+            w.string(event.player_id)
+            continue
+        else:
+            w.uint(_EVENT_FIELDS << 1 | (event.current_bet != bet))
+            w.timestamp(event.timestamp)
+            w.string(event.event_type)
+            w.string(event.player_id)
+            w.string(event.action)
+            w.int(event.amount)
+            w.float(event.hand_strength)
+            w.text(event.reasoning)
+            w.int(event.pot_size - pot)
+        if event.current_bet != bet:
+            w.int(event.current_bet - bet)
+        pot, bet = event.pot_size, event.current_bet
+    w.timestamp(hand.timestamp)  # After the events it follows: a small delta
+
+    w.uint(len(hand.showdown_hands))
+    for player_id, cards in hand.showdown_hands.items():
+        w.string(player_id)
+        w.cards(cards)
+    w.uint(len(hand.hand_rankings))
+    for player_id, rank in hand.hand_rankings.items():
+        w.string(player_id)
+        w.string(rank)
+
+    return bytes(w.buf)
+
+
+def decode_hand(data: bytes, table: Optional[TableTemplate] = None) -> CompletedHand:
+    """Decode bytes from encode_hand() back into a CompletedHand, with the template they were encoded with."""
+    r = _Reader(data, table or _NO_TABLE)
+
+    hand_number = r.uint()
+    community_cards = r.cards()
+    pot_size = r.int()
+    winner_ids = [r.string() for _ in range(r.uint())]
+    winner_names = [r.string() for _ in range(r.uint())]
+    human_action = r.string()
+    human_cards = r.cards()
+    human_final_stack = r.int()
+    human_hand_strength = r.float()
+    human_pot_odds = r.float()
+    analysis_available = bool(r.uint())
+    session_id = r.uuid()
+
+    ai_decisions = {}
+    for _ in range(r.uint()):
+        player_id = r.string()
+        ai_decisions[player_id] = AIDecision(
+            action=r.string(),
+            amount=r.int(),
+            reasoning=r.text(),
+            hand_strength=r.float(),
+            pot_odds=r.float(),
+            confidence=r.float(),
+            spr=r.float(),
+            decision_id=r.uuid()
+        )
+
+    names = dict(r.table.seats)
+    stacks: Dict[str, int] = {}
+    pot = 0
+    betting_rounds = []
+    for _ in range(r.uint()):
+        round_name = r.string()
+        round_cards = r.board(community_cards)
+        pot_at_start = pot = pot + r.int()
+        actions = []
+        for _ in range(r.uint()):
+            header = r.uint()
+            player_id = r.string()
+            if header & _NAMED:
+                player_name = names[player_id]
+            else:
+                player_name = names[player_id] = r.string()
+            code = header >> 2
+            action = _RECORD_ACTIONS[code - 1] if code else r.string()
+            amount = r.int()
+            stack_before = stacks.get(player_id, 0) + r.int()
+            if header & _CHIPS:
+                stack_after, pot_before, pot_after = stack_before - amount, pot, pot + amount
+            else:
+                stack_after = stack_before - amount - r.int()
+                pot_before = pot + r.int()
+                pot_after = pot_before + amount + r.int()
+            actions.append(ActionRecord(
+                player_id=player_id,
+                player_name=player_name,
+                action=action,
+                amount=amount,
+                stack_before=stack_before,
+                stack_after=stack_after,
+                pot_before=pot_before,
+                pot_after=pot_after,
+                reasoning=r.text()
+            ))
+            stacks[player_id] = stack_after
+            pot = pot_after
+        pot = pot + r.int()
+        betting_rounds.append(BettingRound(
+            round_name=round_name,
+            community_cards=round_cards,
+            actions=actions,
+            pot_at_start=pot_at_start,
+            pot_at_end=pot
+        ))
+
+    records = iter([action for betting_round in betting_rounds for action in betting_round.actions])
+    events = []
+    pot = bet = 0
+    for _ in range(r.uint()):
+        header = r.uint()
+        kind = header >> 1
+        timestamp = r.timestamp()
+        if kind == _EVENT_ACTION:
+            record = next(records)
+            event = HandEvent(timestamp, "action", record.player_id, record.action, record.amount,
+                              r.float(), record.reasoning, record.pot_after,
+                              bet + r.int() if header & 1 else bet)
+        elif kind == _EVENT_DEAL:
+            event_type, action, amount, reasoning = _DEAL_EVENT
+            event = HandEvent(timestamp, event_type, r.string(), action, amount, 0.0, reasoning, pot, bet)
+        else:
+            event = HandEvent(
+                timestamp=timestamp,
+                event_type=r.string(),
+                player_id=r.string(),
+                action=r.string(),
+                amount=r.int(),
+                hand_strength=r.float(),
+                reasoning=r.text(),
+                pot_size=pot + r.int(),
+                current_bet=bet + r.int() if header & 1 else bet
+            )
+        pot, bet = event.pot_size, event.current_bet
+        events.append(event)
+    hand_timestamp = r.timestamp()
+
+    showdown_hands = {}
+    for _ in range(r.uint()):
+        player_id = r.string()
+        showdown_hands[player_id] = r.cards()
+    hand_rankings = {}
+    for _ in range(r.uint()):
+        player_id = r.string()
+        hand_rankings[player_id] = r.string()
+
+    if r.pos != len(data):
+        raise ValueError(f"Trailing data after encoded hand ({len(data) - r.pos} bytes)")
+
+    return CompletedHand(
+        hand_number=hand_number,
+        community_cards=community_cards,
+        pot_size=pot_size,
+        winner_ids=winner_ids,
+        winner_names=winner_names,
+        human_action=human_action,
+        human_cards=human_cards,
+        human_final_stack=human_final_stack,
+        human_hand_strength=human_hand_strength,
+        human_pot_odds=human_pot_odds,
+        ai_decisions=ai_decisions,
+        events=events,
+        analysis_available=analysis_available,
+        session_id=session_id,
+        timestamp=hand_timestamp,
+        betting_rounds=betting_rounds,
+        showdown_hands=showdown_hands,
+        hand_rankings=hand_rankings
+    )
@@ -1,52 +1,258 @@
+import os
 import random
-from typing import List, Dict, Tuple, TYPE_CHECKING
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Dict, Optional, Sequence, Tuple, TYPE_CHECKING
 
+import numpy as np
 from treys import Evaluator, Card
 
+from game.cards import CARD_INDEX, CARD_STRINGS
+from game.rank_table import get_rank_table
+from game.equity import EquityResult, get_equity_engine, DEFAULT_SAMPLES
+from game.preflop_table import get_preflop_table
+
+# Treys card int for each card index (5-6 card path, no string parsing)
+TREYS_CARDS = [Card.new(card) for card in CARD_STRINGS]
+
+# Runouts sampled per incomplete-board evaluation (was a 100-iteration loop)
+MONTE_CARLO_SAMPLES = DEFAULT_SAMPLES
+
+# Max cached (hand, board) evaluations shared by all HandEvaluator instances
+EVALUATION_CACHE_SIZE = int(os.getenv("POKER_EVAL_CACHE_SIZE", "65536"))
+
 if TYPE_CHECKING:
     from game.poker_engine import Player
 
 
+class EvaluationCache:
+    """
+    Bounded LRU cache of exact hand evaluations (5-7 known cards).
+
+    Scores only depend on the set of cards up to a relabelling of suits, so
+    keys are canonicalized under suit isomorphism: one 13-bit rank mask per
+    suit, sorted. "AhKh + Qh Jh Th 2c 3d" and "AsKs + Qs Js Ts 2d 3c" share
+    one entry.
+    """
+
+    def __init__(self, max_size: int = EVALUATION_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple[int, ...], Tuple[int, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def canonical_key(cards: Sequence[int]) -> Tuple[int, ...]:
+        """Suit-isomorphic key for a set of card indices."""
+        masks = [0, 0, 0, 0]
+        for card in cards:
+            masks[card & 3] |= 1 << (card >> 2)
+        masks.sort()
+        return tuple(masks)
+
+    def get(self, key: Tuple[int, ...]) -> Optional[Tuple[int, str]]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: Tuple[int, ...], result: Tuple[int, str]) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict:
+        """Hit/miss/eviction counters for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+
+# Shared by every HandEvaluator (games, AI decisions, API responses)
+evaluation_cache = EvaluationCache()
+
+_treys_evaluator: Optional[Evaluator] = None
+_shared_evaluator: Optional["HandEvaluator"] = None
+# Guards one-time construction of the process-wide instances (threads may race on first use)
+_init_lock = threading.RLock()
+
+
+def get_treys_evaluator() -> Evaluator:
+    """
+    Process-wide treys Evaluator, used by the shared HandEvaluator. Building one
+    generates treys' lookup tables (~10ms), which used to happen for every AI decision.
+    """
+    global _treys_evaluator
+    if _treys_evaluator is None:
+        with _init_lock:
+            if _treys_evaluator is None:
+                _treys_evaluator = Evaluator()
+    return _treys_evaluator
+
+
+def get_hand_evaluator() -> "HandEvaluator":
+    """
+    Process-wide HandEvaluator, shared by games, AI decisions and API responses.
+    Evaluation only reads shared tables (and the locked cache), so one instance
+    is safe to use from any number of threads.
+    """
+    global _shared_evaluator
+    if _shared_evaluator is None:
+        with _init_lock:
+            if _shared_evaluator is None:
+                _shared_evaluator = HandEvaluator()
+    return _shared_evaluator
+
+
+def warm_up() -> Dict[str, float]:
+    """
+    Build the shared evaluator and everything it loads, so no request or AI
+    decision pays for it. Call at startup, and as the initializer of process
+    pools that evaluate hands. Returns milliseconds per step and in total.
+    """
+    steps = (
+        ("treys", get_treys_evaluator),
+        ("rank_table", get_rank_table),
+        ("equity_engine", get_equity_engine),
+        ("preflop_table", get_preflop_table),
+        ("evaluator", get_hand_evaluator),
+    )
+    timings = {}
+    for name, build in steps:
+        start = time.perf_counter()
+        build()
+        timings[name] = (time.perf_counter() - start) * 1000
+    timings["total"] = sum(timings.values())
+    return timings
+
+
 class HandEvaluator:
-    """Hand evaluation using Treys library."""
+    """
+    Hand evaluation using Treys library.
+    Use get_hand_evaluator() rather than constructing one.
+    """
 
     def __init__(self):
-        self.evaluator = Evaluator()
+        self.evaluator = get_treys_evaluator()
+        # 7-card hands go through the shared memory-mapped rank table
+        self.rank_table = get_rank_table()
+        self.equity_engine = get_equity_engine()
+        # Preflop (2 hole cards, no board) is a table read; None if the table is missing
+        self.preflop_table = get_preflop_table()
+        self.cache = evaluation_cache
 
-    def evaluate_hand(self, hole_cards: List[str], community_cards: List[str]) -> Tuple[int, str]:
-        """Evaluate hand strength."""
-        # Convert to Treys format
-        hole = [Card.new(card.replace("10", "T")) for card in hole_cards]
-        board = [Card.new(card.replace("10", "T")) for card in community_cards]
+    def __reduce__(self):
+        # Pickles (e.g. a PokerGame sent to a process pool) carry no tables:
+        # the receiving process uses its own shared evaluator
+        return get_hand_evaluator, ()
 
-        if len(board) + len(hole) >= 5:
-            score = self.evaluator.evaluate(board, hole)
-            rank = self.evaluator.get_rank_class(score)
-            rank_str = self.evaluator.class_to_string(rank)
-            return score, rank_str
-
-        # Simple Monte Carlo for incomplete hands
-        if len(board) < 5:
-            remaining_deck = [rank + suit for rank in "23456789TJQKA" for suit in "shdc"]
-            # Remove known cards (player's perspective: only their cards + community)
-            for card in hole_cards + community_cards:
-                if card in remaining_deck:
-                    remaining_deck.remove(card)
-
-            scores = []
-            for _ in range(100):  # Monte Carlo simulation (increased from 20 to 100 for accuracy)
-                sim_deck = remaining_deck.copy()
-                random.shuffle(sim_deck)
-                sim_board = board + [Card.new(c.replace("10", "T")) for c in sim_deck[:5-len(board)]]
-                scores.append(self.evaluator.evaluate(sim_board, hole))
-
-            avg_score = sum(scores) / len(scores)
+    def evaluate_hand(self, hole_cards: List[int], community_cards: List[int],
+                      rng: Optional[random.Random] = None) -> Tuple[int, str]:
+        """
+        Evaluate hand strength. Cards are ints (card strings are also accepted).
+        rng seeds Monte Carlo sampling (a game's own stream); default is the global `random`.
+        """
+        num_cards = len(hole_cards) + len(community_cards)
+
+        if num_cards >= 5:
+            # Exact evaluations are memoized (same spot is re-evaluated per pot/broadcast)
+            cards = [CARD_INDEX[card] for card in hole_cards + community_cards]
+            key = self.cache.canonical_key(cards)
+            result = self.cache.get(key)
+            if result is None:
+                result = self._evaluate_exact(cards)
+                self.cache.put(key, result)
+            return result
+
+        if not community_cards and len(hole_cards) == 2 and self.preflop_table:
+            avg_score = self.preflop_table.mean_score(hole_cards)
+            rank = self.evaluator.get_rank_class(int(avg_score))
+            return avg_score, self.evaluator.class_to_string(rank)
+
+        # Monte Carlo for incomplete boards: thousands of runouts scored in one batch
+        if len(community_cards) < 5 and len(hole_cards) == 2:
+            result = self.equity_engine.estimate(
+                [CARD_INDEX[card] for card in hole_cards],
+                [CARD_INDEX[card] for card in community_cards],
+                samples=MONTE_CARLO_SAMPLES,
+                rng=self._numpy_rng(rng)
+            )
+            avg_score = result.mean_score
             rank = self.evaluator.get_rank_class(int(avg_score))
             rank_str = self.evaluator.class_to_string(rank)
             return avg_score, rank_str
 
         return 7500, "High Card"  # Default
 
+    def _evaluate_exact(self, cards: List[int]) -> Tuple[int, str]:
+        """Score 5-7 known card ints (no sampling)."""
+        if len(cards) == 7:
+            # Fast path: one rank table read instead of 21 treys 5-card evaluations
+            score = self.rank_table.evaluate7(cards)
+        else:
+            # 5-6 cards (flop/turn): treys is already cheap here
+            score = self.evaluator.evaluate([TREYS_CARDS[card] for card in cards[2:]],
+                                            [TREYS_CARDS[card] for card in cards[:2]])
+        rank = self.evaluator.get_rank_class(score)
+        return score, self.evaluator.class_to_string(rank)
+
+    @staticmethod
+    def cache_stats() -> Dict:
+        """Counters of the shared evaluation cache."""
+        return evaluation_cache.stats()
+
+    @staticmethod
+    def _numpy_rng(rng: Optional[random.Random]) -> Optional[np.random.Generator]:
+        """NumPy generator seeded from a game's stream (None: engine seeds from global `random`)."""
+        return np.random.default_rng(rng.getrandbits(64)) if rng is not None else None
+
+    def estimate_equity(self, hole_cards: List[int], community_cards: List[int],
+                        num_opponents: int = 1, samples: int = MONTE_CARLO_SAMPLES,
+                        rng: Optional[random.Random] = None) -> EquityResult:
+        """Monte Carlo equity (with standard error) against random opponent hands."""
+        table = self.preflop_table
+        if not community_cards and table and 1 <= num_opponents <= table.max_opponents:
+            equity = table.equity(hole_cards, num_opponents)
+            return EquityResult(
+                mean_score=table.mean_score(hole_cards),
+                score_std_error=0.0,
+                equity=equity,
+                std_error=(equity * (1 - equity) / table.samples) ** 0.5,
+                samples=table.samples,
+                num_opponents=num_opponents
+            )
+
+        return self.equity_engine.estimate(
+            [CARD_INDEX[card] for card in hole_cards],
+            [CARD_INDEX[card] for card in community_cards],
+            num_opponents=num_opponents,
+            samples=samples,
+            rng=self._numpy_rng(rng)
+        )
+
     @staticmethod
     def score_to_strength(score: int) -> float:
         """
@@ -85,6 +291,13 @@ class HandEvaluator:
         else:
             return 0.05  # High Card
 
+    @staticmethod
+    def scores_to_strength(scores: np.ndarray) -> np.ndarray:
+        """Vectorized score_to_strength() (same buckets) for the batched engine."""
+        bounds = np.array([10, 166, 322, 1599, 1609, 2467, 3325, 6185])
+        strengths = np.array([0.95, 0.90, 0.85, 0.75, 0.65, 0.55, 0.45, 0.25, 0.05])
+        return strengths[np.searchsorted(bounds, scores, side="left")]
+
     def determine_winners_with_side_pots(
         self, players: List["Player"], community_cards: List[str]
     ) -> List[Dict]:
@@ -94,6 +307,16 @@ class HandEvaluator:
         Fixed: Bug #5 - Side pot implementation
         Fixed: Bug #3 - Optimization for simple cases (no side pots needed)
         """
+        return self.resolve_pots(players, community_cards)[0]
+
+    def resolve_pots(
+        self, players: List["Player"], community_cards: List[str]
+    ) -> Tuple[List[Dict], Dict[str, Tuple[int, str]]]:
+        """
+        determine_winners_with_side_pots(), plus the (score, rank) of every hand
+        it scored, by player_id. Each live hand is scored exactly once, however
+        many side pots it contests.
+        """
         # Players who can win pots
         eligible_winners = [p for p in players if p.is_active or p.all_in]
 
@@ -104,90 +327,71 @@ class HandEvaluator:
         if len(eligible_winners) <= 1:
             winner = eligible_winners[0] if eligible_winners else None
             if not winner:
-                return []
+                return [], {}
             return [{
                 'winners': [winner.player_id],
                 'amount': total_pot,
                 'type': 'main',
                 'eligible_player_ids': [p.player_id for p in eligible_winners]
-            }]
+            }], {}
+
+        # Score each live hand once, in seat order (ties keep seat order)
+        hands = {
+            player.player_id: self.evaluate_hand(player.hole_cards, community_cards)
+            for player in eligible_winners if player.hole_cards
+        }
 
         # OPTIMIZATION (Bug #3): Simple pot when all eligible invested same
         eligible_investments = [p.total_invested for p in eligible_winners]
-        if len(set(eligible_investments)) == 1:
+        if len(set(eligible_investments)) == 1 and hands:
             # All eligible players invested same amount - simple single pot
-            hands = {}
-            for player in eligible_winners:
-                if player.hole_cards:
-                    score, rank = self.evaluate_hand(
-                        player.hole_cards, community_cards
-                    )
-                    hands[player.player_id] = (score, rank, player)
-
-            if hands:
-                best_score = min(hand[0] for hand in hands.values())
-                winners = [
-                    pid for pid, (score, rank, p) in hands.items()
-                    if score == best_score
-                ]
-                return [{
-                    'winners': winners,
-                    'amount': total_pot,
-                    'type': 'main',
-                    'eligible_player_ids': [p.player_id for p in eligible_winners]
-                }]
-
-        # Build side pots (only when players have different investments)
-        # CRITICAL FIX: Don't mutate player.total_invested - make a copy!
-        # Bug: Function was called multiple times, each time reducing total_invested
-        # causing chips to disappear
-        investments = {p.player_id: p.total_invested for p in all_players_with_investment}
+            best_score = min(score for score, _ in hands.values())
+            return [{
+                'winners': [pid for pid, (score, _) in hands.items() if score == best_score],
+                'amount': total_pot,
+                'type': 'main',
+                'eligible_player_ids': [p.player_id for p in eligible_winners]
+            }], hands
+
+        return self._layer_side_pots(all_players_with_investment, eligible_winners, hands), hands
+
+    @staticmethod
+    def _layer_side_pots(invested: List["Player"], eligible_winners: List["Player"],
+                         hands: Dict[str, Tuple[int, str]]) -> List[Dict]:
+        """
+        Sweep the distinct investment levels once, lowest first. Each level is a
+        pot of (level - previous level) from everyone who invested at least that
+        much, won by the best scored hand among its eligible contributors. A
+        level with no eligible contributor (all folded) creates no pot.
+
+        Don't mutate player.total_invested: this is called more than once per hand.
+        """
+        eligible_ids = {p.player_id for p in eligible_winners}
+        investments = sorted(p.total_invested for p in invested)
+        # Eligible contributors, seat order, with their investment
+        contenders = [(p.total_invested, p.player_id) for p in invested if p.player_id in eligible_ids]
+
         pots = []
+        previous = 0
+        below = 0  # Players who invested less than the current level
+        for level in sorted(set(investments)):
+            while investments[below] < level:
+                below += 1
+            pot_amount = (level - previous) * (len(investments) - below)
+            previous = level
 
-        while investments:
-            # Find minimum investment among remaining players
-            min_investment = min(inv for inv in investments.values() if inv > 0)
-            if min_investment == 0:
-                break
-
-            # Create pot at this level - include ALL players' contributions
-            pot_amount = 0
-            pot_contributors = []  # All who contribute to this pot
-            eligible_for_pot = []  # Only active/all-in can win
-
-            for player in all_players_with_investment:
-                if player.player_id not in investments:
-                    continue
-
-                contribution = min(investments[player.player_id], min_investment)
-                pot_amount += contribution
-                investments[player.player_id] -= contribution
-                if contribution > 0:
-                    pot_contributors.append(player)
-                    # Only eligible winners can actually win this pot
-                    if player in eligible_winners:
-                        eligible_for_pot.append(player)
-
-            # Evaluate hands for this pot (only among eligible winners)
-            if eligible_for_pot:
-                hands = {}
-                for player in eligible_for_pot:
-                    if player.hole_cards:
-                        score, rank = self.evaluate_hand(player.hole_cards, community_cards)
-                        hands[player.player_id] = (score, rank, player)
-
-                if hands:
-                    best_score = min(hand[0] for hand in hands.values())
-                    winners = [pid for pid, (score, rank, player) in hands.items() if score == best_score]
-
-                    pots.append({
-                        'winners': winners,
-                        'amount': pot_amount,
-                        'type': 'main' if len(pots) == 0 else f'side_{len(pots)}',
-                        'eligible_player_ids': [p.player_id for p in eligible_for_pot]
-                    })
-
-            # Remove players with zero investment
-            investments = {pid: inv for pid, inv in investments.items() if inv > 0}
+            contenders = [(amount, pid) for amount, pid in contenders if amount >= level]
+            if not contenders:
+                break  # Only folded players invested this much (or more)
+            scored = [(hands[pid][0], pid) for _, pid in contenders if pid in hands]
+            if not scored:
+                continue
+            best_score = min(score for score, _ in scored)
+            pots.append({
+                'winners': [pid for score, pid in scored if score == best_score],
+                'amount': pot_amount,
+                'type': 'main' if len(pots) == 0 else f'side_{len(pots)}',
+                'eligible_player_ids': [pid for _, pid in contenders]
+            })
 
         return pots
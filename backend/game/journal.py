@@ -0,0 +1,214 @@
+"""
+Append-only per-game action journal.
+
+A journaled game writes one JSON line per engine call that changes it
+(start_new_hand, submit_human_action, apply_action, decide_ai_action,
+advance_turn, _advance_state_for_websocket), after a header line with the
+constructor arguments and seed. The engine is deterministic for a seed: AI
+decisions and shuffles draw only from the game's own RNG. So replaying the
+calls in order rebuilds the game exactly, down to the cards still in the deck
+(only wall-clock timestamps and AI decision IDs in the rebuilt history differ).
+
+Only outermost calls are written: a submit_human_action that runs AI turns is
+one line, not one per action. A call that raises is still written, marked
+failed ("h!"): it may have changed the game before raising, so replay runs it
+again and expects it to fail the same way. Every journaled call, journal or
+not, also bumps game.state_version, which is what state broadcasts cache on.
+
+The process appending to a journal holds an exclusive flock on it, so a second
+worker can't replay the game into a copy of its own that appends to the same
+file: opening a locked journal raises JournalLockedError.
+
+    journal = start_journal(game, "/var/poker/journal/<game_id>.jsonl", meta={"user_id": uid})
+    ...                                    # crash / worker restart
+    game, meta = resume_journal(path)      # replayed, and appending again
+
+A crash mid-append leaves at most a partial last line, which read() drops.
+"""
+import functools
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock, run a single worker
+    fcntl = None
+
+JOURNAL_VERSION = 1
+
+# Journaled PokerGame method -> code written in the journal
+JOURNAL_CODES = {
+    "start_new_hand": "n",
+    "submit_human_action": "h",
+    "apply_action": "a",
+    "decide_ai_action": "d",
+    "advance_turn": "t",
+    "_advance_state_for_websocket": "s",
+}
+JOURNAL_METHODS = {code: name for name, code in JOURNAL_CODES.items()}
+# Suffix on the code of a call that raised
+FAILED = "!"
+
+
+class JournalLockedError(RuntimeError):
+    """Another process (or open GameJournal) is appending to this journal."""
+
+
+def _lock(file, path: str):
+    if fcntl is None:
+        return
+    try:
+        fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        file.close()
+        raise JournalLockedError(f"Journal is held by another process: {path}")
+
+
+class GameJournal:
+    """One game's journal file, opened for appending and locked until close()."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+        _lock(self._file, path)
+
+    def append(self, entry: list):
+        """Write one entry and flush it to the OS, so it survives a process crash."""
+        self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()  # Releases the lock
+
+    @staticmethod
+    def read(path: str) -> List[list]:
+        """All complete entries. A torn last line (crash mid-write) is dropped."""
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().split("\n")
+        entries = []
+        for number, line in enumerate(lines, start=1):
+            if not line:
+                continue
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                if number < len(lines):  # Only the unterminated last line may be torn
+                    raise ValueError(f"Corrupt journal entry at {path}:{number}")
+        return entries
+
+
+def journaled(method):
+    """
+    Mark a state-changing PokerGame method: bumps game.state_version, and writes
+    the call to game.journal when it is the outermost journaled call.
+    """
+    code = JOURNAL_CODES[method.__name__]
+
+    @functools.wraps(method)
+    def wrapper(game, *args, **kwargs):
+        game.state_version += 1
+        journal = game.journal
+        if journal is None or game._journal_depth:
+            return method(game, *args, **kwargs)
+        game._journal_depth += 1
+        try:
+            result = method(game, *args, **kwargs)
+        except Exception:
+            journal.append([code + FAILED, *args, kwargs] if kwargs else [code + FAILED, *args])
+            raise
+        finally:
+            game._journal_depth -= 1
+        journal.append([code, *args, kwargs] if kwargs else [code, *args])
+        return result
+
+    return wrapper
+
+
+def start_journal(game, path: str, meta: Optional[Dict[str, Any]] = None) -> GameJournal:
+    """Start journaling a new game (before its first hand) to path."""
+    if game.hand_count:
+        raise ValueError("A journal must be started before the game's first hand")
+    journal = GameJournal(path)
+    journal.append(["game", JOURNAL_VERSION, {
+        "human_player_name": game.players[0].name,
+        "ai_count": len(game.players) - 1,
+        "headless": game.headless,
+        "seed": game.seed,
+        "session_id": game.session_id,
+        "meta": meta or {},
+    }])
+    game.journal = journal
+    return journal
+
+
+def replay_journal(path: str) -> Tuple["PokerGame", Dict[str, Any]]:
+    """Rebuild a game by replaying its journal. Returns (game, meta); the game is not journaling."""
+    from game.poker_engine import PokerGame
+
+    entries = GameJournal.read(path)
+    if not entries or entries[0][0] != "game":
+        raise ValueError(f"Not a game journal: {path}")
+    _, version, header = entries[0]
+    if version != JOURNAL_VERSION:
+        raise ValueError(f"Unsupported journal version {version}: {path}")
+
+    game = PokerGame(header["human_player_name"], header["ai_count"],
+                     headless=header["headless"], seed=header["seed"])
+    game.session_id = header["session_id"]
+    for number, entry in enumerate(entries[1:], start=2):
+        code = entry[0]
+        failed = code.endswith(FAILED)
+        method = JOURNAL_METHODS.get(code[:-len(FAILED)] if failed else code)
+        if method is None:
+            raise ValueError(f"Unknown journal entry {code!r}: {path}")
+        args = entry[1:]
+        kwargs = args.pop() if args and isinstance(args[-1], dict) else {}
+        if not failed:
+            getattr(game, method)(*args, **kwargs)
+            continue
+        try:
+            getattr(game, method)(*args, **kwargs)
+        except Exception:
+            continue  # Failed when recorded too: the game is as it was left then
+        raise ValueError(f"Journal entry {path}:{number} failed when recorded but not on replay")
+    return game, header["meta"]
+
+
+def resume_journal(path: str) -> Tuple["PokerGame", Dict[str, Any]]:
+    """
+    replay_journal(), then keep appending to the same journal. The journal is
+    locked first: JournalLockedError if another process is appending to it.
+    """
+    journal = GameJournal(path)
+    try:
+        game, meta = replay_journal(path)
+    except Exception:
+        journal.close()
+        raise
+    game.journal = journal
+    return game, meta
+
+
+def remove_unlocked_journal(path: str) -> bool:
+    """Delete a journal no process is appending to. Returns False if it is locked."""
+    try:
+        journal = GameJournal(path)
+    except JournalLockedError:
+        return False
+    try:
+        os.remove(path)
+    finally:
+        journal.close()
+    return True
+
+
+def discard_journal(game, path: Optional[str] = None):
+    """Stop journaling game and delete its journal file (game finished or deleted)."""
+    journal = game.journal if game is not None else None
+    if journal is not None:
+        journal.close()
+        game.journal = None
+        path = path or journal.path
+    if path and os.path.exists(path):
+        os.remove(path)
@@ -1,19 +1,27 @@
 # Poker Game Engine - Bug Fixes Applied
 # Fixed: Turn order, fold resolution, raise validation, raise accounting, side pots
 import random
+import itertools
 import json
 import uuid  # FIX Issue #3: Generate unique IDs for AI decisions
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Iterator
 from enum import Enum
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 # Extracted modules (Phase 3 refactor)
+from game.cards import cards_to_str
 from game.deck_manager import DeckManager
-from game.hand_evaluator import HandEvaluator
-from game.ai_strategy import AIStrategy, AIDecision
+from game.hand_evaluator import HandEvaluator, get_hand_evaluator
+from game.ai_strategy import AIStrategy, AIDecision, AIDecisionRequest, AIDecisionResult
+from game.seat_state import SeatMasks, SeatFlag, BetFlag, StackLedger, TableBet, SeatedPlayers
+from game.qc import QCLevel, QCCounters, QCSampler
+from game.journal import journaled
 
 # Memory management constants
 MAX_HAND_EVENTS_HISTORY = 1000  # Keep last ~10-20 hands worth of events
+MAX_HAND_HISTORY = 100  # Completed hands kept per game (hand_history)
+MAX_LEGACY_COMPLETED_HANDS = 50  # Newest part of hand_history exposed as completed_hands
 
 class GameState(Enum):
     PRE_FLOP = "pre_flop"
@@ -22,7 +30,7 @@ class GameState(Enum):
     RIVER = "river"
     SHOWDOWN = "showdown"
 
-@dataclass
+@dataclass(slots=True)
 class HandEvent:
     """Track events that happen during a hand for learning."""
     timestamp: str
@@ -35,9 +43,74 @@ class HandEvent:
     pot_size: int = 0
     current_bet: int = 0
 
+
+class HandEventLog:
+    """
+    Fixed-capacity ring buffer of HandEvents, stored column-wise.
+
+    One preallocated list per HandEvent field; appending overwrites the oldest
+    slot, so per-event cost is O(1) and memory is bounded by the capacity.
+    Iterating or indexing rebuilds HandEvent records, oldest first.
+    """
+
+    def __init__(self, capacity: int = MAX_HAND_EVENTS_HISTORY):
+        self.capacity = capacity
+        self._names = [f.name for f in fields(HandEvent)]
+        self._columns = {name: [None] * capacity for name in self._names}
+        self._next = 0  # Slot the next event goes into
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, event: HandEvent):
+        slot = self._next
+        for name in self._names:
+            self._columns[name][slot] = getattr(event, name)
+        self._next = (slot + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def extend(self, events: List[HandEvent]):
+        for event in events:
+            self.append(event)
+
+    def clear(self):
+        for column in self._columns.values():
+            column[:] = [None] * self.capacity
+        self._next = 0
+        self._size = 0
+
+    def _slots(self) -> range:
+        """Physical slots, oldest to newest (wrapping past the end)."""
+        start = self._next - self._size
+        return range(start, start + self._size)
+
+    def column(self, name: str) -> list:
+        """One field for every stored event, oldest first."""
+        values = self._columns[name]
+        return [values[slot % self.capacity] for slot in self._slots()]
+
+    def _record(self, slot: int) -> HandEvent:
+        slot %= self.capacity
+        return HandEvent(**{name: self._columns[name][slot] for name in self._names})
+
+    def __iter__(self) -> Iterator[HandEvent]:
+        for slot in self._slots():
+            yield self._record(slot)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._record(slot) for slot in self._slots()[index]]
+        return self._record(self._slots()[index])
+
+    def tail(self, count: int) -> List[HandEvent]:
+        """The newest count events, oldest first; only those are rebuilt."""
+        return self[max(self._size - count, 0):] if count > 0 else []
+
 # AIDecision moved to game.ai_strategy (re-exported above)
 
-@dataclass
+@dataclass(slots=True)
 class ActionRecord:
     """Single action in a betting round - Phase 3."""
     player_id: str
@@ -50,7 +123,7 @@ class ActionRecord:
     pot_after: int
     reasoning: str = ""  # AI reasoning if available
 
-@dataclass
+@dataclass(slots=True)
 class BettingRound:
     """All actions in a single betting round - Phase 3."""
     round_name: str  # pre_flop, flop, turn, river
@@ -59,7 +132,7 @@ class BettingRound:
     pot_at_start: int = 0
     pot_at_end: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class CompletedHand:
     """Store completed hand for analysis."""
     hand_number: int
@@ -83,19 +156,68 @@ class CompletedHand:
     showdown_hands: Dict[str, List[str]] = field(default_factory=dict)  # player_id -> cards revealed
     hand_rankings: Dict[str, str] = field(default_factory=dict)  # player_id -> hand rank (pair, flush, etc.)
 
+@dataclass(frozen=True, slots=True)
+class ShowdownHand:
+    """One player's revealed hand at showdown."""
+    player_id: str
+    hole_cards: Tuple[str, ...]
+    score: float  # Treys score, lower is better
+    hand_rank: str  # Pair, Flush, etc.
+
+@dataclass(frozen=True, slots=True)
+class PotResult:
+    """One pot (main or side) as awarded at showdown."""
+    amount: int
+    type: str  # main, side_1, side_2, ...
+    winner_ids: Tuple[str, ...]
+    eligible_player_ids: Tuple[str, ...]
+
+    def as_dict(self) -> Dict:
+        """Same shape as HandEvaluator.determine_winners_with_side_pots() pots."""
+        return {
+            'winners': list(self.winner_ids),
+            'amount': self.amount,
+            'type': self.type,
+            'eligible_player_ids': list(self.eligible_player_ids)
+        }
+
+@dataclass(frozen=True, slots=True)
+class ShowdownSummary:
+    """
+    How a hand's showdown went, scored once (PokerGame.showdown_summary).
+    Immutable, so every serializer and every broadcast can share it.
+    """
+    hand_number: int
+    participants: Tuple[ShowdownHand, ...]  # Best hand first (ties in seat order)
+    pots: Tuple[PotResult, ...]
+
+    def hand(self, player_id: str) -> Optional[ShowdownHand]:
+        return next((h for h in self.participants if h.player_id == player_id), None)
+
+    def showdown_hands(self) -> Dict[str, List[str]]:
+        """player_id -> cards revealed (CompletedHand.showdown_hands)."""
+        return {h.player_id: list(h.hole_cards) for h in self.participants}
+
+    def hand_rankings(self) -> Dict[str, str]:
+        """player_id -> hand rank (CompletedHand.hand_rankings)."""
+        return {h.player_id: h.hand_rank for h in self.participants}
+
 @dataclass
 class Player:
+    # stack, is_active, current_bet, all_in and has_acted are seat_state fields:
+    # once seated (PokerGame.players), writes also update the table's seat masks
+    # and chip ledger (game.seat_masks)
     player_id: str
     name: str
-    stack: int = 1000
-    hole_cards: List[str] = field(default_factory=list)
-    is_active: bool = True
-    current_bet: int = 0  # Bet in current betting round
+    stack: int = StackLedger(1000)  # Running stack total: the QC chip ledger
+    hole_cards: List[int] = field(default_factory=list)  # Card ints, see game.cards
+    is_active: bool = SeatFlag(True)
+    current_bet: int = BetFlag(0)  # Bet in current betting round
     total_invested: int = 0  # Total invested in hand (for side pots)
-    all_in: bool = False
+    all_in: bool = SeatFlag(False)
     is_human: bool = False
     personality: str = ""
-    has_acted: bool = False  # Track if player has acted this round
+    has_acted: bool = SeatFlag(False)  # Track if player has acted this round
 
     def bet(self, amount: int) -> int:
         """Place a bet, reducing stack. Fixed: proper accounting + all-in handling."""
@@ -132,25 +254,66 @@ class Player:
 # HandEvaluator moved to game.hand_evaluator (re-exported above)
 # AIStrategy moved to game.ai_strategy (re-exported above)
 
+# PokerGame state captured by snapshot()/restore(): immutable values, kept as is ...
+SNAPSHOT_VALUES = (
+    "pot", "current_bet", "current_state", "dealer_index", "small_blind_index",
+    "big_blind_index", "hand_count", "big_blind", "small_blind", "current_player_index",
+    "last_raiser_index", "last_raise_amount", "last_hand_summary", "total_chips",
+    "_pot_at_round_start", "_last_actor_id", "_showdown_pots", "_showdown_scores",
+    "_showdown_summary",
+)
+# ... and per-hand containers, copied shallowly (their records are never mutated)
+SNAPSHOT_CONTAINERS = (
+    "community_cards", "current_hand_events", "last_ai_decisions",
+    "_current_round_actions", "_hand_betting_rounds", "_hand_action_counts",
+)
+
+
+@dataclass(slots=True)
+class GameSnapshot:
+    """Point-in-time PokerGame state for what-if rollouts (see PokerGame.snapshot)."""
+    players: List[Dict]  # Per seat: copy of the Player's attributes
+    values: Dict[str, object]  # SNAPSHOT_VALUES
+    containers: Dict[str, object]  # SNAPSHOT_CONTAINERS
+    completed_hands: Tuple[CompletedHand, ...]
+    deck: Tuple[List[int], int]  # DeckManager.snapshot()
+    rng_state: tuple
+
+
 class PokerGame:
     """Main poker game class with bug fixes applied."""
 
-    def __init__(self, human_player_name: str, ai_count: int = 3):
+    def __init__(self, human_player_name: str, ai_count: int = 3, headless: bool = False,
+                 seed: Optional[int] = None):
         """
         Create a new poker game.
 
         Args:
             human_player_name: Name of the human player
             ai_count: Number of AI opponents (1-5, default 3 for 4-player table)
+            headless: Lean mode for bulk AI-only simulation. Skips everything only
+                      the UI/analysis needs (HandEvent log, ActionRecord/BettingRound/
+                      CompletedHand history) and replaces the per-action QC scans with
+                      one chip-total check per hand. Same outcomes for the same seed.
+            seed: Seed for this game's own random stream, which drives name/personality
+                  picks, shuffles and AI decisions. Same seed -> same game, bit for bit,
+                  regardless of other games in the process. If omitted, the seed is drawn
+                  from the global `random` module (so random.seed() still reproduces runs).
         """
         if ai_count < 1 or ai_count > 5:
             raise ValueError("AI count must be between 1 and 5")
 
-        self.deck_manager = DeckManager()
-        self.hand_evaluator = HandEvaluator()
+        self.headless = headless
+        self.seed = seed if seed is not None else random.getrandbits(64)
+        self.rng = random.Random(self.seed)  # Per-game stream, never shared between games
+        self.deck_manager = DeckManager(self.rng)
+        self.hand_evaluator = get_hand_evaluator()  # Process-wide, shared by every game
+
+        # Per-seat flags as bitmasks, kept current by Player (see game.seat_state)
+        self.seat_masks = SeatMasks()
 
         # Create human player
-        self.players = [Player("human", human_player_name, is_human=True)]
+        players = [Player("human", human_player_name, is_human=True)]
 
         # Add AI players dynamically with creative AI pun names (30 names for 5-AI support)
         ai_name_pool = [
@@ -170,8 +333,7 @@ class PokerGame:
         ]
 
         # Randomly select unique names for AI players
-        import random
-        selected_names = random.sample(ai_name_pool, min(ai_count, len(ai_name_pool)))
+        selected_names = self.rng.sample(ai_name_pool, min(ai_count, len(ai_name_pool)))
 
         # Phase 5: Random personality assignment from expanded pool (6 personalities)
         all_personalities = [
@@ -183,18 +345,19 @@ class PokerGame:
             "Maniac"
         ]
         # Randomly assign personalities (no duplicates in same game)
-        selected_personalities = random.sample(all_personalities, min(ai_count, len(all_personalities)))
+        selected_personalities = self.rng.sample(all_personalities, min(ai_count, len(all_personalities)))
 
         for i in range(ai_count):
-            self.players.append(
+            players.append(
                 Player(
                     player_id=f"ai{i+1}",
                     name=selected_names[i],
                     personality=selected_personalities[i]  # Random unique personality
                 )
             )
+        self.players = players
 
-        self.community_cards = []
+        self.community_cards: List[int] = []  # Card ints, see game.cards
         self.pot = 0
         self.current_bet = 0
         self.current_state = GameState.PRE_FLOP
@@ -215,30 +378,166 @@ class PokerGame:
         self.last_raiser_index = None
         self.last_raise_amount = None  # Track size of last raise for minimum raise calculation
 
-        # Learning features
-        self.hand_events: List[HandEvent] = []
+        # Learning features (past hands' events: see hand_events)
+        self.event_log = HandEventLog(MAX_HAND_EVENTS_HISTORY)
         self.current_hand_events: List[HandEvent] = []
         self.last_ai_decisions: Dict[str, AIDecision] = {}
 
-        # Hand history for analysis (UX Phase 2)
-        self.completed_hands: List[CompletedHand] = []
+        # Hand history for analysis: one ring of completed hands, oldest dropped
+        # first (see hand_history / completed_hands)
         self.last_hand_summary: Optional[CompletedHand] = None
+        # Pots awarded at this hand's showdown; showdown_summary is built from them on first read
+        self._showdown_pots: Optional[List[Dict]] = None
+        self._showdown_scores: Dict[str, Tuple[int, str]] = {}  # player_id -> (score, rank), scored with the pots
+        self._showdown_summary: Optional[ShowdownSummary] = None
+        self._completed_hand_ring: deque = deque(maxlen=MAX_HAND_HISTORY)
 
         # Phase 3: Hand history infrastructure
         import uuid
         from datetime import datetime
         self.session_id = str(uuid.uuid4())  # Generate unique session ID
-        self.hand_history: List[CompletedHand] = []  # Store all hands (max 100)
 
         # Phase 3: Current hand tracking for detailed history
         self._current_round_actions: List[ActionRecord] = []
         self._hand_betting_rounds: List[BettingRound] = []
         self._pot_at_round_start = 0
 
-        # QC: Enable runtime assertions for poker rule validation
-        self.qc_enabled = True  # Set to False to disable for performance
+        # The only event data game logic needs: actions per player (BB option) and,
+        # in headless mode, the last actor
+        self._hand_action_counts: Dict[str, int] = {}
+        self._last_actor_id: Optional[str] = None
+
+        # QC: Runtime assertions for poker rule validation (see game.qc)
+        self.qc_level = QCLevel.FULL  # OFF / LEDGER / SAMPLED / FULL (qc_enabled = on/off)
+        self.qc_counters = QCCounters()
+        self._qc_sampler = QCSampler()
         self.total_chips = sum(p.stack for p in self.players) + self.pot  # Track expected total
 
+        # Crash recovery: append-only log of state-changing calls (see game.journal)
+        self.journal = None
+        self._journal_depth = 0
+        # Bumped by every state-changing call; observers (broadcasts) cache on it
+        self.state_version = 0
+        # AI decision computed off the game (e.g. in a worker pool), used by the
+        # next decide_ai_action() if it still matches the game (see use_computed_ai_decision)
+        self._computed_ai_decision: Optional[AIDecisionResult] = None
+
+    @property
+    def players(self) -> List[Player]:
+        return self._players
+
+    @players.setter
+    def players(self, players: List[Player]):
+        """Seat players. The seated list is read-only: assign a new list to change it."""
+        self._players = SeatedPlayers(players)
+        self.seat_masks.seat(self._players)
+
+    # Table bet: writes also refresh seat_masks.matched
+    current_bet = TableBet()
+
+    @property
+    def qc_enabled(self) -> bool:
+        """Legacy on/off switch: True = QCLevel.FULL, False = QCLevel.OFF."""
+        return self.qc_level is not QCLevel.OFF
+
+    @qc_enabled.setter
+    def qc_enabled(self, enabled: bool):
+        self.qc_level = QCLevel.FULL if enabled else QCLevel.OFF
+
+    @property
+    def qc_sample_rate(self) -> float:
+        """Fraction of checkpoints that run the full checks under QCLevel.SAMPLED."""
+        return self._qc_sampler.rate
+
+    @qc_sample_rate.setter
+    def qc_sample_rate(self, rate: float):
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError("QC sample rate must be between 0 and 1")
+        self._qc_sampler.rate = rate
+
+    # ========================================================================
+    # SNAPSHOT / RESTORE - cheap what-if rollouts
+    # ========================================================================
+
+    def snapshot(self) -> GameSnapshot:
+        """
+        Capture the game mid-hand: players, pot, betting-round state, deck order
+        and RNG state. Nothing is deep-copied: the deck list, hole cards and
+        history records are shared, since the engine replaces them rather than
+        mutating them.
+
+        Past hands' events (event_log) are not captured; they only change when
+        the next hand starts.
+        """
+        state = self.__dict__
+        return GameSnapshot(
+            players=[player.__dict__.copy() for player in self.players],
+            values={name: state[name] for name in SNAPSHOT_VALUES},
+            containers={name: state[name].copy() for name in SNAPSHOT_CONTAINERS},
+            completed_hands=tuple(self._completed_hand_ring),
+            deck=self.deck_manager.snapshot(),
+            rng_state=self.rng.getstate()
+        )
+
+    def restore(self, snapshot: GameSnapshot):
+        """
+        Roll the game back to a snapshot() of it. A snapshot can be restored any
+        number of times, e.g. once per rollout.
+        """
+        if self.journal is not None:
+            raise RuntimeError("Cannot restore a journaled game: its journal would no longer replay")
+        if len(snapshot.players) != len(self.players):
+            raise ValueError(
+                f"Snapshot has {len(snapshot.players)} players, game has {len(self.players)}"
+            )
+        for player, player_state in zip(self.players, snapshot.players):
+            player.__dict__.update(player_state)
+        state = self.__dict__
+        state.update(snapshot.values)
+        for name, container in snapshot.containers.items():
+            state[name] = container.copy()
+        ring = self._completed_hand_ring
+        if len(ring) != len(snapshot.completed_hands) or (ring and ring[-1] is not snapshot.completed_hands[-1]):
+            ring.clear()
+            ring.extend(snapshot.completed_hands)
+        self.deck_manager.restore(snapshot.deck)
+        self.rng.setstate(snapshot.rng_state)
+        # Player/table writes above bypassed the seat-mask hooks
+        self.seat_masks.table_bet = self.current_bet
+        self.seat_masks.rebuild()
+        self.state_version += 1  # Never rolls back: the restored state is a new version
+
+    def clone(self) -> "PokerGame":
+        """
+        Independent copy of the game at this point, e.g. for a search-based AI to
+        play out. Completed hands are shared shallowly; the clone starts with an
+        empty event_log.
+        """
+        game = PokerGame.__new__(PokerGame)
+        state = game.__dict__
+        state.update(self.__dict__)
+        for name in SNAPSHOT_CONTAINERS:
+            state[name] = state[name].copy()
+        game.rng = random.Random()
+        game.rng.setstate(self.rng.getstate())
+        game.deck_manager = self.deck_manager.fork(game.rng)
+        game.event_log = HandEventLog(self.event_log.capacity)
+        game.journal = None  # What-if play on a clone never reaches the original's journal
+        game._journal_depth = 0
+        game._computed_ai_decision = None
+        game.qc_counters = QCCounters()
+        game._qc_sampler = QCSampler(self.qc_sample_rate)
+        game._completed_hand_ring = deque(self._completed_hand_ring, maxlen=MAX_HAND_HISTORY)
+        game.seat_masks = SeatMasks()
+        game.seat_masks.table_bet = self.current_bet
+        players = []
+        for player in self.players:
+            copy = Player.__new__(Player)
+            copy.__dict__.update(player.__dict__)
+            players.append(copy)
+        game.players = players
+        return game
+
     # ========================================================================
     # QC RUNTIME ASSERTIONS - Phase 1: Catch bugs immediately
     # ========================================================================
@@ -247,13 +546,16 @@ class PokerGame:
         """
         Assert that total chips always equal $4000.
         This is THE fundamental invariant of poker - chips cannot be created or destroyed.
+        Checked against the running chip ledger (seat_masks.stacks), so O(1) at every level
+        but OFF; full checks also verify the ledger against the stacks.
 
         If this fails, a critical bug has occurred and the game is corrupt.
         """
-        if not self.qc_enabled:
-            return
+        if self.qc_level is QCLevel.OFF or self.headless:
+            return  # Headless mode checks the chip total once per hand instead
 
-        total = sum(p.stack for p in self.players) + self.pot
+        self.qc_counters.ledger_checks += 1
+        total = self.seat_masks.stacks + self.pot
         if total != self.total_chips:
             # Build detailed error message
             stacks_info = ", ".join([f"{p.name}=${p.stack}" for p in self.players])
@@ -272,9 +574,15 @@ class PokerGame:
         Assert that game state is valid.
         Checks multiple invariants that should always be true.
         ENHANCED: Now checks all-in logic, current player validity, and more.
+        Runs at QCLevel.FULL, and on a qc_sample_rate fraction of calls at SAMPLED.
         """
-        if not self.qc_enabled:
+        level = self.qc_level
+        if level is QCLevel.OFF or level is QCLevel.LEDGER or self.headless:
+            return
+        if level is QCLevel.SAMPLED and not self._qc_sampler.should_check():
+            self.qc_counters.sampled_out += 1
             return
+        self.qc_counters.full_checks += 1
 
         errors = []
 
@@ -351,6 +659,10 @@ class PokerGame:
             if len(active_not_all_in) > 1 and self.current_player_index is None:
                 errors.append(f"{len(active_not_all_in)} active players can act but no current player set")
 
+        # 12. Incremental seat masks and chip ledger agree with the players
+        #     (round completion / turn order / chip conservation use them)
+        errors.extend(self.seat_masks.mismatches())
+
         if errors:
             error_msg = "\n   ".join(errors)
             raise RuntimeError(
@@ -359,13 +671,73 @@ class PokerGame:
                 f"   This is a CRITICAL BUG - game rules violated!"
             )
 
+    def _assert_chip_total(self, context: str = ""):
+        """Cheap chip conservation check used once per hand in headless mode."""
+        if self.qc_level is QCLevel.OFF:
+            return
+
+        self.qc_counters.ledger_checks += 1
+        total = self.seat_masks.stacks + self.pot
+        if total != self.total_chips:
+            raise RuntimeError(
+                f"🚨 CHIP CONSERVATION VIOLATED {context}\n"
+                f"   Total: ${total} (Expected: ${self.total_chips})"
+            )
+
     # ========================================================================
     # End QC Assertions
     # ========================================================================
 
+    @property
+    def hand_history(self) -> List[CompletedHand]:
+        """
+        Completed hands, oldest first (last MAX_HAND_HISTORY). Each read copies the
+        whole ring: read it once, or use recent_hands() / find_hand() for part of it.
+        """
+        return list(self._completed_hand_ring)
+
+    @property
+    def hand_history_count(self) -> int:
+        """len(hand_history) without the copy."""
+        return len(self._completed_hand_ring)
+
+    def recent_hands(self, limit: int) -> List[CompletedHand]:
+        """The newest limit completed hands, oldest first; copies only those."""
+        ring = self._completed_hand_ring
+        return list(itertools.islice(ring, max(len(ring) - limit, 0), None))
+
+    def find_hand(self, hand_number: int) -> Optional[CompletedHand]:
+        """Completed hand by number, if still in the history (no copy)."""
+        return next((hand for hand in self._completed_hand_ring if hand.hand_number == hand_number), None)
+
+    @property
+    def completed_hands(self) -> List[CompletedHand]:
+        """Legacy view: the newest MAX_LEGACY_COMPLETED_HANDS entries of hand_history."""
+        return self.recent_hands(MAX_LEGACY_COMPLETED_HANDS)
+
+    @property
+    def hand_events(self) -> List[HandEvent]:
+        """
+        Events of previous hands, oldest first (last MAX_HAND_EVENTS_HISTORY).
+        Each read rebuilds every event; use recent_events() for the newest few.
+        """
+        return list(self.event_log)
+
+    def recent_events(self, limit: int) -> List[HandEvent]:
+        """The newest limit events of previous hands, oldest first."""
+        return self.event_log.tail(limit)
+
     def _log_hand_event(self, event_type: str, player_id: str, action: str,
                        amount: int = 0, hand_strength: float = 0.0, reasoning: str = ""):
         """Log a hand event for learning analysis."""
+        if event_type == "action":
+            self._hand_action_counts[player_id] = self._hand_action_counts.get(player_id, 0) + 1
+        if self.headless:
+            # Keep only what betting logic reads back; no HandEvent/timestamp
+            if event_type == "action":
+                self._last_actor_id = player_id
+            return
+
         event = HandEvent(
             timestamp=datetime.now().isoformat(),
             event_type=event_type,
@@ -381,39 +753,32 @@ class PokerGame:
 
     def _get_next_active_player_index(self, start_index: int) -> Optional[int]:
         """Get next active player index who can act. Fixed: Bug #1."""
-        for i in range(len(self.players)):
-            idx = (start_index + i) % len(self.players)
-            player = self.players[idx]
-            if player.is_active and not player.all_in:
-                return idx
-        return None
+        return self.seat_masks.next_seat(self.seat_masks.can_act, start_index)
 
     def _betting_round_complete(self) -> bool:
         """Check if betting round is complete. Fixed: Bug #1 + BB option."""
-        active_players = [p for p in self.players if p.is_active and not p.all_in]
-        all_active_players = [p for p in self.players if p.is_active]  # Including all-in
+        seats = self.seat_masks
+        can_act = seats.can_act  # Active, not all-in
+        can_act_count = can_act.bit_count()
 
         # If 0 active non-all-in players (everyone folded or all-in), round is complete
-        if len(active_players) == 0:
+        if can_act_count == 0:
             return True
 
         # If only 1 non-all-in player remains:
-        # - If others are all-in (len(all_active_players) > 1), this player needs to act
-        # - If others have folded (len(all_active_players) == 1), pot goes to winner - complete
-        if len(active_players) == 1:
-            if len(all_active_players) > 1:
+        # - If others are all-in (more than 1 active), this player needs to act
+        # - If others have folded (1 active), pot goes to winner - complete
+        if can_act_count == 1:
+            if seats.active.bit_count() > 1:
                 # Others are all-in, this player still needs to act
-                return active_players[0].has_acted
+                return bool(can_act & seats.acted)
             else:
                 # All others folded, this player wins - round is complete
                 return True
 
         # All active players must have acted and matched the current bet
-        for player in active_players:
-            if not player.has_acted:
-                return False
-            if player.current_bet != self.current_bet:
-                return False
+        if can_act & ~(seats.acted & seats.matched):
+            return False
 
         # BB OPTION: Pre-flop, BB gets option to raise even if everyone just called
         if self.current_state == GameState.PRE_FLOP and self.last_raiser_index is not None:
@@ -421,10 +786,7 @@ class PokerGame:
             # BB gets option if: active, not all-in, and hasn't made an action beyond posting blind
             if bb_player.is_active and not bb_player.all_in:
                 # Count BB's actual actions (not blind posting)
-                bb_action_count = sum(1 for e in self.current_hand_events
-                                     if e.player_id == bb_player.player_id
-                                     and e.event_type == "action"
-                                     and e.action in ["check", "call", "raise", "fold"])
+                bb_action_count = self._hand_action_counts.get(bb_player.player_id, 0)
                 # If BB hasn't acted yet (only posted blind), round is not complete
                 if bb_action_count == 0:
                     return False
@@ -451,6 +813,7 @@ class PokerGame:
             self._log_hand_event("blind_increase", "system", "increase", 0, 0.0,
                                f"Blinds increased from ${old_sb}/${old_bb} to ${self.small_blind}/${self.big_blind}")
 
+    @journaled
     def start_new_hand(self, process_ai: bool = True):
         """
         Start a new poker hand.
@@ -492,13 +855,9 @@ class PokerGame:
                         self.pot = 0
                         break
 
-        # Save previous hand events to history
+        # Save previous hand events to history (ring buffer: oldest events drop off)
         if self.current_hand_events:
-            self.hand_events.extend(self.current_hand_events)
-
-            # Cap hand_events to prevent unbounded growth
-            if len(self.hand_events) > MAX_HAND_EVENTS_HISTORY:
-                self.hand_events = self.hand_events[-MAX_HAND_EVENTS_HISTORY:]
+            self.event_log.extend(self.current_hand_events)
 
         self.hand_count += 1
 
@@ -507,6 +866,11 @@ class PokerGame:
 
         self.current_hand_events = []
         self.last_ai_decisions = {}
+        self._hand_action_counts = {}
+        self._last_actor_id = None
+        self._showdown_pots = None
+        self._showdown_scores = {}
+        self._showdown_summary = None
 
         # Phase 3: Reset hand history tracking for new hand
         self._current_round_actions = []
@@ -531,8 +895,7 @@ class PokerGame:
         for player in self.players:
             if player.is_active:
                 player.hole_cards = self.deck_manager.deal_cards(2)
-                self._log_hand_event("deal", player.player_id, "hole_cards", 0, 0.0,
-                                   f"Dealt {len(player.hole_cards)} hole cards")
+                self._log_hand_event("deal", player.player_id, "hole_cards", 0, 0.0, "Dealt 2 hole cards")
 
         # Post blinds and get actual blind positions (important when players are busted)
         sb_index, bb_index = self._post_blinds()
@@ -557,6 +920,8 @@ class PokerGame:
         self._maybe_advance_state()
 
         # QC: Verify chip conservation and game state after starting new hand
+        if self.headless:
+            self._assert_chip_total("after start_new_hand()")
         self._assert_chip_conservation("after start_new_hand()")
         self._assert_valid_game_state("after start_new_hand()")
 
@@ -663,6 +1028,7 @@ class PokerGame:
             return None
         return self.players[self.current_player_index]
 
+    @journaled
     def apply_action(self, player_index: int, action: str, amount: int = 0,
                      hand_strength: float = 0.0, reasoning: str = "") -> dict:
         """
@@ -706,13 +1072,13 @@ class PokerGame:
                                hand_strength, reasoning or f"{player.name} folded")
 
             # Check if <= 1 player remains after fold - triggers immediate showdown
-            active_players = [p for p in self.players if p.is_active]
-            if len(active_players) <= 1:
+            active = self.seat_masks.active
+            if active.bit_count() <= 1:
                 triggers_showdown = True
                 pot_awarded = 0
                 winner_id = None
-                if len(active_players) == 1:
-                    winner = active_players[0]
+                if active:
+                    winner = self.players[SeatMasks.first(active)]
                     winner_id = winner.player_id
                     pot_awarded = self.pot
                     winner.stack += self.pot
@@ -790,7 +1156,7 @@ class PokerGame:
                                    hand_strength, reasoning or f"{player.name} raised to ${self.current_bet}")
 
         # Phase 3: Track action for detailed hand history
-        if action != "fold":  # Track successful actions (fold already tracked separately)
+        if action != "fold" and not self.headless:  # Track successful actions (fold already tracked separately)
             action_record = ActionRecord(
                 player_id=player.player_id,
                 player_name=player.name,
@@ -806,6 +1172,7 @@ class PokerGame:
 
         return {"success": True, "bet_amount": bet_amount, "triggers_showdown": triggers_showdown, "error": ""}
 
+    @journaled
     def submit_human_action(self, action: str, amount: int = None, process_ai: bool = True) -> bool:
         """
         Process human player action.
@@ -916,14 +1283,7 @@ class PokerGame:
         Process a single AI player action.
         Refactored to use apply_action() as single source of truth.
         """
-        ai_decision = AIStrategy.make_decision_with_reasoning(
-            player.personality, player.hole_cards, self.community_cards,
-            self.current_bet, self.pot, player.stack, player.current_bet, self.big_blind,
-            self.last_raise_amount
-        )
-
-        # Store decision for frontend
-        self.last_ai_decisions[player.player_id] = ai_decision
+        ai_decision = self.decide_ai_action(player_index)
 
         # Use apply_action() - SINGLE SOURCE OF TRUTH for action processing
         self.apply_action(
@@ -937,6 +1297,50 @@ class PokerGame:
         # QC: Verify chip conservation after each AI action
         self._assert_chip_conservation(f"after AI {player.name} action: {ai_decision.action}")
 
+    @journaled
+    def decide_ai_action(self, player_index: int) -> AIDecision:
+        """
+        Decide (but don't apply) the AI action for player_index, drawing only from
+        self.rng so a seeded or journaled game replays the same decisions.
+        The decision is stored in last_ai_decisions for the frontend.
+        """
+        player = self.players[player_index]
+        computed, self._computed_ai_decision = self._computed_ai_decision, None
+        if computed is not None and computed.request == self.ai_decision_request(player_index):
+            ai_decision = computed.decision
+            self.rng.setstate(computed.rng_state)
+        else:
+            ai_decision = AIStrategy.make_decision_with_reasoning(
+                player.personality, player.hole_cards, self.community_cards,
+                self.current_bet, self.pot, player.stack, player.current_bet, self.big_blind,
+                self.last_raise_amount, rng=self.rng
+            )
+        self.last_ai_decisions[player.player_id] = ai_decision
+        return ai_decision
+
+    def ai_decision_request(self, player_index: int) -> AIDecisionRequest:
+        """What decide_ai_action(player_index) would compute, for game.ai_strategy.compute_ai_decision()."""
+        player = self.players[player_index]
+        return AIDecisionRequest(player_index, (
+            player.personality, tuple(player.hole_cards), tuple(self.community_cards),
+            self.current_bet, self.pot, player.stack, player.current_bet, self.big_blind,
+            self.last_raise_amount
+        ), self.rng.getstate())
+
+    def use_computed_ai_decision(self, result: AIDecisionResult):
+        """
+        Have the next decide_ai_action() take a decision computed elsewhere instead
+        of computing it. It is only used if the game still matches the request (same
+        player, cards, bets and RNG state), so the game, its RNG and its journal end
+        up exactly as if the decision had been computed inline.
+        """
+        self._computed_ai_decision = result
+
+    @journaled
+    def advance_turn(self):
+        """Pass the turn to the next player who can act (WebSocket path, AI handled externally)."""
+        self.current_player_index = self._get_next_active_player_index(self.current_player_index + 1)
+
     def _advance_state_core(self, process_ai: bool = True) -> bool:
         """
         Core state advancement logic. SINGLE SOURCE OF TRUTH for state transitions.
@@ -965,7 +1369,7 @@ class PokerGame:
         if self.current_state == GameState.SHOWDOWN:
             return False
 
-        active_count = sum(1 for p in self.players if p.is_active)
+        active_count = self.seat_masks.active.bit_count()
 
         # SAFETY CHECK: If no current player and not at showdown, force resolution
         # This handles edge cases where betting can't continue but hand isn't over
@@ -973,7 +1377,7 @@ class PokerGame:
             if self.pot > 0:
                 if active_count == 1:
                     # Award pot to sole active player
-                    winner = next((p for p in self.players if p.is_active), None)
+                    winner = self.players[SeatMasks.first(self.seat_masks.active)]
                     if winner:
                         winner.stack += self.pot
                         if winner.stack > 0 and winner.all_in:
@@ -991,7 +1395,7 @@ class PokerGame:
 
         # Handle 0 active players (all folded - award to last actor)
         if active_count == 0:
-            last_actor_id = None
+            last_actor_id = self._last_actor_id if self.headless else None
             for event in reversed(self.current_hand_events):
                 if event.event_type == "action":
                     last_actor_id = event.player_id
@@ -1014,7 +1418,7 @@ class PokerGame:
 
         # Handle 1 active player (everyone else folded - award pot)
         if active_count == 1:
-            winner = next((p for p in self.players if p.is_active), None)
+            winner = self.players[SeatMasks.first(self.seat_masks.active)]
             pot_awarded = 0
             if winner and self.pot > 0:
                 pot_awarded = self.pot
@@ -1034,8 +1438,7 @@ class PokerGame:
 
         # ALL-IN FAST-FORWARD (UAT-5 fix): If all remaining active players are all-in
         # (or only 1 player can still act), no more betting is possible - go to showdown
-        active_not_all_in = [p for p in self.players if p.is_active and not p.all_in]
-        if len(active_not_all_in) <= 1:
+        if self.seat_masks.can_act.bit_count() <= 1:
             # Deal remaining community cards
             if self.current_state == GameState.PRE_FLOP:
                 self.community_cards.extend(self.deck_manager.deal_cards(3))  # Flop
@@ -1058,12 +1461,12 @@ class PokerGame:
         if not self._betting_round_complete():
             return False  # Can't advance yet
 
-        # Phase 3: Save current betting round before advancing
+        # Phase 3: Save current betting round before advancing (never populated in headless mode)
         if len(self._current_round_actions) > 0:
             betting_round = BettingRound(
                 round_name=self.current_state.value,
-                community_cards=self.community_cards.copy(),
-                actions=self._current_round_actions.copy(),
+                community_cards=cards_to_str(self.community_cards),
+                actions=self._current_round_actions,  # Handed over: a fresh list starts below
                 pot_at_start=self._pot_at_round_start,
                 pot_at_end=self.pot
             )
@@ -1112,6 +1515,7 @@ class PokerGame:
         # Delegate to core method with AI processing enabled
         self._advance_state_core(process_ai=True)
 
+    @journaled
     def _advance_state_for_websocket(self):
         """
         Advance game state without processing AI actions (for WebSocket flow).
@@ -1133,7 +1537,10 @@ class PokerGame:
         # Store original pot for verification
         original_pot = self.pot
 
-        pots = self.hand_evaluator.determine_winners_with_side_pots(self.players, self.community_cards)
+        pots, hands = self.hand_evaluator.resolve_pots(self.players, self.community_cards)
+        self._showdown_pots = pots
+        self._showdown_scores = hands
+        self._showdown_summary = None
 
         # Calculate total pot from side pot calculation
         calculated_pot_total = sum(pot_info['amount'] for pot_info in pots)
@@ -1190,8 +1597,36 @@ class PokerGame:
         self._assert_chip_conservation("after _award_pot_at_showdown()")
         self._assert_valid_game_state("after _award_pot_at_showdown()")
 
+    @property
+    def showdown_summary(self) -> Optional[ShowdownSummary]:
+        """
+        This hand's showdown, or None if it hasn't reached one (or ended by
+        folds). Built on first read from the awarded pots, then shared: players
+        who could win a pot, with their cards, score and rank, best hand first.
+        Hands were scored when the pots were resolved and are not scored again.
+        """
+        if self._showdown_summary is None and self._showdown_pots is not None:
+            eligible = set()
+            for pot_info in self._showdown_pots:
+                eligible.update(pot_info.get('eligible_player_ids', pot_info['winners']))
+            participants = []
+            for player in self.players:
+                if player.player_id in eligible and len(player.hole_cards) == 2:
+                    score, rank = self._showdown_scores.get(player.player_id) or \
+                        self.hand_evaluator.evaluate_hand(player.hole_cards, self.community_cards)
+                    participants.append(ShowdownHand(player.player_id, tuple(cards_to_str(player.hole_cards)),
+                                                     score, rank))
+            participants.sort(key=lambda hand: hand.score)
+            pots = tuple(PotResult(pot_info['amount'], pot_info['type'], tuple(pot_info['winners']),
+                                   tuple(pot_info.get('eligible_player_ids', ())))
+                         for pot_info in self._showdown_pots)
+            self._showdown_summary = ShowdownSummary(self.hand_count, tuple(participants), pots)
+        return self._showdown_summary
+
     def _save_hand_on_early_end(self, winner_id: Optional[str], pot_size: int):
         """Save hand that ended early (before showdown). UX Phase 2."""
+        if self.headless:
+            return
         try:
             # Skip saving if no human player (AI-only games)
             human = next((p for p in self.players if p.is_human), None)
@@ -1241,12 +1676,12 @@ class PokerGame:
             # Create completed hand record
             completed_hand = CompletedHand(
                 hand_number=self.hand_count,
-                community_cards=self.community_cards.copy(),
+                community_cards=cards_to_str(self.community_cards),
                 pot_size=pot_size,
                 winner_ids=winner_ids,
                 winner_names=winner_names,
                 human_action=human_action,
-                human_cards=human.hole_cards.copy() if human.hole_cards else [],
+                human_cards=cards_to_str(human.hole_cards),
                 human_final_stack=human.stack,
                 human_hand_strength=human_hand_strength,
                 human_pot_odds=human_pot_odds,
@@ -1260,18 +1695,9 @@ class PokerGame:
                 hand_rankings={}  # Early end - no rankings
             )
 
-            # Store
+            # Store (ring buffer: oldest hand drops off at MAX_HAND_HISTORY)
             self.last_hand_summary = completed_hand
-            self.completed_hands.append(completed_hand)
-
-            # Phase 3: Also store in hand_history with 100-hand limit
-            self.hand_history.append(completed_hand)
-            if len(self.hand_history) > 100:
-                self.hand_history = self.hand_history[-100:]
-
-            # Keep only last 50 hands in completed_hands (legacy)
-            if len(self.completed_hands) > 50:
-                self.completed_hands = self.completed_hands[-50:]
+            self._completed_hand_ring.append(completed_hand)
 
         except Exception as e:
             print(f"Warning: Failed to save early-end hand for analysis: {e}")
@@ -1280,6 +1706,8 @@ class PokerGame:
 
     def _save_completed_hand(self, pots: List[Dict], pot_size: int):
         """Save completed hand for later analysis. UX Phase 2."""
+        if self.headless:
+            return
         try:
             # Skip saving if no human player (AI-only games)
             human = next((p for p in self.players if p.is_human), None)
@@ -1306,9 +1734,13 @@ class PokerGame:
                         human_action = event.action
                         break
 
-            # Get human's hand strength at showdown (using consolidated method)
+            # Get human's hand strength at showdown (scored once in the showdown summary)
+            summary = self.showdown_summary
             human_hand_strength = 0.0
-            if human.hole_cards and self.community_cards:
+            human_showdown = summary.hand(human.player_id) if summary else None
+            if human_showdown:
+                human_hand_strength = HandEvaluator.score_to_strength(human_showdown.score)
+            elif human.hole_cards and self.community_cards:
                 score, _ = self.hand_evaluator.evaluate_hand(human.hole_cards, self.community_cards)
                 human_hand_strength = HandEvaluator.score_to_strength(score)
 
@@ -1324,26 +1756,18 @@ class PokerGame:
             # Phase 3: Collect showdown hands and rankings
             from datetime import datetime
             timestamp = datetime.utcnow().isoformat() + 'Z'
-            showdown_hands = {}
-            hand_rankings = {}
-
-            for player in self.players:
-                if player.hole_cards and len(player.hole_cards) == 2:
-                    # All players who reached showdown
-                    if player.is_active or player.all_in:
-                        showdown_hands[player.player_id] = player.hole_cards.copy()
-                        _, rank = self.hand_evaluator.evaluate_hand(player.hole_cards, self.community_cards)
-                        hand_rankings[player.player_id] = rank
+            showdown_hands = summary.showdown_hands() if summary else {}
+            hand_rankings = summary.hand_rankings() if summary else {}
 
             # Create completed hand record
             completed_hand = CompletedHand(
                 hand_number=self.hand_count,
-                community_cards=self.community_cards.copy(),
+                community_cards=cards_to_str(self.community_cards),
                 pot_size=pot_size,
                 winner_ids=list(all_winner_ids),
                 winner_names=winner_names,
                 human_action=human_action,
-                human_cards=human.hole_cards.copy() if human.hole_cards else [],
+                human_cards=cards_to_str(human.hole_cards),
                 human_final_stack=human.stack,
                 human_hand_strength=human_hand_strength,
                 human_pot_odds=human_pot_odds,
@@ -1357,18 +1781,9 @@ class PokerGame:
                 hand_rankings=hand_rankings
             )
 
-            # Store as last hand and in history
+            # Store as last hand and in history (ring buffer: oldest hand drops off)
             self.last_hand_summary = completed_hand
-            self.completed_hands.append(completed_hand)
-
-            # Phase 3: Also store in hand_history with 100-hand limit
-            self.hand_history.append(completed_hand)
-            if len(self.hand_history) > 100:
-                self.hand_history = self.hand_history[-100:]
-
-            # Keep only last 50 hands to avoid memory issues (legacy)
-            if len(self.completed_hands) > 50:
-                self.completed_hands = self.completed_hands[-50:]
+            self._completed_hand_ring.append(completed_hand)
 
         except Exception as e:
             # Don't fail the game if hand saving fails
@@ -1474,16 +1889,20 @@ class PokerGame:
         self._award_pot_at_showdown()
 
         # Return results (pot is already 0 after awarding)
-        pots = self.hand_evaluator.determine_winners_with_side_pots(self.players, self.community_cards)
+        summary = self.showdown_summary
+        if summary:
+            pots = [pot.as_dict() for pot in summary.pots]
+        else:
+            pots = self.hand_evaluator.determine_winners_with_side_pots(self.players, self.community_cards)
 
         return {
             "pots": pots,
-            "community_cards": self.community_cards,
+            "community_cards": cards_to_str(self.community_cards),
             "players": [
                 {
                     "player_id": p.player_id,
                     "name": p.name,
-                    "hole_cards": p.hole_cards,
+                    "hole_cards": cards_to_str(p.hole_cards),
                     "stack": p.stack
                 } for p in self.players
             ]
@@ -1505,11 +1924,11 @@ class PokerGame:
                     "is_active": p.is_active,
                     "all_in": p.all_in,
                     "is_human": p.is_human,
-                    "hole_cards": p.hole_cards if p.is_human else (["hidden", "hidden"] if len(p.hole_cards) > 0 else []),
+                    "hole_cards": cards_to_str(p.hole_cards) if p.is_human else (["hidden", "hidden"] if len(p.hole_cards) > 0 else []),
                     "is_current": self.players.index(p) == self.current_player_index
                 } for p in self.players
             ],
-            "community_cards": self.community_cards,
+            "community_cards": cards_to_str(self.community_cards),
             "pot": self.pot,
             "current_bet": self.current_bet,
             "hand_count": self.hand_count,
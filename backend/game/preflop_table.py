@@ -0,0 +1,160 @@
+"""
+Preflop equity table - the 169 canonical starting hands.
+
+Preflop is the most expensive evaluation (all 5 board cards unknown), yet
+there are only 169 distinct starting hands up to suit symmetry ("AA",
+"AKs", "AKo", ...). This module ships a versioned JSON table with, for each
+class:
+- mean_score: exact average treys score of the final 7-card hand over all
+  C(50, 5) boards (what HandEvaluator.evaluate_hand returns preflop)
+- equity_estimate: share of pots won against 1-5 random opponents (ai_count
+  range in PokerGame), ties split. A seeded Monte Carlo estimate (EQUITY_SAMPLES
+  per entry, standard error about 0.001), not an exact value: exact multiway
+  enumeration is impractical
+
+Lookups are a dict read. Regenerate offline with:  python -m game.preflop_table
+"""
+import itertools
+import json
+import os
+import sys
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from game.equity import EquityEngine, get_equity_engine
+from game.rank_table import CARD_INDEX, RANKS
+
+TABLE_VERSION = 2
+MAX_OPPONENTS = 5  # PokerGame allows 1-5 AI opponents
+EQUITY_SAMPLES = 200_000  # Monte Carlo samples per (class, opponents) when generating
+GENERATION_SEED = 169
+
+DEFAULT_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "preflop_equity.json")
+
+
+def hand_class(hole_cards: Sequence[str]) -> str:
+    """Canonical class of two hole cards: "AA", "AKs" or "AKo"."""
+    first, second = (CARD_INDEX[card] for card in hole_cards)
+    high, low = max(first, second), min(first, second)
+    ranks = RANKS[high >> 2] + RANKS[low >> 2]
+    if high >> 2 == low >> 2:
+        return ranks
+    return ranks + ("s" if high & 3 == low & 3 else "o")
+
+
+def all_hand_classes() -> List[str]:
+    """The 169 classes, strongest ranks first."""
+    classes = []
+    for high in reversed(range(13)):
+        for low in reversed(range(high + 1)):
+            if high == low:
+                classes.append(RANKS[high] * 2)
+            else:
+                classes.append(RANKS[high] + RANKS[low] + "s")
+                classes.append(RANKS[high] + RANKS[low] + "o")
+    return classes
+
+
+def representative_cards(cls: str) -> List[int]:
+    """Card indices of one concrete hand in the class (spades/hearts)."""
+    high, low = RANKS.index(cls[0]), RANKS.index(cls[1])
+    second_suit = 0 if cls.endswith("s") else 1
+    return [high * 4, low * 4 + second_suit]
+
+
+def _exact_mean_score(engine: EquityEngine, hole: List[int], board_positions: np.ndarray) -> float:
+    """Average score of hole + every possible 5-card board."""
+    deck = np.array([c for c in range(52) if c not in hole], dtype=np.int32)
+    total = 0
+    for start in range(0, len(board_positions), 500_000):
+        boards = deck[board_positions[start:start + 500_000]]
+        hands = np.hstack([np.broadcast_to(np.array(hole, dtype=np.int32), (len(boards), 2)), boards])
+        total += int(engine.score7(hands).sum(dtype=np.int64))
+    return total / len(board_positions)
+
+
+def build_preflop_table(path: str = DEFAULT_TABLE_PATH, samples: int = EQUITY_SAMPLES,
+                        seed: int = GENERATION_SEED) -> str:
+    """Generate the table file at path (offline, takes a few minutes). Returns the path written."""
+    engine = get_equity_engine()
+    board_positions = np.array(list(itertools.combinations(range(50), 5)), dtype=np.int8)
+    rng = np.random.default_rng(seed)
+
+    hands = {}
+    for cls in all_hand_classes():
+        hole = representative_cards(cls)
+        equity = [
+            round(engine.estimate(hole, [], num_opponents=n, samples=samples, rng=rng).equity, 5)
+            for n in range(1, MAX_OPPONENTS + 1)
+        ]
+        hands[cls] = {"mean_score": round(_exact_mean_score(engine, hole, board_positions), 3),
+                      "equity_estimate": equity}
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"version": TABLE_VERSION, "samples": samples, "seed": seed,
+                   "max_opponents": MAX_OPPONENTS, "hands": hands}, f, indent=1)
+        f.write("\n")
+    os.replace(tmp_path, path)
+    return path
+
+
+class PreflopTable:
+    """In-memory preflop table, keyed by hand class."""
+
+    def __init__(self, path: str = DEFAULT_TABLE_PATH):
+        self.path = path
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("version") != TABLE_VERSION or len(data.get("hands", {})) != 169:
+            raise ValueError(f"Preflop table at {path} is stale or corrupt")
+        self.samples = data["samples"]
+        self.max_opponents = data["max_opponents"]
+        self.hands: Dict[str, dict] = data["hands"]
+
+    def mean_score(self, hole_cards: Sequence[str]) -> float:
+        """Exact average final-hand score (lower is better)."""
+        return self.hands[hand_class(hole_cards)]["mean_score"]
+
+    def equity(self, hole_cards: Sequence[str], num_opponents: int = 1) -> float:
+        """
+        Preflop equity against num_opponents (1-5) random hands. An estimate from
+        self.samples Monte Carlo samples; standard error sqrt(e * (1 - e) / samples).
+        """
+        if not 1 <= num_opponents <= self.max_opponents:
+            raise ValueError(f"num_opponents must be 1-{self.max_opponents}, got {num_opponents}")
+        return self.hands[hand_class(hole_cards)]["equity_estimate"][num_opponents - 1]
+
+
+_preflop_table: Optional[PreflopTable] = None
+_failed_path: Optional[str] = None  # Path that last failed to load; not retried
+
+
+def get_preflop_table() -> Optional[PreflopTable]:
+    """
+    Process-wide preflop table (loaded once). Returns None if the shipped
+    file is missing or stale, so callers fall back to the equity engine.
+    A failed load is remembered, not retried on every call.
+    """
+    global _preflop_table, _failed_path
+    if _preflop_table is None:
+        path = os.getenv("POKER_PREFLOP_TABLE_PATH", DEFAULT_TABLE_PATH)
+        if path == _failed_path:
+            return None
+        try:
+            _preflop_table = PreflopTable(path)
+        except (OSError, ValueError):
+            _failed_path = path
+            return None
+    return _preflop_table
+
+
+if __name__ == "__main__":
+    import time
+
+    target = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_TABLE_PATH
+    start = time.time()
+    build_preflop_table(target)
+    print(f"Wrote preflop table to {target} in {time.time() - start:.1f}s")
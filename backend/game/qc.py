@@ -0,0 +1,48 @@
+"""
+QC (runtime invariant checking) levels for PokerGame.
+
+Chip conservation is checked against a running ledger (SeatMasks.stacks, kept
+current by every Player.stack write) plus the pot, so it costs O(1) instead of a
+scan of every stack. The full invariant scan (_assert_valid_game_state) is the
+expensive part; SAMPLED runs it on a fraction of checkpoints.
+
+    game.qc_level = QCLevel.SAMPLED
+    game.qc_sample_rate = 0.05   # Full checks at 1 in 20 checkpoints
+    game.qc_counters             # How much checking actually ran
+"""
+from dataclasses import dataclass
+from enum import Enum
+
+
+class QCLevel(Enum):
+    OFF = "off"          # No checks
+    LEDGER = "ledger"    # Chip ledger at every checkpoint, no state scans
+    SAMPLED = "sampled"  # Ledger at every checkpoint, full scans at qc_sample_rate
+    FULL = "full"        # Everything at every checkpoint (default)
+
+
+@dataclass
+class QCCounters:
+    """Checks run so far, per kind."""
+    ledger_checks: int = 0
+    full_checks: int = 0
+    sampled_out: int = 0  # Full checks skipped by SAMPLED
+
+
+class QCSampler:
+    """
+    Deterministic sampling: accumulates the rate per checkpoint and fires each
+    time the total crosses 1. Never draws from the game's RNG, so sampling
+    cannot change a seeded game's outcome.
+    """
+
+    def __init__(self, rate: float = 0.1):
+        self.rate = rate
+        self._credit = 0.0
+
+    def should_check(self) -> bool:
+        self._credit += self.rate
+        if self._credit >= 1.0:
+            self._credit -= 1.0
+            return True
+        return False
@@ -0,0 +1,181 @@
+"""
+Seven-card rank table - memory-mapped lookup evaluator.
+
+Scores any 7-card hand with a handful of integer adds and one table read,
+instead of treys' 21 five-card sub-evaluations. Scores use the exact treys
+scale (1 = Royal Flush ... 7462 = worst High Card), so
+HandEvaluator.score_to_strength() and side-pot resolution are unchanged.
+
+How it works (same idea as the 2+2 / SKPokerEval family of evaluators):
+- Each rank has a key chosen so the sum of 7 rank keys is unique for every
+  7-card rank multiset. That sum indexes the unsuited table directly.
+- Each suit has a base-8 key, so the summed suit key tells whether 5+ cards
+  share a suit. In that case the rank bits of the flush suit index a small
+  flush table (flushes and straight flushes).
+
+The table is generated once from treys' own 5-card lookup, written to a file,
+and memory-mapped read-only. Every process sharing the file (gunicorn workers,
+process pools) shares the same page cache.
+
+Generate it ahead of time with:  python -m game.rank_table
+"""
+import itertools
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Optional, Sequence
+
+from treys import Card
+from treys.lookup import LookupTable
+
+# Card index = rank * 4 + suit, see game.cards (re-exported here)
+from game.cards import RANKS, SUITS, CARD_INDEX, card_index  # noqa: F401
+
+# Rank keys: sum of any 7 (count <= 4 per rank) is unique (max 7,825,759)
+RANK_KEYS = [0, 1, 5, 22, 98, 453, 2031, 8698, 22854, 83661, 262349, 636345, 1479181]
+UNSUITED_TABLE_SIZE = 7 * RANK_KEYS[-1] - 3 * (RANK_KEYS[-1] - RANK_KEYS[-2]) + 1
+FLUSH_TABLE_SIZE = 1 << 13
+
+TABLE_MAGIC = b"PLRT"
+TABLE_VERSION = 1
+_HEADER = struct.Struct("<4sIcxxxII")
+
+DEFAULT_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "rank_table.bin")
+
+# Per-card lookup lists (indexed by card index 0-51)
+CARD_RANK_KEY = [RANK_KEYS[i >> 2] for i in range(52)]
+CARD_SUIT_KEY = [1 << (3 * (i & 3)) for i in range(52)]
+CARD_RANK_BIT = [1 << (i >> 2) for i in range(52)]
+
+# Summed suit key -> flush suit (0-3), or -1 if no suit has 5+ cards
+FLUSH_SUIT = [-1] * (1 << 12)
+for _suit_sum in range(1 << 12):
+    for _suit in range(4):
+        if (_suit_sum >> (3 * _suit)) & 7 >= 5:
+            FLUSH_SUIT[_suit_sum] = _suit
+            break
+
+
+def _build_tables():
+    """Compute flush and unsuited tables from treys' 5-card lookup."""
+    lookup = LookupTable()
+
+    flush = array("H", bytes(2 * FLUSH_TABLE_SIZE))
+    for mask in range(FLUSH_TABLE_SIZE):
+        bits = [1 << r for r in range(13) if (mask >> r) & 1]
+        if len(bits) < 5:
+            continue
+        flush[mask] = min(
+            lookup.flush_lookup[Card.prime_product_from_rankbits(sum(combo))]
+            for combo in itertools.combinations(bits, 5)
+        )
+
+    unsuited = array("H", bytes(2 * UNSUITED_TABLE_SIZE))
+    for ranks in itertools.combinations_with_replacement(range(13), 7):
+        # At most 4 cards per rank (combinations are sorted, so check runs)
+        if any(ranks[i] == ranks[i + 4] for i in range(3)):
+            continue
+        best = LookupTable.MAX_HIGH_CARD
+        for five in set(itertools.combinations(ranks, 5)):
+            prime = 1
+            for r in five:
+                prime *= Card.PRIMES[r]
+            score = lookup.unsuited_lookup[prime]
+            if score < best:
+                best = score
+        unsuited[sum(RANK_KEYS[r] for r in ranks)] = best
+
+    return flush, unsuited
+
+
+def build_rank_table(path: str = DEFAULT_TABLE_PATH) -> str:
+    """
+    Generate the rank table file at path (atomic replace, safe if several
+    workers race to build it). Returns the path written.
+    """
+    flush, unsuited = _build_tables()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        byteorder = b"<" if sys.byteorder == "little" else b">"
+        f.write(_HEADER.pack(TABLE_MAGIC, TABLE_VERSION, byteorder, len(flush), len(unsuited)))
+        flush.tofile(f)
+        unsuited.tofile(f)
+    os.replace(tmp_path, path)
+    return path
+
+
+class RankTable:
+    """Read-only view over a memory-mapped rank table file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, byteorder, flush_len, unsuited_len = _HEADER.unpack_from(self._mmap, 0)
+        except struct.error:
+            magic = version = byteorder = flush_len = unsuited_len = None
+        native = b"<" if sys.byteorder == "little" else b">"
+        if (len(self._mmap) != _HEADER.size + 2 * (FLUSH_TABLE_SIZE + UNSUITED_TABLE_SIZE)
+                or magic != TABLE_MAGIC or version != TABLE_VERSION or byteorder != native
+                or flush_len != FLUSH_TABLE_SIZE or unsuited_len != UNSUITED_TABLE_SIZE):
+            self._mmap.close()
+            raise ValueError(f"Rank table at {path} is stale or corrupt")
+
+        view = memoryview(self._mmap)
+        flush_start = _HEADER.size
+        unsuited_start = flush_start + 2 * flush_len
+        self.flush = view[flush_start:unsuited_start].cast("H")
+        self.unsuited = view[unsuited_start:unsuited_start + 2 * unsuited_len].cast("H")
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> "RankTable":
+        """Memory-map the table, generating the file first if missing or stale."""
+        path = path or os.getenv("POKER_RANK_TABLE_PATH", DEFAULT_TABLE_PATH)
+        try:
+            return cls(path)
+        except (OSError, ValueError):
+            build_rank_table(path)
+            return cls(path)
+
+    def evaluate7(self, cards: Sequence[int]) -> int:
+        """Score exactly 7 card indices on the treys scale (lower is better)."""
+        c0, c1, c2, c3, c4, c5, c6 = cards
+        suit_sum = (CARD_SUIT_KEY[c0] + CARD_SUIT_KEY[c1] + CARD_SUIT_KEY[c2] + CARD_SUIT_KEY[c3]
+                    + CARD_SUIT_KEY[c4] + CARD_SUIT_KEY[c5] + CARD_SUIT_KEY[c6])
+        flush_suit = FLUSH_SUIT[suit_sum]
+        if flush_suit >= 0:
+            # With 5+ suited cards out of 7, quads/full house are impossible
+            mask = 0
+            for c in cards:
+                if c & 3 == flush_suit:
+                    mask |= CARD_RANK_BIT[c]
+            return self.flush[mask]
+
+        return self.unsuited[CARD_RANK_KEY[c0] + CARD_RANK_KEY[c1] + CARD_RANK_KEY[c2] + CARD_RANK_KEY[c3]
+                             + CARD_RANK_KEY[c4] + CARD_RANK_KEY[c5] + CARD_RANK_KEY[c6]]
+
+
+_rank_table: Optional[RankTable] = None
+
+
+def get_rank_table() -> RankTable:
+    """Process-wide rank table (loaded once, shared by all evaluators)."""
+    global _rank_table
+    if _rank_table is None:
+        _rank_table = RankTable.load()
+    return _rank_table
+
+
+if __name__ == "__main__":
+    import time
+
+    target = sys.argv[1] if len(sys.argv) > 1 else os.getenv("POKER_RANK_TABLE_PATH", DEFAULT_TABLE_PATH)
+    start = time.time()
+    build_rank_table(target)
+    print(f"Wrote rank table to {target} ({os.path.getsize(target):,} bytes) in {time.time() - start:.1f}s")
@@ -0,0 +1,199 @@
+"""
+Incremental per-seat flags for PokerGame.
+
+SeatMasks keeps one bitmask per Player flag (bit i = seat i) plus a
+"matched the table bet" mask, and a running total of the players' stacks
+(the chip ledger QC checks against). The tracked Player fields and
+PokerGame.current_bet are write-only descriptors that report every change, so
+the masks stay current without rescanning players: round completion and
+next-to-act become a few integer operations. Reads stay plain instance-dict
+reads.
+
+PokerGame._assert_valid_game_state() compares the masks against a fresh scan
+(mismatches()) whenever QC is on.
+"""
+from typing import List, Optional
+
+# Player flag -> SeatMasks attribute mirroring it
+SEAT_FLAG_MASKS = {
+    "is_active": "active",
+    "all_in": "all_in",
+    "has_acted": "acted",
+}
+
+
+class SeatField:
+    """
+    Base for the Player fields below, declared in the class body with the
+    field's default (stack: int = StackLedger(1000)). There is no __get__, so
+    reads stay instance-dict reads; dataclass therefore takes the descriptor
+    itself as the default, and __init__ passes it to __set__, which swaps in
+    the real default. Subclasses define __set__ (the swap included) in one
+    body, since every stack, bet and flag write goes through it.
+    """
+
+    def __init__(self, default):
+        self.default = default
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __repr__(self):
+        return repr(self.default)  # As the default shows in Player's signature
+
+
+class SeatFlag(SeatField):
+    """Boolean Player flag: writes also update the seated table's mask of that flag."""
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+        self.mask = SEAT_FLAG_MASKS[name]
+
+    def __set__(self, player, value):
+        if value is self:
+            value = self.default
+        player.__dict__[self.name] = value
+        seats = player.__dict__.get("_seats")
+        if seats is not None:
+            seats.set_bit(self.mask, player._seat_bit, value)
+
+
+class BetFlag(SeatField):
+    """Player.current_bet: writes keep the player's 'matched' bit current."""
+
+    def __set__(self, player, value):
+        if value is self:
+            value = self.default
+        player.__dict__["current_bet"] = value
+        seats = player.__dict__.get("_seats")
+        if seats is not None:
+            seats.set_bit("matched", player._seat_bit, value == seats.table_bet)
+
+
+class StackLedger(SeatField):
+    """Player.stack: writes keep SeatMasks.stacks, the running sum of stacks."""
+
+    def __set__(self, player, value):
+        if value is self:
+            value = self.default
+        state = player.__dict__
+        seats = state.get("_seats")
+        if seats is not None:
+            seats.stacks += value - state["stack"]
+        state["stack"] = value
+
+
+class SeatedPlayers(list):
+    """
+    PokerGame.players once seated. Seat bits follow list positions, so the
+    list is replaced rather than edited: in-place changes raise TypeError
+    instead of leaving the masks stale (game.players = new_list re-seats).
+    """
+
+    def _refuse(self, *args, **kwargs):
+        raise TypeError("PokerGame.players cannot be edited in place; assign a new list")
+
+    append = extend = insert = pop = remove = clear = sort = reverse = _refuse
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _refuse
+
+    def __reduce_ex__(self, protocol):
+        return self.__class__, (list(self),)
+
+
+class TableBet:
+    """Write hook for PokerGame.current_bet: recomputes every 'matched' bit."""
+
+    def __set__(self, game, value):
+        game.__dict__["current_bet"] = value
+        game.seat_masks.set_table_bet(value)
+
+
+class SeatMasks:
+    """Bitmasks of active / all-in / acted / matched-bet seats for one table."""
+
+    def __init__(self):
+        self.players: List = []
+        self.table_bet = 0  # PokerGame.current_bet
+        self.active = 0
+        self.all_in = 0
+        self.acted = 0
+        self.matched = 0  # current_bet == table_bet
+        self.stacks = 0  # Sum of player stacks
+
+    def seat(self, players: List):
+        """Attach players (seat order) and build the masks from scratch."""
+        seated = set(map(id, players))
+        for player in self.players:
+            if id(player) not in seated:
+                player.__dict__["_seats"] = None
+        self.players = players
+        for i, player in enumerate(players):
+            player.__dict__["_seats"] = self
+            player.__dict__["_seat_bit"] = 1 << i
+        self.rebuild()
+
+    def rebuild(self):
+        self.active, self.all_in, self.acted, self.matched, self.stacks = self._scan()
+
+    def _scan(self):
+        active = all_in = acted = matched = stacks = 0
+        for i, player in enumerate(self.players):
+            bit = 1 << i
+            stacks += player.stack
+            if player.is_active:
+                active |= bit
+            if player.all_in:
+                all_in |= bit
+            if player.has_acted:
+                acted |= bit
+            if player.current_bet == self.table_bet:
+                matched |= bit
+        return active, all_in, acted, matched, stacks
+
+    def set_bit(self, mask: str, bit: int, value: bool):
+        bits = getattr(self, mask)
+        setattr(self, mask, bits | bit if value else bits & ~bit)
+
+    def set_table_bet(self, bet: int):
+        """The table's current bet changed (raise, new round): recompute matched."""
+        self.table_bet = bet
+        matched = 0
+        for i, player in enumerate(self.players):
+            if player.current_bet == bet:
+                matched |= 1 << i
+        self.matched = matched
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @property
+    def can_act(self) -> int:
+        """Active and not all-in."""
+        return self.active & ~self.all_in
+
+    @staticmethod
+    def first(bits: int) -> Optional[int]:
+        """Lowest seat in bits, or None."""
+        return (bits & -bits).bit_length() - 1 if bits else None
+
+    def next_seat(self, bits: int, start: int) -> Optional[int]:
+        """First seat in bits at or after start, wrapping around the table."""
+        if not bits:
+            return None
+        start %= len(self.players)
+        later = bits >> start
+        if later:
+            return start + (later & -later).bit_length() - 1
+        return (bits & -bits).bit_length() - 1
+
+    def mismatches(self) -> List[str]:
+        """Masks (and the stack total) that disagree with a fresh scan of the players (QC)."""
+        names = ("active", "all_in", "acted", "matched")
+        current = (self.active, self.all_in, self.acted, self.matched)
+        *scanned, stacks = self._scan()
+        errors = [f"seat mask '{name}' is {have:b}, players say {want:b}"
+                  for name, have, want in zip(names, current, scanned) if have != want]
+        if self.stacks != stacks:
+            errors.append(f"chip ledger has ${self.stacks} in stacks, players hold ${stacks}")
+        return errors
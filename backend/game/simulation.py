@@ -0,0 +1,353 @@
+"""
+Multi-process AI tournament simulation runner.
+
+Plays complete AI-only games (headless PokerGame, every seat AI) across a
+process pool and merges per-game results into the same statistics that
+tests/test_stress_ai_games.py tracks (chip violations, side pots, hands
+per game, ...). Games are independent, so throughput scales with cores.
+
+Each game is seeded from (base seed, game number), not from the worker it
+lands on, so a run gives identical totals for any worker count and a
+resumed run matches an uninterrupted one. Long runs write a JSON
+checkpoint every N games; --resume skips the games it already holds.
+
+    python -m game.simulation --games 2000 --workers 8 --seed 42
+    python -m game.simulation --games 100000 --checkpoint sim.json --resume
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+import traceback
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from game.hand_evaluator import warm_up
+from game.poker_engine import GameState, PokerGame
+
+MAX_HANDS_PER_GAME = 200  # Safety limit (same as the stress tests)
+PLAYER_COUNTS = [2, 3, 4, 5, 6]  # Table sizes when player count varies
+CHECKPOINT_VERSION = 1
+MAX_ERRORS_KEPT = 100  # Error strings kept in stats (counters are exact)
+
+
+def game_seed(base_seed: int, game_num: int) -> int:
+    """Deterministic 64-bit seed for one game, independent of sharding."""
+    return random.Random(f"{base_seed}:{game_num}").getrandbits(64)
+
+
+@dataclass
+class GameResult:
+    """Outcome of one simulated game, sent from a worker to the parent."""
+    game_num: int
+    seed: int
+    player_count: int
+    completed: bool = False  # One player won every chip
+    hands: int = 0
+    actions: int = 0
+    chip_violation: bool = False
+    infinite_loop: bool = False  # Hit max hands, or a hand ended with chips left in the pot
+    allin_hands: int = 0
+    side_pot_hands: int = 0
+    showdown_hands: int = 0
+    fold_victories: int = 0
+    duration: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class SimulationStats:
+    """Statistics merged across games (mirrors StressTestStats)."""
+    games_completed: int = 0
+    games_crashed: int = 0
+    games_unfinished: int = 0  # Stopped at the max-hands limit without crashing
+    total_hands: int = 0
+    total_actions: int = 0
+    chip_violations: int = 0
+    infinite_loop_hits: int = 0
+    allin_scenarios: int = 0
+    side_pot_scenarios: int = 0
+    showdown_scenarios: int = 0
+    fold_victories: int = 0
+    total_duration: float = 0.0
+    min_hands: Optional[int] = None
+    max_hands: int = 0
+    player_count_distribution: Dict[int, int] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def games_played(self) -> int:
+        return self.games_completed + self.games_crashed + self.games_unfinished
+
+    def merge(self, result: GameResult):
+        """Fold one game's result into the totals."""
+        if result.error is not None:
+            self.games_crashed += 1
+            if len(self.errors) < MAX_ERRORS_KEPT:
+                self.errors.append(f"Game {result.game_num} (seed {result.seed}): {result.error}")
+        elif result.completed:
+            self.games_completed += 1
+        else:
+            self.games_unfinished += 1
+
+        self.total_hands += result.hands
+        self.total_actions += result.actions
+        self.chip_violations += int(result.chip_violation)
+        self.infinite_loop_hits += int(result.infinite_loop)
+        self.allin_scenarios += result.allin_hands
+        self.side_pot_scenarios += result.side_pot_hands
+        self.showdown_scenarios += result.showdown_hands
+        self.fold_victories += result.fold_victories
+        self.total_duration += result.duration
+        self.min_hands = result.hands if self.min_hands is None else min(self.min_hands, result.hands)
+        self.max_hands = max(self.max_hands, result.hands)
+        self.player_count_distribution[result.player_count] = (
+            self.player_count_distribution.get(result.player_count, 0) + 1
+        )
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SimulationStats":
+        data = dict(data)
+        # JSON object keys are strings
+        data["player_count_distribution"] = {int(k): v for k, v in data["player_count_distribution"].items()}
+        return cls(**data)
+
+    def report(self) -> str:
+        """Summary report in the stress test format."""
+        total_games = self.games_played
+        success_rate = (self.games_completed / total_games * 100) if total_games > 0 else 0
+        avg_hands = self.total_hands / total_games if total_games > 0 else 0
+        avg_duration = self.total_duration / total_games if total_games > 0 else 0
+
+        report = f"""
+================================================================================
+SIMULATION SUMMARY
+================================================================================
+Games Attempted:     {total_games}
+Games Completed:     {self.games_completed} ({success_rate:.1f}%)
+Games Crashed:       {self.games_crashed}
+Games Unfinished:    {self.games_unfinished}
+Total Hands Played:  {self.total_hands}
+Hands/Game:          {avg_hands:.1f} avg, {self.min_hands or 0} min, {self.max_hands} max
+Total Actions:       {self.total_actions}
+Chip Violations:     {self.chip_violations}
+Infinite Loop Hits:  {self.infinite_loop_hits}
+Avg Game Duration:   {avg_duration:.3f}s (per worker)
+
+EDGE CASE COVERAGE:
+All-In Scenarios:    {self.allin_scenarios}
+Side Pot Scenarios:  {self.side_pot_scenarios}
+Showdown Victories:  {self.showdown_scenarios}
+Fold Victories:      {self.fold_victories}
+================================================================================
+"""
+        if self.player_count_distribution:
+            report += "\nPLAYER COUNT DISTRIBUTION:\n"
+            for count in sorted(self.player_count_distribution):
+                games = self.player_count_distribution[count]
+                pct = (games / total_games * 100) if total_games > 0 else 0
+                report += f"  {count} players: {games} games ({pct:.1f}%)\n"
+
+        if self.errors:
+            report += f"\nERRORS ({self.games_crashed}):\n"
+            for i, err in enumerate(self.errors[:10], 1):  # Show first 10
+                report += f"  {i}. {err[:100]}...\n" if len(err) > 100 else f"  {i}. {err}\n"
+            if self.games_crashed > 10:
+                report += f"  ... and {self.games_crashed - 10} more errors\n"
+
+        return report
+
+
+def create_ai_only_game(player_count: int, seed: Optional[int] = None) -> PokerGame:
+    """Headless game with every seat AI (seat 0 converted from human)."""
+    game = PokerGame("AI Player 1", ai_count=player_count - 1, headless=True, seed=seed)
+    game.players[0].is_human = False
+    game.players[0].personality = "Conservative"
+    return game
+
+
+def play_game(game_num: int, base_seed: int, player_count: Optional[int] = None,
+              max_hands: int = MAX_HANDS_PER_GAME) -> GameResult:
+    """
+    Play one AI-only game until a single player holds every chip (or
+    max_hands). Never raises: crashes are reported in the result.
+    If player_count is None it is drawn from PLAYER_COUNTS.
+    """
+    seed = game_seed(base_seed, game_num)
+    if player_count is None:
+        player_count = random.Random(seed).choice(PLAYER_COUNTS)
+
+    result = GameResult(game_num=game_num, seed=seed, player_count=player_count)
+    start = time.perf_counter()
+    try:
+        # The game's own RNG stream drives names, deck and AI decisions
+        game = create_ai_only_game(player_count, seed)
+        while result.hands < max_hands:
+            if sum(1 for p in game.players if p.stack > 0) < 2:
+                result.completed = True
+                break
+
+            stacks_before = [p.stack for p in game.players]
+            game.start_new_hand()
+            result.hands += 1
+            result.actions += sum(game._hand_action_counts.values())
+
+            if game.pot != 0:
+                # Hand stopped mid-way (betting loop hit its iteration cap)
+                result.infinite_loop = True
+                result.error = f"Hand {game.hand_count} ended with ${game.pot} still in the pot"
+                break
+
+            # Invested chips stay set until the next hand starts
+            in_hand = [p for p in game.players if p.total_invested > 0]
+            if any(p.total_invested == stacks_before[i] for i, p in enumerate(game.players) if p.total_invested > 0):
+                result.allin_hands += 1
+            contenders = [p for p in in_hand if p.is_active]
+            if game.current_state == GameState.SHOWDOWN and len(contenders) > 1:
+                result.showdown_hands += 1
+                if len({p.total_invested for p in contenders}) > 1:
+                    result.side_pot_hands += 1
+            else:
+                result.fold_victories += 1
+        else:
+            result.completed = sum(1 for p in game.players if p.stack > 0) < 2
+            result.infinite_loop = not result.completed
+    except Exception as e:
+        result.chip_violation = "CHIP CONSERVATION" in str(e)
+        result.error = f"{type(e).__name__}: {e}\n{traceback.format_exc(limit=3)}"
+    result.duration = time.perf_counter() - start
+    return result
+
+
+def _play_game_task(task: tuple) -> GameResult:
+    """Pool entry point (top-level so it pickles)."""
+    return play_game(*task)
+
+
+def run_games(game_nums: Iterable[int], base_seed: int, workers: int = 1,
+              player_count: Optional[int] = None,
+              max_hands: int = MAX_HANDS_PER_GAME) -> Iterator[GameResult]:
+    """
+    Play games and yield each result as soon as it finishes (completion
+    order, not game order). workers=1 runs in-process.
+    """
+    tasks = [(game_num, base_seed, player_count, max_hands) for game_num in game_nums]
+    if workers <= 1:
+        for task in tasks:
+            yield _play_game_task(task)
+        return
+
+    # Small chunks keep results streaming and balance long and short games
+    chunksize = max(1, min(16, len(tasks) // (workers * 8)))
+    with multiprocessing.Pool(workers, initializer=warm_up) as pool:
+        yield from pool.imap_unordered(_play_game_task, tasks, chunksize=chunksize)
+
+
+class Checkpoint:
+    """Resumable run state: config, finished game numbers and merged stats."""
+
+    def __init__(self, path: str, config: Dict):
+        self.path = path
+        self.config = config
+        self.completed: set = set()
+        self.stats = SimulationStats()
+
+    @classmethod
+    def load(cls, path: str, config: Dict) -> "Checkpoint":
+        """Load a checkpoint; refuses one written for a different run config."""
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"Checkpoint {path} has unsupported version {data.get('version')}")
+        if data["config"] != config:
+            raise ValueError(f"Checkpoint {path} was written for a different run: {data['config']}")
+        checkpoint = cls(path, config)
+        checkpoint.completed = set(data["completed"])
+        checkpoint.stats = SimulationStats.from_dict(data["stats"])
+        return checkpoint
+
+    def record(self, result: GameResult):
+        self.completed.add(result.game_num)
+        self.stats.merge(result)
+
+    def save(self):
+        """Write atomically (temp file + rename) so a kill never leaves it truncated."""
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"version": CHECKPOINT_VERSION, "config": self.config,
+                       "completed": sorted(self.completed), "stats": self.stats.to_dict()}, f)
+        os.replace(tmp_path, self.path)
+
+
+def run_simulation(num_games: int, base_seed: int = 0, workers: Optional[int] = None,
+                   player_count: Optional[int] = None, max_hands: int = MAX_HANDS_PER_GAME,
+                   checkpoint_path: Optional[str] = None, resume: bool = False,
+                   checkpoint_every: int = 100, progress: bool = False) -> SimulationStats:
+    """
+    Run num_games games across `workers` processes (default: all cores) and
+    return the merged statistics. With checkpoint_path, progress is saved
+    every checkpoint_every games and on exit; resume=True continues from it.
+    """
+    workers = workers or os.cpu_count() or 1
+    config = {"games": num_games, "seed": base_seed, "players": player_count, "max_hands": max_hands}
+
+    if checkpoint_path and resume and os.path.exists(checkpoint_path):
+        checkpoint = Checkpoint.load(checkpoint_path, config)
+    else:
+        checkpoint = Checkpoint(checkpoint_path or "", config)
+
+    pending = [n for n in range(num_games) if n not in checkpoint.completed]
+    start = time.perf_counter()
+    since_save = 0
+    try:
+        for result in run_games(pending, base_seed, workers, player_count, max_hands):
+            checkpoint.record(result)
+            since_save += 1
+            if checkpoint_path and since_save >= checkpoint_every:
+                checkpoint.save()
+                since_save = 0
+            if progress and checkpoint.stats.games_played % 100 == 0:
+                elapsed = time.perf_counter() - start
+                print(f"  {checkpoint.stats.games_played}/{num_games} games "
+                      f"({checkpoint.stats.total_hands / elapsed:,.0f} hands/sec)", file=sys.stderr)
+    finally:
+        if checkpoint_path:
+            checkpoint.save()
+    return checkpoint.stats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run AI-only poker games across a process pool.")
+    parser.add_argument("--games", type=int, default=100, help="number of games (default: 100)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0, help="base seed; each game's seed derives from it")
+    parser.add_argument("--players", type=int, default=None, choices=PLAYER_COUNTS,
+                        help="players per game (default: vary 2-6)")
+    parser.add_argument("--max-hands", type=int, default=MAX_HANDS_PER_GAME, help="safety limit per game")
+    parser.add_argument("--checkpoint", default=None, help="JSON checkpoint file for long runs")
+    parser.add_argument("--checkpoint-every", type=int, default=100, help="games between checkpoint writes")
+    parser.add_argument("--resume", action="store_true", help="continue from --checkpoint")
+    args = parser.parse_args(argv)
+
+    if args.resume and not args.checkpoint:
+        parser.error("--resume requires --checkpoint")
+
+    start = time.perf_counter()
+    stats = run_simulation(args.games, base_seed=args.seed, workers=args.workers,
+                           player_count=args.players, max_hands=args.max_hands,
+                           checkpoint_path=args.checkpoint, resume=args.resume,
+                           checkpoint_every=args.checkpoint_every, progress=True)
+    elapsed = time.perf_counter() - start
+    print(stats.report())
+    print(f"Wall time: {elapsed:.1f}s")
+    return 1 if stats.games_crashed or stats.chip_violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
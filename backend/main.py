@@ -8,14 +8,19 @@ Phase 4: LLM-powered hand analysis with Claude AI
 from dotenv import load_dotenv
 load_dotenv()
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Query
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 import asyncio
 import time
 import logging
 import os
 
 from game.poker_engine import GameState
+from game.hand_evaluator import warm_up as warm_up_evaluator
+from game.cards import to_cards
+from game.journal import JournalLockedError
+from ai_executor import ai_executor
 from websocket_manager import manager, thread_safe_manager, process_ai_turns_with_events, serialize_game_state
 from auth import verify_token_string
 from database import save_completed_hand
@@ -68,6 +73,13 @@ app.include_router(game_router)
 app.include_router(analysis_router)
 
 
+@app.exception_handler(JournalLockedError)
+async def game_held_elsewhere(request: Request, exc: JournalLockedError):
+    """Another worker holds the game (app_state.recover_game): the client should retry."""
+    return JSONResponse(status_code=409, content={"detail": "Game is held by another worker"},
+                        headers={"Retry-After": "1"})
+
+
 # Health check endpoint for monitoring and deployment verification
 @app.get("/health")
 async def health_check():
@@ -80,26 +92,55 @@ async def health_check():
     }
 
 
+@app.get("/admin/broadcast-metrics")
+async def get_broadcast_metrics():
+    """WebSocket state broadcast counters: serializations, cache hits, skipped broadcasts."""
+    return manager.broadcast_metrics()
+
+
+@app.get("/admin/ai-metrics")
+async def get_ai_metrics():
+    """AI decision executor: mode, decisions, per-decision latency and compute time percentiles."""
+    return ai_executor.metrics()
+
+
 # Periodic cleanup task
 @app.on_event("startup")
 async def startup_event():
-    """Start periodic cleanup of old games."""
+    """Load the hand evaluator tables, start the AI decision pool and periodic cleanup of old games."""
+    timings = warm_up_evaluator()
+    steps = ", ".join(f"{name} {ms:.0f}ms" for name, ms in timings.items() if name != "total")
+    print(f"[Startup] Hand evaluator ready in {timings['total']:.0f}ms ({steps})")
+    ai_executor.start()
+    print(f"[Startup] AI decisions: {ai_executor.mode}"
+          + (f" ({ai_executor.workers} workers)" if ai_executor.mode != "inline" else ""))
+
     async def periodic_cleanup():
         while True:
             await asyncio.sleep(app_state.GAME_CLEANUP_INTERVAL_SECONDS)
             removed = app_state.cleanup_old_games()
             if removed > 0:
                 print(f"[Cleanup] Removed {removed} idle game(s)")
+            removed = app_state.cleanup_old_journals()
+            if removed > 0:
+                print(f"[Cleanup] Removed {removed} abandoned game journal(s)")
 
     asyncio.create_task(periodic_cleanup())
     print(f"[Startup] Periodic game cleanup enabled (every {app_state.GAME_CLEANUP_INTERVAL_SECONDS}s, max idle {app_state.GAME_MAX_IDLE_SECONDS}s)")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the AI decision pool."""
+    ai_executor.shutdown()
+
+
 @app.websocket("/ws/{game_id}")
 async def websocket_endpoint(
     websocket: WebSocket,
     game_id: str,
-    token: str = Query(None)
+    token: str = Query(None),
+    protocol: str = Query("full")
 ):
     """
     WebSocket endpoint for real-time game updates (requires authentication).
@@ -109,12 +150,15 @@ async def websocket_endpoint(
         websocket: WebSocket connection
         game_id: Game ID
         token: JWT token as query parameter (?token=xxx)
+        protocol: "delta" for a state snapshot followed by seq-numbered patches
+            (&protocol=delta); anything else sends full state updates
 
     Flow:
     1. Client connects with auth token
     2. Client sends action: {"action": "fold/call/raise", "amount": 100}
     3. Server processes human action
     4. Server processes AI turns ONE AT A TIME, emitting events for each
+       (with "timeline": true, all at once as one ai_timeline message)
     5. Client receives events and animates each action
     """
     from fastapi import HTTPException
@@ -132,19 +176,23 @@ async def websocket_endpoint(
         await websocket.close(code=1008, reason="Invalid token")
         return
 
-    # Validate game exists
-    if game_id not in games:
+    # Validate game exists (recovered from its journal after a restart)
+    try:
+        game = app_state.get_game(game_id)
+    except JournalLockedError:
+        await websocket.close(code=1013, reason="Game is held by another worker")
+        return
+    if game is None:
         await websocket.close(code=1008, reason="Game not found")
         return
 
     # Validate game ownership
-    game, _ = games[game_id]
     if not hasattr(game, 'user_id') or game.user_id != user_id:
         await websocket.close(code=1008, reason="Unauthorized")
         return
 
     # Connect to WebSocket manager
-    await manager.connect(game_id, websocket)
+    await manager.connect(game_id, websocket, delta=protocol == "delta")
 
     try:
         # Send initial game state
@@ -177,8 +225,9 @@ async def websocket_endpoint(
                 # Human player action
                 action = data.get("action")
                 amount = data.get("amount")
-                show_ai_thinking = data.get("show_ai_thinking", False)
+                show_ai_thinking = manager.ai_thinking(websocket, data)
                 step_mode = data.get("step_mode", False)  # Phase 4: Step Mode (UAT-1 fix)
+                timeline = data.get("timeline", False)  # AI actions as one batch, paced by the client
 
                 # Validate action
                 if action not in ["fold", "call", "raise"]:
@@ -205,7 +254,7 @@ async def websocket_endpoint(
                     await manager.broadcast_state(game_id, game, show_ai_thinking)
 
                     # Process AI turns in background task (so we can continue receiving messages)
-                    task = asyncio.create_task(process_ai_turns_with_events(game, game_id, show_ai_thinking, step_mode))
+                    task = asyncio.create_task(process_ai_turns_with_events(game, game_id, show_ai_thinking, step_mode, timeline))
                     app_state.game_tasks[game_id] = task
                     return True
 
@@ -239,14 +288,15 @@ async def websocket_endpoint(
 
                 # Start new hand (process_ai=False: let WebSocket handle AI turns async)
                 game.start_new_hand(process_ai=False)
-                show_ai_thinking = data.get("show_ai_thinking", False)
+                show_ai_thinking = manager.ai_thinking(websocket, data)
                 step_mode = data.get("step_mode", False)  # Phase 4: Step Mode
+                timeline = data.get("timeline", False)
                 await manager.broadcast_state(game_id, game, show_ai_thinking)
 
                 # Process AI turns if game starts with AI (background task)
                 current = game.get_current_player()
                 if current and not current.is_human:
-                    task = asyncio.create_task(process_ai_turns_with_events(game, game_id, show_ai_thinking, step_mode))
+                    task = asyncio.create_task(process_ai_turns_with_events(game, game_id, show_ai_thinking, step_mode, timeline))
                     app_state.game_tasks[game_id] = task
 
             elif message_type == "continue":
@@ -255,10 +305,12 @@ async def websocket_endpoint(
                 manager.signal_continue(game_id)
                 print(f"[WebSocket] Continue signal sent to manager")
 
-            elif message_type == "get_state":
-                # Client requesting current state
-                show_ai_thinking = data.get("show_ai_thinking", False)
-                await manager.broadcast_state(game_id, game, show_ai_thinking)
+            elif message_type in ("get_state", "resync"):
+                # Client requesting current state (send even if unchanged since the last broadcast)
+                # Delta clients get a full snapshot, e.g. after a gap in patch seq numbers
+                show_ai_thinking = manager.ai_thinking(websocket, data)
+                manager.resync(websocket)
+                await manager.broadcast_state(game_id, game, show_ai_thinking, force=True)
 
             else:
                 await manager.send_event(game_id, {
@@ -306,6 +358,9 @@ if TEST_MODE:
 
         game, _ = games[game_id]
 
+        # Hand-edited state can't be replayed from the game's journal
+        app_state.discard_game_journal(game_id, game)
+
         # Apply state modifications with validation
         if "player_stacks" in request:
             for player_name, stack in request["player_stacks"].items():
@@ -352,8 +407,8 @@ if TEST_MODE:
                         detail=f"Invalid card format: {card}. Expected format: rank[2-9TJQKA] + suit[hdsc]"
                     )
 
-            game.community_cards = cards
-            logger.info(f"[TEST] Set community cards to {game.community_cards}")
+            game.community_cards = to_cards(cards)
+            logger.info(f"[TEST] Set community cards to {cards}")
 
         if "current_player_index" in request:
             game.current_player_index = request["current_player_index"]
@@ -361,6 +416,7 @@ if TEST_MODE:
 
         # Recalculate total chips for conservation check
         game.total_chips = sum(p.stack for p in game.players) + game.pot
+        game.state_version += 1  # Direct writes above bypass the engine's versioning
 
         # Disable chip conservation for test scenarios
         game.qc_enabled = False
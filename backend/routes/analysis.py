@@ -14,7 +14,7 @@ from models import Game, Hand
 from database import get_db
 import app_state
 from app_state import (
-    games, analysis_cache, analysis_metrics, last_analysis_time,
+    get_game, analysis_cache, analysis_metrics, last_analysis_time,
     track_analysis_metrics,
 )
 
@@ -67,20 +67,14 @@ def get_hand_analysis(game_id: str, hand_number: Optional[int] = None):
     Returns insights, tips, and AI reasoning for the specified hand.
     Phase 3: Support for historical hand analysis via hand_number parameter.
     """
-    if game_id not in games:
+    game = get_game(game_id)  # Updates access time
+    if game is None:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    game, _ = games[game_id]
-    games[game_id] = (game, time.time())  # Update access time
-
     # Phase 3: Support analyzing specific hand by number
     if hand_number is not None:
         # Find hand in history
-        target_hand = None
-        for hand in game.hand_history:
-            if hand.hand_number == hand_number:
-                target_hand = hand
-                break
+        target_hand = game.find_hand(hand_number)
 
         if not target_hand:
             raise HTTPException(status_code=404, detail=f"Hand #{hand_number} not found in history")
@@ -137,14 +131,11 @@ async def get_llm_hand_analysis(
             detail="LLM analysis not available. Set ANTHROPIC_API_KEY environment variable."
         )
 
-    # Check if game is in active games (in-memory)
-    game = None
-    is_active_game = game_id in games
+    # Check if game is in active games (in-memory, or recoverable from its journal)
+    game = get_game(game_id)  # Updates access time
+    is_active_game = game is not None
 
-    if is_active_game:
-        game, _ = games[game_id]
-        games[game_id] = (game, time.time())  # Update access time
-    else:
+    if not is_active_game:
         # Query database for completed game
         game_record = db.query(Game).filter(
             Game.game_id == game_id,
@@ -168,10 +159,7 @@ async def get_llm_hand_analysis(
     if is_active_game:
         # Active game: use in-memory data
         if hand_number is not None and hasattr(game, 'hand_history'):
-            target_hand = next(
-                (h for h in game.hand_history if h.hand_number == hand_number),
-                None
-            )
+            target_hand = game.find_hand(hand_number)
         else:
             target_hand = game.last_hand_summary
 
@@ -314,13 +302,11 @@ async def get_session_analysis(
         )
 
     # Try in-memory game first, then fall back to database
-    game = None
+    game = get_game(game_id)
     hand_history = []
     ending_stack = 1000
 
-    if game_id in games:
-        game, _ = games[game_id]
-        games[game_id] = (game, time.time())
+    if game is not None:
         hand_history = game.hand_history if hasattr(game, 'hand_history') else []
         human_player = next((p for p in game.players if p.is_human), None)
         if human_player:
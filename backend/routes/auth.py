@@ -85,7 +85,7 @@ async def delete_account(user_id: str = Depends(verify_token), db: Session = Dep
         raise HTTPException(status_code=404, detail="User not found")
 
     # Clean up any active in-memory games
-    from app_state import games, deleted_games, game_tasks
+    from app_state import games, deleted_games, game_tasks, discard_game_journal
     user_games = [gid for gid, (game, _) in games.items()
                   if hasattr(game, 'user_id') and game.user_id == user_id]
     for gid in user_games:
@@ -93,7 +93,8 @@ async def delete_account(user_id: str = Depends(verify_token), db: Session = Dep
             game_tasks[gid].cancel()
             del game_tasks[gid]
         deleted_games.add(gid)
-        del games[gid]
+        game, _ = games.pop(gid)
+        discard_game_journal(gid, game)
 
     db.delete(user)  # Cascade deletes Game -> Hand -> AnalysisCache
     db.commit()
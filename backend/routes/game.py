@@ -9,11 +9,14 @@ from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.orm import Session
 
 from game.poker_engine import PokerGame, GameState, HandEvaluator
+from game.cards import cards_to_str
+from game.journal import start_journal
 from auth import verify_token
 from models import Game, Hand
 from database import get_db, save_completed_hand
 from app_state import (
-    games, CreateGameRequest, GameActionRequest, GameResponse,
+    games, get_game, journal_path, discard_game_journal,
+    CreateGameRequest, GameActionRequest, GameResponse,
 )
 
 router = APIRouter(tags=["game"])
@@ -39,7 +42,7 @@ def _build_game_response(game_id: str, game: PokerGame, show_ai_thinking: bool =
             "is_human": player.is_human,
             "personality": player.personality if not player.is_human else None,
             # Only show hole cards for human player or if showdown
-            "hole_cards": player.hole_cards if (player.is_human or game.current_state == GameState.SHOWDOWN) else []
+            "hole_cards": cards_to_str(player.hole_cards) if (player.is_human or game.current_state == GameState.SHOWDOWN) else []
         }
         players_data.append(player_data)
 
@@ -49,7 +52,7 @@ def _build_game_response(game_id: str, game: PokerGame, show_ai_thinking: bool =
         "name": human_player.name,
         "stack": human_player.stack,
         "current_bet": human_player.current_bet,
-        "hole_cards": human_player.hole_cards,
+        "hole_cards": cards_to_str(human_player.hole_cards),
         "is_active": human_player.is_active,
         "is_current_turn": game.get_current_player() == human_player if game.get_current_player() else False
     }
@@ -87,9 +90,9 @@ def _build_game_response(game_id: str, game: PokerGame, show_ai_thinking: bool =
 
     if has_pot_award:
         # Determine if this is a showdown or fold win
-        # Showdown happened if there are showdown_hands recorded (not just based on game state)
-        is_showdown = (game.last_hand_summary is not None and
-                      len(game.last_hand_summary.showdown_hands) > 0)
+        # Showdown happened if hands were revealed (scored once per hand by the engine)
+        showdown = game.showdown_summary
+        is_showdown = showdown is not None and len(showdown.participants) > 0
 
         # Collect ALL pot_award events (not just the first one!)
         winners = []
@@ -97,12 +100,13 @@ def _build_game_response(game_id: str, game: PokerGame, show_ai_thinking: bool =
             if event.event_type == "pot_award":
                 winner = next((p for p in game.players if p.player_id == event.player_id), None)
                 if winner:
-                    # Get hand rank and hole cards from last_hand_summary (only at showdown)
+                    # Get hand rank and hole cards from the showdown summary (only at showdown)
                     hand_rank = None
                     hole_cards = []
-                    if is_showdown and game.last_hand_summary:
-                        hand_rank = game.last_hand_summary.hand_rankings.get(winner.player_id)
-                        hole_cards = game.last_hand_summary.showdown_hands.get(winner.player_id, [])
+                    revealed = showdown.hand(winner.player_id) if is_showdown else None
+                    if revealed:
+                        hand_rank = revealed.hand_rank
+                        hole_cards = list(revealed.hole_cards)
 
                     winners.append({
                         "player_id": winner.player_id,
@@ -120,55 +124,33 @@ def _build_game_response(game_id: str, game: PokerGame, show_ai_thinking: bool =
         all_showdown_hands = []
         folded_players = []
 
-        if is_showdown and game.last_hand_summary:
-            # Get showdown participants (players who revealed cards)
-            evaluator = HandEvaluator()
-            showdown_participants = []
-
+        if is_showdown:
+            # Showdown participants, already sorted by hand strength (best first)
+            amounts_won = {}
+            for w in winners:
+                amounts_won.setdefault(w["player_id"], w["amount"])
+            players_by_id = {p.player_id: p for p in game.players}
+
+            for revealed in showdown.participants:
+                player = players_by_id[revealed.player_id]
+                all_showdown_hands.append({
+                    "player_id": player.player_id,
+                    "name": player.name,
+                    "hand_rank": revealed.hand_rank,
+                    "hole_cards": list(revealed.hole_cards),
+                    "amount_won": amounts_won.get(player.player_id, 0),
+                    "is_human": player.is_human
+                })
+
+            # Players who folded - don't show cards
             for player in game.players:
-                if player.player_id in game.last_hand_summary.showdown_hands:
-                    # This player went to showdown
-                    hole_cards = game.last_hand_summary.showdown_hands[player.player_id]
-                    hand_rank = game.last_hand_summary.hand_rankings.get(player.player_id, "Unknown")
-
-                    # Calculate score for ranking
-                    score = 9999  # Default high score
-                    if hole_cards and game.community_cards:
-                        score, _ = evaluator.evaluate_hand(hole_cards, game.community_cards)
-
-                    # Find amount won (if any)
-                    amount_won = 0
-                    for w in winners:
-                        if w["player_id"] == player.player_id:
-                            amount_won = w["amount"]
-                            break
-
-                    showdown_participants.append({
-                        "player_id": player.player_id,
-                        "name": player.name,
-                        "hand_rank": hand_rank,
-                        "hole_cards": hole_cards,
-                        "amount_won": amount_won,
-                        "is_human": player.is_human,
-                        "score": score  # For sorting (lower is better in Treys)
-                    })
-                else:
-                    # This player folded - don't show cards
+                if showdown.hand(player.player_id) is None:
                     folded_players.append({
                         "player_id": player.player_id,
                         "name": player.name,
                         "is_human": player.is_human
                     })
 
-            # Sort by hand strength (lower score = better hand)
-            showdown_participants.sort(key=lambda x: x["score"])
-
-            # Remove score from final output (internal use only)
-            for participant in showdown_participants:
-                del participant["score"]
-
-            all_showdown_hands = showdown_participants
-
         # Return as list if multiple winners, single dict if only one
         # Add showdown data to the response
         if len(winners) > 1:
@@ -188,7 +170,7 @@ def _build_game_response(game_id: str, game: PokerGame, show_ai_thinking: bool =
         pot=game.pot,
         current_bet=game.current_bet,
         players=players_data,
-        community_cards=game.community_cards,
+        community_cards=cards_to_str(game.community_cards),
         current_player_index=game.current_player_index,
         human_player=human_data,
         last_ai_decisions=ai_decisions_data,
@@ -232,6 +214,11 @@ def create_game(
     # Store user_id in game for later access
     game.user_id = user_id
 
+    # Journal every action so the game survives a server restart
+    path = journal_path(game_id)
+    if path:
+        start_journal(game, path, meta={"user_id": user_id})
+
     # Start first hand
     # MVP: Use process_ai=True for REST API flow (WebSocket support comes later)
     game.start_new_hand(process_ai=True)
@@ -269,13 +256,11 @@ def get_game_state(game_id: str, show_ai_thinking: bool = False):
     Returns: Complete game state including players, cards, pot, etc.
     """
     # Validate game exists
-    if game_id not in games:
+    # Get game (recovered from its journal after a restart) and update last access time
+    game = get_game(game_id)
+    if game is None:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    # Get game and update last access time
-    game, _ = games[game_id]
-    games[game_id] = (game, time.time())
-
     return _build_game_response(game_id, game, show_ai_thinking)
 
 
@@ -291,13 +276,11 @@ def submit_action(
     Returns: Updated game state
     """
     # Validate game exists
-    if game_id not in games:
+    # Get game (recovered from its journal after a restart) and update last access time
+    game = get_game(game_id)
+    if game is None:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    # Get game and update last access time
-    game, _ = games[game_id]
-    games[game_id] = (game, time.time())
-
     # Validate action
     if request.action not in ["fold", "call", "raise"]:
         raise HTTPException(status_code=400, detail="Invalid action. Must be 'fold', 'call', or 'raise'")
@@ -331,13 +314,11 @@ def next_hand(
     Returns: Updated game state
     """
     # Validate game exists
-    if game_id not in games:
+    # Get game (recovered from its journal after a restart) and update last access time
+    game = get_game(game_id)
+    if game is None:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    # Get game and update last access time
-    game, _ = games[game_id]
-    games[game_id] = (game, time.time())
-
     # Check if current hand is finished
     if game.current_state != GameState.SHOWDOWN:
         raise HTTPException(status_code=400, detail="Current hand not finished. Complete showdown first.")
@@ -395,9 +376,8 @@ async def quit_game(
         return {"message": "Game already completed"}
 
     # Get in-memory game state to save final stack and hand history
-    game_tuple = games.get(game_id)
-    if game_tuple:
-        game, _ = game_tuple  # Extract PokerGame from tuple
+    game = get_game(game_id)
+    if game:
 
         # Save the last completed hand if it exists
         if game.last_hand_summary and hasattr(game, 'user_id'):
@@ -422,6 +402,7 @@ async def quit_game(
     deleted_games.add(game_id)
     if game_id in games:
         del games[game_id]
+    discard_game_journal(game_id, game)
 
     return {"message": "Game quit successfully", "game_id": game_id}
 
@@ -515,27 +496,35 @@ def get_hand_history(game_id: str, limit: Optional[int] = 10):
     Returns:
         List of completed hands with detailed round-by-round actions.
     """
-    if game_id not in games:
+    game = get_game(game_id)  # Updates access time
+    if game is None:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    game, _ = games[game_id]
-    games[game_id] = (game, time.time())  # Update access time
-
     # Validate and cap limit
     if limit < 1:
         limit = 10
     elif limit > 100:
         limit = 100
 
-    # Get most recent N hands
-    hands = game.hand_history[-limit:] if len(game.hand_history) > limit else game.hand_history
+    # Get most recent N hands (copies only those, not the whole history)
+    hands = game.recent_hands(limit)
 
     # Convert to JSON-serializable format
     hands_data = [asdict(hand) for hand in hands]
 
     return {
         "session_id": game.session_id,
-        "total_hands": len(game.hand_history),
+        "total_hands": game.hand_history_count,
         "returned_hands": len(hands_data),
         "hands": hands_data
     }
+
+
+@router.get("/admin/evaluator-metrics")
+def get_evaluator_metrics():
+    """
+    Hand evaluation cache counters (shared by all games in this process).
+
+    Returns size, capacity, hits, misses, evictions and hit rate.
+    """
+    return HandEvaluator.cache_stats()
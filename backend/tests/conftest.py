@@ -5,13 +5,21 @@ Defines custom markers for test categorization.
 """
 
 import pytest
+import asyncio
+import json
 import os
+import time
 import uuid
 import httpx
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from models import Base
 
+import app_state
+import websocket_manager
+from game.poker_engine import PokerGame
+from websocket_manager import ConnectionManager
+
 
 def pytest_configure(config):
     """Register custom pytest markers."""
@@ -66,3 +74,63 @@ async def create_authed_game(port: int, token: str, ai_count: int = 3) -> str:
         )
         assert resp.status_code == 200, f"Game creation failed: {resp.text}"
         return resp.json()["game_id"]
+
+
+# ============================================================
+# Shared WebSocket helpers for ConnectionManager tests
+# ============================================================
+
+class FakeWebSocket:
+    """Records what the server sends; with fail=True every send raises like a closed connection."""
+
+    def __init__(self, fail: bool = False):
+        self.sent = []
+        self.fail = fail
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text: str):
+        if self.fail:
+            raise RuntimeError("connection closed")
+        self.sent.append(text)
+
+    def messages(self, *types):
+        messages = [json.loads(text) for text in self.sent]
+        return [m for m in messages if not types or m["type"] in types]
+
+
+def deliver(manager: ConnectionManager, send):
+    """Run a send and wait until the connections' writers have written it."""
+    async def run():
+        await send
+        await manager.flush()
+    asyncio.run(run())
+
+
+@pytest.fixture
+def connected_game(monkeypatch):
+    """
+    Factory for game "g" registered with a fresh ConnectionManager and one
+    connected FakeWebSocket: create(seed, ai_count, delta) returns
+    (manager, game, ws, sleeps). The server's pauses between AI actions are
+    recorded in sleeps instead of slept.
+    """
+    sleeps = []
+    sleep = asyncio.sleep
+
+    async def record_sleep(seconds):
+        sleeps.append(seconds)
+        await sleep(0)  # Still lets the connection writers run
+    monkeypatch.setattr(websocket_manager.asyncio, "sleep", record_sleep)
+
+    def create(seed: int = 1, ai_count: int = 3, delta: bool = False):
+        sleeps.clear()
+        manager = ConnectionManager()
+        monkeypatch.setattr(websocket_manager, "manager", manager)
+        game = PokerGame("Human", ai_count=ai_count, seed=seed)
+        monkeypatch.setitem(app_state.games, "g", (game, time.time()))
+        ws = FakeWebSocket()
+        asyncio.run(manager.connect("g", ws, delta=delta))
+        return manager, game, ws, sleeps
+    return create
@@ -0,0 +1,244 @@
+"""
+AI decision executor tests (ai_executor.AIExecutor).
+
+- Inline, thread and process modes make the same decisions and leave the game,
+  its RNG and its journal exactly as inline decide_ai_action() calls do
+- A decision computed for a game that changed while it was in the pool is
+  recomputed inline instead of applied
+- process_ai_turns_with_events goes through the executor and, like the REST
+  path, sizes AI minimum raises from the last raise
+- Per-decision latency and compute time are recorded
+
+The 200 concurrent games load test is marked slow.
+"""
+import asyncio
+import json
+import pytest
+import sys
+import os
+import time
+from dataclasses import asdict
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import app_state
+import websocket_manager
+from ai_executor import AIExecutor
+from game.ai_strategy import AIStrategy, compute_ai_decision
+from game.journal import replay_journal, start_journal
+from game.poker_engine import PokerGame, GameState
+from websocket_manager import ConnectionManager, process_ai_turns_with_events
+
+
+@pytest.fixture
+def executor(request):
+    executor = AIExecutor(mode=request.param, workers=2)
+    executor.start()
+    yield executor
+    executor.shutdown()
+
+
+def alive(game: PokerGame) -> int:
+    return sum(1 for p in game.players if p.stack > 0)
+
+
+async def play(game: PokerGame, executor: AIExecutor, num_hands: int, latencies=None):
+    """
+    WebSocket path with AI turns through the executor, the human always calling.
+    latencies collects each AI action's time from being due (before yielding to
+    the other games) to applied.
+    """
+    for _ in range(num_hands):
+        if alive(game) < 2:
+            break
+        game.start_new_hand(process_ai=False)
+        for _ in range(200):
+            if game.current_state == GameState.SHOWDOWN or game.current_player_index is None:
+                break
+            if game._betting_round_complete():
+                game._advance_state_for_websocket()
+                continue
+            player = game.players[game.current_player_index]
+            if player.is_human:
+                game.submit_human_action("call", process_ai=False)
+                continue
+            due = time.perf_counter()
+            await asyncio.sleep(0)  # Other games' traffic runs here, as between broadcasts
+            decision = await executor.decide(game, game.current_player_index)
+            result = game.apply_action(game.current_player_index, decision.action, decision.amount,
+                                       hand_strength=decision.hand_strength, reasoning=decision.reasoning)
+            if not result["success"]:
+                game.apply_action(game.current_player_index, "fold")
+            if latencies is not None:
+                latencies.append((time.perf_counter() - due) * 1000)
+            if game.current_player_index is not None:
+                game.advance_turn()
+
+
+def outcome(game: PokerGame):
+    """Game state that must not depend on the executor (session/decision IDs and timestamps excluded)."""
+    def history(hand):
+        data = asdict(hand)
+        data.pop("timestamp")
+        data.pop("session_id")
+        for event in data["events"]:
+            event.pop("timestamp")
+        for decision in data["ai_decisions"].values():
+            decision.pop("decision_id")
+        return data
+
+    return ([asdict(p) for p in game.players], game.pot, game.current_state, game.community_cards,
+            game.rng.getstate(), [history(hand) for hand in game.hand_history])
+
+
+def played(seed: int, executor: AIExecutor, num_hands: int = 6) -> PokerGame:
+    game = PokerGame("Human", ai_count=5, seed=seed)
+    asyncio.run(play(game, executor, num_hands))
+    return game
+
+
+class TestExecutor:
+
+    @pytest.mark.parametrize("executor", ["thread", "process"], indirect=True)
+    @pytest.mark.parametrize("seed", [1, 4])
+    def test_pool_decides_like_inline(self, executor, seed):
+        inline = AIExecutor(mode="inline")
+        assert outcome(played(seed, executor)) == outcome(played(seed, inline))
+        assert executor.decisions == inline.decisions > 0
+        assert executor.recomputed == 0
+
+    @pytest.mark.parametrize("executor", ["thread"], indirect=True)
+    def test_journal_replays_pooled_decisions(self, executor, tmp_path):
+        path = str(tmp_path / "game.jsonl")
+        game = PokerGame("Human", ai_count=3, seed=6)
+        start_journal(game, path)
+        asyncio.run(play(game, executor, 8))
+        assert outcome(replay_journal(path)[0]) == outcome(game)
+
+    def test_stale_result_recomputed(self):
+        game = PokerGame("Human", ai_count=5, seed=3)
+        game.start_new_hand(process_ai=False)
+        while game.players[game.current_player_index].is_human:
+            game.submit_human_action("call", process_ai=False)
+        index = game.current_player_index
+        result = compute_ai_decision(game.ai_decision_request(index))
+
+        game.rng.random()  # Game moved on while the decision was computed
+        expected = game.clone()
+        game.use_computed_ai_decision(result)
+        decision = game.decide_ai_action(index)
+        assert decision is not result.decision
+        assert asdict(decision) | {"decision_id": ""} == asdict(expected.decide_ai_action(index)) | {"decision_id": ""}
+        assert game.rng.getstate() == expected.rng.getstate()
+        assert game._computed_ai_decision is None
+
+    @pytest.mark.parametrize("executor", ["thread"], indirect=True)
+    def test_websocket_ai_turns_use_executor(self, executor, monkeypatch):
+        monkeypatch.setattr(websocket_manager, "ai_executor", executor)
+        monkeypatch.setattr(websocket_manager, "manager", ConnectionManager())
+        game = PokerGame("Human", ai_count=5, seed=2)
+        monkeypatch.setitem(app_state.games, "g", (game, time.time()))
+        game.start_new_hand(process_ai=False)
+        if game.get_current_player().is_human:
+            game.submit_human_action("call", process_ai=False)
+
+        asyncio.run(process_ai_turns_with_events(game, "g", timeline=True))
+        assert executor.decisions > 0
+        assert executor.decisions == len(executor.latency_ms)
+
+    def test_websocket_ai_uses_last_raise(self, monkeypatch):
+        last_raises = []
+        decide = AIStrategy.make_decision_with_reasoning
+
+        def spy(*args, **kwargs):
+            last_raises.append(args[8])  # last_raise_amount
+            return decide(*args, **kwargs)
+
+        monkeypatch.setattr(AIStrategy, "make_decision_with_reasoning", staticmethod(spy))
+        monkeypatch.setattr(websocket_manager, "ai_executor", AIExecutor(mode="inline"))
+        monkeypatch.setattr(websocket_manager, "manager", ConnectionManager())
+        game = PokerGame("Human", ai_count=5, seed=2)
+        monkeypatch.setitem(app_state.games, "g", (game, time.time()))
+        game.start_new_hand(process_ai=False)
+        if game.get_current_player().is_human:
+            game.submit_human_action("call", process_ai=False)
+        game.last_raise_amount = 4 * game.big_blind
+
+        asyncio.run(process_ai_turns_with_events(game, "g"))
+        assert last_raises and last_raises[0] == 4 * game.big_blind
+
+    def test_latency_metrics(self):
+        executor = AIExecutor(mode="inline")
+        played(seed=5, executor=executor, num_hands=3)
+        metrics = executor.metrics()
+        assert metrics["mode"] == "inline" and metrics["workers"] == 0
+        assert metrics["decisions"] == len(executor.latency_ms) == len(executor.compute_ms) > 0
+        assert 0 < metrics["compute_p50_ms"] <= metrics["compute_p99_ms"]
+        assert metrics["latency_p50_ms"] <= metrics["latency_p99_ms"] <= metrics["latency_max_ms"]
+        json.dumps(metrics)
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            AIExecutor(mode="greenlet")
+        with pytest.raises(ValueError):
+            AIExecutor(workers=-1)
+
+
+@pytest.mark.slow
+class TestConcurrentGamesLoad:
+    """Load test: p99 AI action latency with 200 games sharing one event loop."""
+
+    def test_load_200_games(self):
+        print("\n" + "="*60)
+        print("LOAD TEST: 200 concurrent 6-handed games, 2 hands each")
+        print("="*60)
+
+        games, hands = 200, 2
+
+        def run(mode: str):
+            executor = AIExecutor(mode=mode, workers=2)
+            executor.start()
+            latencies, lags = [], []
+
+            async def probe(done: asyncio.Event):
+                """Another client's traffic: how late a 1 ms timer fires."""
+                loop = asyncio.get_running_loop()
+                while not done.is_set():
+                    due = loop.time() + 0.001
+                    await asyncio.sleep(0.001)
+                    lags.append((loop.time() - due) * 1000)
+
+            async def main():
+                tables = [PokerGame("Human", ai_count=5, seed=seed) for seed in range(games)]
+                done = asyncio.Event()
+                prober = asyncio.create_task(probe(done))
+                start = time.perf_counter()
+                await asyncio.gather(*(play(game, executor, hands, latencies) for game in tables))
+                elapsed = time.perf_counter() - start
+                done.set()
+                await prober
+                return tables, elapsed
+
+            try:
+                tables, elapsed = asyncio.run(main())
+            finally:
+                executor.shutdown()
+            return [outcome(game) for game in tables], elapsed, sorted(latencies), sorted(lags), executor
+
+        p = lambda values, q: values[min(len(values) - 1, int(q * len(values)))]
+        results = {mode: run(mode) for mode in ("inline", "thread", "process")}
+
+        print(f"\n📊 Results ({os.cpu_count()} CPU, 2 pool workers):")
+        for mode, (_, elapsed, latencies, lags, executor) in results.items():
+            print(f"  {mode:8s} {len(latencies):5,} AI actions in {elapsed:5.2f} s | action latency "
+                  f"p50 {p(latencies, 0.5):6.2f} ms  p99 {p(latencies, 0.99):7.2f} ms | "
+                  f"decision compute p99 {executor.metrics()['compute_p99_ms']:.3f} ms | "
+                  f"loop lag p99 {p(lags, 0.99):6.2f} ms")
+
+        baseline = results["inline"][0]
+        for mode, (outcomes, _, latencies, _, executor) in results.items():
+            assert outcomes == baseline, f"{mode} games diverged from inline"
+            assert executor.recomputed == 0
+            assert executor.decisions == len(latencies)
+
+        print("\n✅ PASS: 200 games play identically in every mode; latencies above")
@@ -0,0 +1,171 @@
+"""
+AI timeline mode tests (process_ai_turns_with_events(timeline=True)).
+
+- Every AI action up to the human's next decision is resolved without sleeping
+  and sent as one ai_timeline message, then the resulting state
+- Playing the entries' patches back from base_version shows exactly the states
+  the paced mode broadcasts, at the same AI_ACTION_DELAY_MS spacing
+- Step mode still pauses per action
+
+The server time per human action benchmark is marked slow.
+"""
+import asyncio
+import pytest
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from conftest import FakeWebSocket
+from game.poker_engine import PokerGame, GameState
+from websocket_manager import (AI_ACTION_DELAY_MS, ConnectionManager, apply_state_patch,
+                               process_ai_turns_with_events)
+
+
+def play_hand(manager: ConnectionManager, game: PokerGame, timeline: bool):
+    """One hand the way the WebSocket endpoint drives it, the human always calling."""
+    async def run():
+        game.start_new_hand(process_ai=False)
+        await manager.broadcast_state("g", game)
+        for _ in range(20):
+            await process_ai_turns_with_events(game, "g", timeline=timeline)
+            current = game.get_current_player()
+            if game.current_state == GameState.SHOWDOWN or current is None or not current.is_human:
+                break
+            game.submit_human_action("call", process_ai=False)
+            await manager.broadcast_state("g", game)
+        await manager.flush()
+    asyncio.run(run())
+
+
+def visible(states):
+    """States as a player sees them: without ids/versions, consecutive repeats collapsed."""
+    shown = []
+    for state in states:
+        state = dict(state, state_version=None, last_ai_decisions={
+            pid: {k: v for k, v in decision.items() if k != "decision_id"}
+            for pid, decision in state["last_ai_decisions"].items()})
+        if not shown or shown[-1] != state:
+            shown.append(state)
+    return shown
+
+
+def played_back(ws: FakeWebSocket):
+    """States a timeline client shows: state messages, with each timeline played back in between."""
+    shown = []
+    for message in ws.messages("state_update", "ai_timeline"):
+        if message["type"] == "state_update":
+            shown.append(message["data"])
+            continue
+        timeline = message["data"]
+        assert shown[-1]["state_version"] == timeline["base_version"]
+        state = shown[-1]
+        for entry in timeline["entries"]:
+            state = apply_state_patch(state, entry["patch"])
+            shown.append(state)
+    return shown
+
+
+class TestTimeline:
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_shows_same_states_as_paced_mode(self, connected_game, seed):
+        manager, game, paced_ws, _ = connected_game(seed, ai_count=5)
+        play_hand(manager, game, timeline=False)
+        paced = [m["data"] for m in paced_ws.messages("state_update")]
+
+        manager, game, timeline_ws, sleeps = connected_game(seed, ai_count=5)
+        play_hand(manager, game, timeline=True)
+        assert sleeps == []
+        assert visible(played_back(timeline_ws)) == visible(paced)
+
+    def test_batch_then_state(self, connected_game):
+        manager, game, ws, _ = connected_game(seed=4, ai_count=5)
+        play_hand(manager, game, timeline=True)
+
+        types = [m["type"] for m in ws.messages()]
+        assert "ai_action" not in types
+        for i, message_type in enumerate(types):
+            if message_type == "ai_timeline":
+                assert types[i + 1] == "state_update"
+
+    def test_offsets_match_server_pacing(self, connected_game):
+        manager, game, ws, _ = connected_game(seed=5, ai_count=5)
+        play_hand(manager, game, timeline=True)
+
+        for message in ws.messages("ai_timeline"):
+            timeline = message["data"]
+            actions = 0
+            for entry in timeline["entries"]:
+                assert entry["offset_ms"] == actions * AI_ACTION_DELAY_MS
+                if entry["type"] == "ai_action":
+                    actions += 1
+                    assert {"player_id", "action", "stack_after", "pot_after"} <= set(entry["data"])
+                else:
+                    assert entry["data"]["state"] in {s.value for s in GameState}
+            assert timeline["duration_ms"] == actions * AI_ACTION_DELAY_MS
+
+    def test_no_ai_to_act_sends_state_only(self, connected_game):
+        manager, game, ws, _ = connected_game(seed=6, ai_count=5)
+        game.start_new_hand(process_ai=False)
+        game.current_player_index = next(i for i, p in enumerate(game.players) if p.is_human)
+        asyncio.run(process_ai_turns_with_events(game, "g", timeline=True))
+        asyncio.run(manager.flush())
+        assert [m["type"] for m in ws.messages()] == ["state_update"]
+
+    def test_step_mode_takes_precedence(self, connected_game):
+        manager, game, ws, sleeps = connected_game(seed=7, ai_count=5)
+        game.start_new_hand(process_ai=False)
+        if game.get_current_player().is_human:
+            game.submit_human_action("call", process_ai=False)
+
+        async def run():
+            task = asyncio.create_task(process_ai_turns_with_events(game, "g", step_mode=True, timeline=True))
+            for _ in range(20):
+                await asyncio.sleep(0)
+                if manager.step_mode_events.get("g"):
+                    break
+            task.cancel()
+            await manager.flush()
+        asyncio.run(run())
+        types = [m["type"] for m in ws.messages()]
+        assert "ai_timeline" not in types and "awaiting_continue" in types
+
+
+@pytest.mark.slow
+class TestTimelineBenchmark:
+    """Benchmark: time the server spends per human action on AI turns, paced vs timeline."""
+
+    def test_benchmark_server_time_per_action(self, connected_game):
+        print("\n" + "="*60)
+        print("BENCHMARK: AI turns per human action, 6-handed")
+        print("="*60)
+
+        hands = 20
+
+        def run(timeline: bool):
+            manager, game, ws, sleeps = connected_game(seed=11, ai_count=5)
+            start = time.perf_counter()
+            for _ in range(hands):
+                play_hand(manager, game, timeline)
+            busy = time.perf_counter() - start
+            calls = max(1, len(ws.messages("ai_timeline")) if timeline else hands)
+            return busy, sum(sleeps), calls
+
+        paced_busy, paced_sleep, _ = run(timeline=False)
+        timeline_busy, timeline_sleep, batches = run(timeline=True)
+        paced_held = (paced_busy + paced_sleep) / hands
+        timeline_held = timeline_busy / hands
+
+        print(f"\n📊 Results ({hands} hands, {batches} AI batches):")
+        print(f"  Paced (server sleeps): {paced_held * 1000:8.1f} ms/hand holding the game "
+              f"({paced_sleep / hands:.1f} s asleep)")
+        print(f"  Timeline:              {timeline_held * 1000:8.1f} ms/hand, "
+              f"{timeline_busy / batches * 1000:.2f} ms per AI batch")
+        print(f"  Game held per hand:    ~{paced_held / timeline_held:.0f}x shorter")
+
+        assert timeline_sleep == 0
+        assert timeline_held * 50 < paced_held, "Timeline mode still holds the game for long"
+
+        print("\n✅ PASS: AI turns resolve in milliseconds; the client paces the playback")
@@ -0,0 +1,84 @@
+"""
+Integer card representation tests.
+
+- Card int <-> string conversion (including the "10" alias)
+- DeckManager deals ints without copying the deck per deal
+- Engine state holds ints; API/serialization edges produce strings
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from game.cards import (
+    CARD_STRINGS, FULL_DECK, card_index, card_str, cards_to_str, to_cards
+)
+from game.deck_manager import DeckManager
+from game.poker_engine import PokerGame, HandEvaluator
+from websocket_manager import serialize_game_state
+
+
+class TestCardConversion:
+    """Card ints and strings."""
+
+    def test_round_trip(self):
+        assert [card_index(card) for card in CARD_STRINGS] == FULL_DECK
+        assert cards_to_str(FULL_DECK) == CARD_STRINGS
+
+    def test_known_cards(self):
+        assert card_index("2s") == 0
+        assert card_index("Ac") == 51
+        assert card_str(card_index("Kh")) == "Kh"
+
+    def test_ten_alias_and_ints_accepted(self):
+        assert to_cards(["10h", "Th", 35]) == [card_index("Th")] * 2 + [35]
+        assert card_str("10d") == "Td"
+
+
+class TestDeckManagerInts:
+    """DeckManager holds and deals card ints."""
+
+    def test_deck_is_ints(self):
+        dm = DeckManager()
+        assert all(type(card) is int for card in dm.deck)
+        assert sorted(dm.deck) == FULL_DECK
+
+    def test_deal_advances_position_without_rebuilding_deck(self):
+        dm = DeckManager()
+        cards_before = dm._cards
+        first = dm.deal_cards(2)
+        second = dm.deal_cards(3)
+        assert dm._cards is cards_before
+        assert dm._position == 5
+        assert first + second == cards_before[:5]
+
+    def test_reset_restores_position(self):
+        dm = DeckManager()
+        dm.deal_cards(7)
+        dm.reset()
+        assert len(dm.deck) == 52
+
+
+class TestEngineEdges:
+    """Ints inside the engine, strings at the edges."""
+
+    def test_game_state_holds_ints(self):
+        game = PokerGame("Human", ai_count=3)
+        game.start_new_hand(process_ai=False)
+        for player in game.players:
+            assert all(type(card) is int for card in player.hole_cards)
+
+    def test_serialized_state_has_strings(self):
+        game = PokerGame("Human", ai_count=3)
+        game.start_new_hand(process_ai=False)
+        game.community_cards = game.deck_manager.deal_cards(3)
+        state = serialize_game_state(game)
+        human = next(p for p in game.players if p.is_human)
+        assert state["human_player"]["hole_cards"] == cards_to_str(human.hole_cards)
+        assert state["community_cards"] == cards_to_str(game.community_cards)
+        assert all(isinstance(card, str) for card in state["community_cards"])
+
+    def test_evaluator_accepts_ints_and_strings(self):
+        ev = HandEvaluator()
+        hole, board = ["Ah", "Kh"], ["Qh", "Jh", "Th", "2c"]
+        assert ev.evaluate_hand(to_cards(hole), to_cards(board)) == ev.evaluate_hand(hole, board)
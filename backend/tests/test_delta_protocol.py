@@ -0,0 +1,228 @@
+"""
+Delta state protocol tests (ConnectionManager with delta clients).
+
+- diff_state() patches hold only changed fields and apply_state_patch() rebuilds
+  every state the full protocol would have sent
+- A delta client gets one snapshot, then patches numbered seq + 1, ...
+- New or resyncing clients get a snapshot; full-protocol clients on the same game
+  still get state_update
+- A resync without show_ai_thinking keeps the connection's last choice
+- Re-broadcasts with nothing new send delta clients nothing
+
+The bytes/CPU per hand benchmark is marked slow.
+"""
+import asyncio
+import pytest
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from conftest import FakeWebSocket, deliver
+from game.poker_engine import PokerGame, GameState
+from websocket_manager import (ConnectionManager, apply_state_patch, diff_state,
+                               process_ai_turns_with_events, serialize_game_state)
+
+
+class DeltaClient:
+    """Applies snapshots and patches the way the frontend does."""
+
+    def __init__(self, ws: FakeWebSocket):
+        self.ws = ws
+        self.read = 0
+        self.seq = 0
+        self.state = None
+        self.states = []
+
+    def receive(self):
+        for message in self.ws.messages()[self.read:]:
+            if message["type"] == "state_snapshot":
+                self.state, self.seq = message["data"], message["seq"]
+            elif message["type"] == "state_patch":
+                assert message["seq"] == self.seq + 1, "Gap in patch sequence"
+                self.state, self.seq = apply_state_patch(self.state, message["data"]), message["seq"]
+            else:
+                continue
+            self.states.append(self.state)
+        self.read = len(self.ws.sent)
+
+
+class Play:
+    """Drives hands through the same broadcasts as the WebSocket endpoint (human always calls)."""
+
+    def __init__(self, manager: ConnectionManager, game: PokerGame, show_ai_thinking: bool = False):
+        self.manager, self.game, self.show_ai_thinking = manager, game, show_ai_thinking
+
+    async def broadcast(self):
+        await self.manager.broadcast_state("g", self.game, self.show_ai_thinking)
+
+    async def hand(self):
+        game = self.game
+        game.start_new_hand(process_ai=False)
+        await self.broadcast()
+        for _ in range(20):
+            await process_ai_turns_with_events(game, "g", self.show_ai_thinking)
+            current = game.get_current_player()
+            if game.current_state == GameState.SHOWDOWN or current is None or not current.is_human:
+                break
+            game.submit_human_action("call", process_ai=False)
+            await self.broadcast()
+
+    def hands(self, count: int):
+        async def run():
+            for _ in range(count):
+                if sum(1 for p in self.game.players if p.stack > 0) < 2:
+                    break
+                await self.hand()
+            await self.manager.flush()
+        asyncio.run(run())
+
+
+class TestDiff:
+
+    def test_patch_round_trip(self, connected_game):
+        manager, game, delta, _ = connected_game(seed=3, delta=True)
+        full = FakeWebSocket()
+        asyncio.run(manager.connect("g", full))
+        Play(manager, game).hands(3)
+
+        client = DeltaClient(delta)
+        client.receive()
+        updates = [m["data"] for m in full.messages("state_update")]
+        assert len(updates) > 10
+        assert client.states == updates
+
+    def test_ai_action_patch_is_small(self):
+        game = PokerGame("Human", ai_count=3, seed=5)
+        game.start_new_hand()
+        before = serialize_game_state(game)
+        game.submit_human_action("call", process_ai=False)
+        after = serialize_game_state(game)
+
+        patch = diff_state(before, after)
+        seat = next(i for i, p in enumerate(game.players) if p.is_human)
+        assert set(patch["players"]) == {str(seat)}
+        assert "community_cards" not in patch and "small_blind" not in patch
+        assert {"pot", "current_player_index", "state_version"} <= set(patch)
+        assert apply_state_patch(before, patch) == after
+
+    def test_seat_count_change_replaces_list(self):
+        game = PokerGame("Human", ai_count=3, seed=5)
+        game.start_new_hand()
+        before = serialize_game_state(game)
+        after = dict(before, players=before["players"][:3])
+        patch = diff_state(before, after)
+        assert patch == {"players": after["players"]}
+        assert apply_state_patch(before, patch) == after
+
+
+class TestDeltaClients:
+
+    def test_snapshot_then_consecutive_patches(self, connected_game):
+        manager, game, ws, _ = connected_game(seed=1, delta=True)
+        Play(manager, game).hands(2)
+
+        messages = ws.messages("state_snapshot", "state_patch", "state_update")
+        assert messages[0]["type"] == "state_snapshot" and messages[0]["seq"] == 1
+        assert all(m["type"] == "state_patch" for m in messages[1:])
+        assert [m["seq"] for m in messages] == list(range(1, len(messages) + 1))
+
+    def test_joining_and_resyncing_clients_get_snapshot(self, connected_game):
+        manager, game, first, _ = connected_game(seed=2, delta=True)
+        play = Play(manager, game)
+        play.hands(1)
+
+        second = FakeWebSocket()
+        asyncio.run(manager.connect("g", second, delta=True))
+        game.start_new_hand(process_ai=False)
+        deliver(manager, play.broadcast())
+        assert first.messages()[-1]["type"] == "state_patch"
+        assert second.messages()[-1]["type"] == "state_snapshot"
+        assert first.messages()[-1]["seq"] == second.messages()[-1]["seq"]
+
+        manager.resync(first)
+        deliver(manager, manager.broadcast_state("g", game, force=True))
+        snapshot = first.messages()[-1]
+        assert snapshot["type"] == "state_snapshot"
+        assert snapshot["data"] == serialize_game_state(game)
+        assert len(second.sent) == 1  # Already current
+
+    def test_resync_keeps_ai_thinking(self, connected_game):
+        manager, game, ws, _ = connected_game(seed=2, delta=True)
+        assert manager.ai_thinking(ws, {"type": "action", "show_ai_thinking": True})
+        Play(manager, game, show_ai_thinking=True).hands(1)
+
+        manager.resync(ws)
+        deliver(manager, manager.broadcast_state("g", game, manager.ai_thinking(ws, {"type": "resync"}), force=True))
+        snapshot = ws.messages()[-1]
+        assert snapshot["type"] == "state_snapshot"
+        assert snapshot["data"] == serialize_game_state(game, show_ai_thinking=True) != serialize_game_state(game)
+
+        manager.disconnect("g", ws)
+        assert not manager.ai_thinking(ws, {"type": "resync"})
+
+    def test_unchanged_state_sends_nothing(self, connected_game):
+        manager, game, delta, _ = connected_game(seed=4, delta=True)
+        full = FakeWebSocket()
+        asyncio.run(manager.connect("g", full))
+        game.start_new_hand(process_ai=False)
+        game.last_ai_decisions.clear()
+        deliver(manager, Play(manager, game).broadcast())
+
+        deliver(manager, manager.broadcast_state("g", game, force=True))
+        deliver(manager, manager.broadcast_state("g", game, show_ai_thinking=True))  # Nothing to show
+        assert len(full.sent) == 3
+        assert len(delta.sent) == 1
+
+    def test_mixed_protocols_serialize_once(self, connected_game):
+        manager, game, delta, _ = connected_game(seed=1, delta=True)
+        full = FakeWebSocket()
+        asyncio.run(manager.connect("g", full))
+        game.start_new_hand(process_ai=False)
+        deliver(manager, Play(manager, game).broadcast())
+        assert full.messages()[-1]["type"] == "state_update"
+        assert delta.messages()[-1]["type"] == "state_snapshot"
+        assert manager.stats.serialized == 1 and manager.stats.cache_hits == 0
+        assert manager.broadcast_metrics()["delta_clients"] == 1
+
+        manager.disconnect("g", delta)
+        assert manager.broadcast_metrics()["delta_clients"] == 0
+
+
+@pytest.mark.slow
+class TestDeltaProtocolBenchmark:
+    """Benchmark: state bytes and broadcast CPU per hand, full vs delta protocol."""
+
+    def test_benchmark_delta_protocol(self, connected_game):
+        print("\n" + "="*60)
+        print("BENCHMARK: state messages per hand, full vs delta")
+        print("="*60)
+
+        hands = 30
+
+        def run(delta: bool):
+            manager, game, ws, _ = connected_game(seed=7, delta=delta)
+            play = Play(manager, game, show_ai_thinking=True)
+            start = time.perf_counter()
+            play.hands(hands)
+            elapsed = time.perf_counter() - start
+            state_chars = sum(len(text) for text in ws.sent if not text.startswith('{"type":"ai_action"'))
+            return elapsed, state_chars, manager.stats
+
+        full_time, full_chars, full_stats = run(delta=False)
+        delta_time, delta_chars, delta_stats = run(delta=True)
+        per_hand = lambda value: value / hands
+
+        print(f"\n📊 Results ({hands} hands, AI reasoning shown):")
+        print(f"  Full protocol:  {per_hand(full_chars):8,.0f} chars/hand in state messages")
+        print(f"  Delta protocol: {per_hand(delta_chars):8,.0f} chars/hand "
+              f"({delta_stats.snapshots_sent} snapshot, {delta_stats.patches_sent} patches)")
+        print(f"  Reduction:      {full_chars / delta_chars:.1f}x fewer chars")
+        print(f"  Hand time incl. engine: full {per_hand(full_time) * 1000:.1f} ms, "
+              f"delta {per_hand(delta_time) * 1000:.1f} ms")
+
+        assert delta_stats.snapshots_sent == 1
+        assert delta_chars < full_chars / 2, "Patches are not much smaller than full states"
+
+        print("\n✅ PASS: Delta clients get one snapshot and compact patches")
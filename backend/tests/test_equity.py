@@ -0,0 +1,267 @@
+"""
+Vectorized Monte Carlo equity engine tests.
+
+- Batched score7() matches the rank table / treys
+- Sampled runouts are distinct and never reuse known cards
+- Equity estimates land on known values with shrinking standard error
+- Exact enumeration below the threshold is deterministic and matches brute force
+- HandEvaluator's incomplete-board path uses the engine and stays reproducible
+
+The legacy-loop vs engine and exact vs sampling benchmarks are marked slow (nightly).
+"""
+import pytest
+import itertools
+import random
+import sys
+import os
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from treys import Evaluator, Card
+
+from game.equity import EquityEngine, get_equity_engine
+from game.rank_table import CARD_INDEX, RANKS, SUITS, get_rank_table
+from game.poker_engine import HandEvaluator
+
+ALL_CARDS = [rank + suit for rank in RANKS for suit in SUITS]
+
+
+def idx(cards):
+    return [CARD_INDEX[c] for c in cards]
+
+
+class TestScore7:
+    """Batched scoring must agree with the scalar rank table."""
+
+    def test_matches_rank_table(self):
+        engine = get_equity_engine()
+        table = get_rank_table()
+        rng = np.random.default_rng(7)
+        hands = np.array([rng.choice(52, 7, replace=False) for _ in range(5000)], dtype=np.int32)
+        scores = engine.score7(hands)
+        assert [int(s) for s in scores] == [table.evaluate7(list(h)) for h in hands]
+
+    def test_flush_rows(self):
+        engine = get_equity_engine()
+        hands = np.array([idx(["As", "Ks", "Qs", "Js", "Ts", "2h", "3d"]),
+                          idx(["2h", "4h", "6h", "8h", "Th", "Kc", "Kd"])], dtype=np.int32)
+        evaluator = Evaluator()
+        expected = evaluator.evaluate([Card.new("2h"), Card.new("4h")],
+                                      [Card.new(c) for c in ["6h", "8h", "Th", "Kc", "Kd"]])
+        assert list(engine.score7(hands)) == [1, expected]
+
+
+class TestSampling:
+    """Partial Fisher-Yates sampling."""
+
+    def test_rows_are_distinct_and_exclude_known(self):
+        known = idx(["Ah", "Ad", "Kc"])
+        deck = np.array([c for c in range(52) if c not in known], dtype=np.int32)
+        drawn = EquityEngine.sample_cards(np.random.default_rng(1), deck, 1000, 8)
+        assert drawn.shape == (1000, 8)
+        for row in drawn:
+            assert len(set(row)) == 8
+            assert not set(row) & set(known)
+
+    def test_every_card_gets_drawn(self):
+        deck = np.arange(52, dtype=np.int32)
+        drawn = EquityEngine.sample_cards(np.random.default_rng(2), deck, 2000, 5)
+        assert set(drawn.ravel()) == set(range(52))
+
+
+class TestEquityEstimates:
+    """Equity estimates against known values."""
+
+    def test_aces_vs_one_random_hand(self):
+        result = get_equity_engine().estimate(idx(["Ah", "As"]), [], samples=20000,
+                                              rng=np.random.default_rng(3))
+        # AA vs a random hand is ~85.2%
+        assert abs(result.equity - 0.852) < 4 * result.std_error + 0.005
+        assert result.samples == 20000
+
+    def test_more_opponents_lower_equity(self):
+        engine = get_equity_engine()
+        heads_up = engine.estimate(idx(["Ah", "As"]), [], num_opponents=1, rng=np.random.default_rng(4))
+        five_way = engine.estimate(idx(["Ah", "As"]), [], num_opponents=4, rng=np.random.default_rng(4))
+        assert five_way.equity < heads_up.equity
+
+    def test_std_error_shrinks_with_samples(self):
+        engine = get_equity_engine()
+        small = engine.estimate(idx(["7h", "8h"]), idx(["9h", "Tc", "2d"]), samples=500,
+                                rng=np.random.default_rng(5))
+        large = engine.estimate(idx(["7h", "8h"]), idx(["9h", "Tc", "2d"]), samples=8000,
+                                rng=np.random.default_rng(5))
+        assert large.std_error < small.std_error
+        assert large.score_std_error < small.score_std_error
+
+    def test_complete_board_is_exact_score(self):
+        hole, board = idx(["Ah", "Kh"]), idx(["Qh", "Jh", "Th", "2c", "3d"])
+        result = get_equity_engine().estimate(hole, board, samples=200, rng=np.random.default_rng(6))
+        assert result.mean_score == 1
+        assert result.score_std_error == 0
+        assert result.equity == 1.0
+
+
+class TestExactEnumeration:
+    """Exhaustive runouts when their count is under the threshold."""
+
+    def test_count_runouts(self):
+        assert EquityEngine.count_runouts(46, 1, 1) == 46 * 990
+        assert EquityEngine.count_runouts(47, 2, 1) == 1081 * 990
+        assert EquityEngine.count_runouts(45, 0, 2) == 990 * 903
+
+    def test_enumerated_rows_are_distinct_runouts(self):
+        deck = np.arange(10, dtype=np.int32)
+        rows = EquityEngine.enumerate_cards(deck, 1, 1)
+        assert len(rows) == EquityEngine.count_runouts(10, 1, 1)
+        assert all(len(set(row)) == 3 for row in rows)
+        assert len(set(map(tuple, rows))) == len(rows)
+
+    def test_river_matches_brute_force(self):
+        table = get_rank_table()
+        hole, board = idx(["Ah", "Kh"]), idx(["Qh", "7c", "2d", "5s", "9h"])
+        unseen = [c for c in range(52) if c not in hole + board]
+        hero = table.evaluate7(hole + board)
+        shares = []
+        for opponent in itertools.combinations(unseen, 2):
+            villain = table.evaluate7(list(opponent) + board)
+            shares.append(1.0 if hero < villain else 0.5 if hero == villain else 0.0)
+
+        result = get_equity_engine().estimate(hole, board)
+        assert result.exact
+        assert result.samples == 990
+        assert result.equity == pytest.approx(sum(shares) / len(shares))
+
+    def test_turn_is_deterministic_and_zero_variance(self):
+        engine = get_equity_engine()
+        hole, board = idx(["Jc", "Td"]), idx(["9s", "8h", "2c", "Ad"])
+        first = engine.estimate(hole, board, rng=np.random.default_rng(1))
+        second = engine.estimate(hole, board, rng=np.random.default_rng(2))
+        assert first.exact and first == second
+        assert first.std_error == 0 and first.score_std_error == 0
+        assert first.samples == 46 * 990
+
+    def test_above_threshold_falls_back_to_sampling(self):
+        engine = get_equity_engine()
+        hole, board = idx(["Jc", "Td"]), idx(["9s", "8h", "2c", "Ad"])
+        exact = engine.estimate(hole, board)
+        sampled = engine.estimate(hole, board, samples=8000, rng=np.random.default_rng(3), exact_threshold=0)
+        assert not sampled.exact
+        assert sampled.samples == 8000
+        assert abs(sampled.equity - exact.equity) < 4 * sampled.std_error
+
+    def test_threshold_is_configurable_per_engine(self):
+        engine = EquityEngine(exact_threshold=2_000_000)
+        result = engine.estimate(idx(["Ah", "As"]), idx(["Kd", "7c", "2s"]))
+        assert result.exact
+        assert result.samples == 1081 * 990
+
+
+class TestHandEvaluatorIntegration:
+    """evaluate_hand() incomplete-board path."""
+
+    def test_preflop_returns_average_score(self):
+        ev = HandEvaluator()
+        score, rank = ev.evaluate_hand(["Ah", "As"], [])
+        assert 1 <= score <= 7462
+        assert rank in ("Pair", "Two Pair", "Three of a Kind")
+
+    def test_reproducible_under_random_seed(self):
+        ev = HandEvaluator()
+        random.seed(42)
+        first = ev.estimate_equity(["9c", "10d"], ["2h", "5s", "Kd"], num_opponents=2)
+        random.seed(42)
+        second = ev.estimate_equity(["9c", "10d"], ["2h", "5s", "Kd"], num_opponents=2)
+        assert not first.exact
+        assert first == second
+
+    def test_estimate_equity(self):
+        result = HandEvaluator().estimate_equity(["Ah", "As"], ["Kd", "7c", "2s"], num_opponents=2)
+        assert 0.6 < result.equity < 1.0
+        assert result.num_opponents == 2
+
+
+@pytest.mark.slow
+class TestEquityBenchmark:
+    """Benchmark: legacy 100-sample treys loop vs vectorized engine."""
+
+    def test_benchmark_vs_legacy_loop(self):
+        print("\n" + "="*60)
+        print("BENCHMARK: Preflop Monte Carlo (legacy loop vs NumPy engine)")
+        print("="*60)
+
+        evaluator = Evaluator()
+        hole = ["Ah", "Kd"]
+        iterations = 200
+
+        def legacy(rng):
+            deck = [c for c in ALL_CARDS if c not in hole]
+            scores = []
+            for _ in range(100):
+                rng.shuffle(deck)
+                scores.append(evaluator.evaluate([Card.new(c) for c in hole], [Card.new(c) for c in deck[:5]]))
+            return sum(scores) / len(scores), float(np.std(scores) / np.sqrt(len(scores)))
+
+        rng = random.Random(1)
+        start = time.time()
+        legacy_results = [legacy(rng) for _ in range(iterations)]
+        legacy_time = (time.time() - start) / iterations
+
+        engine = get_equity_engine()
+        np_rng = np.random.default_rng(1)
+        start = time.time()
+        engine_results = [engine.estimate(idx(hole), [], rng=np_rng) for _ in range(iterations)]
+        engine_time = (time.time() - start) / iterations
+
+        legacy_se = np.mean([se for _, se in legacy_results])
+        engine_se = np.mean([r.score_std_error for r in engine_results])
+
+        print(f"\n📊 Results (per estimate):")
+        print(f"  Legacy (100 samples):   {legacy_time*1000:.2f}ms, score std error {legacy_se:.1f}")
+        print(f"  Engine ({engine_results[0].samples} samples): {engine_time*1000:.2f}ms, score std error {engine_se:.1f}")
+
+        assert engine_time < legacy_time, "Engine slower than the legacy loop"
+        assert engine_se < legacy_se / 3, "Engine standard error not meaningfully lower"
+
+        print("\n✅ PASS: More samples, lower error, less time")
+
+    def test_benchmark_exact_vs_sampling(self):
+        print("\n" + "="*60)
+        print("BENCHMARK: Exact enumeration vs Monte Carlo (heads-up)")
+        print("="*60)
+
+        engine = get_equity_engine()
+        hole = idx(["Ah", "Kh"])
+        streets = {
+            "Flop": idx(["Qh", "7c", "2d"]),
+            "Turn": idx(["Qh", "7c", "2d", "5s"]),
+            "River": idx(["Qh", "7c", "2d", "5s", "9h"]),
+        }
+
+        print(f"\n📊 Results (exact threshold {engine.exact_threshold:,} runouts):")
+        for street, board in streets.items():
+            start = time.time()
+            exact = engine.estimate(hole, board, exact_threshold=2_000_000)
+            exact_time = time.time() - start
+
+            np_rng = np.random.default_rng(1)
+            start = time.time()
+            sampled = [engine.estimate(hole, board, rng=np_rng, exact_threshold=0) for _ in range(20)]
+            sample_time = (time.time() - start) / len(sampled)
+            observed_error = max(abs(r.equity - exact.equity) for r in sampled)
+
+            default = engine.estimate(hole, board)
+            mode = "exact" if default.exact else "sampled"
+            print(f"  {street:5s}: exact {exact.samples:>9,} runouts {exact_time*1000:7.1f}ms "
+                  f"equity {exact.equity:.4f} | sampled {sample_time*1000:.2f}ms "
+                  f"max error {observed_error:.4f} | default: {mode}")
+
+            assert exact.std_error == 0
+            assert observed_error < 5 * sampled[0].std_error
+            if street != "Flop":
+                assert default.exact, f"{street} should be enumerated by default"
+
+        print("\n✅ PASS: Turn and river equities are exact by default")
@@ -0,0 +1,128 @@
+"""
+Hand evaluation cache tests.
+
+- Suit-isomorphic spots share one cache entry
+- Cached results are identical to uncached evaluation
+- LRU bound, eviction order and hit/miss/eviction counters
+- Counters are readable through /admin/evaluator-metrics
+"""
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from game.hand_evaluator import HandEvaluator, EvaluationCache, evaluation_cache
+from game.rank_table import CARD_INDEX, RANKS, SUITS
+from main import app
+from routes.game import get_evaluator_metrics
+
+ALL_CARDS = [rank + suit for rank in RANKS for suit in SUITS]
+
+
+def idx(cards):
+    return [CARD_INDEX[c] for c in cards]
+
+
+def evaluator_with_cache(max_size=1000):
+    ev = HandEvaluator()
+    ev.cache = EvaluationCache(max_size)
+    return ev
+
+
+class TestCanonicalKey:
+    """Suit isomorphism."""
+
+    def test_suit_relabelling_shares_key(self):
+        a = EvaluationCache.canonical_key(idx(["Ah", "Kh", "Qh", "Jh", "Th", "2c", "3d"]))
+        b = EvaluationCache.canonical_key(idx(["As", "Ks", "Qs", "Js", "Ts", "2d", "3c"]))
+        assert a == b
+
+    def test_order_does_not_matter(self):
+        a = EvaluationCache.canonical_key(idx(["9c", "9d", "2h", "7s", "Kd"]))
+        b = EvaluationCache.canonical_key(idx(["Kd", "7s", "2h", "9d", "9c"]))
+        assert a == b
+
+    def test_different_suit_structure_differs(self):
+        flush = EvaluationCache.canonical_key(idx(["Ah", "Kh", "Qh", "Jh", "9h"]))
+        offsuit = EvaluationCache.canonical_key(idx(["Ah", "Kh", "Qh", "Jh", "9c"]))
+        assert flush != offsuit
+
+
+class TestCachedEvaluation:
+    """Cache hits return the same (score, rank) as a fresh evaluation."""
+
+    def test_matches_uncached_results(self):
+        cached = evaluator_with_cache(max_size=500)
+        rng = random.Random(5)
+        for _ in range(3000):
+            n = rng.choice([5, 6, 7])
+            cards = [ALL_CARDS[c] for c in rng.sample(range(52), n)]
+            hole, board = cards[:2], cards[2:]
+            expected = cached._evaluate_exact(idx(cards))
+            assert cached.evaluate_hand(hole, board) == expected
+            assert cached.evaluate_hand(hole, board) == expected
+
+    def test_isomorphic_spot_is_a_hit(self):
+        ev = evaluator_with_cache()
+        ev.evaluate_hand(["Ah", "Kd"], ["Qh", "7c", "2s", "9d", "Jc"])
+        ev.evaluate_hand(["As", "Kc"], ["Qs", "7h", "2d", "9c", "Jh"])
+        stats = ev.cache.stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+        assert stats["size"] == 1
+
+    def test_preflop_is_not_cached(self):
+        ev = evaluator_with_cache()
+        ev.evaluate_hand(["Ah", "As"], [])
+        assert ev.cache.stats()["size"] == 0
+
+
+class TestLRUBound:
+    """Capacity and eviction."""
+
+    def test_evicts_least_recently_used(self):
+        cache = EvaluationCache(max_size=2)
+        cache.put((1,), (1, "a"))
+        cache.put((2,), (2, "b"))
+        assert cache.get((1,)) == (1, "a")  # (2,) is now least recently used
+        cache.put((3,), (3, "c"))
+        assert cache.get((2,)) is None
+        assert cache.get((1,)) == (1, "a")
+        stats = cache.stats()
+        assert stats["size"] == 2
+        assert stats["evictions"] == 1
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+
+    def test_size_stays_bounded(self):
+        ev = evaluator_with_cache(max_size=50)
+        rng = random.Random(9)
+        for _ in range(500):
+            cards = [ALL_CARDS[c] for c in rng.sample(range(52), 7)]
+            ev.evaluate_hand(cards[:2], cards[2:])
+        stats = ev.cache.stats()
+        assert stats["size"] == 50
+        assert stats["evictions"] == stats["misses"] - 50
+
+    def test_clear_resets(self):
+        cache = EvaluationCache(max_size=4)
+        cache.put((1,), (1, "a"))
+        cache.get((1,))
+        cache.clear()
+        assert cache.stats() == {"size": 0, "max_size": 4, "hits": 0, "misses": 0,
+                                 "evictions": 0, "hit_rate": 0.0}
+
+
+class TestEvaluatorMetricsEndpoint:
+    """Counters exposed through the API."""
+
+    def test_route_registered(self):
+        assert "/admin/evaluator-metrics" in {route.path for route in app.routes}
+
+    def test_endpoint_reports_shared_cache(self):
+        HandEvaluator().evaluate_hand(["2h", "7d"], ["9c", "Jd", "Ks", "4h", "5c"])
+        data = get_evaluator_metrics()
+        assert data == evaluation_cache.stats()
+        assert data["misses"] + data["hits"] >= 1
+        assert set(data) == {"size", "max_size", "hits", "misses", "evictions", "hit_rate"}
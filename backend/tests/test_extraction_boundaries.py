@@ -12,6 +12,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from game.poker_engine import DeckManager, HandEvaluator, AIStrategy, Player
+from game.cards import card_str
 
 
 # ============================================================
@@ -34,8 +35,8 @@ class TestDeckManagerReset:
         ranks = set()
         suits = set()
         for card in dm.deck:
-            ranks.add(card[0])
-            suits.add(card[1])
+            ranks.add(card_str(card)[0])
+            suits.add(card_str(card)[1])
         assert ranks == set("23456789TJQKA")
         assert suits == set("shdc")
 
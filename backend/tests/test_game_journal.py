@@ -0,0 +1,391 @@
+"""
+Per-game action journal tests (game.journal).
+
+- Replaying a journal rebuilds the game exactly: stacks, cards, deck, RNG, history
+  (REST path with AI processed inline, and the WebSocket path driving AI turns)
+- Only outermost calls are journaled; a resumed game keeps appending
+- A call that raised replays to the same state and must fail again
+- A torn last line is dropped, corruption mid-file is an error
+- A journal another process appends to can't be resumed
+- Clones never write to the original's journal; journaled games can't be restored
+- app_state.get_game() recovers a game this process doesn't hold, and refuses
+  one another worker holds; abandoned journals are swept
+
+The append-overhead benchmark is marked slow.
+"""
+import asyncio
+import json
+import pytest
+import subprocess
+import sys
+import os
+import time
+from dataclasses import asdict
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from game.journal import GameJournal, JournalLockedError, replay_journal, resume_journal, start_journal
+from game.poker_engine import PokerGame, GameState
+
+
+def alive(game: PokerGame) -> int:
+    return sum(1 for p in game.players if p.stack > 0)
+
+
+def play_rest(game: PokerGame, num_hands: int, action: str = "call"):
+    """REST path: AI turns run inside start_new_hand/submit_human_action."""
+    for _ in range(num_hands):
+        if alive(game) < 2:
+            break
+        game.start_new_hand()
+        for _ in range(20):
+            index = game.current_player_index
+            if index is None or not game.players[index].is_human:
+                break
+            game.submit_human_action(action)
+
+
+def play_websocket(game: PokerGame, num_hands: int):
+    """WebSocket path: the caller drives AI turns one at a time, as process_ai_turns_with_events does."""
+    for _ in range(num_hands):
+        if alive(game) < 2:
+            break
+        game.start_new_hand(process_ai=False)
+        for _ in range(200):
+            if game.current_state == GameState.SHOWDOWN or game.current_player_index is None:
+                break
+            if game._betting_round_complete():
+                game._advance_state_for_websocket()
+                continue
+            player = game.players[game.current_player_index]
+            if player.is_human:
+                game.submit_human_action("call", process_ai=False)
+                continue
+            decision = game.decide_ai_action(game.current_player_index)
+            result = game.apply_action(game.current_player_index, decision.action, decision.amount,
+                                       hand_strength=decision.hand_strength, reasoning=decision.reasoning)
+            if not result["success"]:
+                game.apply_action(game.current_player_index, "fold")
+            if game.current_player_index is not None:
+                game.advance_turn()
+
+
+def outcome(game: PokerGame):
+    """Everything replay must reproduce (wall-clock timestamps and decision IDs excluded)."""
+    def history(hand):
+        data = asdict(hand)
+        data.pop("timestamp")
+        for event in data["events"]:
+            event.pop("timestamp")
+        for decision in data["ai_decisions"].values():
+            decision.pop("decision_id")
+        return data
+
+    return ([asdict(p) for p in game.players], game.pot, game.current_state, game.current_player_index,
+            game.community_cards, game.deck_manager.deck, game.rng.getstate(), game.session_id,
+            [history(hand) for hand in game.hand_history])
+
+
+class TestReplay:
+
+    @pytest.mark.parametrize("seed", [1, 5, 11])
+    def test_rest_game_replays_exactly(self, tmp_path, seed):
+        path = str(tmp_path / "game.jsonl")
+        game = PokerGame("Human", ai_count=5, seed=seed)
+        start_journal(game, path, meta={"user_id": "u1"})
+        play_rest(game, 25)
+
+        replayed, meta = replay_journal(path)
+        assert meta == {"user_id": "u1"}
+        assert replayed.journal is None
+        assert outcome(replayed) == outcome(game)
+
+    @pytest.mark.parametrize("seed", [2, 8])
+    def test_websocket_game_replays_exactly(self, tmp_path, seed):
+        path = str(tmp_path / "game.jsonl")
+        game = PokerGame("Human", ai_count=3, seed=seed)
+        start_journal(game, path)
+        play_websocket(game, 15)
+
+        codes = {entry[0] for entry in GameJournal.read(path)[1:]}
+        assert {"d", "a", "t", "s"} <= codes
+        assert outcome(replay_journal(path)[0]) == outcome(game)
+
+    def test_mid_hand_replay(self, tmp_path):
+        path = str(tmp_path / "game.jsonl")
+        game = PokerGame("Human", ai_count=3, seed=4)
+        start_journal(game, path)
+        play_rest(game, 3)
+        game.start_new_hand()  # Stops at the human's turn (or showdown)
+
+        assert outcome(replay_journal(path)[0]) == outcome(game)
+
+    def test_only_outermost_calls_journaled(self, tmp_path):
+        path = str(tmp_path / "game.jsonl")
+        game = PokerGame("Human", ai_count=5, seed=3)
+        start_journal(game, path)
+        play_rest(game, 5)
+
+        entries = GameJournal.read(path)
+        assert entries[0][0] == "game"
+        assert {entry[0] for entry in entries[1:]} <= {"n", "h"}
+
+    def test_resume_keeps_appending(self, tmp_path):
+        path = str(tmp_path / "game.jsonl")
+        game = PokerGame("Human", ai_count=3, seed=6)
+        start_journal(game, path)
+        play_rest(game, 4)
+        game.journal.close()  # "Crash": the original stops writing
+        game.journal = None
+
+        resumed, _ = resume_journal(path)
+        play_rest(game, 4)
+        play_rest(resumed, 4)
+        resumed.journal.close()
+        assert outcome(resumed) == outcome(game)
+        assert outcome(replay_journal(path)[0]) == outcome(game)
+
+    def test_failed_call_replays(self, tmp_path, monkeypatch):
+        """A call that changed the game and then raised is replayed, failing the same way."""
+        path = str(tmp_path / "game.jsonl")
+        game = PokerGame("Human", ai_count=3, seed=5)
+        start_journal(game, path)
+        play_rest(game, 2)
+        while True:
+            game.start_new_hand()
+            if game.get_current_player() is not None and game.get_current_player().is_human:
+                break
+
+        log_event = PokerGame._log_hand_event
+        failing_hand = game.hand_count
+
+        def fail_on_human_call(self, event_type, player_id, action, *args, **kwargs):
+            if self.hand_count == failing_hand and player_id == "human" and action == "call":
+                raise RuntimeError("logging failed")  # After the call's chips moved
+            return log_event(self, event_type, player_id, action, *args, **kwargs)
+
+        monkeypatch.setattr(PokerGame, "_log_hand_event", fail_on_human_call)
+        with pytest.raises(RuntimeError):
+            game.submit_human_action("call")
+        assert GameJournal.read(path)[-1][0] == "h!"
+        assert outcome(replay_journal(path)[0]) == outcome(game)
+
+        monkeypatch.setattr(PokerGame, "_log_hand_event", log_event)
+        with pytest.raises(ValueError):
+            replay_journal(path)  # Succeeds now: the journal no longer matches
+
+    def test_must_start_before_first_hand(self, tmp_path):
+        game = PokerGame("Human", ai_count=3, seed=1)
+        game.start_new_hand()
+        with pytest.raises(ValueError):
+            start_journal(game, str(tmp_path / "game.jsonl"))
+
+
+class TestDurability:
+
+    def test_torn_last_line_dropped(self, tmp_path):
+        path = str(tmp_path / "game.jsonl")
+        game = PokerGame("Human", ai_count=3, seed=9)
+        start_journal(game, path)
+        play_rest(game, 3)
+        entries = GameJournal.read(path)
+        with open(path, "a") as f:
+            f.write('["h","ra')  # Crash mid-append
+
+        assert GameJournal.read(path) == entries
+        assert outcome(replay_journal(path)[0]) == outcome(game)
+
+    def test_corruption_mid_file_rejected(self, tmp_path):
+        path = str(tmp_path / "game.jsonl")
+        game = PokerGame("Human", ai_count=3, seed=9)
+        start_journal(game, path)
+        play_rest(game, 2)
+        with open(path) as f:
+            lines = f.read().split("\n")
+        lines[1] = lines[1][:-1]
+        with open(path, "w") as f:
+            f.write("\n".join(lines))
+
+        with pytest.raises(ValueError):
+            GameJournal.read(path)
+
+    def test_unknown_entry_rejected(self, tmp_path):
+        path = str(tmp_path / "game.jsonl")
+        start_journal(PokerGame("Human", ai_count=3, seed=1), path)
+        with open(path, "a") as f:
+            f.write(json.dumps(["reset_for_new_hand"]) + "\n")
+        with pytest.raises(ValueError):
+            replay_journal(path)
+
+
+class TestLocking:
+
+    def test_held_journal_not_resumed(self, tmp_path):
+        path = str(tmp_path / "game.jsonl")
+        game = PokerGame("Human", ai_count=3, seed=3)
+        start_journal(game, path)
+        play_rest(game, 2)
+
+        with pytest.raises(JournalLockedError):
+            resume_journal(path)
+        game.journal.close()
+        resumed, _ = resume_journal(path)
+        assert outcome(resumed) == outcome(game)
+        resumed.journal.close()
+
+    def test_held_by_another_process(self, tmp_path):
+        path = str(tmp_path / "game.jsonl")
+        start_journal(PokerGame("Human", ai_count=3, seed=3), path).close()
+        holder = subprocess.Popen(
+            [sys.executable, "-c", "import fcntl, sys; f = open(sys.argv[1], 'a'); "
+             "fcntl.flock(f, fcntl.LOCK_EX); print('locked', flush=True); sys.stdin.read()", path],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        try:
+            assert holder.stdout.readline().strip() == "locked"
+            with pytest.raises(JournalLockedError):
+                resume_journal(path)
+        finally:
+            holder.stdin.close()
+            holder.wait()
+        resume_journal(path)[0].journal.close()
+
+
+class TestIsolation:
+
+    def test_clone_not_journaled(self, tmp_path):
+        path = str(tmp_path / "game.jsonl")
+        game = PokerGame("Human", ai_count=3, seed=2)
+        start_journal(game, path)
+        play_rest(game, 2)
+        size = os.path.getsize(path)
+
+        clone = game.clone()
+        assert clone.journal is None
+        play_rest(clone, 3)
+        assert os.path.getsize(path) == size
+
+    def test_restore_refused_while_journaled(self, tmp_path):
+        game = PokerGame("Human", ai_count=3, seed=2)
+        snapshot = game.snapshot()
+        start_journal(game, str(tmp_path / "game.jsonl"))
+        with pytest.raises(RuntimeError):
+            game.restore(snapshot)
+
+
+class TestRecovery:
+
+    def test_get_game_recovers_from_journal(self, tmp_path, monkeypatch):
+        import app_state
+
+        monkeypatch.setattr(app_state, "GAME_JOURNAL_DIR", str(tmp_path))
+        game_id = "6f1c2a7e-3b7d-4f55-9a51-0c7f4f1d2e11"
+        game = PokerGame("Human", ai_count=3, seed=12)
+        start_journal(game, app_state.journal_path(game_id), meta={"user_id": "u2"})
+        play_rest(game, 3)
+        game.journal.close()  # The worker holding it restarted
+
+        recovered = app_state.get_game(game_id)
+        try:
+            assert recovered is not None and recovered is not game
+            assert recovered.user_id == "u2"
+            assert outcome(recovered) == outcome(game)
+            assert app_state.get_game(game_id) is recovered
+        finally:
+            app_state.games.pop(game_id, None)
+            app_state.discard_game_journal(game_id, recovered)
+        assert not os.path.exists(app_state.journal_path(game_id))
+        assert app_state.get_game(game_id) is None
+
+    def test_game_held_by_another_worker_refused(self, tmp_path, monkeypatch):
+        import app_state
+
+        monkeypatch.setattr(app_state, "GAME_JOURNAL_DIR", str(tmp_path))
+        game_id = "0b9f3c1e-8a2d-4c6b-9e7f-5d4a3b2c1d0e"
+        game = PokerGame("Human", ai_count=3, seed=12)
+        start_journal(game, app_state.journal_path(game_id))  # Still held: the other worker's copy
+        play_rest(game, 2)
+        size = os.path.getsize(app_state.journal_path(game_id))
+
+        with pytest.raises(JournalLockedError):
+            app_state.get_game(game_id)
+        assert game_id not in app_state.games
+        assert os.path.getsize(app_state.journal_path(game_id)) == size
+
+        import main
+        assert main.app.exception_handlers[JournalLockedError] is main.game_held_elsewhere
+        response = asyncio.run(main.game_held_elsewhere(None, JournalLockedError(game_id)))
+        assert response.status_code == 409 and response.headers["Retry-After"] == "1"
+        game.journal.close()
+
+    def test_old_journals_swept(self, tmp_path, monkeypatch):
+        import app_state
+
+        monkeypatch.setattr(app_state, "GAME_JOURNAL_DIR", str(tmp_path))
+        ids = ["1c0e7d2a-0000-4000-8000-00000000000%d" % i for i in range(4)]
+        games = [PokerGame("Human", ai_count=2, seed=i) for i in range(4)]
+        for game_id, game in zip(ids, games):
+            start_journal(game, app_state.journal_path(game_id))
+        for game in games[:2]:
+            game.journal.close()  # Abandoned (0) or recently idle (1)
+        monkeypatch.setitem(app_state.games, ids[3], (games[3], time.time()))
+        old = time.time() - 3600
+        for game_id in (ids[0], ids[2], ids[3]):
+            os.utime(app_state.journal_path(game_id), (old, old))
+
+        assert app_state.cleanup_old_journals(max_age_seconds=60) == 1
+        assert [os.path.exists(app_state.journal_path(game_id)) for game_id in ids] == [False, True, True, True]
+        games[2].journal.close()
+        games[3].journal.close()
+
+    def test_no_journal_for_bad_game_id(self, tmp_path, monkeypatch):
+        import app_state
+
+        monkeypatch.setattr(app_state, "GAME_JOURNAL_DIR", str(tmp_path))
+        assert app_state.journal_path("../../etc/passwd") is None
+        assert app_state.get_game("../../etc/passwd") is None
+
+
+@pytest.mark.slow
+class TestJournalBenchmark:
+    """Benchmark: cost of journaling a played game, and journal size per action."""
+
+    def test_benchmark_journal_overhead(self, tmp_path):
+        print("\n" + "="*60)
+        print("BENCHMARK: action journal overhead")
+        print("="*60)
+
+        num_hands = 200
+
+        def timed(journal: bool, seed: int):
+            game = PokerGame("Human", ai_count=5, seed=seed)
+            path = str(tmp_path / f"bench-{seed}.jsonl")
+            if journal:
+                start_journal(game, path)
+            start = time.perf_counter()
+            play_websocket(game, num_hands)
+            return time.perf_counter() - start, game, path
+
+        plain = journaled = 0.0
+        calls = 0
+        for seed in range(3):
+            plain += timed(False, seed)[0]
+            elapsed, game, path = timed(True, seed)
+            journaled += elapsed
+            calls += len(GameJournal.read(path)) - 1
+        size = os.path.getsize(path)
+        overhead_us = (journaled - plain) / calls * 1e6
+
+        start = time.perf_counter()
+        replayed, _ = replay_journal(path)
+        replay_time = time.perf_counter() - start
+
+        print(f"\n📊 Results (up to {num_hands} hands x 3 games, WebSocket path, 6 players):")
+        print(f"  Without journal: {plain:.3f}s")
+        print(f"  With journal:    {journaled:.3f}s ({calls:,} calls, {overhead_us:+.1f} µs/call)")
+        print(f"  Journal size:    {size / (len(GameJournal.read(path)) - 1):.1f} B/call")
+        print(f"  Replay:          {replay_time * 1000:.0f} ms for {game.hand_count} hands")
+
+        assert outcome(replayed) == outcome(game)
+        assert overhead_us < 50, "Journal append too slow"
+
+        print("\n✅ PASS: Journaling is cheap and replays the game exactly")
@@ -0,0 +1,115 @@
+"""
+Per-game RNG stream tests.
+
+- Same seed -> same names, personalities, deals and AI decisions, bit for bit
+- Seeded games are isolated: interleaving other games or global random
+  calls does not change their outcome
+- DeckManager/AIStrategy draw from the stream they are given, not the global one
+- Unseeded games still follow random.seed() (existing tests rely on it)
+"""
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from game.ai_strategy import AIStrategy
+from game.deck_manager import DeckManager
+from game.poker_engine import PokerGame
+
+
+def make_ai_only_game(seed=None, ai_count: int = 5) -> PokerGame:
+    game = PokerGame("AI Player 1", ai_count=ai_count, headless=True, seed=seed)
+    game.players[0].is_human = False
+    game.players[0].personality = "Conservative"
+    return game
+
+
+def play_hand(game: PokerGame):
+    """Play one hand; return its observable outcome."""
+    game.start_new_hand()
+    return (tuple(p.stack for p in game.players), tuple(game.community_cards),
+            tuple(tuple(p.hole_cards) for p in game.players))
+
+
+def play_hands(game: PokerGame, num_hands: int):
+    outcomes = []
+    for _ in range(num_hands):
+        if sum(1 for p in game.players if p.stack > 0) < 2:
+            break
+        outcomes.append(play_hand(game))
+    return outcomes
+
+
+class TestSeededGames:
+    """A seed fully determines a game."""
+
+    def test_same_seed_same_game(self):
+        first = make_ai_only_game(seed=1234)
+        second = make_ai_only_game(seed=1234)
+        assert [(p.name, p.personality) for p in first.players] == \
+               [(p.name, p.personality) for p in second.players]
+        assert play_hands(first, 80) == play_hands(second, 80)
+
+    def test_different_seeds_differ(self):
+        assert play_hands(make_ai_only_game(seed=1), 20) != play_hands(make_ai_only_game(seed=2), 20)
+
+    def test_interleaved_games_are_isolated(self):
+        """Tables sharing a process don't perturb each other's streams."""
+        alone = play_hands(make_ai_only_game(seed=77), 60)
+
+        game = make_ai_only_game(seed=77)
+        other = make_ai_only_game(seed=78)
+        interleaved = []
+        for _ in range(60):
+            if sum(1 for p in game.players if p.stack > 0) < 2:
+                break
+            random.random()  # Unrelated global draws
+            if sum(1 for p in other.players if p.stack > 0) >= 2:
+                play_hand(other)
+            interleaved.append(play_hand(game))
+        assert interleaved == alone
+
+    def test_seeded_game_leaves_global_random_alone(self):
+        random.seed(5)
+        state = random.getstate()
+        play_hands(make_ai_only_game(seed=9), 20)
+        assert random.getstate() == state
+
+    def test_seed_is_recorded(self):
+        game = make_ai_only_game(seed=42)
+        assert game.seed == 42
+        assert make_ai_only_game().seed is not None
+
+    def test_unseeded_game_follows_global_seed(self):
+        random.seed(3)
+        first = play_hands(make_ai_only_game(), 30)
+        random.seed(3)
+        second = play_hands(make_ai_only_game(), 30)
+        assert first == second
+
+
+class TestComponentStreams:
+    """DeckManager and AIStrategy use the stream passed in."""
+
+    def test_deck_uses_given_rng(self):
+        first = DeckManager(random.Random(8))
+        second = DeckManager(random.Random(8))
+        assert first.deal_cards(52) == second.deal_cards(52)
+
+    def test_ai_bluffs_use_given_rng(self):
+        def decisions(seed):
+            rng = random.Random(seed)
+            return [
+                AIStrategy.make_decision_with_reasoning(
+                    "Maniac", ["7h", "2c"], ["Ks", "9d", "4s"], 20, 60, 1000, 0, 10, rng=rng
+                ).action
+                for _ in range(50)
+            ]
+
+        random.seed(0)
+        first = decisions(11)
+        random.seed(1)
+        second = decisions(11)
+        assert first == second
+        assert {"raise", "call"} <= set(first)  # Both branches of the 70% bluff roll
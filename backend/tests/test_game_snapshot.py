@@ -0,0 +1,176 @@
+"""
+PokerGame snapshot/restore/clone tests.
+
+- Restoring a snapshot replays the exact same rollout (deck, RNG, betting state)
+- A snapshot can be restored any number of times
+- clone() is independent of the original and plays out identically
+- Seat masks agree with the players after restore/clone
+
+The clone+rollout throughput benchmark (vs copy.deepcopy) is marked slow.
+"""
+import copy
+import pytest
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from game.poker_engine import PokerGame, GameState
+
+
+def human_index(game: PokerGame) -> int:
+    return next(i for i, p in enumerate(game.players) if p.is_human)
+
+
+def at_human_decision(seed: int, hands: int = 1) -> PokerGame:
+    """Game paused at the human's turn, after at least `hands` hands started."""
+    game = PokerGame("Human", ai_count=3, seed=seed)
+    while True:
+        game.start_new_hand()
+        if game.hand_count >= hands and game.current_player_index == human_index(game):
+            return game
+        rollout(game)
+
+
+def rollout(game: PokerGame, action: str = "call"):
+    """Play the current hand out, the human always taking `action`; return the outcome."""
+    human = human_index(game)
+    for _ in range(20):
+        if game.current_state == GameState.SHOWDOWN or game.current_player_index != human:
+            break
+        game.submit_human_action(action)
+    return (tuple(p.stack for p in game.players), tuple(game.community_cards),
+            game.current_state, game.hand_count)
+
+
+def table_state(game: PokerGame):
+    return ([dict(p.__dict__) for p in game.players], game.pot, game.current_bet,
+            game.current_state, game.current_player_index, list(game.community_cards),
+            game.deck_manager.deck, len(game.current_hand_events), len(game.hand_history))
+
+
+class TestSnapshotRestore:
+
+    @pytest.mark.parametrize("seed", [1, 7, 42])
+    def test_restore_replays_same_rollout(self, seed):
+        game = at_human_decision(seed)
+        snap = game.snapshot()
+        first = rollout(game)
+        game.restore(snap)
+        assert rollout(game) == first
+
+    def test_restore_many_times(self):
+        game = at_human_decision(3)
+        before = table_state(game)
+        snap = game.snapshot()
+        outcomes = {}
+        for action in ["call", "fold", "raise", "call", "fold"]:
+            game.restore(snap)
+            assert table_state(game) == before
+            outcome = rollout(game, action)
+            assert outcomes.setdefault(action, outcome) == outcome
+        game.restore(snap)
+        assert table_state(game) == before
+        assert game.seat_masks.mismatches() == []
+
+    def test_restore_undoes_finished_hand(self):
+        game = at_human_decision(5, hands=3)
+        history = list(game.hand_history)
+        hand_count = game.hand_count
+        snap = game.snapshot()
+        rollout(game, "fold")
+        game.start_new_hand()
+        game.restore(snap)
+        assert game.hand_history == history
+        assert game.hand_count == hand_count
+
+    def test_restore_rejects_other_table_size(self):
+        snap = at_human_decision(1).snapshot()
+        other = PokerGame("Human", ai_count=2, seed=1)
+        with pytest.raises(ValueError):
+            other.restore(snap)
+
+
+class TestClone:
+
+    def test_clone_is_independent(self):
+        game = at_human_decision(11)
+        before = table_state(game)
+        clone = game.clone()
+        rollout(clone, "raise")
+        clone.start_new_hand()
+        assert table_state(game) == before
+        assert game.seat_masks.mismatches() == []
+        assert clone.seat_masks.mismatches() == []
+
+    @pytest.mark.parametrize("seed", [2, 9])
+    def test_clone_plays_like_original(self, seed):
+        game = at_human_decision(seed, hands=2)
+        clone = game.clone()
+        assert rollout(clone) == rollout(game)
+        clone.start_new_hand()
+        game.start_new_hand()
+        assert rollout(clone) == rollout(game)
+
+
+@pytest.mark.slow
+class TestSnapshotBenchmark:
+    """Benchmark: rollouts from a decision point, clone/restore vs copy.deepcopy."""
+
+    def test_benchmark_rollout_throughput(self):
+        print("\n" + "="*60)
+        print("BENCHMARK: what-if rollouts per second")
+        print("="*60)
+
+        # Decision point with a full 100-hand history behind it
+        game = PokerGame("Human", ai_count=3, seed=2024)
+        game.blind_escalation_enabled = False
+        while len(game.hand_history) < 100:
+            game.start_new_hand()
+            rollout(game)
+            if sum(1 for p in game.players if p.stack > 0) < 2:
+                game = PokerGame("Human", ai_count=3, seed=game.hand_count)
+                game.blind_escalation_enabled = False
+        while True:
+            game.start_new_hand()
+            if game.current_player_index == human_index(game):
+                break
+            rollout(game)
+
+        duration = 2.0
+
+        def rate(step):
+            count = 0
+            start = time.perf_counter()
+            while time.perf_counter() - start < duration:
+                step()
+                count += 1
+            return count / (time.perf_counter() - start)
+
+        snap = game.snapshot()
+
+        def restore_rollout():
+            game.restore(snap)
+            rollout(game)
+
+        # The evaluator holds the memory-mapped rank table, which deepcopy cannot copy
+        shared = {id(game.hand_evaluator): game.hand_evaluator}
+        deepcopy_rate = rate(lambda: rollout(copy.deepcopy(game, dict(shared))))
+        clone_only_rate = rate(game.clone)
+        restore_only_rate = rate(lambda: game.restore(snap))
+        clone_rate = rate(lambda: rollout(game.clone()))
+        restore_rate = rate(restore_rollout)
+
+        print(f"\n📊 Results ({len(game.hand_history)} hands of history):")
+        print(f"  clone() alone:             {1e6 / clone_only_rate:,.1f} µs")
+        print(f"  restore() alone:           {1e6 / restore_only_rate:,.1f} µs")
+        print(f"  deepcopy + rollout:        {deepcopy_rate:,.0f} rollouts/sec")
+        print(f"  clone() + rollout:         {clone_rate:,.0f} rollouts/sec")
+        print(f"  restore() + rollout:       {restore_rate:,.0f} rollouts/sec")
+        print(f"  clone vs deepcopy:         {clone_rate / deepcopy_rate:.1f}x")
+
+        assert clone_rate > 2 * deepcopy_rate, "clone() rollouts not clearly faster than deepcopy"
+        assert restore_rate > 2 * deepcopy_rate, "restore() rollouts not clearly faster than deepcopy"
+
+        print("\n✅ PASS: Snapshot rollouts avoid copying the game history")
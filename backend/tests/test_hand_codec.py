@@ -0,0 +1,177 @@
+"""
+Binary hand-history codec tests (game.hand_codec).
+
+- decode_hand(encode_hand(hand)) == hand for real played hands, with and
+  without the game's TableTemplate
+- Against its template an engine hand carries no player or vocabulary strings
+- Reasoning templates, numbers, timestamps, UUIDs, floats, events and action
+  records fall back losslessly when they don't fit the compact forms
+- Bad magic / unknown version / a different template are rejected
+
+The size and encode/decode speed benchmark against asdict() JSON is marked slow.
+"""
+import json
+import pytest
+import sys
+import os
+import time
+from dataclasses import asdict, replace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from game.hand_codec import TEMPLATES, VERSION, WORDS, TableTemplate, decode_hand, encode_hand
+from game.poker_engine import PokerGame, HandEvent
+from routes.analysis import deserialize_completed_hand
+
+
+def play_hands(seed: int, num_hands: int):
+    """Completed hands (with the game's template) from a game where the human always calls."""
+    game = PokerGame("Human", ai_count=5, seed=seed)
+    while game.hand_count < num_hands and sum(1 for p in game.players if p.stack > 0) >= 2:
+        game.start_new_hand()
+        for _ in range(20):
+            index = game.current_player_index
+            if index is None or not game.players[index].is_human:
+                break
+            game.submit_human_action("call")
+    table = TableTemplate.for_game(game)
+    return [(hand, table) for hand in game.hand_history]
+
+
+@pytest.fixture(scope="module")
+def played():
+    return play_hands(seed=1, num_hands=40) + play_hands(seed=2, num_hands=40)
+
+
+@pytest.fixture(scope="module")
+def hands(played):
+    return [hand for hand, _ in played]
+
+
+class TestRoundTrip:
+
+    def test_played_hands_round_trip(self, played):
+        assert played
+        for hand, table in played:
+            assert decode_hand(encode_hand(hand)) == hand
+            assert decode_hand(encode_hand(hand, table), table) == hand
+
+    def test_much_smaller_than_json(self, played):
+        binary = sum(len(encode_hand(hand, table)) for hand, table in played)
+        text = sum(len(json.dumps(asdict(hand))) for hand, _ in played)
+        assert binary * 15 < text
+
+    def test_no_strings_against_table(self, played):
+        hand, table = played[-1]
+        encoded = encode_hand(hand, table)
+        assert len(encoded) < len(encode_hand(hand))
+        for player_id, name in table.seats:
+            assert player_id.encode() not in encoded and name.encode() not in encoded
+        for word in WORDS:
+            assert word.encode() not in encoded
+
+    def test_other_table_rejected(self, played):
+        hand, table = played[0]
+        other = TableTemplate(table.session_id, table.seats[1:] + table.seats[:1])
+        with pytest.raises(ValueError):
+            decode_hand(encode_hand(hand, table), other)
+        with pytest.raises(ValueError):
+            decode_hand(encode_hand(hand, table))
+
+    def test_every_template_round_trips(self, hands):
+        hand = hands[0]
+        for template in TEMPLATES:
+            reasoning = template.format(*["Slot"] * template.count("{}"))
+            event = replace(hand.events[0], reasoning=reasoning)
+            decoded = decode_hand(encode_hand(replace(hand, events=[event])))
+            assert decoded.events[0].reasoning == reasoning
+
+    def test_free_text_and_odd_values(self, hands):
+        hand = hands[0]
+        event = HandEvent(timestamp="yesterday", event_type="action", player_id="someone-new",
+                          action="call", amount=-5, hand_strength=float("nan"),
+                          reasoning="Not a template ✓", pot_size=10 ** 12, current_bet=0)
+        odd = replace(hand, session_id="not-a-uuid", timestamp="2024-01-01T00:00:00+00:00",
+                      human_pot_odds=1 / 3, human_hand_strength=float("inf"),
+                      events=[event, replace(event, timestamp="2024-05-01T12:00:00.000001")])
+        decoded = decode_hand(encode_hand(odd))
+        assert decoded.session_id == "not-a-uuid"
+        assert decoded.timestamp == "2024-01-01T00:00:00+00:00"
+        assert decoded.human_pot_odds == 1 / 3
+        assert decoded.human_hand_strength == float("inf")
+        assert [e.timestamp for e in decoded.events] == ["yesterday", "2024-05-01T12:00:00.000001"]
+        assert decoded.events[0].reasoning == "Not a template ✓"
+        assert decoded.events[0].amount == -5 and decoded.events[0].pot_size == 10 ** 12
+
+    def test_numbers_and_odd_records(self, played):
+        hand, table = next((hand, table) for hand, table in played if hand.betting_rounds[0].actions)
+        first_round = hand.betting_rounds[0]
+        record = first_round.actions[0]
+        odd_record = replace(record, player_name="Renamed", action="check", stack_after=record.stack_after - 7,
+                             pot_before=record.pot_before + 3, reasoning="Human player 007")
+        odd_event = replace(hand.events[-1], reasoning="Pair (-0.50). Pot odds 1.2345678%, SPR 10 - negative EV fold.",
+                            hand_strength=-0.0, current_bet=hand.events[-1].current_bet + 5)
+        odd = replace(hand, events=hand.events[:-1] + [odd_event],
+                      betting_rounds=[replace(first_round, actions=[odd_record] + first_round.actions[1:],
+                                              community_cards=["As"])] + hand.betting_rounds[1:])
+        decoded = decode_hand(encode_hand(odd, table), table)
+        assert decoded == odd
+        assert decoded.events[-1].reasoning == odd_event.reasoning
+        assert str(decoded.events[-1].hand_strength) == "-0.0"
+        assert decoded.betting_rounds[0].actions[0].player_name == "Renamed"
+
+    def test_rejects_foreign_data(self, hands):
+        encoded = encode_hand(hands[0])
+        with pytest.raises(ValueError):
+            decode_hand(b"{}" + encoded[2:])
+        with pytest.raises(ValueError):
+            decode_hand(encoded[:2] + bytes([VERSION + 1]) + encoded[3:])
+        with pytest.raises(ValueError):
+            decode_hand(encoded[:3] + bytes([encoded[3] ^ 1]) + encoded[4:])
+        with pytest.raises(ValueError):
+            decode_hand(encoded + b"\x00")
+
+
+@pytest.mark.slow
+class TestCodecBenchmark:
+    """Benchmark: bytes per hand and encode/decode speed, binary vs asdict() JSON."""
+
+    def test_benchmark_size_and_speed(self):
+        print("\n" + "="*60)
+        print("BENCHMARK: binary hand codec vs asdict() JSON")
+        print("="*60)
+
+        played = play_hands(seed=7, num_hands=100) + play_hands(seed=8, num_hands=100)
+        hands = [hand for hand, _ in played]
+
+        def per_hand_us(fn, items, repeat=5):
+            start = time.perf_counter()
+            for _ in range(repeat):
+                for item in items:
+                    fn(item)
+            return (time.perf_counter() - start) / (repeat * len(items)) * 1e6
+
+        encoded = [(encode_hand(hand, table), table) for hand, table in played]
+        json_encoded = [json.dumps(asdict(hand)) for hand in hands]
+        binary_size = sum(len(data) for data, _ in encoded) / len(hands)
+        untemplated_size = sum(len(encode_hand(hand)) for hand in hands) / len(hands)
+        uuid_size = sum(17 * len(hand.ai_decisions) for hand in hands) / len(hands)
+        json_size = sum(len(s.encode()) for s in json_encoded) / len(hands)
+
+        encode_us = per_hand_us(lambda item: encode_hand(*item), played)
+        decode_us = per_hand_us(lambda item: decode_hand(*item), encoded)
+        json_encode_us = per_hand_us(lambda hand: json.dumps(asdict(hand)), hands)
+        json_decode_us = per_hand_us(json.loads, json_encoded)
+        json_rebuild_us = per_hand_us(lambda s: deserialize_completed_hand(json.loads(s)), json_encoded)
+
+        print(f"\n📊 Results ({len(hands)} hands):")
+        print(f"  Size:    binary {binary_size:,.0f} B/hand ({uuid_size:,.0f} B of them random decision UUIDs; "
+              f"{untemplated_size:,.0f} B without the table template), JSON {json_size:,.0f} B/hand "
+              f"({json_size / binary_size:.1f}x smaller)")
+        print(f"  Encode:  binary {encode_us:,.1f} µs/hand, asdict+JSON {json_encode_us:,.1f} µs/hand")
+        print(f"  Decode:  binary {decode_us:,.1f} µs/hand (to CompletedHand), JSON {json_rebuild_us:,.1f} µs/hand "
+              f"(to CompletedHand), {json_decode_us:,.1f} µs/hand (to dicts)")
+
+        assert binary_size * 15 < json_size, "Binary encoding not clearly smaller than JSON"
+
+        print("\n✅ PASS: Binary hand history is a fraction of the JSON size")
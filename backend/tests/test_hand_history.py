@@ -227,3 +227,68 @@ def test_hand_history_vs_completed_hands():
     # They should contain the same hands
     assert len(game.hand_history) == len(game.completed_hands), \
         "hand_history and completed_hands should have same count"
+
+
+def test_completed_hands_is_newest_part_of_hand_history():
+    """Both accessors read the one ring of completed hands (each hand stored once)."""
+    game = PokerGame(human_player_name="Test", ai_count=2, seed=6)  # Human survives 60 folds
+    game.qc_enabled = False
+
+    for _ in range(60):
+        game.submit_human_action("fold")
+        game.start_new_hand()
+
+    history = game.hand_history
+    assert len(history) > 50
+    assert len(game.completed_hands) == 50
+    assert all(a is b for a, b in zip(game.completed_hands, history[-50:]))
+
+
+def test_hand_events_ring_buffer_bounded():
+    """Past hands' events are capped; oldest drop off, order is preserved."""
+    from game.poker_engine import HandEvent, HandEventLog
+
+    log = HandEventLog(capacity=4)
+    for i in range(6):
+        log.append(HandEvent(timestamp=str(i), event_type="action", player_id="p", action="call", amount=i))
+
+    assert len(log) == 4
+    assert [event.amount for event in log] == [2, 3, 4, 5]
+    assert log[-1].amount == 5
+    assert [event.amount for event in log[1:3]] == [3, 4]
+    assert log.column("timestamp") == ["2", "3", "4", "5"]
+
+    game = PokerGame(human_player_name="Test", ai_count=2)
+    game.qc_enabled = False
+    for _ in range(5):
+        game.submit_human_action("fold")
+        game.start_new_hand()
+    assert 0 < len(game.hand_events) <= game.event_log.capacity
+    assert all(isinstance(event, HandEvent) for event in game.hand_events)
+
+
+def test_recent_hands_and_events_copy_only_the_tail():
+    """recent_hands()/recent_events()/find_hand() read the rings without copying all of them."""
+    from game.poker_engine import HandEvent, HandEventLog
+
+    game = PokerGame(human_player_name="Test", ai_count=2, seed=6)
+    game.qc_enabled = False
+    for _ in range(12):
+        game.submit_human_action("fold")
+        game.start_new_hand()
+
+    history = game.hand_history
+    assert game.hand_history_count == len(history) > 5
+    assert all(a is b for a, b in zip(game.recent_hands(5), history[-5:]))
+    assert game.recent_hands(1000) == history
+    assert game.recent_hands(0) == []
+    assert game.find_hand(history[3].hand_number) is history[3]
+    assert game.find_hand(-1) is None
+
+    log = HandEventLog(capacity=4)
+    for i in range(6):
+        log.append(HandEvent(timestamp=str(i), event_type="action", player_id="p", action="call", amount=i))
+    assert [event.amount for event in log.tail(2)] == [4, 5]
+    assert [event.amount for event in log.tail(10)] == [2, 3, 4, 5]
+    assert log.tail(0) == []
+    assert game.recent_events(3) == game.hand_events[-3:]
@@ -0,0 +1,156 @@
+"""
+Headless simulation mode tests.
+
+- Same seed gives identical outcomes in normal and headless mode
+- Headless mode keeps no UI/analysis history
+- Cheap per-hand chip check still catches conservation bugs
+
+The headless vs normal mode hands/second benchmark is marked slow (nightly).
+"""
+import pytest
+import random
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from game.hand_evaluator import warm_up
+from game.poker_engine import PokerGame
+
+
+def make_ai_only_game(ai_count: int = 5, headless: bool = False) -> PokerGame:
+    """All seats AI (seat 0 converted, as in test_ai_only_games.py)."""
+    game = PokerGame("AI Player 1", ai_count=ai_count, headless=headless)
+    game.players[0].is_human = False
+    game.players[0].personality = "Conservative"
+    return game
+
+
+def play_hands(seed: int, num_hands: int, headless: bool):
+    """Play AI-only hands; return (stacks, board, dealer) after each hand."""
+    random.seed(seed)
+    game = make_ai_only_game(headless=headless)
+    outcomes = []
+    for _ in range(num_hands):
+        if sum(1 for p in game.players if p.stack > 0) < 2:
+            break
+        game.start_new_hand()
+        outcomes.append((tuple(p.stack for p in game.players), tuple(game.community_cards), game.dealer_index))
+    return outcomes
+
+
+class TestHeadlessOutcomes:
+    """Headless mode must not change game results."""
+
+    @pytest.mark.parametrize("seed", [1, 7, 42, 2024])
+    def test_same_outcomes_as_normal_mode(self, seed):
+        normal = play_hands(seed, 150, headless=False)
+        headless = play_hands(seed, 150, headless=True)
+        assert len(normal) > 10
+        assert headless == normal
+
+    def test_chips_conserved(self):
+        random.seed(3)
+        game = make_ai_only_game(headless=True)
+        for _ in range(100):
+            if sum(1 for p in game.players if p.stack > 0) < 2:
+                break
+            game.start_new_hand()
+            assert sum(p.stack for p in game.players) + game.pot == game.total_chips
+
+
+class TestHeadlessSkipsHistory:
+    """Nothing only the UI needs is built."""
+
+    def test_no_events_or_history(self):
+        random.seed(5)
+        game = make_ai_only_game(headless=True)
+        game.players[0].is_human = True  # Human seat would normally save CompletedHands
+        for _ in range(20):
+            game.start_new_hand(process_ai=True)
+            if game.current_player_index is not None and game.players[game.current_player_index].is_human:
+                game.submit_human_action("fold")
+        assert game.current_hand_events == []
+        assert game.hand_events == []
+        assert game.hand_history == []
+        assert game.completed_hands == []
+        assert game.last_hand_summary is None
+        assert game._hand_betting_rounds == []
+
+    def test_normal_mode_still_records(self):
+        random.seed(5)
+        game = PokerGame("Human", ai_count=3)
+        game.start_new_hand(process_ai=True)
+        assert game.current_hand_events
+
+
+class TestHeadlessQC:
+    """Per-hand chip check."""
+
+    def test_chip_total_check_detects_leak(self):
+        random.seed(11)
+        game = make_ai_only_game(headless=True)
+        game.start_new_hand()
+        game.players[1].stack += 50  # Corrupt state
+        with pytest.raises(RuntimeError, match="CHIP CONSERVATION"):
+            game.start_new_hand()
+
+    def test_qc_disabled_skips_check(self):
+        random.seed(11)
+        game = make_ai_only_game(headless=True)
+        game.qc_enabled = False
+        game.start_new_hand()
+        game.players[1].stack += 50
+        game.start_new_hand()
+
+
+@pytest.mark.slow
+class TestHeadlessBenchmark:
+    """Benchmark: headless vs normal AI-only hands/sec, same shared (warmed) evaluator."""
+
+    def test_benchmark_hands_per_second(self):
+        print("\n" + "="*60)
+        print("BENCHMARK: Headless simulation hands/second")
+        print("="*60)
+
+        duration = 3.0
+        warm_up()  # Both modes use the same process-wide evaluator, already built
+
+        def throughput_loop():
+            """Same loop as test_performance.py::test_hands_per_second_throughput."""
+            hands = 0
+            start = time.time()
+            while time.time() - start < duration:
+                game = PokerGame("TestPlayer", ai_count=3)
+                game.start_new_hand(process_ai=True)
+                hands += 1
+            return hands / (time.time() - start)
+
+        def full_hands(headless):
+            random.seed(99)
+            game = make_ai_only_game(ai_count=3, headless=headless)
+            hands = 0
+            start = time.time()
+            while time.time() - start < duration:
+                if sum(1 for p in game.players if p.stack > 0) < 2:
+                    game = make_ai_only_game(ai_count=3, headless=headless)
+                game.start_new_hand()
+                hands += 1
+            return hands / (time.time() - start)
+
+        loop_rate = throughput_loop()
+        normal_rate = full_hands(headless=False)
+        headless_rate = full_hands(headless=True)
+
+        print(f"\n📊 Results:")
+        print(f"  Throughput loop (new game per hand):  {loop_rate:,.0f} hands/sec")
+        print(f"  Full AI-only hands, normal mode:      {normal_rate:,.0f} hands/sec")
+        print(f"  Full AI-only hands, headless mode:    {headless_rate:,.0f} hands/sec")
+        print(f"  Headless vs normal mode:              {headless_rate / normal_rate:.2f}x")
+
+        # What headless mode skips is a minority of a hand's cost: AI decisions,
+        # shuffling and betting logic run in both modes
+        assert headless_rate > 1.2 * normal_rate, "Headless mode not faster than normal mode"
+
+        print("\n✅ PASS: Headless mode skips the UI/analysis work")
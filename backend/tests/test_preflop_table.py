@@ -0,0 +1,143 @@
+"""
+Preflop equity table tests.
+
+- Hand class canonicalization covers all 1,326 starting hands in 169 classes
+- Shipped table loads, and its values match exact enumeration / the engine
+- A missing or stale table falls back to the engine and is not reloaded per call
+- HandEvaluator and AIStrategy read preflop strength from the table
+"""
+import pytest
+import itertools
+import sys
+import os
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import game.preflop_table as preflop_table
+from game.preflop_table import (
+    PreflopTable, hand_class, all_hand_classes, representative_cards,
+    get_preflop_table, _exact_mean_score, TABLE_VERSION
+)
+from game.equity import get_equity_engine
+from game.rank_table import RANKS, SUITS, CARD_INDEX
+from game.hand_evaluator import HandEvaluator
+from game.ai_strategy import AIStrategy
+
+ALL_CARDS = [rank + suit for rank in RANKS for suit in SUITS]
+
+
+class TestHandClass:
+    """Starting hand -> canonical class."""
+
+    def test_examples(self):
+        assert hand_class(["Ah", "As"]) == "AA"
+        assert hand_class(["Kd", "Ad"]) == "AKs"
+        assert hand_class(["2c", "7h"]) == "72o"
+        assert hand_class(["10s", "Js"]) == "JTs"
+
+    def test_169_classes_cover_all_hands(self):
+        counts = {}
+        for hand in itertools.combinations(ALL_CARDS, 2):
+            cls = hand_class(hand)
+            counts[cls] = counts.get(cls, 0) + 1
+        assert set(counts) == set(all_hand_classes())
+        assert len(counts) == 169
+        assert sum(counts.values()) == 1326
+        assert counts["AA"] == 6 and counts["AKs"] == 4 and counts["AKo"] == 12
+
+    def test_representative_is_in_class(self):
+        for cls in all_hand_classes():
+            assert hand_class([ALL_CARDS[c] for c in representative_cards(cls)]) == cls
+
+
+class TestShippedTable:
+    """The versioned table file in game/data."""
+
+    def test_loads_all_classes(self):
+        table = get_preflop_table()
+        assert table is not None
+        assert len(table.hands) == 169
+        assert table.max_opponents == 5
+
+    def test_mean_score_is_exact(self):
+        """Recompute one class with a different suit representative."""
+        table = get_preflop_table()
+        boards = np.array(list(itertools.combinations(range(50), 5)), dtype=np.int8)
+        hole = [CARD_INDEX["7d"], CARD_INDEX["2c"]]
+        assert _exact_mean_score(get_equity_engine(), hole, boards) == pytest.approx(
+            table.mean_score(["7d", "2c"]), abs=0.001)
+
+    def test_equity_matches_known_values(self):
+        table = get_preflop_table()
+        assert table.equity(["Ah", "As"], 1) == pytest.approx(0.852, abs=0.005)
+        assert table.equity(["Ah", "Kh"], 1) == pytest.approx(0.670, abs=0.005)
+        assert table.equity(["7h", "2c"], 1) == pytest.approx(0.346, abs=0.005)
+
+    def test_equity_agrees_with_engine(self):
+        table = get_preflop_table()
+        engine = get_equity_engine()
+        for cls, opponents in [("QJs", 2), ("55", 4), ("A5o", 5)]:
+            hole = representative_cards(cls)
+            result = engine.estimate(hole, [], num_opponents=opponents, samples=20000,
+                                     rng=np.random.default_rng(11))
+            expected = table.hands[cls]["equity_estimate"][opponents - 1]
+            assert abs(result.equity - expected) < 4 * result.std_error + 0.002
+
+    def test_equity_decreases_with_opponents(self):
+        table = get_preflop_table()
+        for cls in all_hand_classes():
+            equity = table.hands[cls]["equity_estimate"]
+            assert all(a > b for a, b in zip(equity, equity[1:])), cls
+
+    def test_rejects_out_of_range_opponents(self):
+        with pytest.raises(ValueError):
+            get_preflop_table().equity(["Ah", "As"], 6)
+
+    def test_stale_table_rejected(self, tmp_path):
+        path = tmp_path / "preflop.json"
+        path.write_text('{"version": %d, "hands": {}}' % (TABLE_VERSION + 1))
+        with pytest.raises(ValueError):
+            PreflopTable(str(path))
+
+    def test_missing_table_falls_back(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(preflop_table, "_preflop_table", None)
+        monkeypatch.setenv("POKER_PREFLOP_TABLE_PATH", str(tmp_path / "missing.json"))
+        assert get_preflop_table() is None
+
+        ev = HandEvaluator()
+        assert ev.preflop_table is None
+        score, _ = ev.evaluate_hand(["Ah", "As"], [])
+        assert score == pytest.approx(2461.9, abs=100)
+
+    def test_failed_load_not_retried(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(preflop_table, "_preflop_table", None)
+        monkeypatch.setattr(preflop_table, "_failed_path", None)
+        monkeypatch.setenv("POKER_PREFLOP_TABLE_PATH", str(tmp_path / "missing.json"))
+        loads = []
+        monkeypatch.setattr(preflop_table, "PreflopTable", lambda path: loads.append(path) or open(path))
+        for _ in range(3):
+            assert get_preflop_table() is None
+        assert len(loads) == 1
+
+
+class TestPreflopLookups:
+    """Callers read preflop strength from the table."""
+
+    def test_evaluate_hand_preflop_is_table_read(self):
+        ev = HandEvaluator()
+        score, rank = ev.evaluate_hand(["Kd", "Ad"], [])
+        assert score == get_preflop_table().mean_score(["Ad", "Kd"])
+        assert rank == ev.evaluator.class_to_string(ev.evaluator.get_rank_class(int(score)))
+
+    def test_estimate_equity_preflop_uses_table(self):
+        result = HandEvaluator().estimate_equity(["Ah", "As"], [], num_opponents=3)
+        assert result.equity == get_preflop_table().equity(["Ah", "As"], 3)
+        assert result.samples == get_preflop_table().samples
+
+    def test_ai_strategy_preflop_strength(self):
+        decision = AIStrategy.make_decision_with_reasoning(
+            "Mathematical", ["Qs", "Qh"], [], current_bet=20, pot_size=30, player_stack=1000)
+        expected = HandEvaluator.score_to_strength(get_preflop_table().mean_score(["Qs", "Qh"]))
+        assert decision.hand_strength == expected
@@ -0,0 +1,137 @@
+"""
+Tiered QC tests (game.qc).
+
+- qc_enabled still works as an on/off switch (FULL / OFF)
+- The chip ledger catches leaks at every level but OFF, including direct stack writes
+- SAMPLED runs full checks at qc_sample_rate, deterministically, and counts what it skipped
+- The QC level never changes a seeded game's outcome
+
+The per-checkpoint cost benchmark is marked slow.
+"""
+import pytest
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from game.poker_engine import PokerGame
+from game.qc import QCLevel, QCSampler
+
+
+def make_ai_only_game(seed: int, level: QCLevel = QCLevel.FULL) -> PokerGame:
+    game = PokerGame("AI Player 1", ai_count=5, seed=seed)
+    game.players[0].is_human = False
+    game.players[0].personality = "Conservative"
+    game.qc_level = level
+    return game
+
+
+def play_hands(game: PokerGame, num_hands: int):
+    for _ in range(num_hands):
+        if sum(1 for p in game.players if p.stack > 0) < 2:
+            break
+        game.start_new_hand()
+    return [p.stack for p in game.players]
+
+
+class TestLevels:
+
+    def test_qc_enabled_maps_to_levels(self):
+        game = PokerGame("Human", ai_count=2, seed=1)
+        assert game.qc_level is QCLevel.FULL and game.qc_enabled
+        game.qc_enabled = False
+        assert game.qc_level is QCLevel.OFF and not game.qc_enabled
+        game.qc_level = QCLevel.LEDGER
+        assert game.qc_enabled
+
+    @pytest.mark.parametrize("level", [QCLevel.LEDGER, QCLevel.SAMPLED, QCLevel.FULL])
+    def test_ledger_catches_leak(self, level):
+        game = make_ai_only_game(seed=3, level=level)
+        game.start_new_hand()
+        game.players[2].stack += 50
+        with pytest.raises(RuntimeError, match="CHIP CONSERVATION"):
+            game._assert_chip_conservation("test")
+
+    def test_off_ignores_leak(self):
+        game = make_ai_only_game(seed=3, level=QCLevel.OFF)
+        game.start_new_hand()
+        game.players[2].stack += 50
+        game._assert_chip_conservation("test")
+        game._assert_valid_game_state("test")
+        assert game.qc_counters.ledger_checks == 0 and game.qc_counters.full_checks == 0
+
+    def test_ledger_level_skips_state_scan(self):
+        game = make_ai_only_game(seed=4, level=QCLevel.LEDGER)
+        play_hands(game, 10)
+        assert game.qc_counters.ledger_checks > 0
+        assert game.qc_counters.full_checks == 0
+
+    def test_full_check_verifies_ledger(self):
+        game = make_ai_only_game(seed=5)
+        game.start_new_hand()
+        game.seat_masks.stacks += 10  # Ledger drifts from the real stacks
+        game.total_chips += 10
+        with pytest.raises(RuntimeError, match="chip ledger"):
+            game._assert_valid_game_state("test")
+
+    @pytest.mark.parametrize("level", list(QCLevel))
+    def test_level_does_not_change_outcome(self, level):
+        assert play_hands(make_ai_only_game(seed=9, level=level), 20) == \
+            play_hands(make_ai_only_game(seed=9), 20)
+
+
+class TestSampling:
+
+    def test_sampler_rate(self):
+        sampler = QCSampler(0.25)
+        assert sum(sampler.should_check() for _ in range(400)) == 100
+        assert not any(QCSampler(0.0).should_check() for _ in range(100))
+        assert all(QCSampler(1.0).should_check() for _ in range(100))
+
+    def test_sampled_counters(self):
+        game = make_ai_only_game(seed=6, level=QCLevel.SAMPLED)
+        game.qc_sample_rate = 0.2
+        play_hands(game, 20)
+        counters = game.qc_counters
+        total = counters.full_checks + counters.sampled_out
+        assert total > 0
+        assert abs(counters.full_checks - 0.2 * total) <= 1
+        assert counters.ledger_checks > 0
+
+    def test_invalid_sample_rate(self):
+        game = PokerGame("Human", ai_count=2, seed=1)
+        with pytest.raises(ValueError):
+            game.qc_sample_rate = 1.5
+
+
+@pytest.mark.slow
+class TestQCBenchmark:
+    """Benchmark: cost of one QC checkpoint (chip + state check) per level."""
+
+    def test_benchmark_qc_levels(self):
+        print("\n" + "="*60)
+        print("BENCHMARK: QC checkpoint cost per level")
+        print("="*60)
+
+        checkpoints = 50_000
+
+        def checkpoint_cost(level):
+            game = make_ai_only_game(seed=0, level=level)
+            game.qc_sample_rate = 0.05
+            game.start_new_hand()
+            start = time.perf_counter()
+            for _ in range(checkpoints):
+                game._assert_chip_conservation("benchmark")
+                game._assert_valid_game_state("benchmark")
+            return (time.perf_counter() - start) / checkpoints * 1e6
+
+        costs = {level: checkpoint_cost(level) for level in QCLevel}
+
+        print(f"\n📊 Results (SAMPLED at 5%, 6 players):")
+        for level, cost in costs.items():
+            print(f"  {level.value:<8} {cost:6.2f} µs/checkpoint")
+
+        assert costs[QCLevel.SAMPLED] < costs[QCLevel.FULL] / 2, "Sampled QC not clearly cheaper than full QC"
+
+        print("\n✅ PASS: Sampled QC keeps ledger coverage at a fraction of the cost")
@@ -0,0 +1,163 @@
+"""
+Seven-card rank table tests.
+
+Validates the memory-mapped lookup evaluator against treys:
+- Identical scores on random 7-card hands and on every flush rank mask
+- HandEvaluator.evaluate_hand() 7-card path returns treys-compatible results
+- Table file generation, reloading and stale-file rebuild
+
+The 1M-hand benchmark against the treys path is marked slow (nightly).
+"""
+import pytest
+import random
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from treys import Evaluator, Card
+
+from game.rank_table import (
+    RankTable, build_rank_table, get_rank_table, card_index,
+    RANKS, SUITS, CARD_INDEX
+)
+from game.poker_engine import HandEvaluator
+
+ALL_CARDS = [rank + suit for rank in RANKS for suit in SUITS]
+TREYS_CARDS = [Card.new(card) for card in ALL_CARDS]
+TREYS_EVALUATOR = Evaluator()
+
+
+def treys_score(cards):
+    """Reference score straight from treys."""
+    return TREYS_EVALUATOR.evaluate([TREYS_CARDS[c] for c in cards[:2]], [TREYS_CARDS[c] for c in cards[2:]])
+
+
+class TestCardIndex:
+    """Card string -> index mapping."""
+
+    def test_index_matches_fresh_deck_order(self):
+        assert [card_index(card) for card in ALL_CARDS] == list(range(52))
+
+    def test_ten_alias(self):
+        assert card_index("10s") == card_index("Ts")
+        assert card_index("10h") == card_index("Th")
+
+    def test_all_52_distinct(self):
+        assert len(set(CARD_INDEX[card] for card in ALL_CARDS)) == 52
+
+
+class TestRankTableMatchesTreys:
+    """Rank table must reproduce treys scores exactly."""
+
+    def test_random_hands_match_treys(self):
+        table = get_rank_table()
+        evaluator = Evaluator()
+        rng = random.Random(1234)
+        for _ in range(20000):
+            cards = rng.sample(range(52), 7)
+            expected = evaluator.evaluate([TREYS_CARDS[c] for c in cards[:2]],
+                                          [TREYS_CARDS[c] for c in cards[2:]])
+            assert table.evaluate7(cards) == expected, [ALL_CARDS[c] for c in cards]
+
+    def test_every_flush_mask_matches_treys(self):
+        """All 7-card single-suit rank sets (flushes and straight flushes)."""
+        import itertools
+        table = get_rank_table()
+        for suit in range(4):
+            for ranks in itertools.combinations(range(13), 7):
+                cards = [r * 4 + suit for r in ranks]
+                assert table.evaluate7(cards) == treys_score(cards)
+
+    def test_known_hands(self):
+        table = get_rank_table()
+        royal = [CARD_INDEX[c] for c in ["As", "Ks", "Qs", "Js", "Ts", "2h", "3d"]]
+        quads = [CARD_INDEX[c] for c in ["Ah", "Ad", "Ac", "As", "Kh", "2d", "3c"]]
+        worst = [CARD_INDEX[c] for c in ["7h", "5d", "4c", "3s", "2h", "9d", "8c"]]
+        assert table.evaluate7(royal) == 1
+        assert table.evaluate7(quads) == 11
+        assert table.evaluate7(worst) == treys_score(worst)
+
+
+class TestHandEvaluatorSevenCardPath:
+    """HandEvaluator.evaluate_hand() uses the table for 7 cards."""
+
+    def test_seven_cards_match_treys(self):
+        ev = HandEvaluator()
+        rng = random.Random(99)
+        for _ in range(2000):
+            cards = rng.sample(range(52), 7)
+            score, rank = ev.evaluate_hand([ALL_CARDS[c] for c in cards[:2]],
+                                           [ALL_CARDS[c] for c in cards[2:]])
+            expected = treys_score(cards)
+            assert score == expected
+            assert rank == ev.evaluator.class_to_string(ev.evaluator.get_rank_class(expected))
+
+    def test_ten_notation_supported(self):
+        ev = HandEvaluator()
+        score, rank = ev.evaluate_hand(["As", "Ks"], ["Qs", "Js", "10s", "2h", "3d"])
+        assert score == 1
+        assert rank == "Royal Flush"
+
+    def test_evaluators_share_one_table(self):
+        assert HandEvaluator().rank_table is HandEvaluator().rank_table
+
+
+class TestRankTableFile:
+    """Table generation and memory-mapped loading."""
+
+    def test_build_and_load(self, tmp_path):
+        path = str(tmp_path / "rank_table.bin")
+        build_rank_table(path)
+        table = RankTable(path)
+        cards = [CARD_INDEX[c] for c in ["Ah", "Kh", "Qh", "Jh", "Th", "2c", "3d"]]
+        assert table.evaluate7(cards) == 1
+
+    def test_stale_file_is_rebuilt(self, tmp_path):
+        path = str(tmp_path / "rank_table.bin")
+        with open(path, "wb") as f:
+            f.write(b"not a rank table")
+        with pytest.raises(ValueError):
+            RankTable(path)
+        table = RankTable.load(path)
+        cards = [CARD_INDEX[c] for c in ["Ah", "Kh", "Qh", "Jh", "Th", "2c", "3d"]]
+        assert table.evaluate7(cards) == 1
+
+
+@pytest.mark.slow
+class TestRankTableBenchmark:
+    """Benchmark: rank table vs treys on 1M random 7-card hands."""
+
+    def test_benchmark_1m_hands_vs_treys(self):
+        print("\n" + "="*60)
+        print("BENCHMARK: Rank table vs treys (1,000,000 7-card hands)")
+        print("="*60)
+
+        num_hands = 1_000_000
+        rng = random.Random(2024)
+        hands = [rng.sample(range(52), 7) for _ in range(num_hands)]
+        treys_hands = [([TREYS_CARDS[c] for c in h[:2]], [TREYS_CARDS[c] for c in h[2:]]) for h in hands]
+
+        table = get_rank_table()
+        evaluator = Evaluator()
+
+        start = time.time()
+        table_scores = [table.evaluate7(h) for h in hands]
+        table_time = time.time() - start
+
+        start = time.time()
+        treys_scores = [evaluator.evaluate(hole, board) for hole, board in treys_hands]
+        treys_time = time.time() - start
+
+        speedup = treys_time / table_time
+
+        print(f"\n📊 Results:")
+        print(f"  Rank table: {table_time:.2f}s ({num_hands/table_time:,.0f} hands/sec)")
+        print(f"  Treys:      {treys_time:.2f}s ({num_hands/treys_time:,.0f} hands/sec)")
+        print(f"  Speedup:    {speedup:.1f}x")
+
+        assert table_scores == treys_scores, "Rank table disagrees with treys"
+        assert speedup >= 5.0, f"Rank table only {speedup:.1f}x faster than treys"
+
+        print("\n✅ PASS: Rank table matches treys and is faster")
@@ -0,0 +1,134 @@
+"""
+Compact hand-history record tests.
+
+- HandEvent, ActionRecord, BettingRound and CompletedHand are slotted (no
+  per-instance __dict__) with the same attributes and constructors
+- asdict() / deserialize_completed_hand() round-trip still works
+
+The tracemalloc benchmark (1,000 hands, slotted vs dict-backed records) is
+marked slow.
+"""
+import gc
+import pytest
+import sys
+import os
+import tracemalloc
+from dataclasses import MISSING, asdict, field, fields, make_dataclass
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import game.poker_engine as poker_engine
+from game.poker_engine import PokerGame, HandEvent, ActionRecord, BettingRound, CompletedHand
+
+RECORD_TYPES = [HandEvent, ActionRecord, BettingRound, CompletedHand]
+
+
+def make_ai_only_game(seed: int) -> PokerGame:
+    """Normal (non-headless) AI-only game, so full history is recorded."""
+    game = PokerGame("AI Player 1", ai_count=5, seed=seed)
+    game.players[0].is_human = False
+    game.players[0].personality = "Conservative"
+    return game
+
+
+def play_games(num_hands: int):
+    """Play seeded games until num_hands hands; return the games (kept alive)."""
+    games = []
+    hands = 0
+    while hands < num_hands:
+        game = make_ai_only_game(seed=len(games))
+        while hands < num_hands and sum(1 for p in game.players if p.stack > 0) >= 2:
+            game.start_new_hand()
+            hands += 1
+        games.append(game)
+    return games
+
+
+def dict_backed(cls):
+    """Same fields as cls, as a plain (per-instance __dict__) dataclass."""
+    specs = []
+    for f in fields(cls):
+        if f.default is not MISSING:
+            specs.append((f.name, f.type, field(default=f.default)))
+        elif f.default_factory is not MISSING:
+            specs.append((f.name, f.type, field(default_factory=f.default_factory)))
+        else:
+            specs.append((f.name, f.type))
+    return make_dataclass(cls.__name__, specs)
+
+
+class TestSlottedRecords:
+    """Records keep their attribute API without a per-instance dict."""
+
+    def test_no_instance_dict(self):
+        """Instances the engine builds, so a non-slotted base class would show up too."""
+        game = PokerGame("Human", ai_count=3, seed=5)
+        game.start_new_hand()
+        while game.current_player_index is not None and game.players[game.current_player_index].is_human:
+            game.submit_human_action("call")
+        hand = game.hand_history[-1]
+        records = [hand.events[0], hand.betting_rounds[0].actions[0], hand.betting_rounds[0], hand]
+        assert [type(record) for record in records] == RECORD_TYPES
+        for record in records:
+            assert not hasattr(record, "__dict__"), type(record).__name__
+
+    def test_attributes_and_defaults(self):
+        event = HandEvent(timestamp="2024-01-01T00:00:00", event_type="action", player_id="p1", action="call")
+        assert event.amount == 0 and event.reasoning == ""
+        event.amount = 20
+        assert event.amount == 20
+        with pytest.raises(AttributeError):
+            event.extra = 1
+
+    def test_round_trip_through_asdict(self):
+        from routes.analysis import deserialize_completed_hand
+
+        game = PokerGame("Human", ai_count=3, seed=5)
+        game.start_new_hand()
+        while game.current_player_index is not None and game.players[game.current_player_index].is_human:
+            game.submit_human_action("call")
+        hand = game.hand_history[-1]
+        assert hand.events and hand.betting_rounds[0].actions
+
+        rebuilt = deserialize_completed_hand(asdict(hand))
+        assert asdict(rebuilt) == asdict(hand)
+        assert isinstance(rebuilt.events[0], HandEvent)
+        assert isinstance(rebuilt.betting_rounds[0].actions[0], ActionRecord)
+
+
+@pytest.mark.slow
+class TestRecordMemory:
+    """Benchmark: memory held by 1,000 hands of history, slotted vs dict-backed."""
+
+    def test_slotted_records_use_less_memory(self, monkeypatch):
+        print("\n" + "="*60)
+        print("BENCHMARK: Hand-history memory, 1,000 hands (6 AI players)")
+        print("="*60)
+
+        def measure():
+            """Bytes still held by the games once played, and the peak while playing."""
+            tracemalloc.start()
+            games = play_games(1000)
+            held, peak = tracemalloc.get_traced_memory()
+            del games
+            gc.collect()
+            held -= tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            return held, peak
+
+        play_games(1000)  # Warm evaluator caches so they don't count against either run
+        slotted, slotted_peak = measure()
+        with monkeypatch.context() as patch:
+            for cls in RECORD_TYPES:
+                patch.setattr(poker_engine, cls.__name__, dict_backed(cls))
+            plain, plain_peak = measure()
+
+        saving = 1 - slotted / plain
+        print(f"\n📊 Results:")
+        print(f"  Dict-backed: {plain/1024:,.0f} KiB held ({plain_peak/1024:,.0f} KiB peak)")
+        print(f"  Slotted:     {slotted/1024:,.0f} KiB held ({slotted_peak/1024:,.0f} KiB peak)")
+        print(f"  Saving:      {saving:.0%}")
+
+        assert slotted < plain
+
+        print("\n✅ PASS: Slotted records reduce per-game memory")
@@ -18,6 +18,7 @@ from typing import List, Tuple
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from game.poker_engine import PokerGame, DeckManager, HandEvaluator
+from game.cards import cards_to_str
 
 
 @pytest.mark.slow
@@ -110,7 +111,7 @@ class TestCardDistribution:
             game.start_new_hand(process_ai=False)
 
             for player in game.players:
-                for card in player.hole_cards:
+                for card in cards_to_str(player.hole_cards):
                     suit = card[-1]  # Last character is suit (s, h, d, c)
                     suit_counts[suit] += 1
 
@@ -336,8 +337,8 @@ class TestDeckIntegrity:
                 f"Iteration {i+1}: Deck has duplicate cards"
 
             # Verify all ranks and suits
-            ranks = set(card[:-1] for card in deck.deck)
-            suits = set(card[-1] for card in deck.deck)
+            ranks = set(card[:-1] for card in cards_to_str(deck.deck))
+            suits = set(card[-1] for card in cards_to_str(deck.deck))
 
             assert len(ranks) == 13, f"Missing ranks: {13 - len(ranks)}"
             assert len(suits) == 4, f"Missing suits: {4 - len(suits)}"
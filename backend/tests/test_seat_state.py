@@ -0,0 +1,99 @@
+"""
+Seat mask tests (game.seat_state).
+
+- Masks follow Player flag writes and table-bet changes without a rescan
+- next_seat / first wrap around the table like the old list scans
+- Masks agree with a fresh scan after every action of many AI hands
+- Replacing game.players reseats and detaches the old players; editing it in
+  place is refused
+- The tracked fields keep their Player defaults and stay plain dict reads
+"""
+import copy
+import pickle
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from game.poker_engine import PokerGame, Player
+from game.seat_state import SeatMasks, SeatedPlayers
+
+
+def test_flag_writes_update_masks():
+    game = PokerGame("Human", ai_count=3, seed=1)
+    seats = game.seat_masks
+    game.players[2].is_active = False
+    game.players[1].all_in = True
+    game.players[3].has_acted = True
+    assert seats.active == 0b1011
+    assert seats.all_in == 0b0010
+    assert seats.acted == 0b1000
+    assert seats.can_act == 0b1001
+    assert seats.mismatches() == []
+
+
+def test_table_bet_tracks_matched():
+    game = PokerGame("Human", ai_count=2, seed=1)
+    seats = game.seat_masks
+    game.current_bet = 20
+    assert seats.matched == 0
+    game.players[0].bet(20)
+    game.players[2].current_bet = 20
+    assert seats.matched == 0b101
+    game.current_bet = 40
+    assert seats.matched == 0
+    assert seats.mismatches() == []
+
+
+def test_next_seat_wraps():
+    game = PokerGame("Human", ai_count=3, seed=1)
+    seats = game.seat_masks
+    assert seats.next_seat(0b0101, 1) == 2
+    assert seats.next_seat(0b0101, 3) == 0
+    assert seats.next_seat(0b0101, 4) == 0
+    assert seats.next_seat(0, 0) is None
+    assert SeatMasks.first(0b1100) == 2
+    assert SeatMasks.first(0) is None
+
+
+def test_masks_consistent_through_ai_hands():
+    game = PokerGame("AI Player 1", ai_count=5, headless=True, seed=7)
+    game.players[0].is_human = False
+    game.players[0].personality = "Conservative"
+    for _ in range(50):
+        if sum(1 for p in game.players if p.stack > 0) < 2:
+            break
+        game.start_new_hand()
+        assert game.seat_masks.mismatches() == []
+
+
+def test_reseating_detaches_old_players():
+    game = PokerGame("Human", ai_count=2, seed=1)
+    old = game.players[1]
+    game.players = [Player("p0", "A"), Player("p1", "B", is_active=False)]
+    assert game.seat_masks.active == 0b01
+    old.is_active = False  # No longer seated: must not touch the masks
+    assert game.seat_masks.mismatches() == []
+
+
+def test_players_not_edited_in_place():
+    game = PokerGame("Human", ai_count=2, seed=1)
+    extra = Player("p9", "Z")
+    edits = [lambda p: p.append(extra), lambda p: p.insert(0, extra), lambda p: p.pop(),
+             lambda p: p.remove(p[0]), lambda p: p.__setitem__(0, extra), lambda p: p.sort(key=id),
+             lambda p: p.__delitem__(0), lambda p: p.__iadd__([extra]), lambda p: p.clear()]
+    for edit in edits:
+        with pytest.raises(TypeError):
+            edit(game.players)
+    assert len(game.players) == 3 and game.seat_masks.mismatches() == []
+
+    players = pickle.loads(pickle.dumps(game.players))
+    assert isinstance(players, SeatedPlayers) and len(copy.deepcopy(game.players)) == 3
+
+
+def test_tracked_field_defaults():
+    player = Player("p0", "A")
+    assert (player.stack, player.is_active, player.current_bet, player.all_in, player.has_acted) == \
+        (1000, True, 0, False, False)
+    assert not hasattr(type(Player.__dict__["stack"]), "__get__")  # Reads skip the descriptor
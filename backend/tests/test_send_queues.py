@@ -0,0 +1,245 @@
+"""
+Per-connection send queue tests (ConnectionManager / ClientQueue).
+
+- Broadcasts and events only queue; a stalled client never holds up the caller
+  or the other clients
+- Queues are bounded: "coalesce" keeps events and the latest full state,
+  "resync" drops everything queued for the latest full state
+- Delta clients never see a seq gap after an overflow
+- Queue depth, drops and send latency are reported per connection
+
+The slow-client benchmark is marked slow.
+"""
+import asyncio
+import json
+import pytest
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from game.poker_engine import PokerGame
+from websocket_manager import ConnectionManager, apply_state_patch, serialize_game_state
+
+
+class StalledWebSocket:
+    """Client whose sends block until released (or take a fixed delay)."""
+
+    def __init__(self, delay: float = 0.0):
+        self.sent = []
+        self.delay = delay
+        self.released = asyncio.Event()
+        self.released.set()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text: str):
+        await self.released.wait()
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(text)
+
+    def messages(self):
+        return [json.loads(text) for text in self.sent]
+
+
+def stalled():
+    ws = StalledWebSocket()
+    ws.released.clear()
+    return ws
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def new_game(seed: int = 1) -> PokerGame:
+    game = PokerGame("Human", ai_count=3, seed=seed)
+    game.start_new_hand()
+    return game
+
+
+async def change(manager: ConnectionManager, game: PokerGame, event: bool = False):
+    """A visible state change, broadcast (optionally after an ai_action event)."""
+    game.pot += 1
+    game.state_version += 1
+    if event:
+        await manager.send_event("g", {"type": "ai_action", "data": {"pot_after": game.pot}})
+    await manager.broadcast_state("g", game)
+
+
+class TestQueues:
+
+    def test_stalled_client_does_not_block(self):
+        async def run():
+            manager = ConnectionManager()
+            slow, fast = stalled(), StalledWebSocket()
+            await manager.connect("g", slow)
+            await manager.connect("g", fast)
+            game = new_game()
+
+            start = time.perf_counter()
+            for _ in range(10):
+                await change(manager, game, event=True)
+            assert time.perf_counter() - start < 0.5
+            await settle()
+            assert len(fast.sent) == 20 and slow.sent == []
+
+            slow.released.set()
+            await manager.flush()
+            assert slow.sent == fast.sent
+        asyncio.run(run())
+
+    def test_coalesce_keeps_events_and_latest_state(self):
+        async def run():
+            manager = ConnectionManager(queue_size=4, overflow_policy="coalesce")
+            ws = stalled()
+            await manager.connect("g", ws)
+            game = new_game()
+            for _ in range(6):
+                await change(manager, game, event=True)
+            ws.released.set()
+            await manager.flush()
+
+            messages = ws.messages()
+            assert len(messages) <= 4
+            assert messages[-1] == {"type": "state_update", "data": serialize_game_state(game)}
+            assert [m["type"] for m in messages[:-1]] == ["ai_action"] * (len(messages) - 1)
+            assert messages[-2]["data"]["pot_after"] == game.pot
+            assert manager.stats.overflows > 0
+            assert manager.stats.frames_dropped == 12 - len(messages)
+        asyncio.run(run())
+
+    def test_resync_drops_queue_for_latest_state(self):
+        async def run():
+            manager = ConnectionManager(queue_size=4, overflow_policy="resync")
+            ws = stalled()
+            await manager.connect("g", ws)
+            game = new_game()
+            for _ in range(5):
+                await change(manager, game, event=False)
+            metrics = manager.broadcast_metrics()["connections"][0]
+            ws.released.set()
+            await manager.flush()
+
+            # 5th state overflowed the queue of 4 and replaced it
+            assert metrics["depth"] == 1 and metrics["dropped"] == 4 and metrics["max_depth"] == 4
+            assert ws.messages() == [{"type": "state_update", "data": serialize_game_state(game)}]
+        asyncio.run(run())
+
+    @pytest.mark.parametrize("policy", ["coalesce", "resync"])
+    def test_delta_client_has_no_gap_after_overflow(self, policy):
+        async def run():
+            manager = ConnectionManager(queue_size=3, overflow_policy=policy)
+            ws = stalled()
+            await manager.connect("g", ws, delta=True)
+            game = new_game()
+            await manager.broadcast_state("g", game)
+            for i in range(7):
+                await change(manager, game, event=i % 2 == 0)
+            ws.released.set()
+            await manager.flush()
+            for _ in range(2):  # Patches after the overflow continue from its snapshot
+                await change(manager, game)
+            await manager.flush()
+
+            state, seq = None, 0
+            for message in ws.messages():
+                if message["type"] == "state_snapshot":
+                    state, seq = message["data"], message["seq"]
+                elif message["type"] == "state_patch":
+                    assert message["seq"] == seq + 1
+                    state, seq = apply_state_patch(state, message["data"]), message["seq"]
+            assert state == serialize_game_state(game)
+        asyncio.run(run())
+
+    def test_latency_metrics(self):
+        async def run():
+            manager = ConnectionManager()
+            ws = StalledWebSocket(delay=0.005)
+            await manager.connect("g", ws)
+            game = new_game()
+            for _ in range(3):
+                await change(manager, game)
+            await manager.flush()
+            return manager.broadcast_metrics()
+
+        metrics = asyncio.run(run())
+        [connection] = metrics["connections"]
+        assert connection["sent"] == 3 and connection["depth"] == 0
+        assert connection["max_send_ms"] >= 5 * 2  # Third message waited behind two sends
+        assert 5 <= connection["avg_send_ms"] <= connection["max_send_ms"]
+        assert metrics["overflow_policy"] == "coalesce"
+
+    def test_queue_dropped_on_disconnect(self):
+        async def run():
+            manager = ConnectionManager()
+            ws = stalled()
+            await manager.connect("g", ws)
+            await change(manager, new_game())
+            manager.disconnect("g", ws)
+            ws.released.set()
+            await settle()
+            assert ws.sent == [] and manager.broadcast_metrics()["connections"] == []
+        asyncio.run(run())
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            ConnectionManager(overflow_policy="block")
+        with pytest.raises(ValueError):
+            ConnectionManager(queue_size=1)
+
+
+@pytest.mark.slow
+class TestSlowClientBenchmark:
+    """Benchmark: broadcast loop time with one client taking 5 ms per message."""
+
+    def test_benchmark_slow_client(self):
+        print("\n" + "="*60)
+        print("BENCHMARK: 40 AI actions, 1 slow + 2 fast clients")
+        print("="*60)
+
+        actions = 40
+
+        async def sequential():
+            """Previous behaviour: each send awaited in turn."""
+            sockets = [StalledWebSocket(delay=0.005), StalledWebSocket(), StalledWebSocket()]
+            game = new_game()
+            start = time.perf_counter()
+            for _ in range(actions):
+                game.pot += 1
+                for ws in sockets:
+                    await ws.send_text(json.dumps({"type": "ai_action", "data": {"pot_after": game.pot}}))
+                    await ws.send_text(json.dumps({"type": "state_update", "data": serialize_game_state(game)}))
+            return time.perf_counter() - start
+
+        async def queued():
+            manager = ConnectionManager()
+            slow = StalledWebSocket(delay=0.005)
+            for ws in (slow, StalledWebSocket(), StalledWebSocket()):
+                await manager.connect("g", ws)
+            game = new_game()
+            start = time.perf_counter()
+            for _ in range(actions):
+                await change(manager, game, event=True)
+                await asyncio.sleep(0)
+            elapsed = time.perf_counter() - start
+            await manager.flush()
+            return elapsed, manager.broadcast_metrics()
+
+        before = asyncio.run(sequential())
+        after, metrics = asyncio.run(queued())
+        slow = metrics["connections"][0]
+
+        print(f"\n📊 Results:")
+        print(f"  Sequential sends:   {before * 1000:7.1f} ms for {actions} actions")
+        print(f"  Per-client queues:  {after * 1000:7.1f} ms for {actions} actions")
+        print(f"  Slow client: max depth {slow['max_depth']}, dropped {slow['dropped']}, "
+              f"send latency avg {slow['avg_send_ms']:.1f} ms / max {slow['max_send_ms']:.1f} ms")
+
+        assert after < before / 5, "Slow client still holds up the game loop"
+
+        print("\n✅ PASS: The game loop no longer waits on the slowest client")
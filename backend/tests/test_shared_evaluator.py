@@ -0,0 +1,186 @@
+"""
+Shared hand evaluator tests (game.hand_evaluator.get_hand_evaluator / warm_up).
+
+- One evaluator per process, used by every game and by AI decisions
+- Racing threads on first use still build exactly one
+- Pickling (process pools) carries no tables and resolves to the receiver's evaluator
+- warm_up() reports per-step startup cost
+
+The cold-start benchmark (import + warm-up + first decision) and the
+per-decision vs shared evaluator throughput benchmark are marked slow.
+"""
+import json
+import pickle
+import pytest
+import subprocess
+import sys
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from treys import Evaluator
+
+import game.ai_strategy as ai_strategy
+import game.hand_evaluator as hand_evaluator
+import game.poker_engine as poker_engine
+from game.hand_evaluator import HandEvaluator, get_hand_evaluator, warm_up
+from game.ai_strategy import AIStrategy
+from game.poker_engine import PokerGame
+
+BACKEND_DIR = os.path.join(os.path.dirname(__file__), '..')
+
+
+def score(hole_cards, community_cards):
+    return get_hand_evaluator().evaluate_hand(hole_cards, community_cards)
+
+
+class TestSharing:
+
+    def test_games_share_one_evaluator(self):
+        games = [PokerGame("Human", ai_count=3, seed=seed) for seed in range(3)]
+        assert all(game.hand_evaluator is get_hand_evaluator() for game in games)
+        assert games[0].clone().hand_evaluator is get_hand_evaluator()
+
+    def test_one_treys_evaluator(self):
+        assert HandEvaluator().evaluator is get_hand_evaluator().evaluator is hand_evaluator.get_treys_evaluator()
+
+    def test_ai_decisions_use_shared_evaluator(self, monkeypatch):
+        constructed = []
+        monkeypatch.setattr(HandEvaluator, "__init__",
+                            lambda self: constructed.append(self))
+        AIStrategy.make_decision_with_reasoning("Conservative", ["Ah", "Kd"], ["2c", "7h", "9s"],
+                                                20, 40, 1000, 0, 10)
+        assert constructed == []
+
+    def test_concurrent_first_use_builds_once(self, monkeypatch):
+        monkeypatch.setattr(hand_evaluator, "_shared_evaluator", None)
+        barrier = threading.Barrier(8)
+        results = []
+
+        def first_use():
+            barrier.wait()
+            results.append(get_hand_evaluator())
+
+        threads = [threading.Thread(target=first_use) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(results) == 8 and all(result is results[0] for result in results)
+
+    def test_warm_up_reports_steps(self):
+        timings = warm_up()
+        assert set(timings) == {"treys", "rank_table", "equity_engine", "preflop_table", "evaluator", "total"}
+        assert timings["total"] == pytest.approx(sum(v for k, v in timings.items() if k != "total"))
+
+
+class TestPickling:
+
+    def test_evaluator_pickles_to_shared_instance(self):
+        data = pickle.dumps(get_hand_evaluator())
+        assert len(data) < 200
+        assert pickle.loads(data) is get_hand_evaluator()
+
+    def test_game_pickles(self):
+        game = PokerGame("Human", ai_count=3, seed=4)
+        game.start_new_hand()
+        copy = pickle.loads(pickle.dumps(game))
+        assert copy.hand_evaluator is game.hand_evaluator
+        assert [p.stack for p in copy.players] == [p.stack for p in game.players]
+        assert copy.seat_masks.mismatches() == []
+
+    def test_process_pool(self):
+        hands = [(["Ah", "Kh"], ["Qh", "Jh", "Th", "2c", "3d"]),
+                 (["7s", "2d"], ["9c", "Jd", "4h", "5s", "Kc"])]
+        with ProcessPoolExecutor(max_workers=2, initializer=warm_up) as pool:
+            remote = list(pool.map(score, *zip(*hands)))
+        assert remote == [score(*hand) for hand in hands]
+
+
+@pytest.mark.slow
+class TestColdStartBenchmark:
+    """Benchmark: import and warm-up cost in a fresh process, and first-decision latency."""
+
+    def test_benchmark_cold_start(self):
+        print("\n" + "="*60)
+        print("BENCHMARK: evaluator startup cost (fresh process)")
+        print("="*60)
+
+        script = (
+            "import json, time\n"
+            "start = time.perf_counter()\n"
+            "import game.hand_evaluator as he\n"
+            "from game.ai_strategy import AIStrategy\n"
+            "imported = (time.perf_counter() - start) * 1000\n"
+            "def decide():\n"
+            "    start = time.perf_counter()\n"
+            "    AIStrategy.make_decision_with_reasoning('Conservative', ['Ah', 'Kd'], ['2c', '7h', '9s'],"
+            " 20, 40, 1000, 0, 10)\n"
+            "    return (time.perf_counter() - start) * 1000\n"
+            "mode = __import__('sys').argv[1]\n"
+            "timings = he.warm_up() if mode == 'warm' else {}\n"
+            "print(json.dumps({'import': imported, 'warm_up': timings, 'first': decide(), 'second': decide()}))\n"
+        )
+
+        def run(mode):
+            out = subprocess.run([sys.executable, "-c", script, mode], cwd=BACKEND_DIR,
+                                 capture_output=True, text=True, check=True).stdout
+            return json.loads(out.strip().splitlines()[-1])
+
+        cold, warm = run("cold"), run("warm")
+
+        print(f"\n📊 Results:")
+        print(f"  Import (engine modules):       {warm['import']:6.1f} ms")
+        for name, ms in warm["warm_up"].items():
+            print(f"  warm_up {name:<22} {ms:6.1f} ms")
+        print(f"  First AI decision, no warm-up: {cold['first']:6.1f} ms")
+        print(f"  First AI decision, warmed:     {warm['first']:6.1f} ms")
+        print(f"  Steady-state AI decision:      {warm['second']:6.1f} ms")
+
+        assert warm["first"] < cold["first"], "Warm-up did not take the table loading off the first decision"
+
+        print("\n✅ PASS: Evaluator tables load once at startup, not on a player's first decision")
+
+
+@pytest.mark.slow
+class TestSharedEvaluatorBenchmark:
+    """Benchmark: test_performance.py throughput loop, an evaluator per decision vs the shared one."""
+
+    def test_benchmark_shared_vs_per_decision(self, monkeypatch):
+        print("\n" + "="*60)
+        print("BENCHMARK: hands/second, evaluator per decision vs shared")
+        print("="*60)
+
+        duration = 3.0
+
+        def throughput_loop():
+            """Same loop as test_performance.py::test_hands_per_second_throughput."""
+            hands = 0
+            start = time.time()
+            while time.time() - start < duration:
+                game = PokerGame("TestPlayer", ai_count=3)
+                game.start_new_hand(process_ai=True)
+                hands += 1
+            return hands / (time.time() - start)
+
+        with monkeypatch.context() as m:
+            # Before sharing: every game and AI decision built a HandEvaluator,
+            # each generating treys' lookup tables
+            m.setattr(hand_evaluator, "get_treys_evaluator", Evaluator)
+            m.setattr(ai_strategy, "get_hand_evaluator", HandEvaluator)
+            m.setattr(poker_engine, "get_hand_evaluator", HandEvaluator)
+            per_decision = throughput_loop()
+        warm_up()
+        shared = throughput_loop()
+
+        print(f"\n📊 Results:")
+        print(f"  Evaluator per decision: {per_decision:8,.0f} hands/sec")
+        print(f"  Shared evaluator:       {shared:8,.0f} hands/sec")
+        print(f"  Speedup:                {shared / per_decision:8.0f}x")
+
+        assert shared >= 10 * per_decision, "Sharing the evaluator is not an order of magnitude faster"
+
+        print("\n✅ PASS: One evaluator per process, not one per decision")
@@ -0,0 +1,170 @@
+"""
+Showdown summary tests (PokerGame.showdown_summary).
+
+- Built once per hand from the awarded pots and their scores; nothing re-scores hands
+- Participants sorted best hand first, with the same ranks/cards as the hand history
+- None for fold wins and before showdown; reset by the next hand
+- Immutable, and carried through snapshot/restore
+
+The broadcast-at-showdown benchmark is marked slow.
+"""
+import dataclasses
+import pytest
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from game.poker_engine import PokerGame, GameState
+from websocket_manager import serialize_game_state
+
+
+def play_to_showdown(seed: int, min_participants: int = 2) -> PokerGame:
+    """Game stopped right after a hand that went to showdown with min_participants hands revealed."""
+    game = PokerGame("Human", ai_count=3, seed=seed)
+    for _ in range(200):
+        game.start_new_hand()
+        for _ in range(20):
+            index = game.current_player_index
+            if index is None or not game.players[index].is_human:
+                break
+            game.submit_human_action("call")
+        summary = game.showdown_summary
+        if summary and len(summary.participants) >= min_participants:
+            return game
+    raise AssertionError("No showdown reached")
+
+
+@pytest.fixture
+def count_evaluations(monkeypatch):
+    """Count HandEvaluator.evaluate_hand calls made by a game's evaluator."""
+    def install(game: PokerGame):
+        calls = []
+        evaluate = game.hand_evaluator.evaluate_hand
+        monkeypatch.setattr(game.hand_evaluator, "evaluate_hand",
+                            lambda *args, **kwargs: calls.append(args) or evaluate(*args, **kwargs))
+        return calls
+    return install
+
+
+class TestSummary:
+
+    @pytest.mark.parametrize("seed", [1, 3, 5])
+    def test_matches_hand_history(self, seed):
+        game = play_to_showdown(seed)
+        summary = game.showdown_summary
+        hand = game.last_hand_summary
+
+        assert summary.hand_number == hand.hand_number == game.hand_count
+        assert summary.showdown_hands() == hand.showdown_hands
+        assert summary.hand_rankings() == hand.hand_rankings
+        scores = [h.score for h in summary.participants]
+        assert scores == sorted(scores)
+        assert sum(pot.amount for pot in summary.pots) == hand.pot_size
+        assert {w for pot in summary.pots for w in pot.winner_ids} == set(hand.winner_ids)
+
+    def test_same_object_every_read(self):
+        game = play_to_showdown(2)
+        assert game.showdown_summary is game.showdown_summary
+
+    def test_immutable(self):
+        summary = play_to_showdown(2).showdown_summary
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            summary.participants = ()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            summary.participants[0].score = 0
+
+    def test_none_without_showdown(self):
+        game = PokerGame("Human", ai_count=3, seed=1)
+        assert game.showdown_summary is None
+        for _ in range(50):
+            game.start_new_hand()
+            human = next(i for i, p in enumerate(game.players) if p.is_human)
+            if game.current_player_index == human:
+                assert game.showdown_summary is None  # Mid-hand
+                game.submit_human_action("fold")
+            if game.current_state == GameState.SHOWDOWN and not game.last_hand_summary.showdown_hands:
+                assert game.showdown_summary is None  # Won by folds
+                return
+        pytest.fail("No fold win in 50 hands")
+
+    def test_reset_by_next_hand(self):
+        game = play_to_showdown(4)
+        game.start_new_hand()
+        summary = game.showdown_summary
+        assert summary is None or summary.hand_number == game.hand_count
+
+    def test_survives_snapshot_restore(self):
+        game = play_to_showdown(6)
+        snapshot = game.snapshot()
+        summary = game.showdown_summary
+        game.start_new_hand()
+        game.restore(snapshot)
+        assert game.showdown_summary is summary
+
+
+class TestSerializers:
+
+    def test_broadcasts_do_not_rescore(self, count_evaluations):
+        game = play_to_showdown(3)
+        game.showdown_summary
+        calls = count_evaluations(game)
+        first = serialize_game_state(game, show_ai_thinking=True)
+        for _ in range(5):
+            assert serialize_game_state(game, show_ai_thinking=True) == first
+        assert calls == []
+
+    def test_showdown_hands_sorted_from_summary(self):
+        game = play_to_showdown(5)
+        info = serialize_game_state(game)["winner_info"]
+        summary = game.showdown_summary
+        assert [h["player_id"] for h in info["all_showdown_hands"]] == \
+            [h.player_id for h in summary.participants]
+        assert all(h["hole_cards"] == list(summary.hand(h["player_id"]).hole_cards)
+                   for h in info["all_showdown_hands"])
+        revealed = {h.player_id for h in summary.participants}
+        assert {p["player_id"] for p in info["folded_players"]} == \
+            {p.player_id for p in game.players} - revealed
+
+    def test_headless_builds_only_on_read(self, count_evaluations):
+        game = PokerGame("AI Player 1", ai_count=3, seed=8, headless=True)
+        game.players[0].is_human = False
+        game.players[0].personality = "Conservative"
+        for _ in range(20):
+            game.start_new_hand()
+            if game._showdown_pots and len(game._showdown_scores) >= 2:
+                assert game._showdown_summary is None
+                calls = count_evaluations(game)
+                summary = game.showdown_summary
+                assert len(summary.participants) == len(game._showdown_scores)
+                assert calls == []  # Reuses the scores from pot resolution
+                return
+        pytest.skip("No showdown in 20 hands")
+
+
+@pytest.mark.slow
+class TestShowdownSummaryBenchmark:
+    """Benchmark: state broadcast cost while a hand sits at SHOWDOWN."""
+
+    def test_benchmark_showdown_broadcast(self, count_evaluations):
+        print("\n" + "="*60)
+        print("BENCHMARK: serialize_game_state at SHOWDOWN")
+        print("="*60)
+
+        broadcasts = 5_000
+        game = play_to_showdown(11, min_participants=2)
+        calls = count_evaluations(game)
+
+        start = time.perf_counter()
+        for _ in range(broadcasts):
+            serialize_game_state(game, show_ai_thinking=True)
+        per_broadcast = (time.perf_counter() - start) / broadcasts * 1e6
+
+        print(f"\n📊 Results ({len(game.showdown_summary.participants)} hands revealed):")
+        print(f"  serialize_game_state: {per_broadcast:.1f} µs/broadcast")
+        print(f"  Hand evaluations:     {len(calls)} in {broadcasts:,} broadcasts")
+
+        assert calls == [], "Broadcasts re-scored showdown hands"
+
+        print("\n✅ PASS: Showdown hands are scored once per hand, not per broadcast")
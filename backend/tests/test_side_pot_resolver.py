@@ -0,0 +1,173 @@
+"""
+Single-pass side pot resolution tests (HandEvaluator.resolve_pots).
+
+- Same pots (amounts, winners, types, eligibility) as the per-layer resolver it
+  replaced, over random tables with folds, all-ins and ties
+- Every live hand is scored exactly once, however many side pots there are
+- Player investments are never mutated
+
+The 6-player / 5 all-in levels benchmark is marked slow.
+"""
+import random
+import pytest
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from game.hand_evaluator import HandEvaluator
+from game.poker_engine import Player
+
+
+def layered_side_pots(evaluator, players, community_cards):
+    """The previous resolver: re-scores every eligible hand in every layer."""
+    eligible_winners = [p for p in players if p.is_active or p.all_in]
+    all_players_with_investment = [p for p in players if p.total_invested > 0]
+    total_pot = sum(p.total_invested for p in all_players_with_investment)
+
+    if len(eligible_winners) <= 1:
+        if not eligible_winners:
+            return []
+        return [{'winners': [eligible_winners[0].player_id], 'amount': total_pot, 'type': 'main',
+                 'eligible_player_ids': [p.player_id for p in eligible_winners]}]
+
+    if len({p.total_invested for p in eligible_winners}) == 1:
+        hands = {p.player_id: evaluator.evaluate_hand(p.hole_cards, community_cards)[0]
+                 for p in eligible_winners if p.hole_cards}
+        if hands:
+            best = min(hands.values())
+            return [{'winners': [pid for pid, score in hands.items() if score == best],
+                     'amount': total_pot, 'type': 'main',
+                     'eligible_player_ids': [p.player_id for p in eligible_winners]}]
+
+    investments = {p.player_id: p.total_invested for p in all_players_with_investment}
+    pots = []
+    while investments:
+        min_investment = min(inv for inv in investments.values() if inv > 0)
+        pot_amount = 0
+        eligible_for_pot = []
+        for player in all_players_with_investment:
+            if player.player_id not in investments:
+                continue
+            contribution = min(investments[player.player_id], min_investment)
+            pot_amount += contribution
+            investments[player.player_id] -= contribution
+            if contribution > 0 and player in eligible_winners:
+                eligible_for_pot.append(player)
+        if eligible_for_pot:
+            hands = {p.player_id: evaluator.evaluate_hand(p.hole_cards, community_cards)[0]
+                     for p in eligible_for_pot if p.hole_cards}
+            if hands:
+                best = min(hands.values())
+                pots.append({'winners': [pid for pid, score in hands.items() if score == best],
+                             'amount': pot_amount,
+                             'type': 'main' if len(pots) == 0 else f'side_{len(pots)}',
+                             'eligible_player_ids': [p.player_id for p in eligible_for_pot]})
+        investments = {pid: inv for pid, inv in investments.items() if inv > 0}
+    return pots
+
+
+def random_table(rng: random.Random, num_players: int = 6):
+    """Players with random investments, folds and all-ins, and a full board."""
+    deck = list(range(52))
+    rng.shuffle(deck)
+    community = deck[:5]
+    levels = [rng.choice([10, 20, 40, 80, 160, 320]) for _ in range(num_players)]
+    players = []
+    for i in range(num_players):
+        player = Player(f"p{i}", f"P{i}", stack=rng.choice([0, 100]), total_invested=levels[i],
+                        hole_cards=deck[5 + 2 * i:7 + 2 * i])
+        player.all_in = player.stack == 0
+        player.is_active = rng.random() > 0.3
+        players.append(player)
+    if rng.random() < 0.2:  # Chopped board: several players share the best hand
+        for player in players[1:3]:
+            player.hole_cards = list(players[0].hole_cards)
+    return players, community
+
+
+def six_way_all_in(seed: int):
+    """6 players, 5 distinct all-in levels, one caller covering everyone."""
+    rng = random.Random(seed)
+    deck = list(range(52))
+    rng.shuffle(deck)
+    levels = [50, 120, 200, 350, 500, 500]
+    players = [Player(f"p{i}", f"P{i}", stack=0 if i < 5 else 500, total_invested=level,
+                      hole_cards=deck[5 + 2 * i:7 + 2 * i], all_in=i < 5)
+               for i, level in enumerate(levels)]
+    return players, deck[:5]
+
+
+@pytest.fixture(scope="module")
+def evaluator():
+    return HandEvaluator()
+
+
+class TestResolver:
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_layered_resolver(self, evaluator, seed):
+        rng = random.Random(seed)
+        for _ in range(300):
+            players, community = random_table(rng, num_players=rng.randint(2, 6))
+            assert evaluator.determine_winners_with_side_pots(players, community) == \
+                layered_side_pots(evaluator, players, community)
+
+    def test_scores_each_hand_once(self, evaluator, monkeypatch):
+        players, community = six_way_all_in(seed=1)
+        calls = []
+        evaluate = evaluator.evaluate_hand
+        monkeypatch.setattr(evaluator, "evaluate_hand",
+                            lambda *args, **kwargs: calls.append(args) or evaluate(*args, **kwargs))
+
+        pots, hands = evaluator.resolve_pots(players, community)
+        assert len(pots) == 5
+        assert len(calls) == 6
+        assert set(hands) == {p.player_id for p in players}
+
+    def test_pots_sum_to_investments(self, evaluator):
+        players, community = six_way_all_in(seed=2)
+        pots = evaluator.determine_winners_with_side_pots(players, community)
+        assert sum(pot['amount'] for pot in pots) == sum(p.total_invested for p in players)
+        assert [pot['type'] for pot in pots] == ['main', 'side_1', 'side_2', 'side_3', 'side_4']
+        assert [len(pot['eligible_player_ids']) for pot in pots] == [6, 5, 4, 3, 2]
+
+    def test_investments_untouched(self, evaluator):
+        players, community = six_way_all_in(seed=3)
+        before = [p.total_invested for p in players]
+        evaluator.resolve_pots(players, community)
+        evaluator.resolve_pots(players, community)
+        assert [p.total_invested for p in players] == before
+
+
+@pytest.mark.slow
+class TestResolverBenchmark:
+    """Benchmark: side pot resolution, 6 players with 5 distinct all-in levels."""
+
+    def test_benchmark_six_way_all_in(self, evaluator):
+        print("\n" + "="*60)
+        print("BENCHMARK: side pots, 6 players, 5 all-in levels")
+        print("="*60)
+
+        tables = [six_way_all_in(seed) for seed in range(2_000)]
+
+        def per_table_us(resolve):
+            for players, community in tables:  # Warm the evaluation cache for both
+                resolve(players, community)
+            start = time.perf_counter()
+            for players, community in tables:
+                resolve(players, community)
+            return (time.perf_counter() - start) / len(tables) * 1e6
+
+        layered = per_table_us(lambda players, community: layered_side_pots(evaluator, players, community))
+        single_pass = per_table_us(evaluator.determine_winners_with_side_pots)
+
+        print(f"\n📊 Results ({len(tables):,} tables):")
+        print(f"  Per-layer resolver:  {layered:6.1f} µs/showdown (20 hand scores)")
+        print(f"  Single pass:         {single_pass:6.1f} µs/showdown (6 hand scores)")
+        print(f"  Speedup:             {layered / single_pass:.1f}x")
+
+        assert single_pass < layered, "Single-pass resolver not faster"
+
+        print("\n✅ PASS: Side pots resolved in one pass with each hand scored once")
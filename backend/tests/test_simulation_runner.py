@@ -0,0 +1,182 @@
+"""
+Multi-process simulation runner tests.
+
+- Per-game seeding: same totals for any worker count and game order
+- Stats merge and checkpoint round-trip
+- Interrupted + resumed run matches an uninterrupted one
+- Crashes and chip violations are reported, not raised
+
+The scaling benchmark (1 worker vs all cores) is marked slow (nightly).
+"""
+import pytest
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import game.simulation as simulation
+from game.simulation import (
+    GameResult, SimulationStats, Checkpoint, game_seed, play_game, run_games, run_simulation, main
+)
+
+
+class TestDeterminism:
+    """Results depend only on (base seed, game number)."""
+
+    def test_game_seed_is_stable(self):
+        assert game_seed(42, 7) == game_seed(42, 7)
+        assert game_seed(42, 7) != game_seed(42, 8)
+        assert game_seed(42, 7) != game_seed(43, 7)
+
+    def test_same_game_same_result(self):
+        first = play_game(3, base_seed=11)
+        second = play_game(3, base_seed=11)
+        first.duration = second.duration = 0.0
+        assert first == second
+        assert first.completed
+        assert first.hands > 0
+
+    def test_worker_count_does_not_change_totals(self):
+        serial = run_simulation(12, base_seed=5, workers=1)
+        parallel = run_simulation(12, base_seed=5, workers=3)
+        serial.total_duration = parallel.total_duration = 0.0
+        serial.errors.sort()
+        parallel.errors.sort()
+        assert serial == parallel
+        assert serial.games_played == 12
+
+    def test_fixed_player_count(self):
+        results = list(run_games(range(4), base_seed=1, player_count=6))
+        assert {r.player_count for r in results} == {6}
+
+
+class TestStats:
+    """Merging per-game results."""
+
+    def test_merge_counts(self):
+        stats = SimulationStats()
+        stats.merge(GameResult(game_num=0, seed=1, player_count=3, completed=True, hands=40, actions=150,
+                               allin_hands=3, side_pot_hands=1, showdown_hands=8, fold_victories=32))
+        stats.merge(GameResult(game_num=1, seed=2, player_count=3, hands=10, actions=30,
+                               chip_violation=True, error="RuntimeError: CHIP CONSERVATION VIOLATED"))
+        stats.merge(GameResult(game_num=2, seed=3, player_count=4, hands=200, infinite_loop=True))
+
+        assert stats.games_completed == 1
+        assert stats.games_crashed == 1
+        assert stats.games_unfinished == 1
+        assert stats.total_hands == 250
+        assert stats.min_hands == 10 and stats.max_hands == 200
+        assert stats.chip_violations == 1
+        assert stats.infinite_loop_hits == 1
+        assert stats.side_pot_scenarios == 1
+        assert stats.player_count_distribution == {3: 2, 4: 1}
+        assert "CHIP CONSERVATION" in stats.report()
+
+    def test_scenarios_add_up(self):
+        result = play_game(0, base_seed=99, player_count=6)
+        assert result.showdown_hands + result.fold_victories == result.hands
+        assert result.side_pot_hands <= result.showdown_hands
+        assert result.actions >= result.hands
+
+    def test_crash_is_reported_not_raised(self, monkeypatch):
+        def broken_game(player_count, seed=None):
+            raise RuntimeError("🚨 CHIP CONSERVATION VIOLATED after test")
+        monkeypatch.setattr(simulation, "create_ai_only_game", broken_game)
+        result = play_game(0, base_seed=1)
+        assert result.error is not None
+        assert result.chip_violation
+        assert not result.completed
+
+
+class TestCheckpoint:
+    """Resumable runs."""
+
+    def test_round_trip(self, tmp_path):
+        path = str(tmp_path / "sim.json")
+        config = {"games": 3, "seed": 1, "players": None, "max_hands": 200}
+        checkpoint = Checkpoint(path, config)
+        for result in run_games(range(3), base_seed=1):
+            checkpoint.record(result)
+        checkpoint.save()
+
+        loaded = Checkpoint.load(path, config)
+        assert loaded.completed == {0, 1, 2}
+        assert loaded.stats == checkpoint.stats
+
+    def test_config_mismatch_rejected(self, tmp_path):
+        path = str(tmp_path / "sim.json")
+        Checkpoint(path, {"games": 3, "seed": 1, "players": None, "max_hands": 200}).save()
+        with pytest.raises(ValueError):
+            Checkpoint.load(path, {"games": 3, "seed": 2, "players": None, "max_hands": 200})
+
+    def test_resume_matches_uninterrupted_run(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "sim.json")
+        full = run_simulation(10, base_seed=3, workers=1)
+
+        # Interrupt after 4 games
+        real_play_game = simulation.play_game
+        played = []
+
+        def interrupting_play_game(*args):
+            if len(played) == 4:
+                raise KeyboardInterrupt
+            played.append(args[0])
+            return real_play_game(*args)
+
+        monkeypatch.setattr(simulation, "play_game", interrupting_play_game)
+        with pytest.raises(KeyboardInterrupt):
+            run_simulation(10, base_seed=3, workers=1, checkpoint_path=path, checkpoint_every=1)
+        monkeypatch.setattr(simulation, "play_game", real_play_game)
+
+        partial = Checkpoint.load(path, {"games": 10, "seed": 3, "players": None, "max_hands": 200})
+        assert partial.completed == {0, 1, 2, 3}
+
+        resumed = run_simulation(10, base_seed=3, workers=1, checkpoint_path=path, resume=True)
+        resumed.total_duration = full.total_duration = 0.0
+        assert resumed == full
+
+    def test_cli(self, tmp_path, capsys):
+        path = str(tmp_path / "sim.json")
+        exit_code = main(["--games", "3", "--workers", "1", "--seed", "4", "--checkpoint", path])
+        assert exit_code == 0
+        assert "SIMULATION SUMMARY" in capsys.readouterr().out
+        assert os.path.exists(path)
+
+
+@pytest.mark.slow
+class TestSimulationScaling:
+    """Benchmark: process pool throughput vs a single worker."""
+
+    def test_scales_with_cores(self):
+        cores = os.cpu_count() or 1
+        if cores < 2:
+            pytest.skip("needs at least 2 cores")
+
+        print("\n" + "="*60)
+        print(f"BENCHMARK: Simulation runner, 1 worker vs {cores} workers")
+        print("="*60)
+
+        num_games = 50 * cores
+
+        start = time.time()
+        serial = run_simulation(num_games, base_seed=2024, workers=1)
+        serial_time = time.time() - start
+
+        start = time.time()
+        parallel = run_simulation(num_games, base_seed=2024, workers=cores)
+        parallel_time = time.time() - start
+
+        speedup = serial_time / parallel_time
+        efficiency = speedup / cores
+
+        print(f"\n📊 Results ({num_games} games, {serial.total_hands} hands):")
+        print(f"  1 worker:   {serial_time:.2f}s ({serial.total_hands/serial_time:,.0f} hands/sec)")
+        print(f"  {cores} workers: {parallel_time:.2f}s ({parallel.total_hands/parallel_time:,.0f} hands/sec)")
+        print(f"  Speedup:    {speedup:.1f}x ({efficiency:.0%} of linear)")
+
+        assert parallel.total_hands == serial.total_hands
+        assert serial.games_crashed == 0 and serial.chip_violations == 0
+        assert efficiency >= 0.6, f"Only {efficiency:.0%} of linear scaling"
+
+        print("\n✅ PASS: Simulation runner scales with cores")
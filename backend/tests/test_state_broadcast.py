@@ -0,0 +1,195 @@
+"""
+Versioned, serialize-once state broadcast tests (ConnectionManager).
+
+- Every state-changing engine call bumps PokerGame.state_version
+- A state is serialized and encoded once per (version, show_ai_thinking), then
+  the same text goes to every connection
+- Broadcasting a version the clients already have is skipped and counted;
+  new connections and explicit requests (force) still get it
+- Events are encoded once for all connections
+
+The broadcast cost benchmark is marked slow.
+"""
+import asyncio
+import json
+import pytest
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from conftest import FakeWebSocket, deliver
+from game.poker_engine import PokerGame
+from websocket_manager import ConnectionManager, serialize_game_state
+
+
+def human_turn_game(seed: int = 1) -> PokerGame:
+    game = PokerGame("Human", ai_count=3, seed=seed)
+    game.start_new_hand()
+    return game
+
+
+def connected(manager: ConnectionManager, game_id: str, count: int):
+    sockets = [FakeWebSocket() for _ in range(count)]
+    for ws in sockets:
+        asyncio.run(manager.connect(game_id, ws))
+    return sockets
+
+
+class TestStateVersion:
+
+    def test_engine_calls_bump_version(self):
+        game = PokerGame("Human", ai_count=3, seed=2)
+        versions = [game.state_version]
+        game.start_new_hand()
+        versions.append(game.state_version)
+        if game.current_player_index is not None and game.players[game.current_player_index].is_human:
+            game.submit_human_action("call")
+            versions.append(game.state_version)
+        assert versions == sorted(set(versions))
+
+    def test_restore_moves_forward(self):
+        game = human_turn_game()
+        snapshot = game.snapshot()
+        before = game.state_version
+        game.restore(snapshot)
+        assert game.state_version > before
+
+    def test_serialized_state_carries_version(self):
+        game = human_turn_game()
+        assert serialize_game_state(game)["state_version"] == game.state_version
+
+
+class TestBroadcast:
+
+    def test_serialized_once_for_all_connections(self):
+        manager = ConnectionManager()
+        game = human_turn_game()
+        sockets = connected(manager, "g", 3)
+
+        deliver(manager, manager.broadcast_state("g", game))
+        assert manager.stats.serialized == 1
+        texts = {ws.sent[-1] for ws in sockets}
+        assert len(texts) == 1
+        message = json.loads(texts.pop())
+        assert message == {"type": "state_update", "data": serialize_game_state(game)}
+
+    def test_unchanged_version_skipped(self):
+        manager = ConnectionManager()
+        game = human_turn_game()
+        [ws] = connected(manager, "g", 1)
+
+        for _ in range(4):
+            deliver(manager, manager.broadcast_state("g", game))
+        assert len(ws.sent) == 1
+        assert manager.stats.skipped == 3 and manager.stats.serialized == 1
+
+        game.submit_human_action("call", process_ai=False)
+        deliver(manager, manager.broadcast_state("g", game))
+        assert len(ws.sent) == 2
+        assert ws.messages()[-1]["data"]["state_version"] == game.state_version
+
+    def test_thinking_flag_is_separate_state(self):
+        manager = ConnectionManager()
+        game = human_turn_game()
+        [ws] = connected(manager, "g", 1)
+
+        deliver(manager, manager.broadcast_state("g", game, show_ai_thinking=False))
+        deliver(manager, manager.broadcast_state("g", game, show_ai_thinking=True))
+        deliver(manager, manager.broadcast_state("g", game, show_ai_thinking=False))
+        assert len(ws.sent) == 3
+        assert manager.stats.serialized == 2 and manager.stats.cache_hits == 1
+
+    def test_new_connection_and_force_get_state(self):
+        manager = ConnectionManager()
+        game = human_turn_game()
+        [first] = connected(manager, "g", 1)
+        deliver(manager, manager.broadcast_state("g", game))
+
+        [second] = connected(manager, "g", 1)
+        deliver(manager, manager.broadcast_state("g", game))
+        assert len(second.sent) == 1
+
+        deliver(manager, manager.broadcast_state("g", game, force=True))
+        assert len(second.sent) == 2
+        assert manager.stats.serialized == 1
+
+    def test_replaced_game_object_not_served_from_cache(self):
+        manager = ConnectionManager()
+        [ws] = connected(manager, "g", 1)
+        game = human_turn_game(seed=1)
+        deliver(manager, manager.broadcast_state("g", game))
+
+        other = human_turn_game(seed=2)
+        other.state_version = game.state_version
+        deliver(manager, manager.broadcast_state("g", other))
+        assert len(ws.sent) == 2
+        assert ws.messages()[-1]["data"] == serialize_game_state(other)
+
+    def test_events_encoded_once_and_dead_sockets_dropped(self):
+        manager = ConnectionManager()
+        sockets = connected(manager, "g", 2)
+        dead = FakeWebSocket(fail=True)
+        asyncio.run(manager.connect("g", dead))
+
+        deliver(manager, manager.send_event("g", {"type": "ai_action", "data": {"reasoning": "Bluff ✓"}}))
+        assert sockets[0].sent == sockets[1].sent == ['{"type":"ai_action","data":{"reasoning":"Bluff ✓"}}']
+        assert dead not in manager.active_connections["g"]
+
+    def test_cache_dropped_with_last_connection(self):
+        manager = ConnectionManager()
+        game = human_turn_game()
+        [ws] = connected(manager, "g", 1)
+        deliver(manager, manager.broadcast_state("g", game))
+        manager.disconnect("g", ws)
+        assert manager.broadcast_metrics()["cached_states"] == 0
+
+
+@pytest.mark.slow
+class TestBroadcastBenchmark:
+    """Benchmark: per-broadcast cost with 3 connections, changed vs unchanged state."""
+
+    def test_benchmark_broadcast(self):
+        print("\n" + "="*60)
+        print("BENCHMARK: state broadcast, 3 connections")
+        print("="*60)
+
+        broadcasts = 2_000
+        game = human_turn_game()
+
+        async def per_send_json(count):
+            sockets = [FakeWebSocket() for _ in range(3)]
+            start = time.perf_counter()
+            for _ in range(count):
+                message = {"type": "state_update", "data": serialize_game_state(game)}
+                for ws in sockets:
+                    await ws.send_text(json.dumps(message, separators=(",", ":"), ensure_ascii=False))
+            return (time.perf_counter() - start) / count * 1e6
+
+        async def per_broadcast(count, changed):
+            manager = ConnectionManager()
+            for _ in range(3):
+                await manager.connect("g", FakeWebSocket())
+            start = time.perf_counter()
+            for _ in range(count):
+                if changed:
+                    game.state_version += 1
+                await manager.broadcast_state("g", game)
+                await manager.flush()
+            return (time.perf_counter() - start) / count * 1e6, manager.stats
+
+        baseline = asyncio.run(per_send_json(broadcasts))
+        changed, _ = asyncio.run(per_broadcast(broadcasts, changed=True))
+        unchanged, stats = asyncio.run(per_broadcast(broadcasts, changed=False))
+
+        print(f"\n📊 Results ({broadcasts:,} broadcasts):")
+        print(f"  Serialize + send_json per socket: {baseline:6.1f} µs/broadcast")
+        print(f"  Versioned, state changed:         {changed:6.1f} µs/broadcast")
+        print(f"  Versioned, state unchanged:       {unchanged:6.1f} µs/broadcast "
+              f"({stats.skipped:,} skipped)")
+
+        assert changed < baseline, "Encoding once is not cheaper than per-socket encoding"
+        assert unchanged < changed / 5, "Skipping unchanged broadcasts is not cheap"
+
+        print("\n✅ PASS: Each state version is serialized once and never re-sent")
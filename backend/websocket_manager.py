@@ -4,10 +4,16 @@ Phase 1: WebSocket infrastructure for smooth AI turn visibility
 Phase 8: Thread-safe game action processing (concurrency & race conditions)
 """
 from fastapi import WebSocket, WebSocketDisconnect
-from typing import Dict, Any, Callable, Awaitable
+from typing import Dict, Any, Callable, Awaitable, Deque, List, Optional, Tuple
+from dataclasses import dataclass, asdict
+from collections import deque
 import json
 import asyncio
-from game.poker_engine import PokerGame, GameState, Player, AIStrategy, HandEvaluator
+import os
+import time
+from game.poker_engine import PokerGame, GameState, Player
+from game.cards import cards_to_str
+from ai_executor import ai_executor
 
 
 class ThreadSafeGameManager:
@@ -59,17 +65,232 @@ class ThreadSafeGameManager:
             print(f"[ThreadSafe] Cleaned up lock for game {game_id}")
 
 
+def encode_message(message: Dict[str, Any]) -> str:
+    """JSON text of a message, as WebSocket.send_json() would encode it."""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+def diff_state(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Patch from one serialize_game_state() result to the next, holding only the
+    top-level fields that changed. "players" is patched per seat as
+    {seat_index: {changed fields}} (the whole list if the seat count changed)
+    and "human_player" per field; any other changed field is replaced whole.
+    """
+    patch = {}
+    for key, value in new.items():
+        if key in old and old[key] == value:
+            continue
+        previous = old.get(key)
+        if key == "players" and isinstance(previous, list) and len(previous) == len(value):
+            patch[key] = {str(seat): _changed_fields(before, after)
+                          for seat, (before, after) in enumerate(zip(previous, value))
+                          if before != after}
+        elif key == "human_player" and isinstance(previous, dict):
+            patch[key] = _changed_fields(previous, value)
+        else:
+            patch[key] = value
+    return patch
+
+
+def _changed_fields(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in new.items() if key not in old or old[key] != value}
+
+
+def apply_state_patch(state: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """The state a diff_state() patch leads to (what delta clients do; state is not modified)."""
+    state = dict(state)
+    for key, value in patch.items():
+        if key == "players" and isinstance(value, dict):
+            players = list(state["players"])
+            for seat, fields in value.items():
+                players[int(seat)] = {**players[int(seat)], **fields}
+            state["players"] = players
+        elif key == "human_player":
+            state["human_player"] = {**state["human_player"], **value}
+        else:
+            state[key] = value
+    return state
+
+
+# Messages a connection may have queued before the overflow policy applies
+SEND_QUEUE_SIZE = int(os.getenv("WS_SEND_QUEUE_SIZE", "64"))
+# What a full queue does with a slow client:
+# - "coalesce": keep queued events, replace queued states with the latest full state
+# - "resync": drop everything queued and send the latest full state
+OVERFLOW_POLICIES = ("coalesce", "resync")
+OVERFLOW_POLICY = os.getenv("WS_OVERFLOW_POLICY", "coalesce")
+
+
+@dataclass
+class BroadcastStats:
+    """State broadcast counters (all games)."""
+    broadcasts: int = 0  # broadcast_state() calls
+    serialized: int = 0  # States serialized (serialize_game_state calls)
+    cache_hits: int = 0  # Serialized state reused for another broadcast
+    skipped: int = 0  # Broadcasts of a version every client already has
+    frames_sent: int = 0  # Messages written to sockets (all types)
+    chars_sent: int = 0  # Total length of those messages
+    snapshots_sent: int = 0  # Full states sent to delta clients
+    patches_sent: int = 0  # Patches sent to delta clients
+    overflows: int = 0  # Times a connection's send queue was full
+    frames_dropped: int = 0  # Queued messages discarded by the overflow policy
+
+
+@dataclass
+class CachedState:
+    """A game's serialized state at one state_version; the message text is encoded on first use."""
+    game: PokerGame
+    version: int
+    data: Dict[str, Any]
+    text: Optional[str] = None
+
+
+@dataclass
+class DeltaStream:
+    """
+    The state a game's delta clients were last sent, numbered by seq (1, 2, ...
+    one per change). Encoded messages are built once and shared by all clients.
+    """
+    seq: int
+    data: Dict[str, Any]
+    patch: Optional[str] = None  # state_patch message from seq - 1 to seq
+    snapshot: Optional[str] = None  # state_snapshot message at seq
+
+
+class ClientQueue:
+    """
+    Bounded outbound queue of one connection, drained by its own writer task, so
+    a slow client never holds up the game loop or the other clients.
+
+    Items are (text, full_state, queued_at). State messages carry full_state, a
+    callable returning the full state message they stand for; the overflow
+    policy sends that in place of the states (or patches) it drops.
+    """
+
+    def __init__(self, manager: "ConnectionManager", game_id: str, websocket: WebSocket,
+                 maxsize: int, policy: str):
+        self.manager = manager
+        self.game_id = game_id
+        self.websocket = websocket
+        self.maxsize = maxsize
+        self.policy = policy
+        self.items: Deque[Tuple[str, Optional[Callable[[], str]], float]] = deque()
+        self.closed = False
+        self._writer: Optional[asyncio.Task] = None
+        self.max_depth = 0
+        self.sent = 0
+        self.dropped = 0
+        self.overflows = 0
+        self.latency_total = 0.0  # Seconds from put() to send_text() returning
+        self.latency_max = 0.0
+
+    def put(self, text: str, full_state: Optional[Callable[[], str]] = None):
+        """Queue a message without waiting for the network (call from the event loop)."""
+        if self.closed:
+            return
+        if len(self.items) >= self.maxsize:
+            self._overflow(text, full_state)
+        else:
+            self.items.append((text, full_state, time.perf_counter()))
+        self.max_depth = max(self.max_depth, len(self.items))
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._drain())
+
+    def _overflow(self, text: str, full_state: Optional[Callable[[], str]]):
+        queued = len(self.items) + 1
+        latest = full_state or next((item[1] for item in reversed(self.items) if item[1]), None)
+        events = [item for item in self.items if item[1] is None] if self.policy == "coalesce" else []
+        room = self.maxsize - 2  # Leave space for the latest state and a new event
+        now = time.perf_counter()
+        self.items = deque(events[max(0, len(events) - room):])
+        if latest is not None:
+            self.items.append((latest(), latest, now))
+        if full_state is None:
+            self.items.append((text, None, now))
+        self.overflows += 1
+        self.dropped += queued - len(self.items)
+        self.manager.stats.overflows += 1
+        self.manager.stats.frames_dropped += queued - len(self.items)
+
+    async def _drain(self):
+        while self.items and not self.closed:
+            text, _, queued_at = self.items.popleft()
+            try:
+                await self.websocket.send_text(text)
+            except Exception as e:
+                print(f"[WebSocket] Error sending to game {self.game_id}: {e}")
+                self.manager.disconnect(self.game_id, self.websocket)
+                return
+            latency = time.perf_counter() - queued_at
+            self.sent += 1
+            self.latency_total += latency
+            self.latency_max = max(self.latency_max, latency)
+            self.manager.stats.frames_sent += 1
+            self.manager.stats.chars_sent += len(text)
+
+    async def flush(self):
+        """Wait until everything queued so far has been written."""
+        while self._writer is not None and not self._writer.done():
+            await self._writer
+
+    def close(self):
+        self.closed = True
+        self.items.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "game_id": self.game_id,
+            "depth": len(self.items),
+            "max_depth": self.max_depth,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "overflows": self.overflows,
+            "avg_send_ms": self.latency_total / self.sent * 1000 if self.sent else 0.0,
+            "max_send_ms": self.latency_max * 1000,
+        }
+
+
 class ConnectionManager:
-    """Manages WebSocket connections for active games"""
+    """
+    Manages WebSocket connections for active games.
 
-    def __init__(self):
+    Clients use one of two protocols for game state, chosen when they connect:
+    - full (default): every change is a state_update with the whole state
+    - delta: a state_snapshot {"seq", "data"} first, then state_patch
+      {"seq", "data": diff_state() patch} messages with consecutive seq.
+      A client that sees a gap in seq sends "resync" and gets a new snapshot.
+
+    Messages are queued per connection (see ClientQueue); sending never waits on
+    the network.
+    """
+
+    def __init__(self, queue_size: int = SEND_QUEUE_SIZE, overflow_policy: str = OVERFLOW_POLICY):
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow_policy must be one of {OVERFLOW_POLICIES}, got {overflow_policy!r}")
+        if queue_size < 2:
+            raise ValueError(f"queue_size must be at least 2, got {queue_size}")
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
         # Store active connections: {game_id: List[WebSocket]} - Phase 8: Support multiple connections
         self.active_connections: Dict[str, List[WebSocket]] = {}
         # Store step mode state: {game_id: continue_event}
         self.step_mode_events: Dict[str, asyncio.Event] = {}
-
-    async def connect(self, game_id: str, websocket: WebSocket):
-        """Accept a new WebSocket connection for a game"""
+        # Serialized state per (game_id, show_ai_thinking)
+        self._state_cache: Dict[Tuple[str, bool], CachedState] = {}
+        # Last state every connection got: {game_id: (game, state_version, show_ai_thinking)}
+        self._last_broadcast: Dict[str, Tuple[PokerGame, int, bool]] = {}
+        # Delta protocol: seq of the state each delta client holds (0 = none yet)
+        self.delta_clients: Dict[WebSocket, int] = {}
+        # show_ai_thinking each connection last asked for (see ai_thinking())
+        self._show_ai_thinking: Dict[WebSocket, bool] = {}
+        self._delta_streams: Dict[str, DeltaStream] = {}
+        # Outbound queue of every connection
+        self._queues: Dict[WebSocket, ClientQueue] = {}
+        self.stats = BroadcastStats()
+
+    async def connect(self, game_id: str, websocket: WebSocket, delta: bool = False):
+        """Accept a new WebSocket connection for a game (delta: use the delta state protocol)"""
         await websocket.accept()
 
         # Phase 8: Support multiple WebSocket connections per game
@@ -77,6 +298,10 @@ class ConnectionManager:
             self.active_connections[game_id] = []
 
         self.active_connections[game_id].append(websocket)
+        self._queues[websocket] = ClientQueue(self, game_id, websocket, self.queue_size, self.overflow_policy)
+        if delta:
+            self.delta_clients[websocket] = 0
+        self._last_broadcast.pop(game_id, None)  # The new client has no state yet
         connection_count = len(self.active_connections[game_id])
         print(f"[WebSocket] Client connected to game {game_id} (total connections: {connection_count})")
 
@@ -87,6 +312,7 @@ class ConnectionManager:
                 # Phase 8: Remove specific websocket from list
                 try:
                     self.active_connections[game_id].remove(websocket)
+                    self._drop_client(websocket)
                     remaining = len(self.active_connections[game_id])
                     print(f"[WebSocket] Client disconnected from game {game_id} (remaining: {remaining})")
 
@@ -97,12 +323,42 @@ class ConnectionManager:
                     pass  # WebSocket not in list
             else:
                 # Legacy behavior: remove all connections
-                del self.active_connections[game_id]
+                for ws in self.active_connections.pop(game_id):
+                    self._drop_client(ws)
                 print(f"[WebSocket] All clients disconnected from game {game_id}")
 
-        # Clean up step mode event if exists and no more connections
-        if game_id not in self.active_connections and game_id in self.step_mode_events:
-            del self.step_mode_events[game_id]
+        # Clean up step mode event and cached state if no more connections
+        if game_id not in self.active_connections:
+            self.step_mode_events.pop(game_id, None)
+            self._forget_state(game_id)
+
+    def _drop_client(self, websocket: WebSocket):
+        self.delta_clients.pop(websocket, None)
+        self._show_ai_thinking.pop(websocket, None)
+        queue = self._queues.pop(websocket, None)
+        if queue is not None:
+            queue.close()
+
+    def _forget_state(self, game_id: str):
+        self._last_broadcast.pop(game_id, None)
+        self._delta_streams.pop(game_id, None)
+        for show_ai_thinking in (False, True):
+            self._state_cache.pop((game_id, show_ai_thinking), None)
+
+    def ai_thinking(self, websocket: WebSocket, message: Dict[str, Any]) -> bool:
+        """
+        show_ai_thinking for a client message: the message's own value, remembered
+        for the connection, or the connection's last one if the message has none
+        (e.g. a resync), so a snapshot never drops the reasoning the client shows.
+        """
+        if "show_ai_thinking" in message:
+            self._show_ai_thinking[websocket] = bool(message["show_ai_thinking"])
+        return self._show_ai_thinking.get(websocket, False)
+
+    def resync(self, websocket: WebSocket):
+        """Make a delta client's next state message a full snapshot (after a seq gap)."""
+        if websocket in self.delta_clients:
+            self.delta_clients[websocket] = 0
 
     def signal_continue(self, game_id: str):
         """Signal that user wants to continue to next AI action"""
@@ -111,28 +367,114 @@ class ConnectionManager:
             print(f"[WebSocket] Continue signal received for game {game_id}")
 
     async def send_event(self, game_id: str, event: Dict[str, Any]):
-        """Send an event to all WebSocket connections for a game"""
+        """Queue an event for all WebSocket connections of a game"""
         if game_id in self.active_connections:
-            # Phase 8: Send to ALL connections for this game
-            dead_connections = []
-            for ws in self.active_connections[game_id]:
-                try:
-                    await ws.send_json(event)
-                except Exception as e:
-                    print(f"[WebSocket] Error sending to game {game_id}: {e}")
-                    dead_connections.append(ws)
-
-            # Clean up dead connections
-            for ws in dead_connections:
-                self.disconnect(game_id, ws)
-
-    async def broadcast_state(self, game_id: str, game: PokerGame, show_ai_thinking: bool = False):
-        """Broadcast current game state to connected client"""
-        state_data = serialize_game_state(game, show_ai_thinking)
-        await self.send_event(game_id, {
-            "type": "state_update",
-            "data": state_data
-        })
+            await self._send_text(game_id, encode_message(event))
+
+    async def _send_text(self, game_id: str, text: str):
+        """Queue one encoded message for every connection of a game."""
+        # Phase 8: Send to ALL connections for this game
+        for ws in self.active_connections.get(game_id, ()):
+            self._queues[ws].put(text)
+
+    async def flush(self, game_id: Optional[str] = None):
+        """Wait until the queued messages of a game's connections (or all) are written."""
+        queues = [q for q in list(self._queues.values()) if game_id is None or q.game_id == game_id]
+        for queue in queues:
+            await queue.flush()
+
+    def _cached_state(self, game_id: str, game: PokerGame, show_ai_thinking: bool) -> CachedState:
+        key = (game_id, show_ai_thinking)
+        cached = self._state_cache.get(key)
+        if cached is not None and cached.game is game and cached.version == game.state_version:
+            self.stats.cache_hits += 1
+            return cached
+        cached = CachedState(game, game.state_version, serialize_game_state(game, show_ai_thinking))
+        self._state_cache[key] = cached
+        self.stats.serialized += 1
+        return cached
+
+    def encoded_state(self, game_id: str, game: PokerGame, show_ai_thinking: bool = False) -> str:
+        """
+        The state_update message for the game's current state_version, serialized
+        and encoded once and reused until the game changes.
+        """
+        return self._state_text(self._cached_state(game_id, game, show_ai_thinking))
+
+    @staticmethod
+    def _state_text(cached: CachedState) -> str:
+        if cached.text is None:
+            cached.text = encode_message({"type": "state_update", "data": cached.data})
+        return cached.text
+
+    def _advance_stream(self, game_id: str, data: Dict[str, Any]) -> DeltaStream:
+        """Move the game's delta stream to data, numbering it only if something changed."""
+        stream = self._delta_streams.get(game_id)
+        if stream is None:
+            stream = DeltaStream(1, data)
+        elif stream.data is not data:
+            patch = diff_state(stream.data, data)
+            if patch:
+                seq = stream.seq + 1
+                stream = DeltaStream(seq, data, patch=encode_message(
+                    {"type": "state_patch", "seq": seq, "data": patch}))
+        self._delta_streams[game_id] = stream
+        return stream
+
+    def _delta_frame(self, ws: WebSocket, stream: DeltaStream) -> Optional[str]:
+        """The message that brings a delta client to stream.seq (None if it is there)."""
+        held = self.delta_clients[ws]
+        self.delta_clients[ws] = stream.seq
+        if held == stream.seq:
+            return None
+        if held == stream.seq - 1 and stream.patch is not None:
+            self.stats.patches_sent += 1
+            return stream.patch
+        self.stats.snapshots_sent += 1
+        return self._snapshot_text(stream)
+
+    @staticmethod
+    def _snapshot_text(stream: DeltaStream) -> str:
+        if stream.snapshot is None:
+            stream.snapshot = encode_message({"type": "state_snapshot", "seq": stream.seq, "data": stream.data})
+        return stream.snapshot
+
+    async def broadcast_state(self, game_id: str, game: PokerGame, show_ai_thinking: bool = False,
+                              force: bool = False):
+        """
+        Queue current game state for connected clients. Skipped if they already
+        have this state_version (unless force, e.g. a client asked for it).
+        Delta clients get a patch, or a snapshot if they do not hold the previous seq.
+        """
+        if game_id not in self.active_connections:
+            return
+        self.stats.broadcasts += 1
+        current = (game, game.state_version, show_ai_thinking)
+        last = self._last_broadcast.get(game_id)
+        if not force and last is not None and last[0] is game and last[1:] == current[1:]:
+            self.stats.skipped += 1
+            return
+        self._last_broadcast[game_id] = current
+        cached = self._cached_state(game_id, game, show_ai_thinking)
+        full_state = lambda: self._state_text(cached)
+        stream = None
+        for ws in self.active_connections[game_id]:
+            if ws not in self.delta_clients:
+                self._queues[ws].put(full_state(), full_state)
+                continue
+            if stream is None:
+                stream = self._advance_stream(game_id, cached.data)
+                snapshot = lambda: self._snapshot_text(stream)
+            text = self._delta_frame(ws, stream)
+            if text is not None:
+                self._queues[ws].put(text, snapshot)
+
+    def broadcast_metrics(self) -> Dict[str, Any]:
+        """Broadcast counters, what the caches hold, and each connection's send queue."""
+        return {**asdict(self.stats), "cached_states": len(self._state_cache),
+                "delta_clients": len(self.delta_clients),
+                "overflow_policy": self.overflow_policy, "queue_size": self.queue_size,
+                "connections": [queue.metrics() for queue in self._queues.values()]}
 
 
 # Global connection manager instance
@@ -162,7 +504,7 @@ def serialize_game_state(game: PokerGame, show_ai_thinking: bool = False) -> Dic
             "all_in": player.all_in,
             "is_human": player.is_human,
             "personality": player.personality if not player.is_human else None,
-            "hole_cards": player.hole_cards if (player.is_human or game.current_state == GameState.SHOWDOWN) else []
+            "hole_cards": cards_to_str(player.hole_cards) if (player.is_human or game.current_state == GameState.SHOWDOWN) else []
         }
         players_data.append(player_data)
 
@@ -172,7 +514,7 @@ def serialize_game_state(game: PokerGame, show_ai_thinking: bool = False) -> Dic
         "name": human_player.name,
         "stack": human_player.stack,
         "current_bet": human_player.current_bet,
-        "hole_cards": human_player.hole_cards,
+        "hole_cards": cards_to_str(human_player.hole_cards),
         "is_active": human_player.is_active,
         "is_human": True,
         "is_current_turn": game.get_current_player() == human_player if game.get_current_player() else False
@@ -209,9 +551,9 @@ def serialize_game_state(game: PokerGame, show_ai_thinking: bool = False) -> Dic
 
     if has_pot_award:
         # Determine if this is a showdown or fold win
-        # Showdown happened if there are showdown_hands recorded (not just based on game state)
-        is_showdown = (game.last_hand_summary is not None and
-                      len(game.last_hand_summary.showdown_hands) > 0)
+        # Showdown happened if hands were revealed (scored once per hand by the engine)
+        showdown = game.showdown_summary
+        is_showdown = showdown is not None and len(showdown.participants) > 0
 
         # Collect ALL pot_award events (not just the first one!)
         winners = []
@@ -219,12 +561,13 @@ def serialize_game_state(game: PokerGame, show_ai_thinking: bool = False) -> Dic
             if event.event_type == "pot_award":
                 winner = next((p for p in game.players if p.player_id == event.player_id), None)
                 if winner:
-                    # Get hand rank and hole cards from last_hand_summary (only at showdown)
+                    # Get hand rank and hole cards from the showdown summary (only at showdown)
                     hand_rank = None
                     hole_cards = []
-                    if is_showdown and game.last_hand_summary:
-                        hand_rank = game.last_hand_summary.hand_rankings.get(winner.player_id)
-                        hole_cards = game.last_hand_summary.showdown_hands.get(winner.player_id, [])
+                    revealed = showdown.hand(winner.player_id) if is_showdown else None
+                    if revealed:
+                        hand_rank = revealed.hand_rank
+                        hole_cards = list(revealed.hole_cards)
 
                     winners.append({
                         "player_id": winner.player_id,
@@ -242,55 +585,33 @@ def serialize_game_state(game: PokerGame, show_ai_thinking: bool = False) -> Dic
         all_showdown_hands = []
         folded_players = []
 
-        if is_showdown and game.last_hand_summary:
-            # Get showdown participants (players who revealed cards)
-            evaluator = HandEvaluator()
-            showdown_participants = []
+        if is_showdown:
+            # Showdown participants, already sorted by hand strength (best first)
+            amounts_won = {}
+            for w in winners:
+                amounts_won.setdefault(w["player_id"], w["amount"])
+            players_by_id = {p.player_id: p for p in game.players}
+
+            for revealed in showdown.participants:
+                player = players_by_id[revealed.player_id]
+                all_showdown_hands.append({
+                    "player_id": player.player_id,
+                    "name": player.name,
+                    "hand_rank": revealed.hand_rank,
+                    "hole_cards": list(revealed.hole_cards),
+                    "amount_won": amounts_won.get(player.player_id, 0),
+                    "is_human": player.is_human
+                })
 
+            # Players who folded - don't show cards
             for player in game.players:
-                if player.player_id in game.last_hand_summary.showdown_hands:
-                    # This player went to showdown
-                    hole_cards = game.last_hand_summary.showdown_hands[player.player_id]
-                    hand_rank = game.last_hand_summary.hand_rankings.get(player.player_id, "Unknown")
-
-                    # Calculate score for ranking
-                    score = 9999  # Default high score
-                    if hole_cards and game.community_cards:
-                        score, _ = evaluator.evaluate_hand(hole_cards, game.community_cards)
-
-                    # Find amount won (if any)
-                    amount_won = 0
-                    for w in winners:
-                        if w["player_id"] == player.player_id:
-                            amount_won = w["amount"]
-                            break
-
-                    showdown_participants.append({
-                        "player_id": player.player_id,
-                        "name": player.name,
-                        "hand_rank": hand_rank,
-                        "hole_cards": hole_cards,
-                        "amount_won": amount_won,
-                        "is_human": player.is_human,
-                        "score": score  # For sorting (lower is better in Treys)
-                    })
-                else:
-                    # This player folded - don't show cards
+                if showdown.hand(player.player_id) is None:
                     folded_players.append({
                         "player_id": player.player_id,
                         "name": player.name,
                         "is_human": player.is_human
                     })
 
-            # Sort by hand strength (lower score = better hand)
-            showdown_participants.sort(key=lambda x: x["score"])
-
-            # Remove score from final output (internal use only)
-            for participant in showdown_participants:
-                del participant["score"]
-
-            all_showdown_hands = showdown_participants
-
         # Return as list if multiple winners, single dict if only one
         # Add showdown data to the response
         if len(winners) > 1:
@@ -316,7 +637,7 @@ def serialize_game_state(game: PokerGame, show_ai_thinking: bool = False) -> Dic
         "pot": game.pot,
         "current_bet": game.current_bet,
         "players": players_data,
-        "community_cards": game.community_cards,
+        "community_cards": cards_to_str(game.community_cards),
         "current_player_index": game.current_player_index,
         "human_player": human_data,
         "last_ai_decisions": ai_decisions_data,
@@ -327,11 +648,62 @@ def serialize_game_state(game: PokerGame, show_ai_thinking: bool = False) -> Dic
         "dealer_position": dealer_position,
         "small_blind_position": sb_position,
         "big_blind_position": bb_position,
-        "last_raise_amount": game.last_raise_amount  # Issue #2: Minimum raise tracking
+        "last_raise_amount": game.last_raise_amount,  # Issue #2: Minimum raise tracking
+        "state_version": game.state_version  # Increases with every change to the game
     }
 
 
-async def process_ai_turns_with_events(game: PokerGame, game_id: str, show_ai_thinking: bool = False, step_mode: bool = False):
+# Pause after each AI action so players can follow it (server-side sleep, or timeline offset)
+AI_ACTION_DELAY_MS = 500
+
+
+class AITimeline:
+    """
+    AI actions resolved without pausing, sent as one ai_timeline message for the
+    client to play back. Each entry has its display offset and a diff_state()
+    patch from the entry before it (the first from the state at base_version).
+    """
+
+    def __init__(self, game: PokerGame, show_ai_thinking: bool = False):
+        self.game = game
+        self.show_ai_thinking = show_ai_thinking
+        self.base_version = game.state_version
+        self.entries: List[Dict[str, Any]] = []
+        self.actions = 0
+        self._state = serialize_game_state(game, show_ai_thinking)
+
+    def _add(self, entry_type: str, data: Dict[str, Any]):
+        state = serialize_game_state(self.game, self.show_ai_thinking)
+        self.entries.append({
+            "offset_ms": self.actions * AI_ACTION_DELAY_MS,
+            "type": entry_type,
+            "data": data,
+            "patch": diff_state(self._state, state)
+        })
+        self._state = state
+
+    def add_action(self, action: Dict[str, Any]):
+        """An AI action (the ai_action event data), shown for AI_ACTION_DELAY_MS."""
+        self._add("ai_action", action)
+        self.actions += 1
+
+    def add_street(self):
+        """The game advanced to its current street."""
+        self._add("street", {"state": self.game.current_state.value})
+
+    def message(self) -> Dict[str, Any]:
+        return {
+            "type": "ai_timeline",
+            "data": {
+                "base_version": self.base_version,
+                "entries": self.entries,
+                "duration_ms": self.actions * AI_ACTION_DELAY_MS
+            }
+        }
+
+
+async def process_ai_turns_with_events(game: PokerGame, game_id: str, show_ai_thinking: bool = False,
+                                       step_mode: bool = False, timeline: bool = False):
     """
     Process AI turns one-by-one and emit events for each action.
     This is the key function that enables smooth turn-by-turn gameplay!
@@ -341,7 +713,23 @@ async def process_ai_turns_with_events(game: PokerGame, game_id: str, show_ai_th
         game_id: Game identifier
         show_ai_thinking: Whether to include AI reasoning in events
         step_mode: If True, pause after each AI action and wait for user to continue (UAT-1 fix)
+        timeline: If True (and not step_mode), resolve every AI action up to the human's
+            next decision without pausing and send them as one ai_timeline message,
+            followed by the resulting state; the client paces the playback
     """
+    if timeline and not step_mode:
+        batch = AITimeline(game, show_ai_thinking)
+        await _process_ai_turns(game, game_id, show_ai_thinking, False, batch)
+        if batch.entries:
+            await manager.send_event(game_id, batch.message())
+        await manager.broadcast_state(game_id, game, show_ai_thinking)
+        return
+    await _process_ai_turns(game, game_id, show_ai_thinking, step_mode, None)
+
+
+async def _process_ai_turns(game: PokerGame, game_id: str, show_ai_thinking: bool, step_mode: bool,
+                            timeline: Optional[AITimeline]):
+    """process_ai_turns_with_events() for one betting round onwards (timeline: record, don't send)."""
     import time
     start_time = time.time()
     print(f"[WebSocket] ====== Processing AI turns for game {game_id} (step_mode={step_mode}, state={game.current_state.value}) ======")
@@ -392,28 +780,15 @@ async def process_ai_turns_with_events(game: PokerGame, game_id: str, show_ai_th
 
         # Skip inactive, all-in, or already-acted players
         if not current_player.is_active or current_player.all_in or current_player.has_acted:
-            game.current_player_index = game._get_next_active_player_index(
-                game.current_player_index + 1
-            )
+            game.advance_turn()
             continue
 
         action_start = time.time()
         print(f"[WebSocket] >>> AI turn #{len([p for p in game.players if not p.is_human and not p.is_active]) + 1}: {current_player.name} (player_index={game.current_player_index})")
 
-        # Get AI decision
-        decision = AIStrategy.make_decision_with_reasoning(
-            current_player.personality,
-            current_player.hole_cards,
-            game.community_cards,
-            game.current_bet,
-            game.pot,
-            current_player.stack,
-            current_player.current_bet,
-            game.big_blind
-        )
-
-        # Store decision
-        game.last_ai_decisions[current_player.player_id] = decision
+        # Get AI decision (stored in game.last_ai_decisions, drawn from the game's RNG),
+        # computed by the configured executor so a pool keeps it off the event loop
+        decision = await ai_executor.decide(game, game.current_player_index)
 
         # Use apply_action() - SINGLE SOURCE OF TRUTH for action processing
         # This fixes all the divergence bugs (raise accounting, last_raiser_index, has_acted)
@@ -441,52 +816,53 @@ async def process_ai_turns_with_events(game: PokerGame, game_id: str, show_ai_th
             )
 
             # Emit fallback action event
-            await manager.send_event(game_id, {
-                "type": "ai_action",
-                "data": {
-                    "player_id": current_player.player_id,
-                    "player_name": current_player.name,
-                    "action": "fold",
-                    "amount": 0,
-                    "reasoning": f"[FORCED FOLD] {decision.action} failed validation" if show_ai_thinking else None,
-                    "stack_after": current_player.stack,
-                    "pot_after": game.pot,
-                    "bet_amount": 0
-                }
-            })
+            fold_action = {
+                "player_id": current_player.player_id,
+                "player_name": current_player.name,
+                "action": "fold",
+                "amount": 0,
+                "reasoning": f"[FORCED FOLD] {decision.action} failed validation" if show_ai_thinking else None,
+                "stack_after": current_player.stack,
+                "pot_after": game.pot,
+                "bet_amount": 0
+            }
+            if timeline is not None:
+                timeline.add_action(fold_action)
+            else:
+                await manager.send_event(game_id, {"type": "ai_action", "data": fold_action})
 
-            # Broadcast updated state
-            await manager.broadcast_state(game_id, game, show_ai_thinking)
+                # Broadcast updated state
+                await manager.broadcast_state(game_id, game, show_ai_thinking)
 
             # Check if fallback fold triggered showdown
             if game.current_player_index is None or fallback_result["triggers_showdown"]:
                 break
 
             # Move to next player
-            game.current_player_index = game._get_next_active_player_index(
-                game.current_player_index + 1
-            )
+            game.advance_turn()
 
             # Continue to next iteration (skip normal action processing)
             continue
 
         # Emit AI action event (only if action succeeded)
-        await manager.send_event(game_id, {
-            "type": "ai_action",
-            "data": {
-                "player_id": current_player.player_id,
-                "player_name": current_player.name,
-                "action": decision.action,
-                "amount": decision.amount,
-                "reasoning": decision.reasoning if show_ai_thinking else None,
-                "stack_after": current_player.stack,
-                "pot_after": game.pot,
-                "bet_amount": result["bet_amount"]
-            }
-        })
+        ai_action = {
+            "player_id": current_player.player_id,
+            "player_name": current_player.name,
+            "action": decision.action,
+            "amount": decision.amount,
+            "reasoning": decision.reasoning if show_ai_thinking else None,
+            "stack_after": current_player.stack,
+            "pot_after": game.pot,
+            "bet_amount": result["bet_amount"]
+        }
+        if timeline is not None:
+            # Timeline mode: the client shows the action for AI_ACTION_DELAY_MS
+            timeline.add_action(ai_action)
+        else:
+            await manager.send_event(game_id, {"type": "ai_action", "data": ai_action})
 
-        # Broadcast updated state
-        await manager.broadcast_state(game_id, game, show_ai_thinking)
+            # Broadcast updated state
+            await manager.broadcast_state(game_id, game, show_ai_thinking)
 
         # STEP MODE: Pause IMMEDIATELY after AI action (no delay first!)
         if step_mode:
@@ -530,9 +906,9 @@ async def process_ai_turns_with_events(game: PokerGame, game_id: str, show_ai_th
                     }
                 })
                 print(f"[WebSocket] 📤 Sent 'auto_resumed' event after timeout")
-        else:
-            # Non-step mode: Small delay for better UX visibility
-            await asyncio.sleep(0.5)
+        elif timeline is None:
+            # Non-step mode: Small delay for better UX visibility (timeline mode: client-side)
+            await asyncio.sleep(AI_ACTION_DELAY_MS / 1000)
 
         # Check if action triggered showdown (e.g., all others folded)
         # apply_action() sets current_player_index = None when hand is complete
@@ -540,9 +916,7 @@ async def process_ai_turns_with_events(game: PokerGame, game_id: str, show_ai_th
             break
 
         # Move to next player
-        game.current_player_index = game._get_next_active_player_index(
-            game.current_player_index + 1
-        )
+        game.advance_turn()
 
         # Check if betting round is complete
         if game._betting_round_complete():
@@ -557,7 +931,10 @@ async def process_ai_turns_with_events(game: PokerGame, game_id: str, show_ai_th
         print(f"[WebSocket] State advanced: {advanced}, new state={game.current_state.value if advanced else 'N/A'} (took {advance_done - advance_start:.3f}s)")
 
         if advanced:
-            await manager.broadcast_state(game_id, game, show_ai_thinking)
+            if timeline is not None:
+                timeline.add_street()
+            else:
+                await manager.broadcast_state(game_id, game, show_ai_thinking)
             broadcast_done = time.time()
             print(f"[WebSocket] State broadcast done (took {broadcast_done - advance_done:.3f}s, total t={broadcast_done - start_time:.2f}s)")
 
@@ -565,7 +942,7 @@ async def process_ai_turns_with_events(game: PokerGame, game_id: str, show_ai_th
             current = game.get_current_player()
             if current and not current.is_human:
                 print(f"[WebSocket] 🔁 Next player is AI ({current.name}), recursively processing AI turns...")
-                await process_ai_turns_with_events(game, game_id, show_ai_thinking, step_mode)
+                await _process_ai_turns(game, game_id, show_ai_thinking, step_mode, timeline)
             else:
                 print(f"[WebSocket] Next player is human or None, stopping AI processing")
     else:
@@ -574,7 +951,8 @@ async def process_ai_turns_with_events(game: PokerGame, game_id: str, show_ai_th
         # but the last state broadcast was BEFORE current_player_index was updated
         final_broadcast_start = time.time()
         print(f"[WebSocket] Betting round NOT complete, sending final state broadcast (t={final_broadcast_start - start_time:.2f}s)")
-        await manager.broadcast_state(game_id, game, show_ai_thinking)
+        if timeline is None:  # Timeline mode broadcasts once, after the batch
+            await manager.broadcast_state(game_id, game, show_ai_thinking)
         final_broadcast_done = time.time()
         print(f"[WebSocket] Final broadcast done (took {final_broadcast_done - final_broadcast_start:.3f}s)")
 
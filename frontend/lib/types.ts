@@ -50,6 +50,7 @@ export interface GameState {
   small_blind_position: number;
   big_blind_position: number;
   last_raise_amount: number | null;  // Issue #2: Minimum raise tracking
+  state_version?: number;  // Increases with every change to the game (WebSocket states)
 }
 
 export interface CreateGameRequest {
@@ -8,6 +8,8 @@
  * - Type-safe message handling
  * - Connection state management
  * - Error handling and logging
+ * - Optional delta protocol: one state snapshot, then seq-numbered patches
+ * - Optional AI timeline: AI actions arrive as one batch and are played back locally
  */
 
 import { GameState } from './types';
@@ -15,8 +17,46 @@ import { getToken } from './auth';
 
 // WebSocket message types from backend
 export interface WSMessage {
-  type: 'state_update' | 'ai_action' | 'error' | 'game_over' | 'awaiting_continue' | 'auto_resumed';
+  type: 'state_update' | 'state_snapshot' | 'state_patch' | 'ai_action' | 'ai_timeline' | 'error' | 'game_over' | 'awaiting_continue' | 'auto_resumed';
   data: any;
+  seq?: number; // Delta protocol: state_snapshot / state_patch sequence number
+}
+
+export interface WebSocketOptions {
+  deltaUpdates?: boolean; // Receive state as a snapshot plus patches instead of full updates
+  aiTimeline?: boolean; // Receive AI actions as one batch and pace them locally
+}
+
+// ai_timeline message data: AI actions up to the human's next decision
+export interface AITimeline {
+  base_version: number; // state_version the first patch applies to
+  entries: { offset_ms: number; type: 'ai_action' | 'street'; data: any; patch: Record<string, any> }[];
+  duration_ms: number;
+}
+
+const STATE_MESSAGES = ['state_update', 'state_snapshot', 'state_patch'];
+
+/**
+ * Apply a state_patch to the current state (mirrors apply_state_patch in the backend).
+ * "players" is patched per seat ({seatIndex: changedFields}) unless it is a whole list,
+ * "human_player" per field; any other field is replaced.
+ */
+export function applyStatePatch(state: any, patch: Record<string, any>): any {
+  const next = { ...state };
+  for (const [key, value] of Object.entries(patch)) {
+    if (key === 'players' && !Array.isArray(value)) {
+      const players = [...state.players];
+      for (const [seat, fields] of Object.entries(value as Record<string, any>)) {
+        players[Number(seat)] = { ...players[Number(seat)], ...fields };
+      }
+      next.players = players;
+    } else if (key === 'human_player') {
+      next.human_player = { ...state.human_player, ...value };
+    } else {
+      next[key] = value;
+    }
+  }
+  return next;
 }
 
 // WebSocket client callbacks
@@ -49,10 +89,21 @@ export class PokerWebSocket {
   private reconnectDelay: number = 1000; // Start with 1 second
   private reconnectTimer: NodeJS.Timeout | null = null;
   private shouldReconnect: boolean = true;
-
-  constructor(gameId: string, callbacks: WebSocketCallbacks) {
+  private deltaUpdates: boolean;
+  private deltaState: GameState | null = null; // Delta protocol: state the next patch applies to
+  private deltaSeq: number = 0;
+  private resyncRequested: boolean = false;
+  private showAiThinking: boolean = false; // Last show_ai_thinking sent: a resync snapshot keeps it
+  private aiTimeline: boolean;
+  private displayedState: GameState | null = null;
+  private playbackTimers: NodeJS.Timeout[] = [];
+  private heldMessages: WSMessage[] | null = null; // State messages that arrived during a playback
+
+  constructor(gameId: string, callbacks: WebSocketCallbacks, options: WebSocketOptions = {}) {
     this.gameId = gameId;
     this.callbacks = callbacks;
+    this.deltaUpdates = options.deltaUpdates ?? false;
+    this.aiTimeline = options.aiTimeline ?? false;
   }
 
   /**
@@ -97,7 +148,11 @@ export class PokerWebSocket {
     // Use only host (no pathname) to avoid issues with reverse proxy prefixes
     // e.g., https://example.com/api → wss://example.com/ws/{gameId}?token=xxx
     const baseUrl = `${wsProtocol}://${url.host}/ws/${this.gameId}`;
-    const wsUrl = token ? `${baseUrl}?token=${token}` : baseUrl;
+    const params = new URLSearchParams();
+    if (token) params.set('token', token);
+    if (this.deltaUpdates) params.set('protocol', 'delta');
+    const query = params.toString();
+    const wsUrl = query ? `${baseUrl}?${query}` : baseUrl;
 
     console.log(`[WebSocket] Connecting to: ${wsUrl.replace(/token=.+/, 'token=***')}`);
     return wsUrl;
@@ -114,6 +169,10 @@ export class PokerWebSocket {
       this.connectionState = ConnectionState.CONNECTED;
       this.reconnectAttempts = 0;
       this.reconnectDelay = 1000;
+      this.deltaState = null; // The server starts a new connection with a snapshot
+      this.deltaSeq = 0;
+      this.resyncRequested = false;
+      this.stopPlayback();
       this.callbacks.onConnect();
     };
 
@@ -149,9 +208,39 @@ export class PokerWebSocket {
   private handleMessage(message: WSMessage): void {
     console.log('[WebSocket] Received:', message.type, message.data);
 
+    if (this.heldMessages && STATE_MESSAGES.includes(message.type)) {
+      // Shown once the AI timeline playback ends
+      this.heldMessages.push(message);
+      return;
+    }
+
     switch (message.type) {
       case 'state_update':
-        this.callbacks.onStateUpdate(message.data);
+        this.showState(message.data);
+        break;
+
+      case 'ai_timeline':
+        this.playTimeline(message.data);
+        break;
+
+      case 'state_snapshot':
+        this.deltaState = message.data;
+        this.deltaSeq = message.seq!;
+        this.resyncRequested = false;
+        this.showState(message.data);
+        break;
+
+      case 'state_patch':
+        if (this.deltaState === null || message.seq !== this.deltaSeq + 1) {
+          // Missed a patch: ask for a full snapshot and drop patches until it arrives
+          console.warn(`[WebSocket] State patch ${message.seq} does not follow ${this.deltaSeq}, resyncing`);
+          this.deltaState = null;
+          this.requestResync();
+          break;
+        }
+        this.deltaState = applyStatePatch(this.deltaState, message.data);
+        this.deltaSeq = message.seq!;
+        this.showState(this.deltaState!);
         break;
 
       case 'error':
@@ -184,6 +273,44 @@ export class PokerWebSocket {
     }
   }
 
+  private showState(state: GameState): void {
+    this.displayedState = state;
+    this.callbacks.onStateUpdate(state);
+  }
+
+  /**
+   * Play back an AI timeline: show each entry at its offset, holding later state
+   * messages until the end. Skipped if the shown state is not the timeline's base
+   * (the state message that follows carries the result).
+   */
+  private playTimeline(timeline: AITimeline): void {
+    let state = this.displayedState;
+    if (state === null || state.state_version !== timeline.base_version) {
+      console.warn('[WebSocket] AI timeline does not start from the shown state, skipping playback');
+      return;
+    }
+    this.stopPlayback();
+    this.heldMessages = [];
+    for (const entry of timeline.entries) {
+      this.playbackTimers.push(setTimeout(() => {
+        state = applyStatePatch(state, entry.patch);
+        this.showState(state!);
+      }, entry.offset_ms));
+    }
+    this.playbackTimers.push(setTimeout(() => {
+      const held = this.heldMessages ?? [];
+      this.playbackTimers = [];
+      this.heldMessages = null;
+      held.forEach((message) => this.handleMessage(message));
+    }, timeline.duration_ms));
+  }
+
+  private stopPlayback(): void {
+    this.playbackTimers.forEach((timer) => clearTimeout(timer));
+    this.playbackTimers = [];
+    this.heldMessages = null;
+  }
+
   /**
    * Send action to server
    */
@@ -194,12 +321,14 @@ export class PokerWebSocket {
       return;
     }
 
+    this.showAiThinking = showAiThinking;
     const message = {
       type: 'action',
       action,
       amount,
       show_ai_thinking: showAiThinking,
-      step_mode: stepMode // Phase 4: Step Mode
+      step_mode: stepMode, // Phase 4: Step Mode
+      timeline: this.aiTimeline
     };
 
     console.log('[WebSocket] Sending action:', message);
@@ -216,10 +345,12 @@ export class PokerWebSocket {
       return;
     }
 
+    this.showAiThinking = showAiThinking;
     const message = {
       type: 'next_hand',
       show_ai_thinking: showAiThinking,
-      step_mode: stepMode // Phase 4: Step Mode
+      step_mode: stepMode, // Phase 4: Step Mode
+      timeline: this.aiTimeline
     };
 
     console.log('[WebSocket] Starting next hand');
@@ -253,6 +384,7 @@ export class PokerWebSocket {
       return;
     }
 
+    this.showAiThinking = showAiThinking;
     const message = {
       type: 'get_state',
       show_ai_thinking: showAiThinking
@@ -262,12 +394,23 @@ export class PokerWebSocket {
     this.ws!.send(JSON.stringify(message));
   }
 
+  /**
+   * Ask for a full state snapshot (delta protocol, after a sequence gap)
+   */
+  private requestResync(): void {
+    if (this.isConnected() && !this.resyncRequested) {
+      this.resyncRequested = true;
+      this.ws!.send(JSON.stringify({ type: 'resync', show_ai_thinking: this.showAiThinking }));
+    }
+  }
+
   /**
    * Disconnect from WebSocket (intentional)
    */
   disconnect(): void {
     console.log('[WebSocket] Disconnecting...');
     this.shouldReconnect = false;
+    this.stopPlayback();
 
     if (this.reconnectTimer) {
       clearTimeout(this.reconnectTimer);